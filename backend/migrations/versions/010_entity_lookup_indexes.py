@@ -0,0 +1,73 @@
+"""Add expression indexes for entity identifier and name lookups.
+
+Revision ID: 010_entity_lookup_indexes
+Revises: 009_case_reports_ads
+Create Date: 2026-10-16
+
+Indexes the external_ids keys that research lead resolution and the
+ingesters look entities up by, and the lowercased name forms used by
+name-based lead resolution. Indexes are built CONCURRENTLY so existing
+entity writes are not blocked on large tables.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "010_entity_lookup_indexes"
+down_revision = "009_case_reports_ads"
+branch_labels = None
+depends_on = None
+
+
+# external_ids keys resolved with `external_ids->>'<key>' = ANY(...)`
+EXTERNAL_ID_KEYS = (
+    "ein",
+    "bn",
+    "business_number",
+    "sec_cik",
+    "cik",
+    "sedar_profile",
+    "meta_page_id",
+)
+
+# (index name, indexed expression)
+NAME_INDEXES = (
+    # Exact and prefix (LIKE 'x%') matches on the lowercased name
+    ("idx_entities_lower_name", "lower(name) text_pattern_ops"),
+    # Exact matches ignoring surrounding whitespace and trailing periods
+    (
+        "idx_entities_lower_name_trimmed",
+        "lower(trim(trailing '.' from trim(name)))",
+    ),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for key in EXTERNAL_ID_KEYS:
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_entities_ext_{key}
+                ON entities ((external_ids->>'{key}'))
+                WHERE external_ids->>'{key}' IS NOT NULL
+            """)
+
+        # Containment queries on other external_ids keys
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_entities_external_ids
+            ON entities USING gin (external_ids jsonb_path_ops)
+        """)
+
+        for name, expression in NAME_INDEXES:
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {name}
+                ON entities ({expression})
+            """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in NAME_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_entities_external_ids")
+        for key in EXTERNAL_ID_KEYS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_entities_ext_{key}")
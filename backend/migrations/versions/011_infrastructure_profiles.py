@@ -0,0 +1,84 @@
+"""Add infrastructure profile store and signal index
+
+Revision ID: 011_infrastructure_profiles
+Revises: 010_entity_lookup_indexes
+Create Date: 2026-10-16
+
+Creates:
+- infrastructure_profiles: Latest infrastructure profile per domain, with
+  per-component scan times used to rescan only expired components
+- infrastructure_signals: Inverted index from shareable signal values
+  (analytics IDs, nameservers, ASNs, registrant orgs, SAN hosts) to domains
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision: str = "011_infrastructure_profiles"
+down_revision: Union[str, None] = "010_entity_lookup_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # =========================
+    # Infrastructure Profiles Table
+    # =========================
+    op.create_table(
+        "infrastructure_profiles",
+        sa.Column("domain", sa.String(255), primary_key=True),
+        sa.Column("profile", postgresql.JSONB, nullable=False),
+        sa.Column(
+            "scanned_at",
+            postgresql.JSONB,
+            nullable=False,
+            server_default="{}",
+            comment="Last scan time per component (dns, whois, hosting, analytics, ssl)",
+        ),
+        sa.Column(
+            "failed_components",
+            postgresql.ARRAY(sa.String(20)),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column("next_refresh_at", sa.DateTime, nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+    op.create_index(
+        "idx_infra_profiles_next_refresh",
+        "infrastructure_profiles",
+        ["next_refresh_at"],
+    )
+
+    # =========================
+    # Infrastructure Signals Table
+    # =========================
+    op.create_table(
+        "infrastructure_signals",
+        sa.Column("signal_type", sa.String(50), nullable=False),
+        sa.Column("value", sa.Text, nullable=False),
+        sa.Column(
+            "domain",
+            sa.String(255),
+            sa.ForeignKey("infrastructure_profiles.domain", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("signal_type", "value", "domain"),
+    )
+
+    op.create_index("idx_infra_signals_domain", "infrastructure_signals", ["domain"])
+
+
+def downgrade() -> None:
+    op.drop_table("infrastructure_signals")
+    op.drop_table("infrastructure_profiles")
@@ -60,6 +60,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to clean up orphaned ingestion runs: {e}")
 
+    # Create or migrate the Neo4j full-text search indexes (non-blocking)
+    async def ensure_graph_search_indexes():
+        from mitds.db import get_neo4j_session
+        from mitds.graph.search import ensure_search_indexes
+
+        try:
+            async with get_neo4j_session() as session:
+                changed = await ensure_search_indexes(session)
+            if changed:
+                logger.info(f"Created or rebuilt search indexes: {', '.join(changed)}")
+        except Exception as e:
+            logger.warning(f"Failed to ensure Neo4j search indexes: {e}")
+
+    asyncio.create_task(ensure_graph_search_indexes())
+
     # Warm up search cache in background (non-blocking)
     from mitds.ingestion.search import warmup_search_cache
     asyncio.create_task(warmup_search_cache())
@@ -68,6 +83,17 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down MITDS API")
+
+    # Flush queued audit entries before the database pool closes
+    from mitds.api.audit import shutdown_audit_writer
+    await shutdown_audit_writer()
+
+    from mitds.cache import close_cache
+    await close_cache()
+
+    from mitds.ingestion.pdf import shutdown_pdf_service
+    shutdown_pdf_service()
+
     await close_all_connections()
 
 
@@ -144,11 +170,16 @@ async def readiness_check():
     all_healthy = all(v == "healthy" for v in checks.values())
     status_code = 200 if all_healthy else 503
 
+    from mitds.api.audit import get_audit_writer
+    from mitds.cache import get_cache_metrics
+
     return JSONResponse(
         status_code=status_code,
         content={
             "status": "ready" if all_healthy else "not_ready",
             "checks": checks,
+            "audit": get_audit_writer().stats(),
+            "cache": get_cache_metrics(),
         },
     )
 
@@ -2,8 +2,15 @@
 
 Provides comprehensive audit trail for all analyst interactions
 with the system for accountability and reproducibility.
+
+Entries are written off the request path: `log_audit_entry` places them
+on a bounded in-memory queue that a background task drains into
+`audit_log` with multi-row inserts, flushing when a batch fills, when the
+flush interval elapses, and on shutdown. If the queue is full, entries
+are dropped and counted rather than slowing down requests.
 """
 
+import asyncio
 import json
 from datetime import datetime
 from enum import Enum
@@ -13,6 +20,7 @@ from uuid import UUID, uuid4
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
+from ..config import get_settings
 from ..db import get_db_session
 from ..logging import get_context_logger
 
@@ -89,59 +97,235 @@ class AuditEntry:
         }
 
 
-async def log_audit_entry(entry: AuditEntry) -> None:
-    """Store an audit entry in the database.
+AUDIT_INSERT = """
+    INSERT INTO audit_log (
+        id, timestamp, action, user_id, request_id,
+        resource_type, resource_id, parameters, result_summary,
+        ip_address, user_agent
+    ) VALUES (
+        :id, :timestamp, :action, :user_id, :request_id,
+        :resource_type, :resource_id, :parameters, :result_summary,
+        :ip_address, :user_agent
+    )
+"""
+
+
+def _insert_params(entry: AuditEntry) -> dict[str, Any]:
+    return {
+        "id": entry.id,
+        "timestamp": entry.timestamp,
+        "action": entry.action.value,
+        "user_id": entry.user_id,
+        "request_id": entry.request_id,
+        "resource_type": entry.resource_type,
+        "resource_id": entry.resource_id,
+        "parameters": json.dumps(entry.parameters),
+        "result_summary": json.dumps(entry.result_summary),
+        "ip_address": entry.ip_address,
+        "user_agent": entry.user_agent,
+    }
+
+
+async def write_audit_entries(entries: list[AuditEntry]) -> None:
+    """Store a batch of audit entries in one transaction.
+
+    A list of parameter sets makes SQLAlchemy issue a single executemany,
+    which asyncpg pipelines as one round trip.
 
     Args:
-        entry: Audit entry to store
+        entries: Audit entries to store
     """
     from sqlalchemy import text
 
-    try:
-        async with get_db_session() as db:
-            await db.execute(
-                text("""
-                    INSERT INTO audit_log (
-                        id, timestamp, action, user_id, request_id,
-                        resource_type, resource_id, parameters, result_summary,
-                        ip_address, user_agent
-                    ) VALUES (
-                        :id, :timestamp, :action, :user_id, :request_id,
-                        :resource_type, :resource_id, :parameters, :result_summary,
-                        :ip_address, :user_agent
+    async with get_db_session() as db:
+        await db.execute(text(AUDIT_INSERT), [_insert_params(e) for e in entries])
+
+
+class AuditWriter:
+    """Bounded audit queue drained in batches by a background task.
+
+    Usage:
+        writer = get_audit_writer()
+        writer.submit(entry)      # never blocks
+        await writer.close()      # on shutdown: flush what is queued
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ):
+        """Initialize the writer.
+
+        Args:
+            max_queue_size: Entries held before new ones are dropped
+            batch_size: Maximum entries per insert
+            flush_interval: Seconds a partial batch may wait before writing
+        """
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+        self._queue: asyncio.Queue[AuditEntry] | None = None
+        self._batch: list[AuditEntry] = []
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Entries waiting to be written."""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + len(self._batch)
+
+    def stats(self) -> dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "queue_depth": self.queue_depth,
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def submit(self, entry: AuditEntry) -> bool:
+        """Queue an entry for writing without waiting.
+
+        Returns:
+            False if the queue was full and the entry was dropped
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    f"Audit queue full, {self.dropped} entries dropped",
+                    extra={"event": "audit_queue_full", "dropped": self.dropped},
+                )
+            return False
+        self.submitted += 1
+        return True
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new event loop (e.g. after a restart in tests)
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Drain the queue until cancelled.
+
+        The batch being collected or written is kept on the writer, so
+        `close` can still write it after cancelling this task.
+        """
+        while True:
+            self._batch.append(await self._queue.get())
+            deadline = self._loop.time() + self.flush_interval
+            while len(self._batch) < self.batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
                     )
-                """),
-                {
-                    "id": entry.id,
-                    "timestamp": entry.timestamp,
-                    "action": entry.action.value,
-                    "user_id": entry.user_id,
-                    "request_id": entry.request_id,
-                    "resource_type": entry.resource_type,
-                    "resource_id": entry.resource_id,
-                    "parameters": json.dumps(entry.parameters),
-                    "result_summary": json.dumps(entry.result_summary),
-                    "ip_address": entry.ip_address,
-                    "user_agent": entry.user_agent,
-                },
+                except TimeoutError:
+                    break
+            await self._write(self._batch)
+            self._batch = []
+
+    async def _write(self, batch: list[AuditEntry]) -> None:
+        try:
+            await write_audit_entries(batch)
+            self.written += len(batch)
+        except Exception as e:
+            # Log but don't fail requests if audit logging fails
+            self.failed += len(batch)
+            logger.error(
+                f"Failed to write {len(batch)} audit entries: {e}",
+                extra={"event": "audit_log_failed", "entries": len(batch)},
             )
-            await db.commit()
-    except Exception as e:
-        # Log but don't fail the request if audit logging fails
-        logger.error(
-            "audit_log_failed",
-            error=str(e),
-            action=entry.action.value,
+
+    async def flush(self) -> None:
+        """Write everything currently queued."""
+        if self._batch:
+            batch, self._batch = self._batch, []
+            await self._write(batch)
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._write(batch)
+
+    async def close(self) -> None:
+        """Stop the background task and flush remaining entries."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+_audit_writer: AuditWriter | None = None
+
+
+def get_audit_writer() -> AuditWriter:
+    """Get the process-wide audit writer."""
+    global _audit_writer
+    if _audit_writer is None:
+        settings = get_settings()
+        _audit_writer = AuditWriter(
+            max_queue_size=settings.audit_queue_size,
+            batch_size=settings.audit_batch_size,
+            flush_interval=settings.audit_flush_interval,
         )
+    return _audit_writer
+
+
+async def shutdown_audit_writer() -> None:
+    """Flush queued audit entries (for shutdown)."""
+    if _audit_writer is not None:
+        await _audit_writer.close()
+
+
+async def log_audit_entry(entry: AuditEntry) -> None:
+    """Queue an audit entry for storage in the database.
+
+    Returns as soon as the entry is queued; the database write happens
+    in the background in batches.
+
+    Args:
+        entry: Audit entry to store
+    """
+    get_audit_writer().submit(entry)
 
     # Also log to structured log for real-time monitoring
     logger.info(
-        "audit_event",
-        action=entry.action.value,
-        user_id=entry.user_id,
-        resource_type=entry.resource_type,
-        resource_id=entry.resource_id,
-        ip_address=entry.ip_address,
+        f"audit {entry.action.value}",
+        extra={
+            "event": "audit_event",
+            "action": entry.action.value,
+            "user_id": entry.user_id,
+            "resource_type": entry.resource_type,
+            "resource_id": entry.resource_id,
+            "ip_address": entry.ip_address,
+        },
     )
 
 
@@ -289,7 +473,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
             user_agent=request.headers.get("User-Agent"),
         )
 
-        # Log asynchronously (don't block response)
+        # Queued for the background writer (doesn't block the response)
         await log_audit_entry(entry)
 
         return response
@@ -3,11 +3,12 @@
 Provides endpoints for:
 - Temporal coordination analysis
 - Composite coordination scoring
+- Network topology analysis
 - Detection result explanation
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
@@ -97,12 +98,38 @@ class FundingClusterResponse(BaseModel):
     explanation: str = ""
 
 
+class TopologyRequest(BaseModel):
+    """Request for network topology analysis."""
+
+    rel_types: list[str] | None = Field(None, description="Relationship types to include (default: all)")
+    start_date: datetime | None = Field(None, description="Keep relationships valid after this time")
+    end_date: datetime | None = Field(None, description="Keep relationships valid before this time")
+    jurisdictions: list[str] | None = Field(None, description="Keep entities in these jurisdictions (or without one)")
+    entity_ids: list[UUID] | None = Field(None, description="Restrict to these entities and their neighbours")
+    hops: int = Field(1, ge=1, le=3, description="Neighbourhood radius around entity_ids")
+    community_method: Literal["louvain", "label_propagation"] = Field("louvain", description="Community detection algorithm")
+    top_n: int = Field(20, ge=1, le=200, description="Central entities and communities to return")
+
+
+class TopologyResponse(BaseModel):
+    """Response for network topology analysis."""
+
+    projection_version: str
+    network_metrics: dict[str, Any] = Field(default_factory=dict)
+    central_entities: list[dict[str, Any]] = Field(default_factory=list)
+    communities: list[dict[str, Any]] = Field(default_factory=list)
+    explanation: str = ""
+
+
 class InfrastructureSharingRequest(BaseModel):
     """Request for infrastructure sharing detection."""
 
     entity_ids: list[UUID] | None = Field(None, description="Entity IDs to resolve to domains")
     domains: list[str] | None = Field(None, description="Domain strings to scan directly")
     min_score: float = Field(1.0, ge=0.0, description="Minimum match score to include")
+    include_known: bool = Field(
+        False, description="Also match against previously scanned domains sharing a signal"
+    )
 
 
 class InfrastructureSharingResponse(BaseModel):
@@ -479,6 +506,71 @@ async def detect_funding_clusters(
         raise HTTPException(status_code=500, detail=f"Funding cluster detection failed: {e}")
 
 
+# =========================
+# Network Topology
+# =========================
+
+
+@router.post("/topology")
+async def detect_topology(
+    request: TopologyRequest,
+    user: OptionalUser = None,
+) -> TopologyResponse:
+    """Analyze network structure: communities, central entities and cores.
+
+    Runs on a cached in-memory projection of the graph filtered by
+    relationship type, time window and jurisdiction.
+    """
+    from ..detection.topology import TopologyAnalyzer, analyze_topology
+    from ..graph.projection import ProjectionFilter
+
+    try:
+        projection_filter = ProjectionFilter.create(
+            rel_types=request.rel_types,
+            start=request.start_date,
+            end=request.end_date,
+            jurisdictions=request.jurisdictions,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid relationship type: {e}")
+
+    try:
+        result = await analyze_topology(
+            projection_filter,
+            entity_ids=request.entity_ids,
+            hops=request.hops,
+            analyzer=TopologyAnalyzer(
+                community_method=request.community_method,
+                top_n=request.top_n,
+            ),
+        )
+    except Exception as e:
+        logger.exception("Topology analysis failed")
+        raise HTTPException(status_code=500, detail=f"Topology analysis failed: {e}")
+
+    if result.node_count == 0:
+        explanation = "No relationships matched the specified filters."
+    else:
+        explanation = (
+            f"Analyzed {result.node_count} entities and {result.edge_count} connections "
+            f"in {result.connected_components} components; found "
+            f"{len(result.communities)} communities (largest k-core: {result.max_core})."
+        )
+
+    return TopologyResponse(
+        projection_version=result.projection_version,
+        network_metrics=result.model_dump(
+            include={
+                "node_count", "edge_count", "density", "avg_clustering",
+                "connected_components", "diameter", "max_core",
+            }
+        ),
+        central_entities=[n.model_dump() for n in result.central_nodes],
+        communities=[c.model_dump() for c in result.communities],
+        explanation=explanation,
+    )
+
+
 # =========================
 # Infrastructure Sharing
 # =========================
@@ -493,9 +585,11 @@ async def detect_infrastructure_sharing(
 
     Scans domain infrastructure (DNS, WHOIS, hosting, analytics, SSL)
     and identifies pairwise matches. Accepts entity IDs (resolves to domains)
-    or domain strings directly.
+    or domain strings directly. Stored profiles are reused until their
+    components expire.
     """
     from ..detection.infra import InfrastructureDetector
+    from ..detection.infra_store import InfrastructureProfileStore
 
     domains: list[str] = list(request.domains or [])
     errors: list[str] = []
@@ -540,45 +634,46 @@ async def detect_infrastructure_sharing(
         )
 
     # Run infrastructure detection
-    detector = InfrastructureDetector()
+    detector = InfrastructureDetector(store=InfrastructureProfileStore())
     try:
-        matches = await detector.find_shared_infrastructure(
-            domains=domains,
+        scanned = await detector.get_profiles(domains)
+        matches = await detector.match_profiles(
+            scanned.values(),
             min_score=request.min_score,
+            include_known=request.include_known,
         )
 
-        # Build profiles (scan results are internal to the detector;
-        # we report domain-level summaries)
+        # Report domain-level summaries of the profiles matched above
         profiles = []
         for domain in domains:
-            try:
-                profile = await detector.analyze_domain(domain)
-                profiles.append({
-                    "domain": domain,
-                    "dns": {
-                        "nameservers": profile.dns.nameservers if profile.dns else [],
-                        "a_records": profile.dns.a_records if profile.dns else [],
-                    } if profile.dns else None,
-                    "whois": {
-                        "registrar": profile.whois.registrar if profile.whois else None,
-                        "registrant_org": profile.whois.registrant_org if profile.whois else None,
-                    } if profile.whois else None,
-                    "hosting": [
-                        {"ip": h.ip_address, "provider": h.hosting_provider, "asn": h.asn}
-                        for h in (profile.hosting or [])
-                    ],
-                    "analytics": {
-                        "google_analytics": profile.analytics.google_analytics_ids if profile.analytics else [],
-                        "google_tag_manager": profile.analytics.google_tag_manager_ids if profile.analytics else [],
-                    } if profile.analytics else None,
-                    "ssl": {
-                        "issuer": profile.ssl.issuer if profile.ssl else None,
-                        "san_count": len(profile.ssl.subject_alt_names) if profile.ssl else 0,
-                    } if profile.ssl else None,
-                })
-            except Exception as e:
-                profiles.append({"domain": domain, "error": str(e)})
-                errors.append(f"Failed to profile {domain}: {e}")
+            profile = scanned.get(domain)
+            if profile is None:
+                profiles.append({"domain": domain, "error": "scan failed"})
+                errors.append(f"Failed to profile {domain}")
+                continue
+            profiles.append({
+                "domain": domain,
+                "dns": {
+                    "nameservers": profile.dns.nameservers if profile.dns else [],
+                    "a_records": profile.dns.a_records if profile.dns else [],
+                } if profile.dns else None,
+                "whois": {
+                    "registrar": profile.whois.registrar if profile.whois else None,
+                    "registrant_org": profile.whois.registrant_org if profile.whois else None,
+                } if profile.whois else None,
+                "hosting": [
+                    {"ip": h.ip_address, "provider": h.hosting_provider, "asn": h.asn}
+                    for h in (profile.hosting or [])
+                ],
+                "analytics": {
+                    "google_analytics": profile.analytics.google_analytics_ids if profile.analytics else [],
+                    "google_tag_manager": profile.analytics.google_tag_manager_ids if profile.analytics else [],
+                } if profile.analytics else None,
+                "ssl": {
+                    "issuer": profile.ssl.issuer if profile.ssl else None,
+                    "san_count": len(profile.ssl.subject_alt_names) if profile.ssl else 0,
+                } if profile.ssl else None,
+            })
 
         match_dicts = []
         for m in matches:
@@ -732,6 +827,7 @@ async def calculate_composite_score_endpoint(
     if request.include_infrastructure:
         try:
             from ..detection.infra import InfrastructureDetector
+            from ..detection.infra_store import InfrastructureProfileStore
 
             # Resolve entity IDs to domains
             domains: list[str] = []
@@ -753,7 +849,7 @@ async def calculate_composite_score_endpoint(
                             domains.extend(record["domains"])
 
             if len(domains) >= 2:
-                infra_detector = InfrastructureDetector()
+                infra_detector = InfrastructureDetector(store=InfrastructureProfileStore())
                 try:
                     matches = await infra_detector.find_shared_infrastructure(
                         domains=domains,
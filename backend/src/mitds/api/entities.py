@@ -5,14 +5,17 @@ from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
 
 from . import NotFoundError, PaginatedResponse
 from .auth import CurrentUser, OptionalUser
+from ..cache import entity_key, entity_stats_key, read_through, relationship_key
 from ..db import get_neo4j_session
 from ..graph.queries import get_entity_relationships as graph_get_relationships
 from ..graph.queries import get_entity_stats
 from ..graph.queries import find_board_interlocks_for_entity
+from ..graph.search import count_entity_matches, search_entity_nodes
 from ..models.base import EntityType, EntitySummary
 from ..models.relationships import RelationType
 
@@ -80,60 +83,37 @@ async def search_entities(
     - Person names
     - Outlet names and domains
     - EIN, BN, and other identifiers
+
+    Text queries use the entity full-text index with prefix and fuzzy
+    matching; the total is approximate (capped) and cached briefly.
     """
     async with get_neo4j_session() as session:
-        # Build search query
-        type_filter = ""
-        if type:
-            type_filter = f"AND e.entity_type = '{type.value}'"
-
-        jurisdiction_filter = ""
-        if jurisdiction:
-            jurisdiction_filter = f"AND e.jurisdiction = '{jurisdiction}'"
-
         if q:
-            # Search with text matching
-            search_query = f"""
-            MATCH (e)
-            WHERE (e:Organization OR e:Person OR e:Outlet OR e:Sponsor OR e:Ad)
-            AND (
-                toLower(e.name) CONTAINS toLower($search_term)
-                OR toLower(e.page_name) CONTAINS toLower($search_term)
-                OR any(alias IN coalesce(e.aliases, []) WHERE toLower(alias) CONTAINS toLower($search_term))
-                OR e.ein = $search_term
-                OR e.bn = $search_term
-                OR e.meta_ad_id = $search_term
-            )
-            {type_filter}
-            {jurisdiction_filter}
-            RETURN e
-            ORDER BY e.confidence DESC, e.name
-            SKIP $offset
-            LIMIT $limit
-            """
-
-            count_query = f"""
-            MATCH (e)
-            WHERE (e:Organization OR e:Person OR e:Outlet OR e:Sponsor OR e:Ad)
-            AND (
-                toLower(e.name) CONTAINS toLower($search_term)
-                OR toLower(e.page_name) CONTAINS toLower($search_term)
-                OR any(alias IN coalesce(e.aliases, []) WHERE toLower(alias) CONTAINS toLower($search_term))
-                OR e.ein = $search_term
-                OR e.bn = $search_term
-                OR e.meta_ad_id = $search_term
+            # Full-text index search with a capped, cached total
+            nodes = await search_entity_nodes(
+                session,
+                q,
+                entity_type=type.value if type else None,
+                jurisdiction=jurisdiction,
+                offset=offset,
+                limit=limit,
             )
-            {type_filter}
-            {jurisdiction_filter}
-            RETURN count(e) as total
-            """
-
-            result = await session.run(
-                search_query, search_term=q, offset=offset, limit=limit
+            total = await count_entity_matches(
+                session,
+                q,
+                entity_type=type.value if type else None,
+                jurisdiction=jurisdiction,
             )
-            count_result = await session.run(count_query, search_term=q)
         else:
             # List all entities
+            type_filter = ""
+            if type:
+                type_filter = f"AND e.entity_type = '{type.value}'"
+
+            jurisdiction_filter = ""
+            if jurisdiction:
+                jurisdiction_filter = f"AND e.jurisdiction = '{jurisdiction}'"
+
             list_query = f"""
             MATCH (e)
             WHERE (e:Organization OR e:Person OR e:Outlet OR e:Sponsor OR e:Ad)
@@ -156,13 +136,12 @@ async def search_entities(
             result = await session.run(list_query, offset=offset, limit=limit)
             count_result = await session.run(count_query)
 
-        records = await result.data()
-        count_record = await count_result.single()
-        total = count_record["total"] if count_record else 0
+            nodes = [dict(record["e"]) for record in await result.data()]
+            count_record = await count_result.single()
+            total = count_record["total"] if count_record else 0
 
         entities = []
-        for record in records:
-            entity_data = dict(record["e"])
+        for entity_data in nodes:
             # Convert Neo4j DateTime to string if needed
             created_at = entity_data.get("created_at")
             if hasattr(created_at, 'to_native'):
@@ -200,6 +179,17 @@ async def get_entity(
     user: OptionalUser = None,
 ) -> EntityResponse:
     """Get an entity by ID with full details."""
+    cached = await read_through(
+        entity_id, entity_key(entity_id), lambda: _load_entity(entity_id), "entity"
+    )
+    if cached is None:
+        raise NotFoundError("Entity", entity_id)
+
+    return EntityResponse.model_validate(cached)
+
+
+async def _load_entity(entity_id: UUID) -> dict[str, Any] | None:
+    """Load an entity from Neo4j as a JSON-ready EntityResponse payload."""
     async with get_neo4j_session() as session:
         query = """
         MATCH (e {id: $entity_id})
@@ -209,7 +199,7 @@ async def get_entity(
         record = await result.single()
 
         if not record:
-            raise NotFoundError("Entity", entity_id)
+            return None
 
         entity_data = dict(record["e"])
 
@@ -243,7 +233,7 @@ async def get_entity(
         # Handle Ad nodes which use page_name instead of name
         name = entity_data.get("name") or entity_data.get("page_name") or "Unknown"
 
-        return EntityResponse(
+        return jsonable_encoder(EntityResponse(
             id=UUID(entity_data["id"]),
             entity_type=entity_data.get("entity_type", "UNKNOWN"),
             name=name,
@@ -252,7 +242,7 @@ async def get_entity(
             updated_at=updated_at,
             aliases=entity_data.get("aliases", []),
             properties=properties,
-        )
+        ))
 
 
 # =========================
@@ -273,6 +263,38 @@ async def get_entity_relationships(
 
     Returns relationships with the related entity summary for each.
     """
+    point_in_time = None
+    if as_of:
+        try:
+            point_in_time = datetime.fromisoformat(as_of.replace("Z", "+00:00"))
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid as_of format. Use ISO 8601."
+            )
+
+    view = ":".join([
+        direction,
+        rel_type or "*",
+        point_in_time.isoformat() if point_in_time else "",
+        str(limit),
+    ])
+    return await read_through(
+        entity_id,
+        relationship_key(entity_id, view),
+        lambda: _load_relationships(entity_id, rel_type, direction, point_in_time, limit),
+        "relationship",
+    )
+
+
+async def _load_relationships(
+    entity_id: UUID,
+    rel_type: str | None,
+    direction: str,
+    point_in_time: datetime | None,
+    limit: int,
+) -> dict[str, Any]:
+    """Load an entity's relationships as a JSON-ready response payload."""
     async with get_neo4j_session() as session:
         # Build direction pattern
         if direction == "out":
@@ -289,18 +311,11 @@ async def get_entity_relationships(
 
         # Build temporal filter
         time_filter = ""
-        if as_of:
-            try:
-                point_in_time = datetime.fromisoformat(as_of.replace("Z", "+00:00"))
-                time_filter = f"""
-                AND (r.valid_from IS NULL OR r.valid_from <= '{point_in_time.isoformat()}')
-                AND (r.valid_to IS NULL OR r.valid_to > '{point_in_time.isoformat()}')
-                """
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid as_of format. Use ISO 8601."
-                )
+        if point_in_time:
+            time_filter = f"""
+            AND (r.valid_from IS NULL OR r.valid_from <= '{point_in_time.isoformat()}')
+            AND (r.valid_to IS NULL OR r.valid_to > '{point_in_time.isoformat()}')
+            """
 
         query = f"""
         MATCH {pattern}
@@ -371,10 +386,10 @@ async def get_entity_relationships(
                 )
             )
 
-        return {
+        return jsonable_encoder({
             "relationships": relationships,
             "total": len(relationships),
-        }
+        })
 
 
 # =========================
@@ -469,7 +484,12 @@ async def get_entity_statistics(
 
     Returns counts of relationships, funders, recipients, etc.
     """
-    stats = await get_entity_stats(entity_id)
+    stats = await read_through(
+        entity_id,
+        entity_stats_key(entity_id),
+        lambda: _load_entity_stats(entity_id),
+        "stats",
+    )
 
     if not stats:
         raise NotFoundError("Entity", entity_id)
@@ -477,6 +497,12 @@ async def get_entity_statistics(
     return stats
 
 
+async def _load_entity_stats(entity_id: UUID) -> dict[str, Any] | None:
+    """Load entity statistics as a JSON-ready payload."""
+    stats = await get_entity_stats(entity_id)
+    return jsonable_encoder(stats) if stats else None
+
+
 # =========================
 # Get Board Interlocks
 # =========================
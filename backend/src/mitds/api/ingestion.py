@@ -175,6 +175,7 @@ async def autocomplete_entities(
         types: Comma-separated entity types to include (organization, person, sponsor)
     """
     from ..db import get_neo4j_session
+    from ..graph.search import suggest_entities
 
     if len(q) < 2:
         return {"suggestions": [], "query": q}
@@ -182,7 +183,7 @@ async def autocomplete_entities(
     limit = min(limit, 25)
     
     # Parse types filter - use proper Neo4j label case (e.g., Organization, not ORGANIZATION)
-    type_filter = ""
+    neo4j_labels = None
     if types:
         # Map incoming types to actual Neo4j labels (case-sensitive)
         type_mapping = {
@@ -192,47 +193,20 @@ async def autocomplete_entities(
             "outlet": "Outlet",
         }
         type_list = [t.strip().lower() for t in types.split(",")]
-        neo4j_labels = [type_mapping[t] for t in type_list if t in type_mapping]
-        if neo4j_labels:
-            type_labels = " OR ".join([f"e:{label}" for label in neo4j_labels])
-            type_filter = f"AND ({type_labels})"
+        neo4j_labels = [type_mapping[t] for t in type_list if t in type_mapping] or None
 
     suggestions: list[AutocompleteSuggestion] = []
 
     # Search Neo4j for entities
     try:
         async with get_neo4j_session() as session:
-            # Fast prefix search with STARTS WITH for speed
-            query = f"""
-            MATCH (e)
-            WHERE (e:Organization OR e:Person OR e:Sponsor OR e:Outlet)
-            AND (
-                toLower(e.name) STARTS WITH toLower($prefix)
-                OR toLower(e.name) CONTAINS toLower($search_term)
-                OR any(alias IN coalesce(e.aliases, []) WHERE toLower(alias) STARTS WITH toLower($prefix))
-            )
-            {type_filter}
-            WITH e,
-                 CASE WHEN toLower(e.name) STARTS WITH toLower($prefix) THEN 0 ELSE 1 END as match_rank
-            RETURN DISTINCT
-                e.id as id,
-                e.name as name,
-                e.entity_type as entity_type,
-                e.jurisdiction as jurisdiction,
-                coalesce(e.confidence, 0.5) as confidence,
-                match_rank,
-                'neo4j' as source
-            ORDER BY match_rank, confidence DESC, name
-            LIMIT $limit
-            """
-
-            result = await session.run(
-                query,
-                prefix=q,
-                search_term=q,
+            # Bounded full-text index lookup, name-prefix matches first
+            records = await suggest_entities(
+                session,
+                q,
+                labels=neo4j_labels,
                 limit=limit,
             )
-            records = await result.data()
 
             for record in records:
                 suggestions.append(AutocompleteSuggestion(
@@ -247,8 +221,22 @@ async def autocomplete_entities(
         import logging
         logging.getLogger(__name__).warning(f"Neo4j autocomplete failed: {e}")
 
-    # Future: Could also search provincial registry cache if needed
-    # For now, Neo4j contains all scraped data
+    # Top up from the registry name indexes (only those already loaded)
+    if len(suggestions) < limit:
+        from ..ingestion.search import suggest_registry_names
+
+        jurisdictions = {"irs990": "US", "cra": "CA", "canada_corps": "CA"}
+        seen = {s.name.lower() for s in suggestions}
+        for result in suggest_registry_names(q, limit - len(suggestions)):
+            if result.name.lower() in seen:
+                continue
+            seen.add(result.name.lower())
+            suggestions.append(AutocompleteSuggestion(
+                name=result.name,
+                entity_type="organization",
+                source=result.source,
+                jurisdiction=jurisdictions.get(result.source),
+            ))
 
     return {
         "suggestions": [s.model_dump() for s in suggestions[:limit]],
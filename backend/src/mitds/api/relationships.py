@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 
 from . import NotFoundError
 from .auth import OptionalUser
+from ..cache import read_through, relationship_key
 from ..detection.funding import (
     FundingClusterDetector,
     FundingClusterResult,
@@ -526,6 +527,22 @@ async def get_funder_recipients(
     Returns all entities that have received funding directly
     from the specified funder.
     """
+    view = f"funding_recipients:{fiscal_year}:{min_amount}:{limit}"
+    return await read_through(
+        funder_id,
+        relationship_key(funder_id, view),
+        lambda: _load_funding_recipients(funder_id, fiscal_year, min_amount, limit),
+        "relationship",
+    )
+
+
+async def _load_funding_recipients(
+    funder_id: UUID,
+    fiscal_year: int | None,
+    min_amount: float | None,
+    limit: int,
+) -> dict[str, Any]:
+    """Load direct funding recipients as a JSON-ready response payload."""
     recipients = await get_funding_recipients(
         funder_id=funder_id,
         fiscal_year=fiscal_year,
@@ -539,7 +556,7 @@ async def get_funder_recipients(
         "funder_id": str(funder_id),
         "recipients": [
             {
-                "entity": entity.model_dump(),
+                "entity": entity.model_dump(mode="json"),
                 "amount": amount,
             }
             for entity, amount in recipients
@@ -567,6 +584,22 @@ async def get_recipient_funders(
     Returns all entities that have provided funding directly
     to the specified recipient.
     """
+    view = f"funding_sources:{fiscal_year}:{min_amount}:{limit}"
+    return await read_through(
+        recipient_id,
+        relationship_key(recipient_id, view),
+        lambda: _load_funding_sources(recipient_id, fiscal_year, min_amount, limit),
+        "relationship",
+    )
+
+
+async def _load_funding_sources(
+    recipient_id: UUID,
+    fiscal_year: int | None,
+    min_amount: float | None,
+    limit: int,
+) -> dict[str, Any]:
+    """Load direct funders as a JSON-ready response payload."""
     funders = await get_funding_sources(
         recipient_id=recipient_id,
         fiscal_year=fiscal_year,
@@ -580,7 +613,7 @@ async def get_recipient_funders(
         "recipient_id": str(recipient_id),
         "funders": [
             {
-                "entity": entity.model_dump(),
+                "entity": entity.model_dump(mode="json"),
                 "amount": amount,
             }
             for entity, amount in funders
@@ -756,6 +789,7 @@ async def get_shared_infrastructure(
         List of shared infrastructure matches with signals
     """
     from ..detection.infra import InfrastructureDetector
+    from ..detection.infra_store import InfrastructureProfileStore
 
     # Parse domains
     domain_list: list[str] = []
@@ -775,7 +809,7 @@ async def get_shared_infrastructure(
         }
 
     # Detect shared infrastructure
-    detector = InfrastructureDetector()
+    detector = InfrastructureDetector(store=InfrastructureProfileStore())
     try:
         matches = await detector.find_shared_infrastructure(
             domains=domain_list,
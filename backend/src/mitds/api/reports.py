@@ -150,6 +150,15 @@ async def _generate_report_async(
         if isinstance(report, StructuralRiskReport):
             report.entities_analyzed = len(entity_ids)
             report.finalize()
+        elif isinstance(report, TopologySummaryReport):
+            from ..detection.topology import analyze_topology, apply_topology_to_report
+            from ..graph.projection import ProjectionFilter
+
+            topology = await analyze_topology(
+                ProjectionFilter.create(start=date_range_start, end=date_range_end),
+                entity_ids=entity_ids,
+            )
+            apply_topology_to_report(report, topology)
 
         # Store the completed report
         _report_store[report_id]["status"] = ReportStatus.COMPLETED.value
@@ -1,10 +1,21 @@
 """Redis caching for frequently accessed entities.
 
 Provides caching layer to reduce database load for common queries.
+In production a bounded in-process LRU sits in front of Redis; values
+are JSON by default, with optional msgpack encoding and zlib compression
+for large payloads.
 """
 
 import asyncio
+import fnmatch
 import json
+import sys
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Iterable
+from dataclasses import asdict, dataclass
 from datetime import timedelta
 from functools import wraps
 from typing import Any, Callable, TypeVar
@@ -13,6 +24,13 @@ from uuid import UUID
 from .config import get_settings
 from .logging import get_context_logger
 
+# Check for msgpack availability
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = get_context_logger(__name__)
 
 T = TypeVar("T")
@@ -24,18 +42,107 @@ CACHE_TTL = {
     "entity_list": 60,  # 1 minute for entity lists
     "relationship": 300,  # 5 minutes for relationships
     "search_result": 120,  # 2 minutes for search results
+    "search_count": 300,  # 5 minutes for approximate search totals
     "detection_score": 600,  # 10 minutes for detection scores
     "stats": 60,  # 1 minute for statistics
+    "registry_search": 3600,  # 1 hour for external registry lookups
+    "pdf_extraction": 30 * 86400,  # 30 days; keyed by content hash, so never stale
     "default": 300,  # 5 minutes default
 }
 
+# Entity generation counters outlive every cached value, so a counter can
+# only expire (and restart at 0) once nothing tagged with it is left
+GENERATION_TTL = 86400
+
 # Cache key prefixes
 KEY_PREFIX = "mitds:"
 
+# Encoded value header: NUL byte followed by a flags byte
+_HEADER = b"\x00"
+_FLAG_MSGPACK = 1
+_FLAG_ZLIB = 2
+
+
+@dataclass
+class CacheStats:
+    """Counters for a cache backend."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    errors: int = 0
+
+
+class CacheCodec:
+    """Serializes cache values to bytes for Redis.
+
+    Plain JSON values are written without a header, so entries stay
+    readable by older readers and `redis-cli`. msgpack and/or zlib
+    compressed values are prefixed with a NUL byte and a flags byte;
+    JSON never starts with NUL, so both formats decode side by side.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compress_min_bytes: int = 0,
+        compress_level: int = 1,
+    ):
+        """Initialize the codec.
+
+        Args:
+            serializer: "json" or "msgpack" (falls back to JSON if msgpack
+                is not installed)
+            compress_min_bytes: zlib-compress encoded values at least this
+                large (0 disables compression)
+            compress_level: zlib compression level
+        """
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack is not installed, caching values as JSON")
+            serializer = "json"
+        self.serializer = serializer
+        self.compress_min_bytes = compress_min_bytes
+        self.compress_level = compress_level
+
+    def encode(self, value: Any) -> bytes:
+        flags = 0
+        if self.serializer == "msgpack":
+            data = msgpack.packb(value, default=str)
+            flags |= _FLAG_MSGPACK
+        else:
+            data = json.dumps(value, default=str, separators=(",", ":")).encode()
+
+        if self.compress_min_bytes and len(data) >= self.compress_min_bytes:
+            data = zlib.compress(data, self.compress_level)
+            flags |= _FLAG_ZLIB
+
+        if flags:
+            return _HEADER + bytes([flags]) + data
+        return data
+
+    def decode(self, data: bytes | str) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        if data[:1] != _HEADER:
+            return json.loads(data)
+
+        flags, payload = data[1], data[2:]
+        if flags & _FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        if flags & _FLAG_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("Cached value is msgpack encoded but msgpack is not installed")
+            return msgpack.unpackb(payload)
+        return json.loads(payload)
+
 
 class CacheBackend:
     """Abstract cache backend interface."""
 
+    stats: CacheStats
+
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
         raise NotImplementedError
@@ -44,6 +151,15 @@ class CacheBackend:
         """Set value in cache."""
         raise NotImplementedError
 
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """Get several values, in key order (None for misses)."""
+        return [await self.get(key) for key in keys]
+
+    async def mset(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """Set several values with the same TTL."""
+        results = [await self.set(key, value, ttl) for key, value in items.items()]
+        return all(results)
+
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
         raise NotImplementedError
@@ -56,95 +172,249 @@ class CacheBackend:
         """Check if key exists."""
         raise NotImplementedError
 
+    async def incr(self, key: str, ttl: int | None = None) -> int:
+        """Atomically increment an integer counter, refreshing its TTL."""
+        raise NotImplementedError
+
+    async def incr_many(self, keys: list[str], ttl: int | None = None) -> int:
+        """Increment several counters. Returns the number incremented."""
+        for key in keys:
+            await self.incr(key, ttl)
+        return len(keys)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get hit/miss/eviction counters."""
+        return asdict(self.stats)
+
     async def close(self) -> None:
         """Close the cache connection."""
         pass
 
 
 class InMemoryCache(CacheBackend):
-    """Simple in-memory cache for development/testing."""
-
-    def __init__(self):
-        self._cache: dict[str, tuple[Any, float | None]] = {}
-        self._lock = asyncio.Lock()
+    """Bounded in-process LRU cache with per-entry TTL.
 
-    async def get(self, key: str) -> Any | None:
-        import time
+    Used on its own for development/testing and as the local tier of
+    `TieredCache`. Entries are evicted least-recently-used first once
+    either `max_entries` or `max_bytes` is exceeded; expired entries are
+    dropped on read and reclaimed from the LRU end on write.
 
-        async with self._lock:
-            if key not in self._cache:
-                return None
+    All operations are synchronous dict updates with no awaits in
+    between, so no lock is needed within one event loop.
+    """
 
-            value, expires_at = self._cache[key]
-            if expires_at and time.time() > expires_at:
-                del self._cache[key]
-                return None
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        size_of: Callable[[Any], int] | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries (None for unbounded)
+            max_bytes: Maximum total estimated size (None for unbounded)
+            size_of: Size estimate for a value (default: length of its
+                JSON encoding); only used when max_bytes is set
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size_of = size_of or _json_size
+        # key -> (value, expires_at, size)
+        self._cache: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
+        self._bytes = 0
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total estimated size of the cached values."""
+        return self._bytes
+
+    def _lookup(self, key: str, now: float) -> tuple[bool, Any]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at, _ = entry
+        if expires_at is not None and now >= expires_at:
+            self._remove(key)
+            self.stats.expirations += 1
+            return False, None
+        self._cache.move_to_end(key)
+        return True, value
+
+    def _remove(self, key: str) -> bool:
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def _store(self, key: str, value: Any, ttl: int | None, size: int | None = None) -> None:
+        now = time.time()
+        if size is None:
+            size = self._size_of(value) if self.max_bytes else 0
+        self._remove(key)
+        self._cache[key] = (value, now + ttl if ttl else None, size)
+        self._bytes += size
+        self.stats.sets += 1
+        self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        # Reclaim expired entries sitting at the LRU end first
+        while self._cache:
+            oldest = next(iter(self._cache))
+            expires_at = self._cache[oldest][1]
+            if expires_at is None or now < expires_at:
+                break
+            self._remove(oldest)
+            self.stats.expirations += 1
+
+        while self._cache and (
+            (self.max_entries is not None and len(self._cache) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._cache)))
+            self.stats.evictions += 1
 
+    async def get(self, key: str) -> Any | None:
+        found, value = self._lookup(key, time.time())
+        if found:
+            self.stats.hits += 1
             return value
+        self.stats.misses += 1
+        return None
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
-        import time
-
-        async with self._lock:
-            expires_at = time.time() + ttl if ttl else None
-            self._cache[key] = (value, expires_at)
-            return True
+        self._store(key, value, ttl)
+        return True
 
     async def delete(self, key: str) -> bool:
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        return self._remove(key)
 
     async def delete_pattern(self, pattern: str) -> int:
-        import fnmatch
-
-        async with self._lock:
-            keys_to_delete = [
-                k for k in self._cache.keys() if fnmatch.fnmatch(k, pattern)
-            ]
-            for key in keys_to_delete:
-                del self._cache[key]
-            return len(keys_to_delete)
+        keys_to_delete = [k for k in self._cache if fnmatch.fnmatchcase(k, pattern)]
+        for key in keys_to_delete:
+            self._remove(key)
+        return len(keys_to_delete)
 
     async def exists(self, key: str) -> bool:
-        return await self.get(key) is not None
+        return self._lookup(key, time.time())[0]
+
+    async def incr(self, key: str, ttl: int | None = None) -> int:
+        found, value = self._lookup(key, time.time())
+        value = int(value) + 1 if found else 1
+        self._store(key, value, ttl, size=0)
+        return value
 
 
 class RedisCache(CacheBackend):
     """Redis-based cache for production."""
 
-    def __init__(self, redis_client):
+    def __init__(self, redis_client, codec: CacheCodec | None = None):
         self._redis = redis_client
+        self.codec = codec or CacheCodec()
+        self.stats = CacheStats()
 
-    async def get(self, key: str) -> Any | None:
+    def _decode(self, key: str, data: bytes | None) -> Any | None:
+        if data is None:
+            self.stats.misses += 1
+            return None
         try:
-            data = await self._redis.get(key)
-            if data:
-                return json.loads(data)
+            value = self.codec.decode(data)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Redis cache decode error for {key}: {e}")
             return None
+        self.stats.hits += 1
+        return value
+
+    async def get_raw(self, key: str) -> bytes | None:
+        """Get the encoded value for a key, bypassing decoding."""
+        try:
+            return await self._redis.get(key)
         except Exception as e:
+            self.stats.errors += 1
             logger.warning(f"Redis cache get error: {e}")
             return None
 
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+    async def mget_raw(self, keys: list[str]) -> list[bytes | None]:
+        """Get encoded values for several keys in one round trip."""
+        if not keys:
+            return []
+        try:
+            return await self._redis.mget(keys)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Redis cache mget error: {e}")
+            return [None] * len(keys)
+
+    async def get(self, key: str) -> Any | None:
+        return self._decode(key, await self.get_raw(key))
+
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        raw = await self.mget_raw(keys)
+        return [self._decode(key, data) for key, data in zip(keys, raw, strict=True)]
+
+    async def set_raw(self, key: str, data: bytes, ttl: int | None = None) -> bool:
+        """Set an already encoded value."""
         try:
-            data = json.dumps(value, default=str)
             if ttl:
                 await self._redis.setex(key, ttl, data)
             else:
                 await self._redis.set(key, data)
+            self.stats.sets += 1
             return True
         except Exception as e:
+            self.stats.errors += 1
             logger.warning(f"Redis cache set error: {e}")
             return False
 
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        try:
+            data = self.codec.encode(value)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Redis cache encode error for {key}: {e}")
+            return False
+        return await self.set_raw(key, data, ttl)
+
+    async def mset_raw(self, items: dict[str, bytes], ttl: int | None = None) -> bool:
+        """Set several encoded values in one pipelined round trip."""
+        if not items:
+            return True
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, data in items.items():
+                if ttl:
+                    pipe.setex(key, ttl, data)
+                else:
+                    pipe.set(key, data)
+            await pipe.execute()
+            self.stats.sets += len(items)
+            return True
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Redis cache mset error: {e}")
+            return False
+
+    async def mset(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        try:
+            encoded = {key: self.codec.encode(value) for key, value in items.items()}
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Redis cache encode error: {e}")
+            return False
+        return await self.mset_raw(encoded, ttl)
+
     async def delete(self, key: str) -> bool:
         try:
             result = await self._redis.delete(key)
             return result > 0
         except Exception as e:
+            self.stats.errors += 1
             logger.warning(f"Redis cache delete error: {e}")
             return False
 
@@ -160,6 +430,7 @@ class RedisCache(CacheBackend):
                     break
             return deleted
         except Exception as e:
+            self.stats.errors += 1
             logger.warning(f"Redis cache delete pattern error: {e}")
             return 0
 
@@ -167,9 +438,37 @@ class RedisCache(CacheBackend):
         try:
             return await self._redis.exists(key) > 0
         except Exception as e:
+            self.stats.errors += 1
             logger.warning(f"Redis cache exists error: {e}")
             return False
 
+    async def incr(self, key: str, ttl: int | None = None) -> int:
+        try:
+            value = await self._redis.incr(key)
+            if ttl:
+                await self._redis.expire(key, ttl)
+            return value
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Redis cache incr error: {e}")
+            return 0
+
+    async def incr_many(self, keys: list[str], ttl: int | None = None) -> int:
+        if not keys:
+            return 0
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.incr(key)
+                if ttl:
+                    pipe.expire(key, ttl)
+            await pipe.execute()
+            return len(keys)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Redis cache incr error: {e}")
+            return 0
+
     async def close(self) -> None:
         try:
             await self._redis.close()
@@ -177,46 +476,253 @@ class RedisCache(CacheBackend):
             pass
 
 
+class TieredCache(CacheBackend):
+    """Local LRU (L1) in front of Redis (L2).
+
+    Reads are served from L1 when possible; L2 hits are copied into L1.
+    L1 entries live at most `l1_ttl` seconds, which bounds how long a
+    write made by another process can be shadowed locally. Keys starting
+    with any of `l2_only_prefixes` (the entity generation counters) always
+    go to Redis, so read-through invalidation stays exact across
+    processes. Deletes and pattern deletes only reach this process's L1.
+    """
+
+    def __init__(
+        self,
+        l1: InMemoryCache,
+        l2: RedisCache,
+        l1_ttl: int = 30,
+        l2_only_prefixes: tuple[str, ...] = (),
+    ):
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.l2_only_prefixes = l2_only_prefixes
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.l1.stats
+
+    def _local(self, key: str) -> bool:
+        return not key.startswith(self.l2_only_prefixes)
+
+    def _l1_ttl(self, ttl: int | None) -> int:
+        return min(ttl, self.l1_ttl) if ttl else self.l1_ttl
+
+    async def get(self, key: str) -> Any | None:
+        return (await self.mget([key]))[0]
+
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        results: list[Any | None] = [None] * len(keys)
+        remote: list[int] = []
+        for i, key in enumerate(keys):
+            if self._local(key):
+                found, value = self.l1._lookup(key, time.time())
+                if found:
+                    self.l1.stats.hits += 1
+                    results[i] = value
+                    continue
+                self.l1.stats.misses += 1
+            remote.append(i)
+
+        if remote:
+            remote_keys = [keys[i] for i in remote]
+            raw = await self.l2.mget_raw(remote_keys)
+            for i, key, data in zip(remote, remote_keys, raw, strict=True):
+                value = self.l2._decode(key, data)
+                results[i] = value
+                if value is not None and self._local(key):
+                    self.l1._store(key, value, self.l1_ttl, size=len(data))
+        return results
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        return await self.mset({key: value}, ttl)
+
+    async def mset(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        encoded: dict[str, bytes] = {}
+        for key, value in items.items():
+            try:
+                encoded[key] = self.l2.codec.encode(value)
+            except Exception as e:
+                self.l2.stats.errors += 1
+                logger.warning(f"Redis cache encode error for {key}: {e}")
+                return False
+
+        stored = await self.l2.mset_raw(encoded, ttl)
+        for key, value in items.items():
+            if stored and self._local(key):
+                self.l1._store(key, value, self._l1_ttl(ttl), size=len(encoded[key]))
+            else:
+                self.l1._remove(key)
+        return stored
+
+    async def delete(self, key: str) -> bool:
+        self.l1._remove(key)
+        return await self.l2.delete(key)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        await self.l1.delete_pattern(pattern)
+        return await self.l2.delete_pattern(pattern)
+
+    async def exists(self, key: str) -> bool:
+        if self._local(key) and self.l1._lookup(key, time.time())[0]:
+            return True
+        return await self.l2.exists(key)
+
+    async def incr(self, key: str, ttl: int | None = None) -> int:
+        self.l1._remove(key)
+        return await self.l2.incr(key, ttl)
+
+    async def incr_many(self, keys: list[str], ttl: int | None = None) -> int:
+        for key in keys:
+            self.l1._remove(key)
+        return await self.l2.incr_many(keys, ttl)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "l1": {
+                **self.l1.metrics(),
+                "entries": len(self.l1),
+                "bytes": self.l1.size_bytes,
+            },
+            "l2": self.l2.metrics(),
+        }
+
+    async def close(self) -> None:
+        await self.l2.close()
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one.
+
+    The first caller for a key runs the function; callers arriving while
+    it is in flight await the same result (or exception) instead of
+    repeating the backend call.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the exception retrieved even when nobody else was waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+
+def _json_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
 # Global cache instance
 _cache: CacheBackend | None = None
+# Loop a Redis-backed `_cache` was connected on (None for local caches)
+_cache_loop: "weakref.ref[asyncio.AbstractEventLoop] | None" = None
+_single_flight = SingleFlight()
 
 
 async def get_cache() -> CacheBackend:
     """Get or create cache instance.
 
-    Uses Redis in production, falls back to in-memory for development.
+    Uses Redis (behind a bounded local LRU unless `cache_l1_max_entries`
+    is 0) in production, falls back to a bounded in-memory cache for
+    development.
+
+    Redis connections are bound to the event loop that opened them, so a
+    Redis-backed cache is reconnected when called from another loop (e.g.
+    each Celery task's `asyncio.run`).
     """
-    global _cache
+    global _cache, _cache_loop
 
     if _cache is not None:
-        return _cache
+        if _cache_loop is None or _cache_loop() is asyncio.get_running_loop():
+            return _cache
+        logger.debug("Event loop changed; reconnecting the Redis cache")
+        _cache = None
+        _cache_loop = None
 
     settings = get_settings()
 
+    def local_cache() -> InMemoryCache:
+        return InMemoryCache(
+            max_entries=settings.cache_l1_max_entries or None,
+            max_bytes=settings.cache_l1_max_bytes or None,
+        )
+
     if settings.is_production or settings.redis_url:
         try:
             import redis.asyncio as redis
 
             client = redis.from_url(settings.redis_url)
             await client.ping()
-            _cache = RedisCache(client)
+            l2 = RedisCache(
+                client,
+                CacheCodec(
+                    serializer=settings.cache_serializer,
+                    compress_min_bytes=settings.cache_compress_min_bytes,
+                ),
+            )
+            if settings.cache_l1_max_entries:
+                _cache = TieredCache(
+                    local_cache(),
+                    l2,
+                    l1_ttl=settings.cache_l1_ttl,
+                    l2_only_prefixes=(f"{KEY_PREFIX}gen:",),
+                )
+            else:
+                _cache = l2
+            _cache_loop = weakref.ref(asyncio.get_running_loop())
             logger.info("Using Redis cache backend")
         except Exception as e:
             logger.warning(f"Redis unavailable for caching: {e}")
-            _cache = InMemoryCache()
+            _cache = local_cache()
     else:
-        _cache = InMemoryCache()
+        _cache = local_cache()
         logger.info("Using in-memory cache backend")
 
     return _cache
 
 
+def get_cache_metrics() -> dict[str, Any]:
+    """Get cache counters for health/metrics endpoints."""
+    if _cache is None:
+        return {"backend": None}
+    return {
+        "backend": type(_cache).__name__,
+        **_cache.metrics(),
+        "coalesced": _single_flight.coalesced,
+    }
+
+
 async def close_cache() -> None:
     """Close the cache connection."""
-    global _cache
+    global _cache, _cache_loop
     if _cache:
         await _cache.close()
         _cache = None
+    _cache_loop = None
 
 
 # =========================
@@ -254,6 +760,24 @@ def search_key(query: str, filters: dict[str, Any] | None = None) -> str:
     return f"{KEY_PREFIX}search:{query_hash}"
 
 
+def search_count_key(query: str, filters: dict[str, Any] | None = None) -> str:
+    """Build cache key for a search result total."""
+    return search_key(query, filters).replace(":search:", ":search_count:", 1)
+
+
+def registry_search_key(source: str, query: str) -> str:
+    """Build cache key for one registry's results for a query.
+
+    Queries are case-folded and whitespace-collapsed, so trivially
+    different spellings of a name share an entry.
+    """
+    import hashlib
+
+    normalized = " ".join(query.casefold().split())
+    query_hash = hashlib.md5(normalized.encode()).hexdigest()[:12]
+    return f"{KEY_PREFIX}registry_search:{source}:{query_hash}"
+
+
 def relationship_key(entity_id: str | UUID, rel_type: str | None = None) -> str:
     """Build cache key for entity relationships."""
     if rel_type:
@@ -261,6 +785,16 @@ def relationship_key(entity_id: str | UUID, rel_type: str | None = None) -> str:
     return f"{KEY_PREFIX}rel:{entity_id}"
 
 
+def entity_stats_key(entity_id: str | UUID) -> str:
+    """Build cache key for per-entity statistics."""
+    return f"{KEY_PREFIX}entity_stats:{entity_id}"
+
+
+def generation_key(entity_id: str | UUID) -> str:
+    """Build cache key for an entity's generation counter."""
+    return f"{KEY_PREFIX}gen:{entity_id}"
+
+
 def detection_score_key(entity_id: str | UUID) -> str:
     """Build cache key for detection scores."""
     return f"{KEY_PREFIX}detection:{entity_id}"
@@ -271,6 +805,11 @@ def stats_key(stat_type: str) -> str:
     return f"{KEY_PREFIX}stats:{stat_type}"
 
 
+def pdf_extraction_key(content_hash: str, variant: str) -> str:
+    """Build cache key for extracted PDF content."""
+    return f"{KEY_PREFIX}pdf:{content_hash}:{variant}"
+
+
 # =========================
 # Caching Operations
 # =========================
@@ -316,6 +855,9 @@ async def invalidate_entity(entity_id: str | UUID) -> bool:
     """
     cache = await get_cache()
 
+    # Retire every generation-tagged read-through entry for the entity
+    await invalidate_entities([entity_id])
+
     # Delete entity and related caches
     await cache.delete(entity_key(entity_id))
     await cache.delete_pattern(f"{KEY_PREFIX}rel:{entity_id}*")
@@ -328,6 +870,75 @@ async def invalidate_entity(entity_id: str | UUID) -> bool:
     return True
 
 
+async def invalidate_entities(entity_ids: Iterable[str | UUID | None]) -> int:
+    """Invalidate read-through cache entries for entities that were written.
+
+    Bumps each entity's generation counter instead of deleting keys, so
+    callers need not know which views (relationships, stats, funding)
+    were cached. Failures are logged and swallowed: a write must never
+    fail because the cache is unavailable.
+
+    Args:
+        entity_ids: IDs of created, updated or merged entities
+
+    Returns:
+        Number of entities invalidated
+    """
+    keys = sorted({generation_key(i) for i in entity_ids if i})
+    if not keys:
+        return 0
+
+    try:
+        cache = await get_cache()
+        return await cache.incr_many(keys, GENERATION_TTL)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {len(keys)} entities: {e}")
+        return 0
+
+
+async def read_through(
+    entity_id: str | UUID,
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl_key: str = "default",
+) -> Any:
+    """Return a cached entity-scoped value, loading and caching it on a miss.
+
+    Values are stored with the entity's generation read *before* the
+    loader runs. A write that lands while the loader is running bumps the
+    generation, so the possibly stale value is never served afterwards.
+    The generation and the value are fetched in one round trip, and
+    concurrent misses for the same key and generation share one load.
+
+    Args:
+        entity_id: Entity the value belongs to
+        key: Cache key for the value
+        loader: Coroutine function producing a JSON-serializable value
+        ttl_key: Key to look up TTL in CACHE_TTL
+
+    Returns:
+        Cached or freshly loaded value (None results are not cached)
+    """
+    cache = await get_cache()
+    generation, entry = await cache.mget([generation_key(entity_id), key])
+    generation = generation or 0
+
+    if isinstance(entry, dict) and entry.get("gen") == generation:
+        logger.debug(f"Cache hit: {key}")
+        return entry["value"]
+
+    logger.debug(f"Cache miss: {key}")
+
+    async def load() -> Any:
+        value = await loader()
+        if value is not None:
+            ttl = CACHE_TTL.get(ttl_key, CACHE_TTL["default"])
+            await cache.set(key, {"gen": generation, "value": value}, ttl)
+        return value
+
+    return await _single_flight.run(f"{key}@{generation}", load)
+
+
 async def cache_search_results(
     query: str,
     filters: dict[str, Any] | None,
@@ -432,14 +1043,16 @@ def cached(
                 logger.debug(f"Cache hit: {key}")
                 return cached_value
 
-            # Call function and cache result
+            # Call function and cache result, once for concurrent misses
             logger.debug(f"Cache miss: {key}")
-            result = await func(*args, **kwargs)
 
-            if result is not None:
-                await cache.set(key, result, ttl)
+            async def load() -> T:
+                result = await func(*args, **kwargs)
+                if result is not None:
+                    await cache.set(key, result, ttl)
+                return result
 
-            return result
+            return await _single_flight.run(key, load)
 
         return wrapper
 
@@ -447,49 +1060,10 @@ def cached(
 
 
 # =========================
-# Cache Warming
+# Cache Maintenance
 # =========================
 
 
-async def warm_entity_cache(entity_ids: list[str | UUID]) -> int:
-    """Pre-warm cache for a list of entities.
-
-    Args:
-        entity_ids: List of entity IDs to cache
-
-    Returns:
-        Number of entities cached
-    """
-    from .db import get_db_session
-    from sqlalchemy import text
-
-    cached = 0
-
-    async with get_db_session() as db:
-        for entity_id in entity_ids:
-            result = await db.execute(
-                text("SELECT * FROM entities WHERE id = :id"),
-                {"id": entity_id if isinstance(entity_id, UUID) else UUID(entity_id)},
-            )
-            row = result.fetchone()
-
-            if row:
-                entity_data = {
-                    "id": str(row.id),
-                    "name": row.name,
-                    "entity_type": row.entity_type,
-                    "external_ids": row.external_ids,
-                    "metadata": row.metadata,
-                    "created_at": row.created_at.isoformat() if row.created_at else None,
-                    "updated_at": row.updated_at.isoformat() if row.updated_at else None,
-                }
-                if await cache_entity(entity_id, entity_data):
-                    cached += 1
-
-    logger.info(f"Warmed cache for {cached} entities")
-    return cached
-
-
 async def clear_all_cache() -> int:
     """Clear all MITDS cache entries.
 
@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+from ...config import get_settings
+from ...ingestion.search import federated_search
 from ...storage import store_evidence_content
 from ..models import (
     EntryPointType,
@@ -91,53 +93,9 @@ class CorporationAdapter(BaseEntryPointAdapter):
         search_results: dict[str, Any] = {
             "query": corp_name,
             "retrieved_at": now.isoformat(),
-            "sources": {},
+            "sources": await self._search_registries(corp_name),
         }
 
-        # Search SEC EDGAR
-        try:
-            edgar_results = await self._search_edgar(corp_name)
-            search_results["sources"]["edgar"] = {
-                "count": len(edgar_results),
-                "results": edgar_results,
-            }
-        except Exception as e:
-            logger.warning(f"EDGAR search failed: {e}")
-            search_results["sources"]["edgar"] = {"error": str(e)}
-
-        # Search SEDAR+ (Canadian)
-        try:
-            sedar_results = await self._search_sedar(corp_name)
-            search_results["sources"]["sedar"] = {
-                "count": len(sedar_results),
-                "results": sedar_results,
-            }
-        except Exception as e:
-            logger.warning(f"SEDAR search failed: {e}")
-            search_results["sources"]["sedar"] = {"error": str(e)}
-
-        # Search ISED Canada Corporations
-        try:
-            ised_results = await self._search_ised(corp_name)
-            search_results["sources"]["ised"] = {
-                "count": len(ised_results),
-                "results": ised_results,
-            }
-        except Exception as e:
-            logger.warning(f"ISED search failed: {e}")
-            search_results["sources"]["ised"] = {"error": str(e)}
-
-        # Search CRA Charities
-        try:
-            cra_results = await self._search_cra(corp_name)
-            search_results["sources"]["cra"] = {
-                "count": len(cra_results),
-                "results": cra_results,
-            }
-        except Exception as e:
-            logger.warning(f"CRA search failed: {e}")
-            search_results["sources"]["cra"] = {"error": str(e)}
-
         # Store in S3
         content = json.dumps(search_results, indent=2).encode("utf-8")
         content_ref, content_hash = await store_evidence_content(
@@ -165,83 +123,107 @@ class CorporationAdapter(BaseEntryPointAdapter):
             created_at=now,
         )
 
+    async def _search_registries(self, name: str) -> dict[str, dict[str, Any]]:
+        """Search the configured registries concurrently.
+
+        Each registry has its own timeout and results are cached per
+        normalized name, so re-running a case does not repeat lookups.
+        A registry that fails is recorded with its error and the others
+        are still returned.
+        """
+        searches = {
+            "edgar": self._search_edgar,
+            "sedar": self._search_sedar,
+            "ised": self._search_ised,
+            "cra": self._search_cra,
+        }
+        configured = get_settings().corporation_search_sources_list
+        if configured:
+            searches = {k: v for k, v in searches.items() if k in configured}
+
+        outcome = await federated_search(name, searches, use_cache=True)
+
+        sources: dict[str, dict[str, Any]] = {}
+        for source in searches:
+            if source in outcome.results:
+                results = outcome.results[source]
+                sources[source] = {"count": len(results), "results": results}
+            else:
+                sources[source] = {"error": outcome.errors[source]}
+        return sources
+
     async def _search_edgar(self, name: str) -> list[dict[str, Any]]:
         """Search SEC EDGAR for company."""
-        from ...ingestion.edgar import EdgarIngester
-
-        try:
-            ingester = EdgarIngester()
-            results = await ingester.search_companies(name, limit=10)
-            return [
-                {
-                    "cik": r.get("cik"),
-                    "name": r.get("name"),
-                    "ticker": r.get("ticker"),
-                }
-                for r in results
-            ]
-        except Exception as e:
-            logger.debug(f"EDGAR search error: {e}")
-            return []
+        from ...ingestion.search import search_sec_edgar
+
+        results = await search_sec_edgar(name, limit=10)
+        return [
+            {
+                "cik": r.identifier,
+                "name": r.name,
+                "ticker": next(iter(r.details.get("tickers") or []), None),
+            }
+            for r in results
+        ]
 
     async def _search_sedar(self, name: str) -> list[dict[str, Any]]:
-        """Search SEDAR+ for Canadian public companies."""
-        from ...ingestion.sedar import SedarIngester
+        """Search SEDAR+ issuers for Canadian public companies.
 
-        try:
-            ingester = SedarIngester()
-            results = await ingester.search_issuers(name, limit=10)
-            return [
-                {
-                    "sedar_id": r.get("sedar_id"),
-                    "name": r.get("name"),
-                    "jurisdiction": r.get("jurisdiction"),
-                }
-                for r in results
-            ]
-        except Exception as e:
-            logger.debug(f"SEDAR search error: {e}")
+        SEDAR+ has no public name search, so this searches the issuers
+        already ingested from SEDAR+/SEDI (organizations with a SEDAR
+        profile) through the entity full-text index.
+        """
+        from ...db import get_neo4j_session
+        from ...graph.search import ENTITY_SEARCH_INDEX, build_fulltext_query
+
+        search = build_fulltext_query(name)
+        if search is None:
             return []
 
+        async with get_neo4j_session() as session:
+            result = await session.run(
+                """
+                CALL db.index.fulltext.queryNodes($index, $search)
+                YIELD node AS o, score
+                WHERE o:Organization AND o.sedar_profile IS NOT NULL
+                RETURN o.sedar_profile AS sedar_id, o.name AS name,
+                       o.jurisdiction AS jurisdiction
+                ORDER BY score DESC
+                LIMIT 10
+                """,
+                {"index": ENTITY_SEARCH_INDEX.name, "search": search},
+            )
+            return await result.data()
+
     async def _search_ised(self, name: str) -> list[dict[str, Any]]:
         """Search ISED Canada Corporations database."""
-        from ...ingestion.canada_corps import CanadaCorpsIngester
-
-        try:
-            ingester = CanadaCorpsIngester()
-            results = await ingester.search_corporations(name, limit=10)
-            return [
-                {
-                    "corporation_number": r.get("corporation_number"),
-                    "name": r.get("name"),
-                    "status": r.get("status"),
-                    "bn": r.get("bn"),
-                }
-                for r in results
-            ]
-        except Exception as e:
-            logger.debug(f"ISED search error: {e}")
-            return []
+        from ...ingestion.search import search_canada_corps
+
+        results = await search_canada_corps(name, limit=10)
+        return [
+            {
+                "corporation_number": r.identifier,
+                "name": r.name,
+                "status": r.details.get("status"),
+                "bn": r.details.get("bn"),
+            }
+            for r in results
+        ]
 
     async def _search_cra(self, name: str) -> list[dict[str, Any]]:
         """Search CRA Charities database."""
-        from ...ingestion.cra import CRAIngester
-
-        try:
-            ingester = CRAIngester()
-            results = await ingester.search_charities(name, limit=10)
-            return [
-                {
-                    "bn": r.get("bn"),
-                    "name": r.get("name"),
-                    "city": r.get("city"),
-                    "province": r.get("province"),
-                }
-                for r in results
-            ]
-        except Exception as e:
-            logger.debug(f"CRA search error: {e}")
-            return []
+        from ...ingestion.search import search_cra
+
+        results = await search_cra(name, limit=10)
+        return [
+            {
+                "bn": r.identifier,
+                "name": r.name,
+                "city": r.details.get("city"),
+                "province": r.details.get("province"),
+            }
+            for r in results
+        ]
 
     async def extract_leads(self, evidence: Evidence) -> list[ExtractedLead]:
         """Extract leads from corporation search results.
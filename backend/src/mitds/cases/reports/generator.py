@@ -4,9 +4,11 @@ Produces ranked findings with evidence links, cross-border flags,
 and unknown sections.
 """
 
+import asyncio
 import json
 import logging
 import math
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
@@ -76,6 +78,44 @@ RELATIONSHIP_WEIGHTS = {
 }
 
 
+# Entity labels with a unique `id` constraint (see init-neo4j.cypher)
+ENTITY_ID_LABELS = (
+    "Organization",
+    "Person",
+    "Outlet",
+    "Sponsor",
+    "Vendor",
+    "Domain",
+    "PlatformAccount",
+)
+
+
+def _entity_lookup(var: str = "e") -> str:
+    """Cypher binding `var` to the nodes whose id is in $entity_ids.
+
+    A label-less `MATCH (e) WHERE e.id IN ...` cannot use the per-label
+    id constraints and scans every node; this unions one constraint
+    lookup per label instead.
+    """
+    branches = "\n        UNION\n".join(
+        f"        MATCH ({var}:{label}) WHERE {var}.id IN $entity_ids RETURN {var}"
+        for label in ENTITY_ID_LABELS
+    )
+    return f"CALL {{\n{branches}\n        }}"
+
+
+@dataclass
+class ReportData:
+    """Everything a report is built from, gathered in one stage."""
+
+    entities: list[dict[str, Any]] = field(default_factory=list)
+    relationships: list[dict[str, Any]] = field(default_factory=list)
+    ads: list[dict[str, Any]] = field(default_factory=list)
+    cross_border: list[CrossBorderFlag] = field(default_factory=list)
+    unknowns: list[Unknown] = field(default_factory=list)
+    pending_matches: int = 0
+
+
 class ReportGenerator:
     """Generates case reports with ranked findings.
 
@@ -128,12 +168,15 @@ class ReportGenerator:
             logger.warning(f"Case {case.id} has no research session, generating empty report")
             return self._empty_report(case)
 
-        # Fetch data from graph
-        entities = await self._fetch_entities(session_id)
-        relationships = await self._fetch_relationships(session_id)
-        
-        # Fetch ad details for enriching relationships
-        ads = await self._fetch_ads(session_id)
+        # Fetch data from graph and database
+        data = await self._gather_report_data(case.id, session_id)
+        entities = data.entities
+        relationships = data.relationships
+        ads = data.ads
+        cross_border = data.cross_border
+        unknowns = data.unknowns
+
+        # Ad details for enriching relationships
         ad_map = {ad.get("meta_ad_id"): ad for ad in ads if ad.get("meta_ad_id")}
 
         # Rank entities
@@ -142,12 +185,6 @@ class ReportGenerator:
         # Rank relationships and enrich with ad metadata
         ranked_relationships = self._rank_relationships(relationships, ad_map)[:self.MAX_RELATIONSHIPS]
 
-        # Identify cross-border connections
-        cross_border = await self._find_cross_border(session_id)
-
-        # Identify unknowns
-        unknowns = await self._find_unknowns(session_id)
-
         # Build evidence index from entities, relationships, and cross-border flags
         evidence_index = self._build_evidence_index(entities, ranked_relationships, cross_border)
         
@@ -161,9 +198,6 @@ class ReportGenerator:
         end_time = datetime.utcnow()
         processing_time = (end_time - start_time).total_seconds()
 
-        # Count pending matches
-        pending_matches = await self._count_pending_matches(case.id)
-
         # Create summary
         # Handle entry_point_type whether it's an enum or already a string
         entry_type = case.entry_point_type.value if hasattr(case.entry_point_type, 'value') else case.entry_point_type
@@ -173,7 +207,7 @@ class ReportGenerator:
             entity_count=len(entities),
             relationship_count=len(relationships),
             cross_border_count=len(cross_border),
-            has_unresolved_matches=pending_matches > 0,
+            has_unresolved_matches=data.pending_matches > 0,
         )
 
         # Create report
@@ -200,6 +234,44 @@ class ReportGenerator:
         )
         return report
 
+    async def _gather_report_data(self, case_id: UUID, session_id: UUID) -> ReportData:
+        """Run the report's queries concurrently.
+
+        Entities are fetched once. Queries scoped to the session's entities
+        (ads, cross-border links, unknowns, fallback relationships) start
+        as soon as their IDs are known, alongside the queries that do not
+        need them.
+        """
+        entities_task = asyncio.create_task(self._fetch_entities(session_id))
+
+        async def entity_ids() -> list[str]:
+            return [e.get("id") for e in await entities_task if e.get("id")]
+
+        async def for_entities(fetch):
+            ids = await entity_ids()
+            return await fetch(ids) if ids else []
+
+        async def relationships() -> list[dict[str, Any]]:
+            found = await self._fetch_relationships(session_id)
+            if found is not None:
+                return found
+            # No session_relationships records; use the entities' relationships
+            return await for_entities(self._fetch_relationships_fallback)
+
+        try:
+            results = await asyncio.gather(
+                entities_task,
+                relationships(),
+                for_entities(self._fetch_ads),
+                for_entities(self._find_cross_border),
+                for_entities(self._find_unknowns),
+                self._count_pending_matches(case_id),
+            )
+        finally:
+            entities_task.cancel()
+
+        return ReportData(*results)
+
     def _empty_report(self, case: Case) -> CaseReport:
         """Create an empty report for a case without a research session."""
         entry_type = case.entry_point_type.value if hasattr(case.entry_point_type, 'value') else case.entry_point_type
@@ -262,17 +334,16 @@ class ReportGenerator:
         entity_ids = [r["entity_id"] for r in entity_records]
         depth_map = {r["entity_id"]: r["depth"] for r in entity_records}
         
-        # Note: Use COALESCE to avoid warnings about missing properties
-        query = """
-        MATCH (e)
-        WHERE e.id IN $entity_ids
-        OPTIONAL MATCH (e)-[r]-()
-        WITH e, count(DISTINCT r) as rel_count
-        RETURN e.id as id, e.name as name, 
+        # Note: Use COALESCE to avoid warnings about missing properties.
+        # COUNT { (e)--() } reads the degree Neo4j stores per node instead
+        # of expanding every relationship.
+        query = f"""
+        {_entity_lookup("e")}
+        RETURN e.id as id, e.name as name,
                COALESCE(e.entity_type, 'unknown') as entity_type,
-               e.jurisdiction as jurisdiction, 
+               e.jurisdiction as jurisdiction,
                COALESCE(e.confidence, 0.8) as confidence,
-               rel_count, 
+               COUNT {{ (e)--() }} as rel_count,
                COALESCE(e.source_ids, []) as source_ids
         """
 
@@ -328,11 +399,9 @@ class ReportGenerator:
         query = """
         MATCH (s:Sponsor)
         WHERE toLower(s.name) CONTAINS toLower($search_term)
-        OPTIONAL MATCH (s)-[r]-()
-        WITH s, count(DISTINCT r) as rel_count
         RETURN s.id as id, s.name as name, 'organization' as entity_type,
                s.jurisdiction as jurisdiction, s.confidence as confidence,
-               rel_count, [] as source_ids
+               COUNT { (s)--() } as rel_count, [] as source_ids
         LIMIT 50
         """
 
@@ -348,11 +417,13 @@ class ReportGenerator:
             logger.warning(f"Failed fallback entity fetch: {e}")
             return []
 
-    async def _fetch_relationships(self, session_id: UUID) -> list[dict[str, Any]]:
+    async def _fetch_relationships(self, session_id: UUID) -> list[dict[str, Any]] | None:
         """Fetch relationships discovered in the research session.
-        
+
         Uses PostgreSQL session_relationships table to get relationship IDs,
-        then fetches relationship details from Neo4j.
+        then fetches relationship details from Neo4j. Returns None when the
+        session has no relationship records (see
+        `_fetch_relationships_fallback`).
         """
         # First, get relationship IDs from PostgreSQL session_relationships table
         relationship_ids = []
@@ -376,8 +447,7 @@ class ReportGenerator:
                 await session.close()
 
         if not relationship_ids:
-            # Fallback: fetch relationships for entities in this session
-            return await self._fetch_relationships_fallback(session_id)
+            return None
 
         # Fetch relationship details from Neo4j by ID
         query = """
@@ -396,26 +466,19 @@ class ReportGenerator:
             logger.warning(f"Failed to fetch relationship details from Neo4j: {e}")
             return []
 
-    async def _fetch_relationships_fallback(self, session_id: UUID) -> list[dict[str, Any]]:
+    async def _fetch_relationships_fallback(self, entity_ids: list[str]) -> list[dict[str, Any]]:
         """Fallback relationship fetch based on entities in the session.
-        
+
         When no session_relationships records exist, fetch relationships
-        between entities that are linked to this session.
+        of the entities that are linked to this session.
         """
-        # Get entity IDs from session
-        entities = await self._fetch_entities(session_id)
-        if not entities:
-            return []
-
-        entity_ids = [e.get("id") for e in entities if e.get("id")]
-        if not entity_ids:
-            return []
-
-        # Find relationships between these entities
         # Use COALESCE to avoid warnings about missing properties
-        query = """
-        MATCH (source)-[r]->(target)
-        WHERE source.id IN $entity_ids OR target.id IN $entity_ids
+        query = f"""
+        {_entity_lookup("e")}
+        MATCH (e)-[r]-()
+        WITH DISTINCT r
+        LIMIT 100
+        WITH r, startNode(r) as source, endNode(r) as target
         RETURN source.id as source_id, source.name as source_name,
                target.id as target_id, target.name as target_name,
                type(r) as rel_type, 
@@ -423,7 +486,6 @@ class ReportGenerator:
                COALESCE(r.confidence, 0.8) as confidence,
                COALESCE(r.evidence_ids, []) as evidence_ids,
                source.meta_ad_id as source_meta_ad_id
-        LIMIT 100
         """
 
         try:
@@ -559,29 +621,19 @@ class ReportGenerator:
         ranked.sort(key=lambda x: x.significance_score, reverse=True)
         return ranked
 
-    async def _find_cross_border(self, session_id: UUID) -> list[CrossBorderFlag]:
+    async def _find_cross_border(self, entity_ids: list[str]) -> list[CrossBorderFlag]:
         """Find US-CA cross-border connections among session entities."""
-        # Get entities in this session first
-        entities = await self._fetch_entities(session_id)
-        if not entities:
-            return []
-
-        entity_ids = [e.get("id") for e in entities if e.get("id")]
-        if not entity_ids:
-            return []
-
-        # Find cross-border relationships involving session entities
-        query = """
-        MATCH (us)-[r]->(ca)
-        WHERE (us.id IN $entity_ids OR ca.id IN $entity_ids)
-          AND us.jurisdiction = 'US' AND ca.jurisdiction = 'CA'
-        RETURN us.id as us_id, us.name as us_name,
-               ca.id as ca_id, ca.name as ca_name,
-               type(r) as rel_type, r.amount as amount, r.evidence_ids as evidence_ids
-        UNION
-        MATCH (ca)-[r]->(us)
-        WHERE (us.id IN $entity_ids OR ca.id IN $entity_ids)
-          AND us.jurisdiction = 'US' AND ca.jurisdiction = 'CA'
+        # Relationships in either direction between a US and a CA endpoint,
+        # where at least one endpoint is a session entity
+        query = f"""
+        {_entity_lookup("e")}
+        MATCH (e)-[r]-(other)
+        WHERE (e.jurisdiction = 'US' AND other.jurisdiction = 'CA')
+           OR (e.jurisdiction = 'CA' AND other.jurisdiction = 'US')
+        WITH DISTINCT r, startNode(r) as a, endNode(r) as b
+        WITH r,
+             CASE WHEN a.jurisdiction = 'US' THEN a ELSE b END as us,
+             CASE WHEN a.jurisdiction = 'US' THEN b ELSE a END as ca
         RETURN us.id as us_id, us.name as us_name,
                ca.id as ca_id, ca.name as ca_name,
                type(r) as rel_type, r.amount as amount, r.evidence_ids as evidence_ids
@@ -616,28 +668,19 @@ class ReportGenerator:
 
         return flags
 
-    async def _find_unknowns(self, session_id: UUID) -> list[Unknown]:
+    async def _find_unknowns(self, entity_ids: list[str]) -> list[Unknown]:
         """Find entities that couldn't be fully traced.
-        
+
         Looks for entities in the session that have trace_incomplete or
         no_sources_found flags set.
         """
-        # Get entities in this session
-        entities = await self._fetch_entities(session_id)
-        if not entities:
-            return []
-
-        entity_ids = [e.get("id") for e in entities if e.get("id")]
-        if not entity_ids:
-            return []
-
         # Find entities with incomplete traces
         # Use COALESCE to avoid warnings when properties don't exist
-        query = """
-        MATCH (e)
-        WHERE e.id IN $entity_ids
-          AND (COALESCE(e.trace_incomplete, false) = true 
-               OR COALESCE(e.no_sources_found, false) = true)
+        query = f"""
+        {_entity_lookup("e")}
+        WITH e
+        WHERE COALESCE(e.trace_incomplete, false) = true
+           OR COALESCE(e.no_sources_found, false) = true
         RETURN e.name as name, 
                COALESCE(e.trace_reason, 'Not fully traced') as reason,
                COALESCE(e.attempted_sources, []) as sources
@@ -731,24 +774,16 @@ class ReportGenerator:
         logger.info(f"Built evidence index with {len(evidence_map)} unique citations")
         return list(evidence_map.values())
 
-    async def _fetch_ads(self, session_id: UUID) -> list[dict[str, Any]]:
+    async def _fetch_ads(self, entity_ids: list[str]) -> list[dict[str, Any]]:
         """Fetch ad details from Neo4j for entities in this session.
-        
+
         Returns detailed ad data for enriching relationships and building summaries.
         """
-        # Get entities in this session
-        entities = await self._fetch_entities(session_id)
-        if not entities:
-            return []
-
-        entity_ids = [e.get("id") for e in entities if e.get("id")]
-        if not entity_ids:
-            return []
-
-        # Find ads that are SPONSORED_BY entities in this session
-        query = """
+        # Find ads that are SPONSORED_BY entities in this session,
+        # expanding from the (few) session entities rather than all ads
+        query = f"""
+        {_entity_lookup("s")}
         MATCH (a:Ad)-[:SPONSORED_BY]->(s)
-        WHERE s.id IN $entity_ids
         RETURN a.meta_ad_id as meta_ad_id, a.name as name,
                a.creative_body as creative_body, a.creative_title as creative_title,
                a.ad_snapshot_url as ad_snapshot_url,
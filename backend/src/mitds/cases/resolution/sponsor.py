@@ -5,6 +5,7 @@ organizations in the graph using fuzzy matching and confidence scoring.
 """
 
 import logging
+import re
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -12,6 +13,7 @@ from uuid import UUID
 from rapidfuzz import fuzz
 
 from ...db import get_neo4j_session
+from ...graph.search import ENTITY_SEARCH_INDEX
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +64,12 @@ class SponsorResolver:
     # Fuzzy match threshold
     MIN_NAME_SIMILARITY = 0.85
 
+    # Full-text entity index, created on API startup (graph/search.py)
+    NAME_INDEX = ENTITY_SEARCH_INDEX.name
+
+    # Lexical candidates fetched from the index and fuzzy-scored
+    CANDIDATE_LIMIT = 50
+
     def __init__(
         self,
         neo4j_session: Any = None,
@@ -78,6 +86,7 @@ class SponsorResolver:
         self.auto_merge_threshold = auto_merge_threshold
         self.review_threshold = review_threshold
         self._neo4j_session = neo4j_session
+        self._fulltext_available = True
 
     async def _get_neo4j_session(self):
         """Get or create Neo4j session."""
@@ -210,22 +219,9 @@ class SponsorResolver:
         # Normalize name for searching
         normalized = self._normalize_name(name)
 
-        # Query organizations with similar names
-        query = """
-        MATCH (o:Organization)
-        WHERE o.name IS NOT NULL
-        RETURN o.id as id, o.name as name, o.entity_type as entity_type,
-               o.jurisdiction as jurisdiction,
-               o.address_city as address_city,
-               o.address_postal as address_postal,
-               o.ein as ein, o.bn as bn, o.meta_page_id as meta_page_id
-        LIMIT 1000
-        """
-
         try:
             session = await self._get_neo4j_session()
-            result = await session.run(query, {})
-            records = await result.data()
+            records = await self._fetch_name_candidates(session, normalized)
 
             for row in records:
                 org_name = row.get("name", "")
@@ -304,6 +300,74 @@ class SponsorResolver:
         candidates.sort(key=lambda x: x.confidence, reverse=True)
         return candidates[:limit]
 
+    async def _fetch_name_candidates(
+        self, session: Any, normalized: str
+    ) -> list[dict[str, Any]]:
+        """Fetch the top lexical candidates for a normalized name.
+
+        Uses the entity full-text index so only organizations sharing (or
+        nearly sharing) a name token are returned, best first. Hits are
+        filtered to organizations before the candidate limit applies. If
+        the index is missing, falls back to a substring predicate on the
+        longest name token.
+        """
+        tokens = re.findall(r"\w+", normalized)
+        if not tokens:
+            return []
+
+        returns = """
+        RETURN o.id as id, o.name as name, o.entity_type as entity_type,
+               o.jurisdiction as jurisdiction,
+               o.address_city as address_city,
+               o.address_postal as address_postal,
+               o.ein as ein, o.bn as bn, o.meta_page_id as meta_page_id
+        """
+
+        if self._fulltext_available:
+            query = """
+            CALL db.index.fulltext.queryNodes($index, $search)
+            YIELD node AS o, score
+            WHERE o:Organization AND o.name IS NOT NULL
+            WITH o, score
+            LIMIT $limit
+            """ + returns
+            try:
+                result = await session.run(query, {
+                    "index": self.NAME_INDEX,
+                    "search": self._lucene_query(tokens),
+                    "limit": self.CANDIDATE_LIMIT,
+                })
+                return await result.data()
+            except Exception as e:
+                logger.warning(
+                    f"Full-text index {self.NAME_INDEX} query failed, "
+                    f"falling back to substring match: {e}"
+                )
+                # Stop retrying an index that does not exist
+                if "no such" in str(e).lower():
+                    self._fulltext_available = False
+
+        query = """
+        MATCH (o:Organization)
+        WHERE toLower(o.name) CONTAINS $token
+        """ + returns + """
+        LIMIT $limit
+        """
+        result = await session.run(query, {
+            "token": max(tokens, key=len),
+            "limit": self.CANDIDATE_LIMIT,
+        })
+        return await result.data()
+
+    @staticmethod
+    def _lucene_query(tokens: list[str]) -> str:
+        """Build a Lucene query matching any name token, tolerating typos.
+
+        Tokens are word characters only, so need no escaping; longer tokens
+        allow Lucene's default edit distance.
+        """
+        return " OR ".join(f"{t}~" if len(t) >= 5 else t for t in tokens)
+
     def _normalize_name(self, name: str) -> str:
         """Normalize an organization name for comparison."""
         # Remove common suffixes
@@ -49,6 +49,18 @@ def cli():
     default=None,
     help="Maximum number of records to process",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Number of concurrent record-processing workers (default: 1)",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=1,
+    help="Records per micro-batch handed to each worker (default: 1)",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -60,6 +72,8 @@ def ingest_irs990(
     end_year: int | None,
     incremental: bool,
     limit: int | None,
+    workers: int,
+    batch_size: int,
     verbose: bool,
 ):
     """Ingest IRS 990 nonprofit filings.
@@ -77,6 +91,9 @@ def ingest_irs990(
 
         # Test with limited records
         mitds ingest irs990 --limit 100 --verbose
+
+        # Process filings with 8 concurrent workers
+        mitds ingest irs990 --workers 8 --batch-size 50
     """
     from ..ingestion import run_irs990_ingestion
 
@@ -88,6 +105,7 @@ def ingest_irs990(
         click.echo(f"  Mode: {'incremental' if incremental else 'full'}")
         if limit:
             click.echo(f"  Limit: {limit} records")
+        click.echo(f"  Workers: {workers} (batch size {batch_size})")
 
     start_time = datetime.now()
 
@@ -98,6 +116,8 @@ def ingest_irs990(
                 end_year=end_year,
                 incremental=incremental,
                 limit=limit,
+                batch_size=batch_size,
+                max_workers=workers,
             )
         )
 
@@ -308,6 +308,12 @@ def queue_stats():
     default=0.95,
     help="Confidence threshold for automatic merging (default: 0.95)",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=0,
+    help="Processes used for fuzzy scoring (default: 0, in-process)",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -322,6 +328,7 @@ def queue_stats():
 def run_resolution(
     entity_type: str,
     auto_merge_threshold: float,
+    workers: int,
     dry_run: bool,
     verbose: bool,
 ):
@@ -344,7 +351,11 @@ def run_resolution(
 
         # Full run with verbose output
         mitds resolve run --verbose
+
+        # Score fuzzy pairs across 8 processes
+        mitds resolve run --workers 8
     """
+    from ..resolution.dedup import DedupConfig
     from ..resolution.resolver import EntityResolver
     from ..resolution.reconcile import ReconciliationQueue
 
@@ -366,7 +377,9 @@ def run_resolution(
         for etype in entity_types:
             click.echo(f"\nResolving {etype} entities...")
 
-            duplicates = await resolver.find_duplicates(etype)
+            duplicates = await resolver.find_duplicates(
+                etype, config=DedupConfig(workers=workers)
+            )
 
             if not duplicates:
                 click.echo(f"  No duplicates found for {etype}")
@@ -171,6 +171,96 @@ class Settings(BaseSettings):
             return creds
         return None
 
+    # =========================
+    # Meta Ad Library
+    # =========================
+    # Comma-separated watch list harvested when a run names no terms or pages
+    meta_ads_search_terms: str = ""
+    meta_ads_concurrency: int = 4  # Concurrent Ad Library queries
+
+    # =========================
+    # Ingestion
+    # =========================
+    ingestion_batch_size: int = 50  # Records per micro-batch in scheduled ingestion
+    ingestion_max_workers: int = 8  # Concurrent record workers in scheduled ingestion
+
+    # =========================
+    # Registry Search
+    # =========================
+    registry_search_timeout: float = 8.0  # Seconds before one registry's search is abandoned
+    # Comma-separated sources for company search when a caller names none (empty = all)
+    registry_search_sources: str = ""
+    # Comma-separated registries searched for corporation cases (empty = all)
+    corporation_search_sources: str = ""
+
+    # =========================
+    # Research
+    # =========================
+    research_session_workers: int = 4  # Leads processed concurrently per session
+    research_max_workers: int = 16  # Leads processed concurrently per process, across sessions
+    research_reconcile_interval: float = 5.0  # Seconds between session limit/status checks
+
+    # =========================
+    # Graph Projection
+    # =========================
+    graph_projection_ttl: int = 600  # Max seconds a cached projection is reused
+    graph_projection_cache_size: int = 4  # Projections (filters) kept in memory
+    graph_betweenness_samples: int = 256  # Source nodes sampled for betweenness on larger graphs
+
+    # =========================
+    # Infrastructure Profiles
+    # =========================
+    infra_refresh_batch_size: int = 200  # Stale domain profiles rescanned per refresh run
+    infra_known_match_limit: int = 100  # Stored domains compared against a sharing request
+
+    # =========================
+    # Infrastructure Scanning
+    # =========================
+    infra_scan_max_domains: int = 20  # Domains scanned at once
+    infra_scan_max_lookups: int = 64  # Lookups in flight across all services
+    infra_scan_dns_limit: int = 32  # Concurrent DNS queries
+    infra_scan_whois_limit: int = 4  # Concurrent WHOIS queries (registries rate limit)
+    infra_scan_hosting_limit: int = 4  # Concurrent IP/ASN API requests
+    infra_scan_analytics_limit: int = 16  # Concurrent page fetches
+    infra_scan_ssl_limit: int = 16  # Concurrent TLS handshakes
+    infra_scan_threads: int = 8  # Worker threads for blocking WHOIS/resolver calls
+    infra_http_max_connections: int = 32  # Shared HTTP pool size
+    infra_http_max_keepalive: int = 16  # Idle keep-alive connections kept open
+    infra_dns_cache_size: int = 10000  # DNS answers cached per process
+    infra_dns_default_ttl: int = 300  # Seconds to cache answers that carry no TTL
+    infra_dns_negative_ttl: int = 60  # Seconds to cache empty answers
+    # Comma-separated resolver IPs for DNS lookups (empty = system resolver)
+    infra_dns_nameservers: str = ""
+
+    # =========================
+    # PDF Extraction
+    # =========================
+    pdf_workers: int = 2  # Extraction processes (0 = extract in a thread)
+    pdf_timeout: float = 60.0  # Seconds per document before extraction stops
+    pdf_max_pages: int = 200  # Pages extracted per document (0 = all)
+
+    # =========================
+    # Entity Resolution
+    # =========================
+    # Directory of the persistent embedding store (empty = in-memory only)
+    embedding_store_path: str = ""
+
+    # =========================
+    # Cache
+    # =========================
+    cache_l1_max_entries: int = 10_000  # Local LRU entries in front of Redis (0 = Redis only)
+    cache_l1_max_bytes: int = 64 * 1024 * 1024  # Approximate encoded bytes held locally
+    cache_l1_ttl: int = 30  # Max seconds a local entry may shadow Redis
+    cache_serializer: Literal["json", "msgpack"] = "json"  # msgpack requires the msgpack package
+    cache_compress_min_bytes: int = 16_384  # zlib-compress larger values (0 disables)
+
+    # =========================
+    # Audit Logging
+    # =========================
+    audit_queue_size: int = 10_000  # Entries buffered before dropping
+    audit_batch_size: int = 500  # Entries per multi-row insert
+    audit_flush_interval: float = 1.0  # Seconds before a partial batch is written
+
     # =========================
     # JWT/Auth
     # =========================
@@ -195,6 +285,26 @@ class Settings(BaseSettings):
         """Parse CORS origins as a list."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    @property
+    def meta_ads_search_terms_list(self) -> list[str]:
+        """Parse the Meta Ad Library watch list."""
+        return [t.strip() for t in self.meta_ads_search_terms.split(",") if t.strip()]
+
+    @property
+    def registry_search_sources_list(self) -> list[str]:
+        """Parse the default company search sources."""
+        return [s.strip() for s in self.registry_search_sources.split(",") if s.strip()]
+
+    @property
+    def corporation_search_sources_list(self) -> list[str]:
+        """Parse the registries searched for corporation cases."""
+        return [s.strip() for s in self.corporation_search_sources.split(",") if s.strip()]
+
+    @property
+    def infra_dns_nameservers_list(self) -> list[str]:
+        """Parse the resolvers used for infrastructure DNS lookups."""
+        return [s.strip() for s in self.infra_dns_nameservers.split(",") if s.strip()]
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
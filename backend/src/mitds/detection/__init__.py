@@ -5,6 +5,7 @@ Provides detection algorithms for:
 - Temporal coordination detection
 - Infrastructure sharing detection
 - Composite scoring
+- Network topology analysis
 - Hard negative filtering
 """
 
@@ -19,6 +20,7 @@ from .temporal import (
     TemporalCoordinationDetector,
     TemporalCoordinationResult,
     TimingEvent,
+    TimingEventFrame,
     BurstDetectionResult,
     LeadLagResult,
     SynchronizationResult,
@@ -31,6 +33,8 @@ from .infra import (
     InfraSignalType,
     InfrastructureScorer,
 )
+from .infra_scan import DNSCache, ScanLimits
+from .infra_store import InfrastructureProfileStore, StoredProfile
 from .composite import (
     CompositeScoreCalculator,
     CompositeScore,
@@ -40,6 +44,14 @@ from .composite import (
     calculate_composite_score,
     verify_no_single_signal_trigger,
 )
+from .topology import (
+    CentralNode,
+    Community,
+    TopologyAnalyzer,
+    TopologyResult,
+    analyze_topology,
+    apply_topology_to_report,
+)
 from .hardneg import (
     filter_hard_negatives,
     check_hard_negatives,
@@ -58,6 +70,7 @@ __all__ = [
     "TemporalCoordinationDetector",
     "TemporalCoordinationResult",
     "TimingEvent",
+    "TimingEventFrame",
     "BurstDetectionResult",
     "LeadLagResult",
     "SynchronizationResult",
@@ -68,6 +81,10 @@ __all__ = [
     "InfraSignal",
     "InfraSignalType",
     "InfrastructureScorer",
+    "InfrastructureProfileStore",
+    "StoredProfile",
+    "ScanLimits",
+    "DNSCache",
     # Composite
     "CompositeScoreCalculator",
     "CompositeScore",
@@ -76,6 +93,13 @@ __all__ = [
     "SignalCategory",
     "calculate_composite_score",
     "verify_no_single_signal_trigger",
+    # Topology
+    "CentralNode",
+    "Community",
+    "TopologyAnalyzer",
+    "TopologyResult",
+    "analyze_topology",
+    "apply_topology_to_report",
     # Hard Negatives
     "filter_hard_negatives",
     "check_hard_negatives",
@@ -4,6 +4,7 @@ Detects groups of outlets/organizations that share common funders,
 indicating potential coordinated influence.
 """
 
+from collections import Counter
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -13,9 +14,13 @@ from pydantic import BaseModel, Field
 from ..db import get_neo4j_session
 from ..graph.queries import EntityNode, FundingCluster
 from ..logging import get_context_logger
+from .cofunding import CoFundingMatrix, FundingEdge
 
 logger = get_context_logger(__name__)
 
+# Labels FUNDED_BY endpoints are looked up under, by their id constraints
+FUNDING_NODE_LABELS = ("Organization", "Outlet", "Person")
+
 
 class FundingClusterResult(BaseModel):
     """Result of funding cluster detection."""
@@ -76,6 +81,10 @@ class FundingClusterDetector:
     ) -> list[FundingClusterResult]:
         """Detect funding clusters.
 
+        Pulls the FUNDED_BY edge list once and finds recipients sharing
+        funders with sparse matrix products, then groups the strongest
+        pairs into clusters.
+
         Args:
             entity_type: Filter by entity type (OUTLET, ORGANIZATION)
             fiscal_year: Filter by fiscal year
@@ -85,68 +94,123 @@ class FundingClusterDetector:
             List of detected funding clusters
         """
         async with get_neo4j_session() as session:
-            # Build entity type filter
-            entity_filter = ""
-            if entity_type:
-                entity_filter = f"WHERE recipient:{entity_type}"
-
-            # Build fiscal year filter
-            year_filter = ""
-            if fiscal_year:
-                year_filter = f"AND r.fiscal_year = {fiscal_year}"
-
-            # Find entities that share multiple funders
-            query = f"""
-            // Find all recipient-funder pairs
-            MATCH (recipient)-[r:FUNDED_BY]->(funder)
-            {entity_filter}
-            {year_filter}
-            WITH recipient, funder, r.amount as amount, r.fiscal_year as year
-
-            // Group by recipient to get their funders
-            WITH recipient,
-                 collect(DISTINCT {{funder: funder, amount: amount, year: year}}) as funding_info
-
-            // For each pair of recipients, find shared funders
-            MATCH (other)-[r2:FUNDED_BY]->(shared_funder)
-            WHERE other <> recipient
-            AND shared_funder IN [f IN funding_info | f.funder]
-            {year_filter.replace('r.', 'r2.')}
-
-            // Count shared funders
-            WITH recipient, other,
-                 collect(DISTINCT shared_funder) as shared_funders,
-                 funding_info
-
-            WHERE size(shared_funders) >= {self.min_shared_funders}
-
-            // Return cluster info
-            RETURN
-                recipient,
-                other,
-                shared_funders,
-                size(shared_funders) as shared_count,
-                funding_info
-            ORDER BY shared_count DESC
-            LIMIT {limit * 2}
-            """
-
-            result = await session.run(query)
-            records = await result.data()
-
-            # Group into clusters
-            clusters = self._group_into_clusters(records)
+            edges = await self._fetch_funding_edges(session, entity_type, fiscal_year)
+            matrix = CoFundingMatrix(edges)
+
+            # Keep the strongest pairs, so clusters stay focused
+            pairs = matrix.shared_funder_pairs(self.min_shared_funders, limit=limit * 2)
+            logger.info(
+                f"Co-funding: {matrix.edge_count} funding edges, "
+                f"{len(matrix.recipient_ids)} recipients, {len(pairs)} pairs kept"
+            )
 
-            # Calculate scores and return top clusters
-            scored_clusters = []
-            for cluster in clusters[:limit]:
-                score = self._calculate_cluster_score(cluster)
-                cluster.score = score
-                cluster.confidence = min(score + 0.2, 1.0)
-                cluster.evidence_summary = self._generate_evidence_summary(cluster)
-                scored_clusters.append(cluster)
+            shared = {
+                (p.recipient_id, p.other_id): matrix.shared_funders(p.recipient_id, p.other_id)
+                for p in pairs
+            }
+            node_ids = {i for p in pairs for i in (p.recipient_id, p.other_id)}
+            node_ids.update(f for funders in shared.values() for f in funders)
+            nodes = await self._fetch_nodes(session, node_ids)
+
+        records = [
+            {
+                "recipient": nodes[p.recipient_id],
+                "other": nodes[p.other_id],
+                "shared_funders": [
+                    nodes[f] for f in shared[(p.recipient_id, p.other_id)] if f in nodes
+                ],
+                "shared_count": p.shared_count,
+            }
+            for p in pairs
+            if p.recipient_id in nodes and p.other_id in nodes
+        ]
+
+        # Group into clusters
+        clusters = self._group_into_clusters(records)
+
+        # Calculate scores and return top clusters
+        scored_clusters = []
+        for cluster in clusters[:limit]:
+            self._add_funding_totals(cluster, matrix)
+            score = self._calculate_cluster_score(cluster)
+            cluster.score = score
+            cluster.confidence = min(score + 0.2, 1.0)
+            cluster.evidence_summary = self._generate_evidence_summary(cluster)
+            scored_clusters.append(cluster)
+
+        return sorted(scored_clusters, key=lambda c: c.score, reverse=True)
+
+    async def _fetch_funding_edges(
+        self,
+        session: Any,
+        entity_type: str | None,
+        fiscal_year: int | None,
+    ) -> list[FundingEdge]:
+        """Pull the FUNDED_BY edge list in one pass."""
+        recipient = f"recipient:{entity_type}" if entity_type else "recipient"
+
+        conditions = []
+        if fiscal_year:
+            conditions.append("r.fiscal_year = $fiscal_year")
+        if self.min_funding_amount > 0:
+            conditions.append("coalesce(r.amount, 0) >= $min_amount")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        result = await session.run(
+            f"""
+            MATCH ({recipient})-[r:FUNDED_BY]->(funder)
+            {where}
+            RETURN recipient.id AS recipient_id, funder.id AS funder_id,
+                   r.amount AS amount, r.fiscal_year AS fiscal_year
+            """,
+            fiscal_year=fiscal_year,
+            min_amount=self.min_funding_amount,
+        )
 
-            return sorted(scored_clusters, key=lambda c: c.score, reverse=True)
+        edges = []
+        async for record in result:
+            if record["recipient_id"] and record["funder_id"]:
+                edges.append(
+                    FundingEdge(
+                        recipient_id=record["recipient_id"],
+                        funder_id=record["funder_id"],
+                        amount=record["amount"] or 0.0,
+                        fiscal_year=record["fiscal_year"],
+                    )
+                )
+        return edges
+
+    async def _fetch_nodes(self, session: Any, node_ids: set[str]) -> dict[str, Any]:
+        """Load node properties by ID, one id-constraint lookup per label."""
+        nodes: dict[str, Any] = {}
+        if not node_ids:
+            return nodes
+
+        for label in FUNDING_NODE_LABELS:
+            remaining = [i for i in node_ids if i not in nodes]
+            if not remaining:
+                break
+            result = await session.run(
+                f"MATCH (n:{label}) WHERE n.id IN $ids RETURN n",
+                ids=remaining,
+            )
+            for record in await result.data():
+                nodes[record["n"]["id"]] = record["n"]
+        return nodes
+
+    def _add_funding_totals(
+        self, cluster: FundingClusterResult, matrix: CoFundingMatrix
+    ) -> None:
+        """Fill a cluster's funding amounts and years from the matrix."""
+        years: set[int] = set()
+        for member in cluster.members:
+            member_id = str(member.id)
+            if member_id not in matrix.recipient_index:
+                continue
+            cluster.funding_by_member[member_id] = matrix.total_funding(member_id)
+            years |= matrix.fiscal_years(member_id)
+        cluster.total_funding = sum(cluster.funding_by_member.values())
+        cluster.fiscal_years = sorted(years)
 
     async def find_shared_funders(
         self,
@@ -318,6 +382,7 @@ class FundingClusterDetector:
         # Build clusters from pairs
         entity_info = {}
         funder_info = {}
+        funder_pairs: dict[str, Counter] = {}
 
         for record in records:
             recipient = record.get("recipient")
@@ -333,10 +398,12 @@ class FundingClusterDetector:
                     entity_info[recipient_id] = recipient
                     entity_info[other_id] = other
 
+                    counts = funder_pairs.setdefault(recipient_id, Counter())
                     for funder in shared_funders:
                         funder_id = funder.get("id")
                         if funder_id:
                             funder_info[funder_id] = funder
+                            counts[funder_id] += 1
 
         # Group by cluster root
         clusters_by_root = {}
@@ -360,13 +427,14 @@ class FundingClusterDetector:
                 if mid in entity_info
             ]
 
-            # Find shared funders for this cluster
-            # (simplified - in practice would need more complex logic)
-            if funder_info:
-                first_funder_id = next(iter(funder_info))
-                shared_funder = self._parse_entity_node(funder_info[first_funder_id])
-            else:
+            # The funder shared by the most member pairs in this cluster
+            cluster_funders = Counter()
+            for mid in member_ids:
+                cluster_funders.update(funder_pairs.get(mid, {}))
+            if not cluster_funders:
                 continue
+            top_funder_id = cluster_funders.most_common(1)[0][0]
+            shared_funder = self._parse_entity_node(funder_info[top_funder_id])
 
             cluster_num += 1
             clusters.append(
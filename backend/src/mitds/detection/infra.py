@@ -5,25 +5,39 @@ Provides detection of shared technical infrastructure across outlets:
 - Hosting provider detection via IP and ASN analysis
 - Analytics tag detection (Google Analytics, GTM, Facebook Pixel)
 - Shared infrastructure scoring and relationship creation
+- Reuse of stored profiles (see infra_store)
 """
 
 import asyncio
 import hashlib
 import re
 import socket
-from dataclasses import dataclass, field
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from itertools import combinations
 from typing import Any
 from uuid import UUID
 
 import httpx
 
+from ..cache import SingleFlight
+from ..config import get_settings
+from ..logging import get_context_logger
+from .infra_scan import DNSCache, ScanLimits, ScanResources, get_dns_cache
+from .infra_store import COMPONENTS, InfrastructureProfileStore, StoredProfile
+
+logger = get_context_logger(__name__)
+
 
 class InfraSignalType(str, Enum):
     """Types of infrastructure signals that indicate sharing."""
 
     SAME_REGISTRAR = "same_registrar"
+    SAME_REGISTRANT_ORG = "same_registrant_org"
     SAME_NAMESERVER = "same_nameserver"
     SAME_IP = "same_ip"
     SAME_ASN = "same_asn"
@@ -48,6 +62,10 @@ class InfraSignal:
     description: str = ""
 
 
+# (signal type, value) of one shareable piece of infrastructure
+SignalKey = tuple[InfraSignalType, str]
+
+
 @dataclass
 class DNSResult:
     """DNS lookup result for a domain."""
@@ -152,62 +170,128 @@ class SharedInfrastructureMatch:
 
 
 class DNSLookupService:
-    """Service for performing DNS lookups."""
+    """Service for performing DNS lookups.
+
+    Uses dnspython's async resolver when it is installed, caching answers
+    for their TTL. Without it, address records come from the system
+    resolver (run in `executor`) and NS/MX records are not available.
+    """
 
-    def __init__(self, timeout: float = 5.0):
+    RECORD_TYPES = ("A", "AAAA", "NS", "MX")
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        executor: Executor | None = None,
+        cache: DNSCache | None = None,
+        nameservers: list[str] | None = None,
+        port: int = 53,
+    ):
+        """Initialize the service.
+
+        Args:
+            timeout: Seconds allowed per query
+            executor: Thread pool for system resolver calls
+            cache: Answer cache (default: the process-wide cache)
+            nameservers: Resolver IPs (default from the
+                `infra_dns_nameservers` setting, else the system's)
+            port: Resolver port
+        """
         self.timeout = timeout
+        self.executor = executor
+        self.cache = cache if cache is not None else get_dns_cache()
+        if nameservers is None:
+            nameservers = get_settings().infra_dns_nameservers_list
+        self.nameservers = nameservers
+        self.port = port
+        self._resolver: Any = None
+        self._single_flight = SingleFlight()
 
     async def lookup(self, domain: str) -> DNSResult:
         """Perform DNS lookup for a domain."""
         result = DNSResult(domain=domain)
 
-        try:
-            loop = asyncio.get_event_loop()
+        answers = await asyncio.gather(
+            *(self.resolve(domain, rdtype) for rdtype in self.RECORD_TYPES),
+            return_exceptions=True,
+        )
+        records = {}
+        for rdtype, answer in zip(self.RECORD_TYPES, answers, strict=True):
+            records[rdtype] = [] if isinstance(answer, BaseException) else answer
 
-            # A records
-            try:
-                a_records = await loop.run_in_executor(
-                    None, lambda: socket.getaddrinfo(domain, None, socket.AF_INET)
-                )
-                result.a_records = list(set(r[4][0] for r in a_records))
-            except socket.gaierror:
-                pass
+        result.a_records = records["A"]
+        result.aaaa_records = records["AAAA"]
+        result.nameservers = records["NS"]
+        result.mx_records = records["MX"]
 
-            # AAAA records
-            try:
-                aaaa_records = await loop.run_in_executor(
-                    None, lambda: socket.getaddrinfo(domain, None, socket.AF_INET6)
-                )
-                result.aaaa_records = list(set(r[4][0] for r in aaaa_records))
-            except socket.gaierror:
-                pass
+        if all(isinstance(answer, BaseException) for answer in answers):
+            result.error = str(answers[0])
 
-            # Try to get nameservers via dnspython if available
-            try:
-                import dns.resolver
+        return result
 
-                ns_answers = await loop.run_in_executor(
-                    None, lambda: dns.resolver.resolve(domain, "NS")
-                )
-                result.nameservers = [str(rdata) for rdata in ns_answers]
-            except Exception:
-                pass
+    async def resolve(self, name: str, rdtype: str) -> list[str]:
+        """Resolve one record type, answering from the cache when fresh.
+
+        Concurrent queries for the same name and type share one lookup.
+        Missing names and empty answers return []; other failures raise.
+        """
+        cached = self.cache.get(name, rdtype)
+        if cached is not None:
+            return cached
+
+        async def query() -> list[str]:
+            answer = await self._query(name, rdtype)
+            if answer is None:
+                return []
+            values, ttl = answer
+            self.cache.set(name, rdtype, values, ttl)
+            return values
+
+        return await self._single_flight.run(f"{rdtype}:{name}", query)
+
+    async def _query(self, name: str, rdtype: str) -> tuple[list[str], float | None] | None:
+        """Query a resolver; returns (values, TTL) or None if unsupported."""
+        resolver = self._get_resolver()
+        if resolver is not None:
+            import dns.resolver
 
-            # Try MX records
             try:
-                import dns.resolver
+                answer = await resolver.resolve(name, rdtype, lifetime=self.timeout)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                return [], None
+            if rdtype == "MX":
+                values = [str(rdata.exchange) for rdata in answer]
+            else:
+                values = [str(rdata) for rdata in answer]
+            return sorted(set(values)), answer.rrset.ttl
+
+        if rdtype not in ("A", "AAAA"):
+            return None
 
-                mx_answers = await loop.run_in_executor(
-                    None, lambda: dns.resolver.resolve(domain, "MX")
-                )
-                result.mx_records = [str(rdata.exchange) for rdata in mx_answers]
-            except Exception:
-                pass
+        family = socket.AF_INET if rdtype == "A" else socket.AF_INET6
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await asyncio.wait_for(
+                loop.run_in_executor(self.executor, socket.getaddrinfo, name, None, family),
+                self.timeout,
+            )
+        except socket.gaierror:
+            return [], None
+        return sorted({info[4][0] for info in infos}), None
 
-        except Exception as e:
-            result.error = str(e)
+    def _get_resolver(self) -> Any:
+        if self._resolver is None:
+            try:
+                import dns.asyncresolver
 
-        return result
+                resolver = dns.asyncresolver.Resolver()
+                if self.nameservers:
+                    resolver.nameservers = list(self.nameservers)
+                    resolver.port = self.port
+                self._resolver = resolver
+            except ImportError:
+                self._resolver = False
+        return self._resolver or None
 
 
 class WHOISLookupService:
@@ -227,8 +311,10 @@ class WHOISLookupService:
         r"ovh": "OVH",
     }
 
-    def __init__(self, timeout: float = 10.0):
+    def __init__(self, timeout: float = 10.0, executor: Executor | None = None):
         self.timeout = timeout
+        # python-whois blocks on a socket; run it in a bounded pool
+        self.executor = executor
 
     async def lookup(self, domain: str) -> WHOISResult:
         """Perform WHOIS lookup for a domain."""
@@ -237,8 +323,11 @@ class WHOISLookupService:
         try:
             import whois
 
-            loop = asyncio.get_event_loop()
-            w = await loop.run_in_executor(None, lambda: whois.whois(domain))
+            loop = asyncio.get_running_loop()
+            w = await asyncio.wait_for(
+                loop.run_in_executor(self.executor, whois.whois, domain),
+                self.timeout,
+            )
 
             if w:
                 result.registrar = self._normalize_registrar(w.registrar)
@@ -313,9 +402,23 @@ class HostingDetector:
         r"^34\.[0-9]+\.": "Google Cloud",
     }
 
-    def __init__(self, timeout: float = 5.0):
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        client: httpx.AsyncClient | None = None,
+        api_url: str = "http://ip-api.com/json/{ip}",
+    ):
+        """Initialize the detector.
+
+        Args:
+            timeout: Seconds allowed per request
+            client: Shared HTTP client (owned by the caller)
+            api_url: IP lookup endpoint, formatted with `ip`
+        """
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self.api_url = api_url
+        self._client = client
+        self._owns_client = client is None
 
     async def detect(self, ip_address: str) -> HostingResult:
         """Detect hosting provider for an IP address."""
@@ -331,8 +434,9 @@ class HostingDetector:
                 self._client = httpx.AsyncClient(timeout=self.timeout)
 
             response = await self._client.get(
-                f"http://ip-api.com/json/{ip_address}",
+                self.api_url.format(ip=ip_address),
                 params={"fields": "status,country,isp,org,as,hosting"},
+                timeout=self.timeout,
             )
 
             if response.status_code == 200:
@@ -362,7 +466,7 @@ class HostingDetector:
         return result
 
     async def close(self) -> None:
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -388,12 +492,28 @@ class AnalyticsDetector:
         r"webflow\.com": "Webflow",
     }
 
-    def __init__(self, timeout: float = 15.0, user_agent: str | None = None):
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        user_agent: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        url_template: str = "https://{domain}",
+    ):
+        """Initialize the detector.
+
+        Args:
+            timeout: Seconds allowed per page fetch
+            user_agent: User-Agent header sent with page fetches
+            client: Shared HTTP client (owned by the caller)
+            url_template: Page fetched per domain, formatted with `domain`
+        """
         self.timeout = timeout
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         )
-        self._client: httpx.AsyncClient | None = None
+        self.url_template = url_template
+        self._client = client
+        self._owns_client = client is None
 
     async def detect(self, domain: str) -> AnalyticsResult:
         """Detect analytics tags for a domain."""
@@ -401,13 +521,14 @@ class AnalyticsDetector:
 
         try:
             if not self._client:
-                self._client = httpx.AsyncClient(
-                    timeout=self.timeout,
-                    headers={"User-Agent": self.user_agent},
-                    follow_redirects=True,
-                )
+                self._client = httpx.AsyncClient()
 
-            response = await self._client.get(f"https://{domain}")
+            response = await self._client.get(
+                self.url_template.format(domain=domain),
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
             html = response.text
 
             result.google_analytics_ids = self._find_all_patterns(
@@ -463,7 +584,7 @@ class AnalyticsDetector:
         return technologies
 
     async def close(self) -> None:
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -471,25 +592,44 @@ class AnalyticsDetector:
 class SSLAnalyzer:
     """Analyze SSL certificates for infrastructure sharing signals."""
 
-    def __init__(self, timeout: float = 10.0):
+    def __init__(self, timeout: float = 10.0, port: int = 443):
         self.timeout = timeout
+        self.port = port
+        self._context: Any = None
 
-    async def analyze(self, domain: str) -> SSLResult:
-        """Analyze SSL certificate for a domain."""
+    async def analyze(self, domain: str, address: str | None = None) -> SSLResult:
+        """Analyze SSL certificate for a domain.
+
+        Args:
+            domain: Domain whose certificate is requested (SNI)
+            address: IP to connect to, skipping name resolution
+        """
         result = SSLResult(domain=domain)
 
         try:
-            import ssl
-
-            loop = asyncio.get_event_loop()
-
-            def get_cert():
-                context = ssl.create_default_context()
-                with socket.create_connection((domain, 443), timeout=self.timeout) as sock:
-                    with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                        return ssock.getpeercert()
-
-            cert = await loop.run_in_executor(None, get_cert)
+            if self._context is None:
+                import ssl
+
+                self._context = ssl.create_default_context()
+
+            # The handshake runs on the event loop rather than a thread
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    address or domain,
+                    self.port,
+                    ssl=self._context,
+                    server_hostname=domain,
+                ),
+                self.timeout,
+            )
+            try:
+                cert = writer.get_extra_info("peercert")
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except Exception:
+                    pass
 
             if cert:
                 issuer = cert.get("issuer", ())
@@ -523,10 +663,17 @@ class SSLAnalyzer:
 
 
 class InfrastructureScorer:
-    """Score shared infrastructure between domains."""
+    """Score shared infrastructure between domains.
+
+    Every shareable value in a profile (a GA ID, a nameserver, an ASN,
+    ...) is a signal key. Two domains share infrastructure where their
+    signal keys intersect, so matches across many domains are found from
+    an inverted index of keys rather than by comparing every pair.
+    """
 
     SIGNAL_WEIGHTS = {
         InfraSignalType.SAME_REGISTRAR: 0.5,
+        InfraSignalType.SAME_REGISTRANT_ORG: 2.0,
         InfraSignalType.SAME_NAMESERVER: 1.5,
         InfraSignalType.SAME_IP: 3.0,
         InfraSignalType.SAME_ASN: 0.5,
@@ -541,171 +688,173 @@ class InfrastructureScorer:
         InfraSignalType.SSL_SAN_OVERLAP: 4.0,
     }
 
-    def compare(
-        self,
-        profile_a: InfrastructureProfile,
-        profile_b: InfrastructureProfile,
-    ) -> SharedInfrastructureMatch:
-        """Compare two infrastructure profiles and return match result."""
-        match = SharedInfrastructureMatch(
-            domain_a=profile_a.domain,
-            domain_b=profile_b.domain,
-        )
-
-        if profile_a.whois and profile_b.whois:
-            self._compare_whois(profile_a.whois, profile_b.whois, match)
-
-        if profile_a.dns and profile_b.dns:
-            self._compare_dns(profile_a.dns, profile_b.dns, match)
-
-        if profile_a.hosting and profile_b.hosting:
-            self._compare_hosting(profile_a.hosting, profile_b.hosting, match)
-
-        if profile_a.analytics and profile_b.analytics:
-            self._compare_analytics(profile_a.analytics, profile_b.analytics, match)
-
-        if profile_a.ssl and profile_b.ssl:
-            self._compare_ssl(profile_a.ssl, profile_b.ssl, match)
+    SIGNAL_DESCRIPTIONS = {
+        InfraSignalType.SAME_REGISTRAR: "Same registrar: {}",
+        InfraSignalType.SAME_REGISTRANT_ORG: "Same registrant organization: {}",
+        InfraSignalType.SAME_NAMESERVER: "Shared nameserver: {}",
+        InfraSignalType.SAME_IP: "Same IP address: {}",
+        InfraSignalType.SAME_ASN: "Same ASN: {}",
+        InfraSignalType.SAME_HOSTING: "Same hosting provider: {}",
+        InfraSignalType.SAME_CDN: "Same CDN: {}",
+        InfraSignalType.SAME_ANALYTICS: "Same Google Analytics ID: {}",
+        InfraSignalType.SAME_GTM: "Same GTM container: {}",
+        InfraSignalType.SAME_PIXEL: "Same Facebook Pixel: {}",
+        InfraSignalType.SAME_ADSENSE: "Same AdSense publisher: {}",
+        InfraSignalType.SAME_SSL_ISSUER: "Same SSL issuer: {}",
+        InfraSignalType.SAME_CMS: "Same CMS: {}",
+        InfraSignalType.SSL_SAN_OVERLAP: "SSL SAN overlap: {}",
+    }
 
-        return match
+    # Order signals are reported in within a match
+    SIGNAL_ORDER = [
+        InfraSignalType.SAME_REGISTRAR,
+        InfraSignalType.SAME_REGISTRANT_ORG,
+        InfraSignalType.SAME_NAMESERVER,
+        InfraSignalType.SAME_IP,
+        InfraSignalType.SAME_ASN,
+        InfraSignalType.SAME_HOSTING,
+        InfraSignalType.SAME_ANALYTICS,
+        InfraSignalType.SAME_GTM,
+        InfraSignalType.SAME_PIXEL,
+        InfraSignalType.SAME_ADSENSE,
+        InfraSignalType.SAME_CMS,
+        InfraSignalType.SAME_SSL_ISSUER,
+        InfraSignalType.SSL_SAN_OVERLAP,
+    ]
+
+    # Registrant organizations that hide the owner rather than name one
+    PRIVACY_REGISTRANT_PATTERN = re.compile(
+        r"privacy|redacted|proxy|protect|withheld|not disclosed|whoisguard|contact privacy",
+        re.IGNORECASE,
+    )
+
+    def signal_keys(self, profile: InfrastructureProfile) -> set[SignalKey]:
+        """All shareable (signal type, value) pairs in a profile."""
+        keys: set[SignalKey] = set()
+
+        def add(signal_type: InfraSignalType, values: Any) -> None:
+            keys.update((signal_type, v) for v in values if v)
+
+        if profile.whois:
+            whois = profile.whois
+            add(InfraSignalType.SAME_REGISTRAR, [whois.registrar])
+            org = (whois.registrant_org or "").strip()
+            if org and not self.PRIVACY_REGISTRANT_PATTERN.search(org):
+                add(InfraSignalType.SAME_REGISTRANT_ORG, [org])
+            add(InfraSignalType.SAME_NAMESERVER, whois.nameservers)
+
+        if profile.dns:
+            add(InfraSignalType.SAME_IP, profile.dns.a_records)
+
+        add(InfraSignalType.SAME_ASN, [h.asn for h in profile.hosting])
+        add(
+            InfraSignalType.SAME_HOSTING,
+            [h.hosting_provider for h in profile.hosting if not h.is_shared_hosting],
+        )
 
-    def _compare_whois(
-        self, a: WHOISResult, b: WHOISResult, match: SharedInfrastructureMatch
-    ) -> None:
-        if a.registrar and b.registrar and a.registrar == b.registrar:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_REGISTRAR,
-                value=a.registrar,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_REGISTRAR],
-                description=f"Same registrar: {a.registrar}",
-            ))
+        if profile.analytics:
+            analytics = profile.analytics
+            add(InfraSignalType.SAME_ANALYTICS, analytics.google_analytics_ids)
+            add(InfraSignalType.SAME_GTM, analytics.google_tag_manager_ids)
+            add(InfraSignalType.SAME_PIXEL, analytics.facebook_pixel_ids)
+            add(InfraSignalType.SAME_ADSENSE, analytics.adsense_ids)
+            add(InfraSignalType.SAME_CMS, [analytics.cms_detected])
 
-        ns_overlap = set(a.nameservers) & set(b.nameservers)
-        for ns in ns_overlap:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_NAMESERVER,
-                value=ns,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_NAMESERVER],
-                description=f"Shared nameserver: {ns}",
-            ))
+        if profile.ssl:
+            ssl = profile.ssl
+            add(InfraSignalType.SAME_SSL_ISSUER, [ssl.issuer])
+            # A certificate naming its own domain is not shared with anyone
+            own = {ssl.domain, f"*.{ssl.domain}", profile.domain, f"*.{profile.domain}"}
+            add(InfraSignalType.SSL_SAN_OVERLAP, set(ssl.subject_alt_names) - own)
 
-    def _compare_dns(
-        self, a: DNSResult, b: DNSResult, match: SharedInfrastructureMatch
-    ) -> None:
-        ip_overlap = set(a.a_records) & set(b.a_records)
-        for ip in ip_overlap:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_IP,
-                value=ip,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_IP],
-                description=f"Same IP address: {ip}",
-            ))
+        return keys
 
-    def _compare_hosting(
+    def compare(
         self,
-        a: list[HostingResult],
-        b: list[HostingResult],
-        match: SharedInfrastructureMatch,
-    ) -> None:
-        a_asns = {h.asn for h in a if h.asn}
-        b_asns = {h.asn for h in b if h.asn}
-        asn_overlap = a_asns & b_asns
-
-        for asn in asn_overlap:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_ASN,
-                value=asn,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_ASN],
-                description=f"Same ASN: {asn}",
-            ))
-
-        a_hosts = {h.hosting_provider for h in a if h.hosting_provider and not h.is_shared_hosting}
-        b_hosts = {h.hosting_provider for h in b if h.hosting_provider and not h.is_shared_hosting}
-        host_overlap = a_hosts & b_hosts
-
-        for host in host_overlap:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_HOSTING,
-                value=host,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_HOSTING],
-                description=f"Same hosting provider: {host}",
-            ))
+        profile_a: InfrastructureProfile,
+        profile_b: InfrastructureProfile,
+    ) -> SharedInfrastructureMatch:
+        """Compare two infrastructure profiles and return match result."""
+        shared = self.signal_keys(profile_a) & self.signal_keys(profile_b)
+        return self._build_match(profile_a.domain, profile_b.domain, shared)
 
-    def _compare_analytics(
+    def find_matches(
         self,
-        a: AnalyticsResult,
-        b: AnalyticsResult,
-        match: SharedInfrastructureMatch,
-    ) -> None:
-        ga_overlap = set(a.google_analytics_ids) & set(b.google_analytics_ids)
-        for ga_id in ga_overlap:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_ANALYTICS,
-                value=ga_id,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_ANALYTICS],
-                description=f"Same Google Analytics ID: {ga_id}",
-            ))
-
-        gtm_overlap = set(a.google_tag_manager_ids) & set(b.google_tag_manager_ids)
-        for gtm_id in gtm_overlap:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_GTM,
-                value=gtm_id,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_GTM],
-                description=f"Same GTM container: {gtm_id}",
-            ))
+        profiles: Iterable[InfrastructureProfile],
+        min_score: float = 1.0,
+        known: set[str] | None = None,
+    ) -> list[SharedInfrastructureMatch]:
+        """Find every pair of profiles sharing infrastructure.
+
+        Equivalent to comparing all pairs, but driven by an inverted index
+        of signal keys: only pairs that share at least one key are ever
+        visited.
+
+        Args:
+            profiles: Profiles to match (one per domain)
+            min_score: Minimum total signal weight of a match
+            known: Domains whose pairs with each other are not reported
+
+        Returns:
+            Matches, highest scoring first
+        """
+        known = known or set()
+        by_domain = {p.domain: p for p in profiles}
+        position = {domain: i for i, domain in enumerate(by_domain)}
+
+        index: dict[SignalKey, list[str]] = defaultdict(list)
+        for domain, profile in by_domain.items():
+            for key in self.signal_keys(profile):
+                index[key].append(domain)
+
+        shared: dict[tuple[str, str], set[SignalKey]] = defaultdict(set)
+        for key, domains in index.items():
+            for domain_a, domain_b in combinations(domains, 2):
+                if domain_a in known and domain_b in known:
+                    continue
+                shared[(domain_a, domain_b)].add(key)
 
-        pixel_overlap = set(a.facebook_pixel_ids) & set(b.facebook_pixel_ids)
-        for pixel_id in pixel_overlap:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_PIXEL,
-                value=pixel_id,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_PIXEL],
-                description=f"Same Facebook Pixel: {pixel_id}",
-            ))
+        matches = []
+        for (domain_a, domain_b), keys in shared.items():
+            match = self._build_match(domain_a, domain_b, keys)
+            if match.total_score >= min_score:
+                matches.append(match)
+
+        matches.sort(key=lambda m: (
+            -m.total_score, position[m.domain_a], position[m.domain_b],
+        ))
+        return matches
 
-        adsense_overlap = set(a.adsense_ids) & set(b.adsense_ids)
-        for adsense_id in adsense_overlap:
+    def _build_match(
+        self, domain_a: str, domain_b: str, keys: set[SignalKey]
+    ) -> SharedInfrastructureMatch:
+        match = SharedInfrastructureMatch(domain_a=domain_a, domain_b=domain_b)
+        for signal_type, value in sorted(
+            keys, key=lambda k: (self.SIGNAL_ORDER.index(k[0]), k[1])
+        ):
             match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_ADSENSE,
-                value=adsense_id,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_ADSENSE],
-                description=f"Same AdSense publisher: {adsense_id}",
+                signal_type=signal_type,
+                value=value,
+                weight=self.SIGNAL_WEIGHTS[signal_type],
+                description=self.SIGNAL_DESCRIPTIONS[signal_type].format(value),
             ))
+        return match
 
-        if a.cms_detected and b.cms_detected and a.cms_detected == b.cms_detected:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_CMS,
-                value=a.cms_detected,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_CMS],
-                description=f"Same CMS: {a.cms_detected}",
-            ))
 
-    def _compare_ssl(
-        self, a: SSLResult, b: SSLResult, match: SharedInfrastructureMatch
-    ) -> None:
-        if a.issuer and b.issuer and a.issuer == b.issuer:
-            match.add_signal(InfraSignal(
-                signal_type=InfraSignalType.SAME_SSL_ISSUER,
-                value=a.issuer,
-                weight=self.SIGNAL_WEIGHTS[InfraSignalType.SAME_SSL_ISSUER],
-                description=f"Same SSL issuer: {a.issuer}",
-            ))
+class InfrastructureDetector:
+    """Main detector class for infrastructure analysis.
 
-        san_overlap = set(a.subject_alt_names) & set(b.subject_alt_names)
-        san_overlap -= {a.domain, b.domain, f"*.{a.domain}", f"*.{b.domain}"}
-        if san_overlap:
-            for san in san_overlap:
-                match.add_signal(InfraSignal(
-                    signal_type=InfraSignalType.SSL_SAN_OVERLAP,
-                    value=san,
-                    weight=self.SIGNAL_WEIGHTS[InfraSignalType.SSL_SAN_OVERLAP],
-                    description=f"SSL SAN overlap: {san}",
-                ))
+    Scans share one HTTP pool and one bounded thread pool, and lookups
+    are capped globally and per service (see ScanLimits), so large scans
+    keep a fixed number of sockets and threads in use.
 
+    With a profile store, profiles are reused until their components
+    expire, only the expired components are rescanned, and sharing
+    requests can be matched against previously scanned domains.
+    """
 
-class InfrastructureDetector:
-    """Main detector class for infrastructure analysis."""
+    # Updated profiles are written to the store in batches of this size
+    STORE_BATCH_SIZE = 50
 
     def __init__(
         self,
@@ -715,86 +864,314 @@ class InfrastructureDetector:
         analytics_detector: AnalyticsDetector | None = None,
         ssl_analyzer: SSLAnalyzer | None = None,
         scorer: InfrastructureScorer | None = None,
+        store: InfrastructureProfileStore | None = None,
+        limits: ScanLimits | None = None,
     ):
-        self.dns = dns_service or DNSLookupService()
-        self.whois = whois_service or WHOISLookupService()
-        self.hosting = hosting_detector or HostingDetector()
-        self.analytics = analytics_detector or AnalyticsDetector()
+        self.limits = limits or ScanLimits.from_settings()
+        self.resources = ScanResources(self.limits)
+        self.dns = dns_service or DNSLookupService(executor=self.resources.executor)
+        self.whois = whois_service or WHOISLookupService(executor=self.resources.executor)
+        self.hosting = hosting_detector or HostingDetector(client=self.resources.http_client)
+        self.analytics = analytics_detector or AnalyticsDetector(client=self.resources.http_client)
         self.ssl = ssl_analyzer or SSLAnalyzer()
         self.scorer = scorer or InfrastructureScorer()
+        self.store = store
 
-    async def analyze_domain(self, domain: str) -> InfrastructureProfile:
-        """Perform full infrastructure analysis on a domain."""
-        profile = InfrastructureProfile(domain=domain)
+    async def analyze_domain(
+        self,
+        domain: str,
+        components: Iterable[str] | None = None,
+        previous: InfrastructureProfile | None = None,
+    ) -> InfrastructureProfile:
+        """Perform infrastructure analysis on a domain.
+
+        Args:
+            domain: Domain to scan
+            components: Components to scan (default: all)
+            previous: Earlier profile supplying the components not rescanned
+
+        Returns:
+            The domain's profile
+        """
+        profile, _, _ = await self._scan(domain, components, previous)
+        return profile
 
-        dns_task = self.dns.lookup(domain)
-        whois_task = self.whois.lookup(domain)
-        analytics_task = self.analytics.detect(domain)
-        ssl_task = self.ssl.analyze(domain)
+    async def _scan(
+        self,
+        domain: str,
+        components: Iterable[str] | None = None,
+        previous: InfrastructureProfile | None = None,
+    ) -> tuple[InfrastructureProfile, set[str], set[str]]:
+        """Scan components of a domain.
+
+        WHOIS and the page fetch start at once; the TLS handshake and
+        hosting lookups follow DNS, reusing its A records.
+
+        Returns:
+            (profile, components scanned, components that failed). A failed
+            component keeps its previous value when there is one.
+        """
+        components = set(components or COMPONENTS)
+        if previous is not None:
+            profile = replace(previous, scanned_at=datetime.utcnow())
+        else:
+            profile = InfrastructureProfile(domain=domain)
+        scanned: set[str] = set()
+        failed: set[str] = set()
 
-        results = await asyncio.gather(
-            dns_task, whois_task, analytics_task, ssl_task,
-            return_exceptions=True,
+        async def run(component: str, lookup, *args) -> None:
+            scanned.add(component)
+            try:
+                async with self.resources.limit(component):
+                    result = await lookup(*args)
+            except Exception as e:
+                result = e
+            if isinstance(result, Exception) or getattr(result, "error", None):
+                failed.add(component)
+                if getattr(profile, component) is not None:
+                    return
+            if not isinstance(result, Exception):
+                setattr(profile, component, result)
+
+        async def detect_hosting(ip: str) -> HostingResult:
+            async with self.resources.limit("hosting"):
+                return await self.hosting.detect(ip)
+
+        async def scan_network() -> None:
+            previous_ips = {h.ip_address for h in profile.hosting}
+            if "dns" in components:
+                await run("dns", self.dns.lookup, domain)
+            ips = profile.dns.a_records[:5] if profile.dns else []
+
+            followers = []
+            if "ssl" in components:
+                followers.append(run("ssl", self.ssl.analyze, domain, ips[0] if ips else None))
+            # Hosting follows the A records, so it is refreshed when they change
+            if "hosting" in components or ("dns" in scanned and set(ips) != previous_ips):
+                scanned.add("hosting")
+                followers.append(asyncio.gather(
+                    *(detect_hosting(ip) for ip in ips), return_exceptions=True
+                ))
+            results = await asyncio.gather(*followers)
+            if "hosting" in scanned:
+                profile.hosting = [r for r in results[-1] if isinstance(r, HostingResult)]
+                if len(profile.hosting) < len(ips):
+                    failed.add("hosting")
+
+        await asyncio.gather(
+            scan_network(),
+            *(
+                run(component, lookup, domain)
+                for component, lookup in (
+                    ("whois", self.whois.lookup),
+                    ("analytics", self.analytics.detect),
+                )
+                if component in components
+            ),
         )
 
-        if isinstance(results[0], DNSResult):
-            profile.dns = results[0]
+        return profile, scanned, failed
 
-            hosting_tasks = [
-                self.hosting.detect(ip) for ip in profile.dns.a_records[:5]
-            ]
-            if hosting_tasks:
-                hosting_results = await asyncio.gather(
-                    *hosting_tasks, return_exceptions=True
+    async def stream_profiles(
+        self,
+        domains: list[str],
+        refresh: bool = False,
+    ) -> AsyncIterator[InfrastructureProfile]:
+        """Yield profiles as each domain's scan completes.
+
+        At most `limits.max_domains` domains are scanned at once; stored
+        profiles that are still fresh are yielded without scanning. Domains
+        whose scan raised are logged and skipped.
+
+        Args:
+            domains: Domains to profile
+            refresh: Rescan every component regardless of age
+        """
+        domains = list(dict.fromkeys(domains))
+        stored = await self._load_stored(domains)
+        now = datetime.utcnow()
+        remaining = iter(domains)
+        pending: dict[asyncio.Task, str] = {}
+        updated: list[StoredProfile] = []
+
+        def launch() -> None:
+            while len(pending) < max(1, self.limits.max_domains):
+                domain = next(remaining, None)
+                if domain is None:
+                    return
+                task = asyncio.create_task(
+                    self._profile_domain(domain, stored.get(domain), refresh, now)
                 )
-                profile.hosting = [
-                    r for r in hosting_results if isinstance(r, HostingResult)
-                ]
-
-        if isinstance(results[1], WHOISResult):
-            profile.whois = results[1]
+                pending[task] = domain
 
-        if isinstance(results[2], AnalyticsResult):
-            profile.analytics = results[2]
+        try:
+            launch()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    domain = pending.pop(task)
+                    try:
+                        entry, changed = task.result()
+                    except Exception as e:
+                        logger.warning(f"Infrastructure scan failed for {domain}: {e}")
+                        continue
+                    if changed:
+                        updated.append(entry)
+                    if len(updated) >= self.STORE_BATCH_SIZE:
+                        await self._save(updated)
+                        updated = []
+                    yield entry.profile
+                launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            await self._save(updated)
+
+    async def get_profiles(
+        self,
+        domains: list[str],
+        refresh: bool = False,
+    ) -> dict[str, InfrastructureProfile]:
+        """Get profiles for domains, scanning only what is missing or stale.
+
+        Args:
+            domains: Domains to profile
+            refresh: Rescan every component regardless of age
+
+        Returns:
+            Profiles by domain, in input order (domains whose scan raised
+            are omitted)
+        """
+        found = {p.domain: p async for p in self.stream_profiles(domains, refresh)}
+        return {d: found[d] for d in dict.fromkeys(domains) if d in found}
+
+    async def _profile_domain(
+        self,
+        domain: str,
+        entry: StoredProfile | None,
+        refresh: bool,
+        now: datetime,
+    ) -> tuple[StoredProfile, bool]:
+        """Rescan a domain's stale components; returns (entry, changed)."""
+        if entry is None or refresh:
+            stale = set(COMPONENTS)
+        else:
+            stale = entry.stale_components(now)
+            if not stale:
+                return entry, False
 
-        if isinstance(results[3], SSLResult):
-            profile.ssl = results[3]
+        profile, scanned, failed = await self._scan(
+            domain, stale, entry.profile if entry else None
+        )
+        scanned_at = dict(entry.scanned_at) if entry else {}
+        scanned_at.update(dict.fromkeys(scanned, profile.scanned_at))
+        previous_failed = entry.failed - scanned if entry else set()
+        return StoredProfile(profile, scanned_at, previous_failed | failed), True
+
+    async def _save(self, entries: list[StoredProfile]) -> None:
+        if not entries or self.store is None:
+            return
+        try:
+            await self.store.save(entries, {
+                e.profile.domain: self._index_keys(e.profile) for e in entries
+            })
+        except Exception as e:
+            logger.warning(f"Failed to store infrastructure profiles: {e}")
 
-        return profile
+    async def match_profiles(
+        self,
+        profiles: Iterable[InfrastructureProfile],
+        min_score: float = 1.0,
+        include_known: bool = False,
+    ) -> list[SharedInfrastructureMatch]:
+        """Find shared infrastructure among profiles.
+
+        Args:
+            profiles: Profiles to match
+            min_score: Minimum total signal weight of a match
+            include_known: Also match against stored domains found through
+                the signal index (pairs of two stored domains are skipped)
+
+        Returns:
+            Matches, highest scoring first
+        """
+        profiles = list(profiles)
+        known_profiles = []
+        if include_known and self.store is not None:
+            known_profiles = await self._find_known(profiles)
+
+        return self.scorer.find_matches(
+            profiles + known_profiles,
+            min_score=min_score,
+            known={p.domain for p in known_profiles},
+        )
 
     async def find_shared_infrastructure(
         self,
         domains: list[str],
         min_score: float = 1.0,
+        include_known: bool = False,
     ) -> list[SharedInfrastructureMatch]:
         """Find shared infrastructure across a list of domains."""
-        profiles = {}
-        tasks = [self.analyze_domain(domain) for domain in domains]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for domain, result in zip(domains, results):
-            if isinstance(result, InfrastructureProfile):
-                profiles[domain] = result
-
-        matches = []
-        domain_list = list(profiles.keys())
-
-        for i, domain_a in enumerate(domain_list):
-            for domain_b in domain_list[i + 1:]:
-                match = self.scorer.compare(
-                    profiles[domain_a],
-                    profiles[domain_b],
-                )
-                if match.total_score >= min_score:
-                    matches.append(match)
+        profiles = await self.get_profiles(domains)
+        return await self.match_profiles(
+            profiles.values(), min_score=min_score, include_known=include_known
+        )
 
-        matches.sort(key=lambda m: m.total_score, reverse=True)
-        return matches
+    async def refresh_stale_profiles(self, limit: int | None = None) -> int:
+        """Rescan the expired components of the stalest stored profiles.
+
+        Returns:
+            Number of domains refreshed
+        """
+        if self.store is None:
+            return 0
+        limit = limit or get_settings().infra_refresh_batch_size
+        domains = await self.store.stale_domains(limit)
+        profiles = await self.get_profiles(domains)
+        return len(profiles)
+
+    def _index_keys(self, profile: InfrastructureProfile) -> set[tuple[str, str]]:
+        return {(t.value, v) for t, v in self.scorer.signal_keys(profile)}
+
+    async def _load_stored(self, domains: list[str]) -> dict[str, StoredProfile]:
+        if self.store is None:
+            return {}
+        try:
+            return await self.store.load(domains)
+        except Exception as e:
+            logger.warning(f"Failed to load stored infrastructure profiles: {e}")
+            return {}
+
+    async def _find_known(
+        self, profiles: list[InfrastructureProfile]
+    ) -> list[InfrastructureProfile]:
+        """Stored profiles sharing a distinctive signal with `profiles`."""
+        # Weak signals (registrar, ASN, CMS, ...) are shared by large parts
+        # of the web and would pull in most of the store
+        keys = {
+            (t.value, v)
+            for profile in profiles
+            for t, v in self.scorer.signal_keys(profile)
+            if self.scorer.SIGNAL_WEIGHTS[t] >= 1.0
+        }
+        try:
+            found = await self.store.domains_sharing(
+                keys, exclude=[p.domain for p in profiles]
+            )
+            domains = sorted(set().union(*found.values()))
+            domains = domains[: get_settings().infra_known_match_limit]
+            stored = await self.store.load(domains)
+        except Exception as e:
+            logger.warning(f"Failed to look up known infrastructure: {e}")
+            return []
+        return [stored[d].profile for d in domains if d in stored]
 
     async def close(self) -> None:
         """Clean up resources."""
         await self.hosting.close()
         await self.analytics.close()
+        await self.resources.close()
 
 
 async def create_shared_infra_relationships(
@@ -0,0 +1,159 @@
+"""Shared scanning resources for infrastructure detection.
+
+Large domain scans used to open a client, socket and executor thread per
+lookup without limit. The scanner shares instead:
+1. One keep-alive HTTP pool for page fetches and IP/ASN lookups
+2. One bounded thread pool for blocking WHOIS and resolver calls
+3. A process-wide DNS answer cache that honours record TTLs
+4. Global and per-service concurrency limits on outstanding lookups
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import httpx
+
+from ..config import get_settings
+
+# Services with their own concurrency limit (one per profile component)
+SCAN_SERVICES = ("dns", "whois", "hosting", "analytics", "ssl")
+
+
+@dataclass(frozen=True)
+class ScanLimits:
+    """Concurrency and pool limits for a scan."""
+
+    max_domains: int = 20
+    max_lookups: int = 64
+    dns: int = 32
+    whois: int = 4
+    hosting: int = 4
+    analytics: int = 16
+    ssl: int = 16
+    threads: int = 8
+    http_connections: int = 32
+    http_keepalive: int = 16
+
+    @classmethod
+    def from_settings(cls) -> "ScanLimits":
+        settings = get_settings()
+        return cls(
+            max_domains=settings.infra_scan_max_domains,
+            max_lookups=settings.infra_scan_max_lookups,
+            dns=settings.infra_scan_dns_limit,
+            whois=settings.infra_scan_whois_limit,
+            hosting=settings.infra_scan_hosting_limit,
+            analytics=settings.infra_scan_analytics_limit,
+            ssl=settings.infra_scan_ssl_limit,
+            threads=settings.infra_scan_threads,
+            http_connections=settings.infra_http_max_connections,
+            http_keepalive=settings.infra_http_max_keepalive,
+        )
+
+
+class ScanResources:
+    """Pools and semaphores shared by the services of one detector."""
+
+    def __init__(self, limits: ScanLimits):
+        self.limits = limits
+        self._lookups = asyncio.Semaphore(max(1, limits.max_lookups))
+        self._services = {
+            service: asyncio.Semaphore(max(1, getattr(limits, service)))
+            for service in SCAN_SERVICES
+        }
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, limits.threads),
+            thread_name_prefix="infra-scan",
+        )
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=limits.http_connections,
+                max_keepalive_connections=limits.http_keepalive,
+            ),
+        )
+
+    @asynccontextmanager
+    async def limit(self, service: str) -> AsyncIterator[None]:
+        """Hold a slot of the service's limit and of the global limit."""
+        # Wait for the service first, so a saturated service (WHOIS) does
+        # not hold global slots other services could use
+        async with self._services[service], self._lookups:
+            yield
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class DNSCache:
+    """Bounded LRU of DNS answers that expire with their TTL.
+
+    Empty answers (NXDOMAIN, no records) are cached for `negative_ttl`.
+    Answers that come without a TTL (system resolver) use `default_ttl`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        default_ttl: float = 300.0,
+        negative_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[str]]] = OrderedDict()
+
+    def get(self, name: str, rdtype: str) -> list[str] | None:
+        """Cached answer, or None when missing or expired."""
+        key = (name.lower().rstrip("."), rdtype)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, values = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return list(values)
+
+    def set(self, name: str, rdtype: str, values: list[str], ttl: float | None = None) -> None:
+        if not values:
+            ttl = self.negative_ttl if ttl is None else min(ttl, self.negative_ttl)
+        elif ttl is None:
+            ttl = self.default_ttl
+        if ttl <= 0:
+            return
+        key = (name.lower().rstrip("."), rdtype)
+        self._entries[key] = (self.clock() + ttl, list(values))
+        self._entries.move_to_end(key)
+        while len(self._entries) > max(1, self.max_entries):
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_dns_cache: DNSCache | None = None
+
+
+def get_dns_cache() -> DNSCache:
+    """Get the process-wide DNS cache."""
+    global _dns_cache
+    if _dns_cache is None:
+        settings = get_settings()
+        _dns_cache = DNSCache(
+            max_entries=settings.infra_dns_cache_size,
+            default_ttl=settings.infra_dns_default_ttl,
+            negative_ttl=settings.infra_dns_negative_ttl,
+        )
+    return _dns_cache
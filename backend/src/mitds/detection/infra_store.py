@@ -0,0 +1,296 @@
+"""Persistent infrastructure profile store for MITDS.
+
+Keeps the latest InfrastructureProfile per domain in PostgreSQL, with
+the time each component (DNS, WHOIS, hosting, analytics, SSL) was last
+scanned, so only components older than their TTL are rescanned. Every
+profile's shareable signal values are written to an inverted index
+(signal type, value) -> domain, used to find domains sharing
+infrastructure without comparing profiles pairwise.
+"""
+
+import json
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import text
+
+from ..db import get_db_session
+from ..logging import get_context_logger
+
+logger = get_context_logger(__name__)
+
+
+# How long each scanned component stays fresh
+COMPONENT_TTLS: dict[str, timedelta] = {
+    "dns": timedelta(days=1),
+    "hosting": timedelta(days=7),
+    "whois": timedelta(days=30),
+    "analytics": timedelta(days=1),
+    "ssl": timedelta(days=7),
+}
+
+# Components whose lookup failed are retried sooner
+FAILED_COMPONENT_TTL = timedelta(hours=1)
+
+COMPONENTS = tuple(COMPONENT_TTLS)
+
+# (signal type value, signal value) as stored in the inverted index
+SignalKey = tuple[str, str]
+
+
+# =========================
+# Serialization
+# =========================
+
+
+def profile_to_dict(profile) -> dict[str, Any]:
+    """Convert an InfrastructureProfile to JSON-serializable data."""
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, dict):
+            return {k: encode(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [encode(v) for v in value]
+        return value
+
+    return encode(asdict(profile))
+
+
+def profile_from_dict(data: dict[str, Any]):
+    """Rebuild an InfrastructureProfile from `profile_to_dict` output."""
+    from .infra import (
+        AnalyticsResult,
+        DNSResult,
+        HostingResult,
+        InfrastructureProfile,
+        SSLResult,
+        WHOISResult,
+    )
+
+    def build(cls, values: dict[str, Any] | None):
+        if values is None:
+            return None
+        kwargs = {}
+        for f in fields(cls):
+            if f.name not in values:
+                continue
+            value = values[f.name]
+            if isinstance(value, str) and "datetime" in str(f.type):
+                try:
+                    value = datetime.fromisoformat(value)
+                except ValueError:
+                    value = None
+            kwargs[f.name] = value
+        return cls(**kwargs)
+
+    profile = build(InfrastructureProfile, {
+        k: v for k, v in data.items() if k not in ("dns", "whois", "hosting", "analytics", "ssl")
+    })
+    profile.dns = build(DNSResult, data.get("dns"))
+    profile.whois = build(WHOISResult, data.get("whois"))
+    profile.hosting = [build(HostingResult, h) for h in data.get("hosting") or []]
+    profile.analytics = build(AnalyticsResult, data.get("analytics"))
+    profile.ssl = build(SSLResult, data.get("ssl"))
+    return profile
+
+
+# =========================
+# Store
+# =========================
+
+
+@dataclass
+class StoredProfile:
+    """A persisted profile and when each of its components was scanned."""
+
+    profile: Any
+    scanned_at: dict[str, datetime] = field(default_factory=dict)
+    failed: set[str] = field(default_factory=set)
+
+    def expires_at(self, component: str) -> datetime | None:
+        scanned = self.scanned_at.get(component)
+        if scanned is None:
+            return None
+        ttl = FAILED_COMPONENT_TTL if component in self.failed else COMPONENT_TTLS[component]
+        return scanned + ttl
+
+    def stale_components(self, now: datetime | None = None) -> set[str]:
+        """Components never scanned or older than their TTL."""
+        now = now or datetime.utcnow()
+        stale = set()
+        for component in COMPONENTS:
+            expires = self.expires_at(component)
+            if expires is None or expires <= now:
+                stale.add(component)
+        return stale
+
+    @property
+    def next_refresh_at(self) -> datetime | None:
+        expiries = [self.expires_at(c) for c in COMPONENTS]
+        return min((e for e in expiries if e is not None), default=None)
+
+
+class InfrastructureProfileStore:
+    """PostgreSQL-backed profiles and signal index.
+
+    Tables are created by migration 011_infrastructure_profiles.
+    """
+
+    async def load(self, domains: Iterable[str]) -> dict[str, StoredProfile]:
+        """Load stored profiles by domain (missing domains are omitted)."""
+        domains = list(dict.fromkeys(domains))
+        if not domains:
+            return {}
+
+        async with get_db_session() as db:
+            result = await db.execute(
+                text("""
+                    SELECT domain, profile, scanned_at, failed_components
+                    FROM infrastructure_profiles
+                    WHERE domain = ANY(:domains)
+                """),
+                {"domains": domains},
+            )
+            rows = result.fetchall()
+
+        stored = {}
+        for row in rows:
+            profile = row.profile if isinstance(row.profile, dict) else json.loads(row.profile)
+            scanned = row.scanned_at if isinstance(row.scanned_at, dict) else json.loads(row.scanned_at or "{}")
+            stored[row.domain] = StoredProfile(
+                profile=profile_from_dict(profile),
+                scanned_at={c: datetime.fromisoformat(t) for c, t in scanned.items()},
+                failed=set(row.failed_components or []),
+            )
+        return stored
+
+    async def save(
+        self,
+        entries: list[StoredProfile],
+        signal_keys: dict[str, set[SignalKey]],
+    ) -> None:
+        """Upsert profiles and replace their signal index entries.
+
+        Args:
+            entries: Profiles with their component scan times
+            signal_keys: Indexable signal values by domain
+        """
+        if not entries:
+            return
+
+        domains = [e.profile.domain for e in entries]
+        index_rows = [
+            (domain, signal_type, value)
+            for domain in domains
+            for signal_type, value in sorted(signal_keys.get(domain, ()))
+        ]
+
+        async with get_db_session() as db:
+            for entry in entries:
+                await db.execute(
+                    text("""
+                        INSERT INTO infrastructure_profiles (
+                            domain, profile, scanned_at, failed_components,
+                            next_refresh_at, updated_at
+                        ) VALUES (
+                            :domain, CAST(:profile AS jsonb), CAST(:scanned_at AS jsonb),
+                            :failed, :next_refresh_at, NOW()
+                        )
+                        ON CONFLICT (domain) DO UPDATE SET
+                            profile = EXCLUDED.profile,
+                            scanned_at = EXCLUDED.scanned_at,
+                            failed_components = EXCLUDED.failed_components,
+                            next_refresh_at = EXCLUDED.next_refresh_at,
+                            updated_at = NOW()
+                    """),
+                    {
+                        "domain": entry.profile.domain,
+                        "profile": json.dumps(profile_to_dict(entry.profile)),
+                        "scanned_at": json.dumps(
+                            {c: t.isoformat() for c, t in entry.scanned_at.items()}
+                        ),
+                        "failed": sorted(entry.failed),
+                        "next_refresh_at": entry.next_refresh_at,
+                    },
+                )
+
+            await db.execute(
+                text("DELETE FROM infrastructure_signals WHERE domain = ANY(:domains)"),
+                {"domains": domains},
+            )
+            if index_rows:
+                await db.execute(
+                    text("""
+                        INSERT INTO infrastructure_signals (domain, signal_type, value)
+                        SELECT * FROM unnest(
+                            CAST(:domains AS text[]),
+                            CAST(:types AS text[]),
+                            CAST(:values AS text[])
+                        )
+                        ON CONFLICT DO NOTHING
+                    """),
+                    {
+                        "domains": [r[0] for r in index_rows],
+                        "types": [r[1] for r in index_rows],
+                        "values": [r[2] for r in index_rows],
+                    },
+                )
+
+    async def domains_sharing(
+        self,
+        keys: Iterable[SignalKey],
+        exclude: Iterable[str] = (),
+    ) -> dict[SignalKey, set[str]]:
+        """Look up stored domains carrying any of the given signal values.
+
+        Args:
+            keys: Signal values to look up
+            exclude: Domains to leave out of the result
+
+        Returns:
+            Matching domains by signal value
+        """
+        keys = sorted(set(keys))
+        if not keys:
+            return {}
+
+        async with get_db_session() as db:
+            result = await db.execute(
+                text("""
+                    SELECT s.signal_type, s.value, s.domain
+                    FROM unnest(CAST(:types AS text[]), CAST(:values AS text[]))
+                        AS k(signal_type, value)
+                    JOIN infrastructure_signals s
+                      ON s.signal_type = k.signal_type AND s.value = k.value
+                    WHERE NOT (s.domain = ANY(:exclude))
+                """),
+                {
+                    "types": [k[0] for k in keys],
+                    "values": [k[1] for k in keys],
+                    "exclude": list(exclude),
+                },
+            )
+            rows = result.fetchall()
+
+        found: dict[SignalKey, set[str]] = {}
+        for row in rows:
+            found.setdefault((row.signal_type, row.value), set()).add(row.domain)
+        return found
+
+    async def stale_domains(self, limit: int) -> list[str]:
+        """Domains with at least one expired component, stalest first."""
+        async with get_db_session() as db:
+            result = await db.execute(
+                text("""
+                    SELECT domain FROM infrastructure_profiles
+                    WHERE next_refresh_at IS NULL OR next_refresh_at <= :now
+                    ORDER BY next_refresh_at NULLS FIRST
+                    LIMIT :limit
+                """),
+                {"now": datetime.utcnow(), "limit": limit},
+            )
+            return [row.domain for row in result.fetchall()]
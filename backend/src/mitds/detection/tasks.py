@@ -0,0 +1,41 @@
+"""Celery tasks for coordination detection.
+
+Registered with the worker via autodiscovery; `refresh_infrastructure_profiles`
+backs the hourly `refresh-infrastructure-profiles` beat schedule.
+"""
+
+from typing import Any
+
+from ..logging import get_context_logger
+from ..worker import app as celery_app
+
+logger = get_context_logger(__name__)
+
+
+@celery_app.task(name="mitds.detection.tasks.refresh_infrastructure_profiles")
+def refresh_infrastructure_profiles(limit: int | None = None) -> dict[str, Any]:
+    """Rescan expired components of stored infrastructure profiles.
+
+    Args:
+        limit: Domains refreshed per run (default from the
+            `infra_refresh_batch_size` setting)
+
+    Returns:
+        Summary counts
+    """
+    import asyncio
+
+    from .infra import InfrastructureDetector
+    from .infra_store import InfrastructureProfileStore
+
+    async def run():
+        detector = InfrastructureDetector(store=InfrastructureProfileStore())
+        try:
+            refreshed = await detector.refresh_stale_profiles(limit)
+        finally:
+            await detector.close()
+        return {"refreshed": refreshed}
+
+    summary = asyncio.run(run())
+    logger.info(f"Refreshed {summary['refreshed']} infrastructure profiles")
+    return summary
@@ -7,9 +7,8 @@ Detects patterns of coordinated timing in publication/ad delivery:
 """
 
 import math
-from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
@@ -85,6 +84,165 @@ class TemporalCoordinationResult(BaseModel):
     explanation: str = ""
 
 
+class TimingEventFrame:
+    """Columnar, per-entity index over a list of TimingEvents.
+
+    Built once per analysis so burst detection, lead-lag analysis and
+    synchronization scoring share one pass over the events instead of
+    each re-filtering the full list per entity:
+
+    - events are sorted by (entity, timestamp), so each entity is a
+      contiguous slice
+    - `timestamps` holds NumPy datetime64[us] values (UTC for aware
+      datetimes), `entity_codes` integer entity codes and `type_codes`
+      integer event-type codes
+    - binned count series are computed on demand per resolution and cached
+
+    Entity codes follow the order in which entities first appear in the
+    input events.
+
+    Usage:
+        frame = TimingEventFrame.from_events(events)
+        hourly = frame.binned(60)             # entities x hours
+        row = hourly[frame.code("outlet-a")]
+    """
+
+    def __init__(self, events: list[TimingEvent]):
+        """Build the frame (see `from_events`)."""
+        self.entity_ids: list[str] = list(dict.fromkeys(e.entity_id for e in events))
+        self.event_types: list[str] = list(dict.fromkeys(e.event_type for e in events))
+        self._codes = {eid: i for i, eid in enumerate(self.entity_ids)}
+        type_codes = {t: i for i, t in enumerate(self.event_types)}
+
+        if events:
+            self.origin: datetime | None = min(e.timestamp for e in events)
+            offsets = np.fromiter(
+                ((e.timestamp - self.origin) // timedelta(microseconds=1) for e in events),
+                dtype=np.int64,
+                count=len(events),
+            )
+        else:
+            self.origin = None
+            offsets = np.empty(0, dtype=np.int64)
+
+        codes = np.fromiter(
+            (self._codes[e.entity_id] for e in events), dtype=np.int32, count=len(events)
+        )
+        order = np.lexsort((offsets, codes))
+
+        self.events: list[TimingEvent] = [events[i] for i in order]
+        self.entity_codes = codes[order]
+        self.offsets_us = offsets[order]
+        self.type_codes = np.fromiter(
+            (type_codes[e.event_type] for e in self.events), dtype=np.int32, count=len(events)
+        )
+        self.timestamps = self._origin64() + self.offsets_us.astype("timedelta64[us]")
+
+        # Per-entity slices: events of entity code c are [bounds[c], bounds[c + 1])
+        self._bounds = np.searchsorted(
+            self.entity_codes, np.arange(len(self.entity_ids) + 1)
+        )
+        self._binned: dict[int, np.ndarray] = {}
+        self._epoch_seconds: np.ndarray | None = None
+        self._hours_of_day: np.ndarray | None = None
+
+    @classmethod
+    def from_events(
+        cls,
+        events: list[TimingEvent],
+        entity_ids: list[str] | None = None,
+    ) -> "TimingEventFrame":
+        """Build a frame, optionally restricted to some entities."""
+        if entity_ids is not None:
+            wanted = set(entity_ids)
+            events = [e for e in events if e.entity_id in wanted]
+        return cls(events)
+
+    def _origin64(self) -> np.datetime64:
+        if self.origin is None:
+            return np.datetime64(0, "us")
+        origin = self.origin
+        if origin.tzinfo is not None:
+            origin = origin.astimezone(UTC).replace(tzinfo=None)
+        return np.datetime64(origin, "us")
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._codes
+
+    def code(self, entity_id: str) -> int:
+        """Integer code of an entity."""
+        return self._codes[entity_id]
+
+    def entity_slice(self, entity_id: str) -> slice:
+        """Positions of an entity's events (empty for unknown entities)."""
+        code = self._codes.get(entity_id)
+        if code is None:
+            return slice(0, 0)
+        return slice(int(self._bounds[code]), int(self._bounds[code + 1]))
+
+    def count(self, entity_id: str) -> int:
+        """Number of events for an entity."""
+        s = self.entity_slice(entity_id)
+        return s.stop - s.start
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Event count per entity code."""
+        return np.diff(self._bounds)
+
+    def events_for(self, entity_id: str) -> list[TimingEvent]:
+        """An entity's events, sorted by timestamp."""
+        return self.events[self.entity_slice(entity_id)]
+
+    def offsets_for(self, entity_id: str) -> np.ndarray:
+        """An entity's event times as microseconds since `origin`, sorted."""
+        return self.offsets_us[self.entity_slice(entity_id)]
+
+    def binned(self, resolution_minutes: int = 60) -> np.ndarray:
+        """Event counts per entity per time bin (entities x bins).
+
+        Bins are `resolution_minutes` wide and start at `origin`. Cached
+        per resolution.
+        """
+        cached = self._binned.get(resolution_minutes)
+        if cached is not None:
+            return cached
+
+        width_us = resolution_minutes * 60 * 1_000_000
+        bins = self.offsets_us // width_us
+        n_bins = int(bins.max()) + 1 if len(bins) else 0
+        matrix = np.zeros((len(self.entity_ids), n_bins))
+        np.add.at(matrix, (self.entity_codes, bins), 1)
+
+        self._binned[resolution_minutes] = matrix
+        return matrix
+
+    @property
+    def epoch_seconds(self) -> np.ndarray:
+        """POSIX timestamp of each event, as `datetime.timestamp()` gives it."""
+        if self._epoch_seconds is None:
+            self._epoch_seconds = np.fromiter(
+                (e.timestamp.timestamp() for e in self.events),
+                dtype=np.float64,
+                count=len(self.events),
+            )
+        return self._epoch_seconds
+
+    @property
+    def hours_of_day(self) -> np.ndarray:
+        """Hour of day (0-23) of each event in its own timezone."""
+        if self._hours_of_day is None:
+            self._hours_of_day = np.fromiter(
+                (e.timestamp.hour for e in self.events),
+                dtype=np.int64,
+                count=len(self.events),
+            )
+        return self._hours_of_day
+
+
 @dataclass
 class KleinbergBurstState:
     """State for Kleinberg automaton burst detection."""
@@ -142,26 +300,93 @@ class BurstDetector:
 
         # Sort events by timestamp
         events = sorted(events, key=lambda e: e.timestamp)
+        offsets_us = np.fromiter(
+            ((e.timestamp - events[0].timestamp) // timedelta(microseconds=1) for e in events),
+            dtype=np.int64,
+            count=len(events),
+        )
+
+        return self._detect_sorted(entity_id or "all", events, offsets_us)
+
+    def detect_bursts_batch(
+        self,
+        events: list[TimingEvent],
+        entity_ids: list[str] | None = None,
+    ) -> dict[str, BurstDetectionResult]:
+        """Detect bursts for many entities in one pass over the events.
+
+        Equivalent to calling `detect_bursts(events, entity_id)` for each
+        entity, but indexes the events once (see `TimingEventFrame`)
+        instead of re-filtering the full event list per entity.
+
+        Args:
+            events: Timing events for all entities
+            entity_ids: Entities to analyze (default: every entity in events)
+
+        Returns:
+            Mapping of entity ID to its BurstDetectionResult
+        """
+        frame = TimingEventFrame.from_events(events, entity_ids)
+        return self.detect_bursts_frame(frame, entity_ids)
+
+    def detect_bursts_frame(
+        self,
+        frame: TimingEventFrame,
+        entity_ids: list[str] | None = None,
+    ) -> dict[str, BurstDetectionResult]:
+        """Detect bursts for entities of a prebuilt TimingEventFrame.
+
+        Args:
+            frame: Indexed timing events
+            entity_ids: Entities to analyze (default: every entity in frame)
+
+        Returns:
+            Mapping of entity ID to its BurstDetectionResult
+        """
+        return {
+            entity_id: self._detect_sorted(
+                entity_id,
+                frame.events_for(entity_id),
+                frame.offsets_for(entity_id),
+            )
+            for entity_id in (entity_ids if entity_ids is not None else frame.entity_ids)
+        }
+
+    def _detect_sorted(
+        self,
+        entity_id: str,
+        events: list[TimingEvent],
+        offsets_us: np.ndarray,
+    ) -> BurstDetectionResult:
+        """Detect bursts in one entity's time-sorted events.
+
+        Args:
+            entity_id: Entity ID to report
+            events: The entity's events, sorted by timestamp
+            offsets_us: Event times in microseconds from any fixed origin
+        """
+        if len(events) < self.min_burst_events:
+            return BurstDetectionResult(
+                entity_id=entity_id,
+                total_events=len(events),
+            )
 
         # Convert to inter-arrival times (in minutes)
-        gaps = []
-        for i in range(1, len(events)):
-            delta = (events[i].timestamp - events[i - 1].timestamp).total_seconds() / 60
-            gaps.append(max(delta, 0.1))  # Avoid zero gaps
+        gaps = np.maximum(np.diff(offsets_us) / 1e6 / 60, 0.1)  # Avoid zero gaps
 
-        if not gaps:
+        if not len(gaps):
             return BurstDetectionResult(
-                entity_id=entity_id or "all",
+                entity_id=entity_id,
                 total_events=len(events),
             )
 
         # Calculate base rate (expected gap between events)
-        total_time = (events[-1].timestamp - events[0].timestamp).total_seconds() / 60
+        total_time = float(offsets_us[-1] - offsets_us[0]) / 1e6 / 60
         n = len(gaps)
         base_rate = total_time / n if n > 0 else 1.0
 
         # Calculate number of states needed
-        max_rate = max(gaps) if gaps else 1.0
+        max_rate = float(gaps.max())
         k = max(2, int(math.ceil(1 + math.log(max_rate / base_rate, self.s))) + 1)
 
         # Run Viterbi algorithm to find optimal state sequence
@@ -174,7 +399,7 @@ class BurstDetector:
         time_range = (events[-1].timestamp - events[0].timestamp).days or 1
 
         return BurstDetectionResult(
-            entity_id=entity_id or "all",
+            entity_id=entity_id,
             bursts=bursts,
             total_events=len(events),
             burst_count=len(bursts),
@@ -183,67 +408,51 @@ class BurstDetector:
 
     def _viterbi(
         self,
-        gaps: list[float],
+        gaps: list[float] | np.ndarray,
         base_rate: float,
         k: int,
     ) -> list[int]:
-        """Viterbi algorithm for finding optimal state sequence."""
-        n = len(gaps)
+        """Viterbi algorithm for finding optimal state sequence.
 
-        # Initialize state costs
-        # cost[i][j] = min cost to reach state j at position i
-        cost = [[float('inf')] * k for _ in range(n + 1)]
-        parent = [[0] * k for _ in range(n + 1)]
-
-        # Initial state is 0 (base rate)
-        cost[0][0] = 0
+        Emission costs are an (n x k) array and transition costs a k x k
+        matrix, so each step of the forward pass is a vectorised min over
+        predecessor states. Ties resolve to the lowest predecessor state.
+        """
+        n = len(gaps)
+        if n == 0:
+            return []
 
         # State rates: rate[j] = base_rate * s^j
-        rates = [base_rate * (self.s ** j) for j in range(k)]
-
-        for i in range(n):
-            gap = gaps[i]
+        rates = np.array([base_rate * (self.s ** j) for j in range(k)])
+        log_rates = np.array([math.log(r) if r > 0 else 0.0 for r in rates])
 
-            for j in range(k):
-                if cost[i][j] == float('inf'):
-                    continue
-
-                # Calculate emission cost (negative log likelihood)
-                # Using exponential distribution: P(gap|rate) = rate * exp(-rate * gap)
-                for j_next in range(k):
-                    rate = rates[j_next]
+        # Emission cost (negative log likelihood) under an exponential
+        # distribution: P(gap|rate) = rate * exp(-rate * gap)
+        gap_array = np.asarray(gaps, dtype=np.float64)
+        emit = rates[np.newaxis, :] * gap_array[:, np.newaxis] - log_rates[np.newaxis, :]
+        emit[:, rates <= 0] = np.inf
+        emit[gap_array <= 0, :] = np.inf
 
-                    # Emission cost
-                    if rate > 0 and gap > 0:
-                        emit_cost = rate * gap - math.log(rate)
-                    else:
-                        emit_cost = float('inf')
+        # Transition cost: trans[j, j_next] = gamma * (j_next - j) moving up
+        levels = np.arange(k)
+        trans = self.gamma * np.maximum(0, levels[np.newaxis, :] - levels[:, np.newaxis])
 
-                    # Transition cost
-                    trans_cost = self.gamma * max(0, j_next - j) if j_next != j else 0
+        # cost = min cost to reach each state; initial state is 0 (base rate)
+        cost = np.full(k, np.inf)
+        cost[0] = 0.0
+        parent = np.zeros((n, k), dtype=np.int64)
 
-                    total_cost = cost[i][j] + emit_cost + trans_cost
-
-                    if total_cost < cost[i + 1][j_next]:
-                        cost[i + 1][j_next] = total_cost
-                        parent[i + 1][j_next] = j
+        for i in range(n):
+            total = (cost[:, np.newaxis] + emit[i][np.newaxis, :]) + trans
+            parent[i] = np.argmin(total, axis=0)
+            cost = total[parent[i], levels]
 
-        # Backtrack to find optimal state sequence
+        # Backtrack from the minimum cost final state
         states = [0] * n
-
-        # Find minimum cost final state
-        min_cost = float('inf')
-        last_state = 0
-        for j in range(k):
-            if cost[n][j] < min_cost:
-                min_cost = cost[n][j]
-                last_state = j
-
-        # Backtrack
-        current_state = last_state
+        current_state = int(np.argmin(cost)) if np.isfinite(cost).any() else 0
         for i in range(n - 1, -1, -1):
             states[i] = current_state
-            current_state = parent[i + 1][current_state]
+            current_state = int(parent[i, current_state])
 
         return states
 
@@ -303,6 +512,11 @@ class LeadLagAnalyzer:
 
     Uses cross-correlation to identify if one entity consistently
     publishes/acts before another, suggesting coordination.
+
+    Correlations for every lag are computed at once from an FFT
+    cross-correlation plus prefix sums, and the permutation test scores
+    all shuffles as one matrix product, using a seeded RNG so p-values
+    are reproducible.
     """
 
     def __init__(
@@ -311,11 +525,19 @@ class LeadLagAnalyzer:
         lag_step_minutes: int = 30,
         min_samples: int = 10,
         significance_threshold: float = 0.05,
+        n_permutations: int = 1000,
+        random_seed: int | None = 0,
+        max_permutation_cells: int = 4_000_000,
+        resolution_minutes: int = 60,
     ):
         self.max_lag_minutes = max_lag_minutes
         self.lag_step_minutes = lag_step_minutes
         self.min_samples = min_samples
         self.significance_threshold = significance_threshold
+        self.n_permutations = n_permutations
+        self.random_seed = random_seed
+        self.max_permutation_cells = max_permutation_cells
+        self.resolution_minutes = resolution_minutes  # Series bin width for frames
 
     def analyze_pair(
         self,
@@ -333,52 +555,111 @@ class LeadLagAnalyzer:
         Returns:
             LeadLagResult if significant relationship found, None otherwise
         """
-        events_a = [e for e in events if e.entity_id == entity_a]
-        events_b = [e for e in events if e.entity_id == entity_b]
+        # Hourly bins anchored at the pair's first event
+        frame = TimingEventFrame.from_events(events, [entity_a, entity_b])
+        results = self.analyze_frame(frame, [entity_a, entity_b], resolution_minutes=60)
+        return results[0] if results else None
 
-        if len(events_a) < self.min_samples or len(events_b) < self.min_samples:
-            return None
-
-        # Convert to time series (counts per hour)
-        all_events = events_a + events_b
-        start_time = min(e.timestamp for e in all_events)
-        end_time = max(e.timestamp for e in all_events)
+    def analyze_all_pairs(
+        self,
+        events: list[TimingEvent],
+        entity_ids: list[str] | None = None,
+    ) -> list[LeadLagResult]:
+        """Analyze every pair of entities from one binned series matrix.
 
-        total_hours = int((end_time - start_time).total_seconds() / 3600) + 1
-        if total_hours < 2:
-            return None
+        Args:
+            events: All timing events
+            entity_ids: Entities to pair up (default: all in events)
 
-        # Create hourly count arrays
-        series_a = np.zeros(total_hours)
-        series_b = np.zeros(total_hours)
+        Returns:
+            Results for every pair with enough events, in pair order
+        """
+        frame = TimingEventFrame.from_events(events, entity_ids)
+        return self.analyze_frame(frame, entity_ids)
 
-        for e in events_a:
-            hour_idx = int((e.timestamp - start_time).total_seconds() / 3600)
-            if 0 <= hour_idx < total_hours:
-                series_a[hour_idx] += 1
+    def analyze_frame(
+        self,
+        frame: TimingEventFrame,
+        entity_ids: list[str] | None = None,
+        resolution_minutes: int | None = None,
+    ) -> list[LeadLagResult]:
+        """Analyze every pair of entities of a prebuilt TimingEventFrame.
 
-        for e in events_b:
-            hour_idx = int((e.timestamp - start_time).total_seconds() / 3600)
-            if 0 <= hour_idx < total_hours:
-                series_b[hour_idx] += 1
+        Uses the frame's cached (entities x bins) count matrix on a grid
+        starting at the frame's first event; each pair is analyzed over
+        the span from its earliest to its latest event. Because bins align
+        to the shared grid rather than to each pair's first event, results
+        can differ slightly from `analyze_pair`.
 
-        # Calculate cross-correlation at different lags
-        best_corr = 0.0
-        best_lag = 0
+        Args:
+            frame: Indexed timing events
+            entity_ids: Entities to pair up (default: all in the frame)
+            resolution_minutes: Bin width (default: `resolution_minutes`)
 
-        max_lag_hours = self.max_lag_minutes // 60
+        Returns:
+            Results for every pair with enough events, in pair order
+        """
+        if entity_ids is None:
+            entity_ids = frame.entity_ids
+        resolution = resolution_minutes or self.resolution_minutes
+        if len(entity_ids) < 2 or not len(frame):
+            return []
+
+        matrix = frame.binned(resolution)
+        frame_counts = frame.counts
+        codes = [frame.code(eid) if eid in frame else -1 for eid in entity_ids]
+        counts = [int(frame_counts[c]) if c >= 0 else 0 for c in codes]
+
+        # First and last non-empty bin of each entity
+        spans = {}
+        for eid, code, count in zip(entity_ids, codes, counts, strict=True):
+            if count >= self.min_samples:
+                nonzero = np.flatnonzero(matrix[code])
+                spans[eid] = (int(nonzero[0]), int(nonzero[-1]))
+
+        results = []
+        for i, entity_a in enumerate(entity_ids):
+            if entity_a not in spans:
+                continue
+            for j in range(i + 1, len(entity_ids)):
+                entity_b = entity_ids[j]
+                if entity_b not in spans:
+                    continue
+                start = min(spans[entity_a][0], spans[entity_b][0])
+                end = max(spans[entity_a][1], spans[entity_b][1]) + 1
+                if end - start < 2:
+                    continue
+                results.append(
+                    self._analyze_series(
+                        matrix[codes[i], start:end],
+                        matrix[codes[j], start:end],
+                        entity_a,
+                        entity_b,
+                        sample_size=min(counts[i], counts[j]),
+                        resolution_minutes=resolution,
+                    )
+                )
 
-        for lag in range(-max_lag_hours, max_lag_hours + 1):
-            if lag < 0:
-                corr = self._correlation(series_a[-lag:], series_b[:lag])
-            elif lag > 0:
-                corr = self._correlation(series_a[:-lag], series_b[lag:])
-            else:
-                corr = self._correlation(series_a, series_b)
+        return results
 
-            if abs(corr) > abs(best_corr):
-                best_corr = corr
-                best_lag = lag
+    def _analyze_series(
+        self,
+        series_a: np.ndarray,
+        series_b: np.ndarray,
+        entity_a: str,
+        entity_b: str,
+        sample_size: int,
+        resolution_minutes: int = 60,
+    ) -> LeadLagResult:
+        """Find the best lag between two aligned series and test it."""
+        max_lag_bins = self.max_lag_minutes // resolution_minutes
+        lags = np.arange(-max_lag_bins, max_lag_bins + 1)
+        correlations = self._lagged_correlations(series_a, series_b, lags)
+
+        # First lag with the largest |correlation|, as a strict > scan would pick
+        best = int(np.argmax(np.abs(correlations)))
+        best_corr = float(correlations[best])
+        best_lag = int(lags[best]) if best_corr != 0 else 0
 
         # Calculate p-value using permutation test
         p_value = self._permutation_test(series_a, series_b, best_corr)
@@ -388,12 +669,12 @@ class LeadLagAnalyzer:
             # A leads B
             leader = entity_a
             follower = entity_b
-            lag_minutes = best_lag * 60
+            lag_minutes = best_lag * resolution_minutes
         else:
             # B leads A
             leader = entity_b
             follower = entity_a
-            lag_minutes = abs(best_lag) * 60
+            lag_minutes = abs(best_lag) * resolution_minutes
 
         is_significant = (
             p_value < self.significance_threshold and
@@ -406,43 +687,104 @@ class LeadLagAnalyzer:
             lag_minutes=lag_minutes,
             correlation=float(best_corr),
             p_value=float(p_value),
-            sample_size=min(len(events_a), len(events_b)),
+            sample_size=sample_size,
             is_significant=is_significant,
         )
 
-    def _correlation(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate Pearson correlation between two arrays."""
-        if len(a) == 0 or len(b) == 0:
-            return 0.0
-
-        # Ensure same length
-        min_len = min(len(a), len(b))
-        a = a[:min_len]
-        b = b[:min_len]
-
-        # Handle constant arrays
-        if np.std(a) == 0 or np.std(b) == 0:
-            return 0.0
-
-        return float(np.corrcoef(a, b)[0, 1])
+    def _lagged_correlations(
+        self,
+        series_a: np.ndarray,
+        series_b: np.ndarray,
+        lags: np.ndarray,
+    ) -> np.ndarray:
+        """Pearson correlation of a[t] with b[t + lag] for each lag.
+
+        Each lag's correlation is over the overlapping part of the two
+        series only. Lagged dot products come from one FFT
+        cross-correlation; overlap sums and sums of squares from prefix
+        sums. Lags with no overlap or a constant overlap score 0.
+        """
+        a = np.asarray(series_a, dtype=np.float64)
+        b = np.asarray(series_b, dtype=np.float64)
+        t = len(a)
+        correlations = np.zeros(len(lags))
+        if t == 0:
+            return correlations
+
+        valid = np.abs(lags) < t
+        lag = lags[valid]
+        n = (t - np.abs(lag)).astype(np.float64)
+
+        # Lagged dot products: cross[L] = sum_t a[t] * b[t + L]
+        size = 1 << int(2 * t - 1).bit_length()
+        cross = np.fft.irfft(np.conj(np.fft.rfft(a, size)) * np.fft.rfft(b, size), size)
+        dots = cross[lag % size]
+        if np.array_equal(a, np.round(a)) and np.array_equal(b, np.round(b)):
+            # Integer counts: dot products are integers, drop FFT round-off
+            dots = np.round(dots)
+
+        def overlap_sums(x: np.ndarray, head: bool) -> np.ndarray:
+            # head: sum of x[:t - |L|]; otherwise sum of x[|L|:]
+            prefix = np.concatenate([[0.0], np.cumsum(x)])
+            k = np.abs(lag)
+            return prefix[t - k] if head else prefix[t] - prefix[k]
+
+        positive = lag > 0
+        sum_a = np.where(positive, overlap_sums(a, True), overlap_sums(a, False))
+        sum_b = np.where(positive, overlap_sums(b, False), overlap_sums(b, True))
+        sum_aa = np.where(positive, overlap_sums(a * a, True), overlap_sums(a * a, False))
+        sum_bb = np.where(positive, overlap_sums(b * b, False), overlap_sums(b * b, True))
+
+        var_a = n * sum_aa - sum_a * sum_a
+        var_b = n * sum_bb - sum_b * sum_b
+        covariance = n * dots - sum_a * sum_b
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = covariance / np.sqrt(var_a * var_b)
+        corr[(var_a <= 0) | (var_b <= 0)] = 0.0
+
+        correlations[valid] = np.clip(corr, -1.0, 1.0)
+        return correlations
 
     def _permutation_test(
         self,
         series_a: np.ndarray,
         series_b: np.ndarray,
         observed_corr: float,
-        n_permutations: int = 1000,
+        n_permutations: int | None = None,
     ) -> float:
-        """Estimate p-value using permutation test."""
-        count_extreme = 0
+        """Estimate p-value using permutation test.
 
-        for _ in range(n_permutations):
-            # Shuffle one series
-            shuffled_b = np.random.permutation(series_b)
-            perm_corr = self._correlation(series_a, shuffled_b)
+        Shuffles of `series_b` are drawn as an (n_permutations x T) matrix
+        (in chunks bounded by `max_permutation_cells`) and correlated with
+        `series_a` in one product per chunk. Shuffling preserves the mean
+        and variance of `series_b`, so only the dot products vary.
+        """
+        if n_permutations is None:
+            n_permutations = self.n_permutations
+
+        a = np.asarray(series_a, dtype=np.float64)
+        b = np.asarray(series_b, dtype=np.float64)
+        a_centered = a - a.mean()
+        b_centered = b - b.mean()
+        denominator = np.linalg.norm(a_centered) * np.linalg.norm(b_centered)
+
+        if len(a) == 0 or np.std(a) == 0 or np.std(b) == 0 or denominator == 0:
+            # Every shuffle correlates at 0
+            count_extreme = n_permutations if abs(observed_corr) <= 0 else 0
+            return (count_extreme + 1) / (n_permutations + 1)
+
+        rng = np.random.default_rng(self.random_seed)
+        chunk = max(1, self.max_permutation_cells // len(b))
+        # Tolerance so a shuffle equal to the observed ordering counts as extreme
+        threshold = abs(observed_corr) - 1e-12
+        count_extreme = 0
 
-            if abs(perm_corr) >= abs(observed_corr):
-                count_extreme += 1
+        for start in range(0, n_permutations, chunk):
+            rows = min(chunk, n_permutations - start)
+            shuffled = rng.permuted(np.broadcast_to(b_centered, (rows, len(b))), axis=1)
+            perm_corr = (shuffled @ a_centered) / denominator
+            count_extreme += int(np.count_nonzero(np.abs(perm_corr) >= threshold))
 
         return (count_extreme + 1) / (n_permutations + 1)
 
@@ -479,28 +821,44 @@ class SynchronizationScorer:
         if len(entity_ids) < 2:
             return None
 
-        # Filter events for specified entities
-        entity_events = defaultdict(list)
-        for event in events:
-            if event.entity_id in entity_ids:
-                entity_events[event.entity_id].append(event)
+        frame = TimingEventFrame.from_events(events, entity_ids)
+        return self.score_frame(frame, entity_ids)
+
+    def score_frame(
+        self,
+        frame: TimingEventFrame,
+        entity_ids: list[str] | None = None,
+    ) -> SynchronizationResult | None:
+        """Score synchronization for entities of a prebuilt TimingEventFrame.
+
+        Args:
+            frame: Indexed timing events
+            entity_ids: Entity IDs to analyze (default: all in the frame)
 
-        # Check minimum events
+        Returns:
+            SynchronizationResult with sync score
+        """
+        if entity_ids is not None and len(entity_ids) < 2:
+            return None
+
+        # Check minimum events (in order of first appearance)
+        wanted = set(entity_ids) if entity_ids is not None else None
         valid_entities = [
-            eid for eid, evts in entity_events.items()
-            if len(evts) >= self.min_events_per_entity
+            eid for eid in frame.entity_ids
+            if (wanted is None or eid in wanted)
+            and frame.count(eid) >= self.min_events_per_entity
         ]
 
         if len(valid_entities) < 2:
             return None
 
         # Build timing distributions (hour of day)
+        hours_of_day = frame.hours_of_day
         distributions = {}
         for entity_id in valid_entities:
-            dist = np.zeros(24)  # 24 hours
-            for event in entity_events[entity_id]:
-                hour = event.timestamp.hour
-                dist[hour] += 1
+            dist = np.bincount(
+                hours_of_day[frame.entity_slice(entity_id)], minlength=24
+            ).astype(float)
 
             # Normalize to probability distribution
             total = dist.sum()
@@ -521,14 +879,14 @@ class SynchronizationScorer:
         avg_js = np.mean(js_divergences) if js_divergences else 1.0
 
         # Calculate overlap ratio
-        overlap = self._calculate_overlap(entity_events, valid_entities)
+        overlap = self._calculate_overlap(frame, valid_entities)
 
         # Sync score: 1 - normalized JS divergence
         # JS divergence is in [0, ln(2)] for distributions, normalize to [0, 1]
         sync_score = max(0.0, 1.0 - avg_js / math.log(2))
 
         # Confidence based on sample size
-        total_events = sum(len(entity_events[eid]) for eid in valid_entities)
+        total_events = sum(frame.count(eid) for eid in valid_entities)
         confidence = min(1.0, total_events / (len(valid_entities) * 50))
 
         return SynchronizationResult(
@@ -562,7 +920,7 @@ class SynchronizationScorer:
 
     def _calculate_overlap(
         self,
-        entity_events: dict[str, list[TimingEvent]],
+        frame: TimingEventFrame,
         entity_ids: list[str],
     ) -> float:
         """Calculate temporal overlap ratio between entities."""
@@ -572,17 +930,19 @@ class SynchronizationScorer:
         # Bin events by time window
         window_seconds = self.time_window_hours * 3600
 
-        time_bins = defaultdict(set)
-        for entity_id in entity_ids:
-            for event in entity_events[entity_id]:
-                # Round timestamp to window
-                ts = event.timestamp.timestamp()
-                bin_key = int(ts // window_seconds)
-                time_bins[bin_key].add(entity_id)
+        positions = np.concatenate([
+            np.arange(len(frame))[frame.entity_slice(eid)] for eid in entity_ids
+        ])
+        bin_keys = np.floor_divide(frame.epoch_seconds[positions], window_seconds)
+        codes = frame.entity_codes[positions]
+
+        # Distinct (window, entity) pairs, then entities per window
+        pairs = np.unique(np.stack([bin_keys, codes.astype(np.float64)]), axis=1)
+        _, entities_per_bin = np.unique(pairs[0], return_counts=True)
 
         # Count bins with multiple entities
-        multi_entity_bins = sum(1 for entities in time_bins.values() if len(entities) > 1)
-        total_bins = len(time_bins)
+        multi_entity_bins = int(np.count_nonzero(entities_per_bin > 1))
+        total_bins = len(entities_per_bin)
 
         return multi_entity_bins / total_bins if total_bins > 0 else 0.0
 
@@ -653,23 +1013,26 @@ class TemporalCoordinationDetector:
             from .hardneg import filter_hard_negatives
             events = await filter_hard_negatives(events)
 
+        # Index events once for all three analyses
+        frame = TimingEventFrame.from_events(events, unique_entities)
+
         # Run burst detection for each entity
-        bursts = []
-        for entity_id in unique_entities:
-            burst_result = self.burst_detector.detect_bursts(events, entity_id)
-            if burst_result.burst_count > 0:
-                bursts.append(burst_result)
+        burst_results = self.burst_detector.detect_bursts_frame(frame, unique_entities)
+        bursts = [
+            burst_results[entity_id]
+            for entity_id in unique_entities
+            if burst_results[entity_id].burst_count > 0
+        ]
 
         # Run pairwise lead-lag analysis
-        lead_lag_pairs = []
-        for i, entity_a in enumerate(unique_entities):
-            for entity_b in unique_entities[i + 1:]:
-                result = self.lead_lag_analyzer.analyze_pair(events, entity_a, entity_b)
-                if result and result.is_significant:
-                    lead_lag_pairs.append(result)
+        lead_lag_pairs = [
+            result
+            for result in self.lead_lag_analyzer.analyze_frame(frame, unique_entities)
+            if result.is_significant
+        ]
 
         # Run synchronization scoring
-        sync_result = self.sync_scorer.score_group(events, unique_entities)
+        sync_result = self.sync_scorer.score_frame(frame, unique_entities)
         synchronized_groups = [sync_result] if sync_result else []
 
         # Calculate overall coordination score
@@ -0,0 +1,250 @@
+"""Network topology analysis for MITDS.
+
+Runs community detection, centrality and k-core decomposition over
+in-memory graph projections:
+1. Communities (Louvain modularity or label propagation)
+2. PageRank, degree and (sampled) betweenness centrality
+3. Core numbers, locating densely interconnected groups
+"""
+
+import asyncio
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from ..config import get_settings
+from ..graph.projection import GraphProjection, ProjectionFilter, get_projection
+from ..logging import get_context_logger
+
+logger = get_context_logger(__name__)
+
+CommunityMethod = Literal["louvain", "label_propagation"]
+
+
+class CentralNode(BaseModel):
+    """Centrality scores for one entity."""
+
+    entity_id: str
+    name: str | None = None
+    entity_type: str | None = None
+    degree: float = 0.0
+    pagerank: float = 0.0
+    betweenness: float = 0.0
+    core_number: int = 0
+
+
+class Community(BaseModel):
+    """A group of densely connected entities."""
+
+    community_id: str
+    member_ids: list[str]
+    member_names: list[str | None] = Field(default_factory=list)
+    member_types: list[str | None] = Field(default_factory=list)
+    size: int
+    internal_density: float = Field(ge=0.0, le=1.0)
+
+
+class TopologyResult(BaseModel):
+    """Result of topology analysis over a projection."""
+
+    projection_version: str
+    node_count: int = 0
+    edge_count: int = 0
+    density: float = 0.0
+    avg_clustering: float = 0.0
+    connected_components: int = 0
+    diameter: int = 0
+    max_core: int = 0
+    communities: list[Community] = Field(default_factory=list)
+    central_nodes: list[CentralNode] = Field(default_factory=list)
+
+
+class TopologyAnalyzer:
+    """Analyzer for network structure.
+
+    Betweenness is exact on graphs up to `betweenness_samples` nodes and
+    estimated from that many sampled sources on larger ones. The
+    diameter is a two-sweep lower bound on the largest component.
+    """
+
+    def __init__(
+        self,
+        community_method: CommunityMethod = "louvain",
+        top_n: int = 20,
+        min_community_size: int = 3,
+        betweenness_samples: int | None = None,
+        seed: int = 42,
+    ):
+        """Initialize the analyzer.
+
+        Args:
+            community_method: "louvain" or "label_propagation"
+            top_n: Central nodes and communities to report
+            min_community_size: Smallest community reported
+            betweenness_samples: Sampled sources for betweenness (default
+                from the `graph_betweenness_samples` setting)
+            seed: Random seed, for reproducible communities and samples
+        """
+        self.community_method = community_method
+        self.top_n = top_n
+        self.min_community_size = min_community_size
+        if betweenness_samples is None:
+            betweenness_samples = get_settings().graph_betweenness_samples
+        self.betweenness_samples = betweenness_samples
+        self.seed = seed
+
+    def analyze(self, projection: GraphProjection) -> TopologyResult:
+        """Analyze a projection (CPU-bound; see `analyze_topology`)."""
+        import networkx as nx
+
+        result = TopologyResult(
+            projection_version=projection.version,
+            node_count=projection.node_count,
+            edge_count=projection.edge_count,
+        )
+        if projection.node_count == 0:
+            return result
+
+        graph = projection.to_networkx()
+        components = list(nx.connected_components(graph))
+        result.density = nx.density(graph)
+        result.avg_clustering = nx.average_clustering(graph)
+        result.connected_components = len(components)
+        largest = graph.subgraph(max(components, key=len))
+        if largest.number_of_nodes() > 1:
+            result.diameter = nx.approximation.diameter(largest, seed=self.seed)
+
+        core = nx.core_number(graph)
+        result.max_core = max(core.values(), default=0)
+
+        # Centrality
+        pagerank = nx.pagerank(graph, weight="weight")
+        degree = nx.degree_centrality(graph)
+        samples = self.betweenness_samples
+        betweenness = nx.betweenness_centrality(
+            graph,
+            k=samples if 0 < samples < graph.number_of_nodes() else None,
+            seed=self.seed,
+        )
+
+        ranked = sorted(pagerank, key=lambda i: pagerank[i], reverse=True)
+        result.central_nodes = [
+            CentralNode(
+                entity_id=projection.node_ids[i],
+                name=projection.names[i],
+                entity_type=projection.entity_types[i],
+                degree=degree[i],
+                pagerank=pagerank[i],
+                betweenness=betweenness[i],
+                core_number=core[i],
+            )
+            for i in ranked[: self.top_n]
+        ]
+
+        # Communities
+        if self.community_method == "label_propagation":
+            groups = nx.community.label_propagation_communities(graph)
+        else:
+            groups = nx.community.louvain_communities(graph, weight="weight", seed=self.seed)
+
+        groups = sorted(
+            (g for g in groups if len(g) >= self.min_community_size),
+            key=len,
+            reverse=True,
+        )
+        for number, group in enumerate(groups[: self.top_n], start=1):
+            members = sorted(group, key=lambda i: pagerank[i], reverse=True)
+            result.communities.append(
+                Community(
+                    community_id=f"community_{number}",
+                    member_ids=[projection.node_ids[i] for i in members],
+                    member_names=[projection.names[i] for i in members],
+                    member_types=[projection.entity_types[i] for i in members],
+                    size=len(members),
+                    internal_density=nx.density(graph.subgraph(members)),
+                )
+            )
+
+        return result
+
+
+async def analyze_topology(
+    projection_filter: ProjectionFilter,
+    entity_ids: list[UUID | str] | None = None,
+    hops: int = 1,
+    analyzer: TopologyAnalyzer | None = None,
+) -> TopologyResult:
+    """Analyze the topology of a (cached) projection.
+
+    Args:
+        projection_filter: Relationships to project
+        entity_ids: Restrict to these entities and their neighbours
+        hops: Neighbourhood radius around `entity_ids`
+        analyzer: Analyzer to use (default settings if omitted)
+
+    Returns:
+        Network metrics, central entities and communities
+    """
+    projection = await get_projection(projection_filter)
+    if entity_ids:
+        projection = projection.neighborhood((str(i) for i in entity_ids), hops=hops)
+
+    analyzer = analyzer or TopologyAnalyzer()
+    # networkx algorithms are CPU-bound; keep them off the event loop
+    return await asyncio.to_thread(analyzer.analyze, projection)
+
+
+def apply_topology_to_report(report: Any, result: TopologyResult) -> None:
+    """Populate a TopologySummaryReport from a topology result."""
+    from ..reporting.templates import EntityReference
+
+    def reference(entity_id: str, name: str | None, entity_type: str | None):
+        # References need entity UUIDs; other node ids are left out
+        try:
+            uuid = UUID(entity_id)
+        except ValueError:
+            return None
+        return EntityReference(
+            entity_id=uuid,
+            entity_type=entity_type or "UNKNOWN",
+            name=name or entity_id,
+        )
+
+    report.set_network_metrics(
+        node_count=result.node_count,
+        edge_count=result.edge_count,
+        density=result.density,
+        avg_clustering=result.avg_clustering,
+        connected_components=result.connected_components,
+        diameter=result.diameter,
+    )
+
+    for node in result.central_nodes:
+        entity = reference(node.entity_id, node.name, node.entity_type)
+        if entity is None:
+            continue
+        report.add_central_entity(
+            entity,
+            degree_centrality=node.degree,
+            betweenness_centrality=node.betweenness,
+            pagerank=node.pagerank,
+            core_number=node.core_number,
+        )
+
+    for community in result.communities:
+        report.add_cluster(
+            cluster_id=community.community_id,
+            members=[
+                entity
+                for member_id, name, entity_type in zip(
+                    community.member_ids,
+                    community.member_names,
+                    community.member_types,
+                    strict=False,
+                )
+                if (entity := reference(member_id, name, entity_type)) is not None
+            ],
+            internal_density=community.internal_density,
+            label=", ".join(n for n in community.member_names[:3] if n),
+        )
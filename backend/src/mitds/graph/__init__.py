@@ -9,6 +9,18 @@ from .builder import (
     RelationshipResult,
     get_graph_builder,
 )
+from .bulk import (
+    BulkGraphWriter,
+    BulkWriteStats,
+    get_active_writer,
+)
+from .projection import (
+    GraphProjection,
+    ProjectionFilter,
+    clear_projections,
+    get_projection,
+    load_projection,
+)
 from .queries import (
     EntityNode,
     FundingCluster,
@@ -22,13 +34,33 @@ from .queries import (
     get_funding_recipients,
     get_funding_sources,
 )
+from .search import (
+    ENTITY_AUTOCOMPLETE_INDEX,
+    ENTITY_SEARCH_INDEX,
+    FulltextIndex,
+    build_fulltext_query,
+    count_entity_matches,
+    ensure_search_indexes,
+    search_entity_nodes,
+    suggest_entities,
+)
 
 __all__ = [
+    # Bulk writes
+    "BulkGraphWriter",
+    "BulkWriteStats",
+    "get_active_writer",
     # Builder
     "GraphBuilder",
     "NodeResult",
     "RelationshipResult",
     "get_graph_builder",
+    # Projections
+    "GraphProjection",
+    "ProjectionFilter",
+    "clear_projections",
+    "get_projection",
+    "load_projection",
     # Queries
     "EntityNode",
     "FundingCluster",
@@ -41,4 +73,13 @@ __all__ = [
     "get_funding_paths",
     "get_funding_recipients",
     "get_funding_sources",
+    # Search
+    "ENTITY_AUTOCOMPLETE_INDEX",
+    "ENTITY_SEARCH_INDEX",
+    "FulltextIndex",
+    "build_fulltext_query",
+    "count_entity_matches",
+    "ensure_search_indexes",
+    "search_entity_nodes",
+    "suggest_entities",
 ]
@@ -10,6 +10,7 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel
 
+from ..cache import invalidate_entities
 from ..db import get_neo4j_session
 from ..logging import get_context_logger
 from ..models import (
@@ -23,6 +24,7 @@ from ..models import (
     Sponsor,
 )
 from ..models.relationships import RelationType
+from .bulk import BulkGraphWriter
 
 logger = get_context_logger(__name__)
 
@@ -53,9 +55,80 @@ class GraphBuilder:
     Provides methods to:
     - Create/update entity nodes
     - Create/update relationships
-    - Batch operations for efficiency
+    - Batch operations for efficiency (via an attached BulkGraphWriter)
     """
 
+    def __init__(self, writer: BulkGraphWriter | None = None):
+        """Initialize the builder.
+
+        Args:
+            writer: Optional bulk writer. When set, upserts are buffered and
+                flushed as UNWIND batches instead of running an existence
+                check plus a MERGE per call.
+        """
+        self.writer = writer
+
+    async def _buffer_node(
+        self,
+        label: str,
+        merge_key: str,
+        merge_value: str,
+        props: dict[str, Any],
+        entity_type: str,
+    ) -> NodeResult:
+        """Queue a node upsert on the bulk writer.
+
+        The existence check is skipped in buffered mode, so the result
+        reports neither created nor updated.
+        """
+        await self.writer.merge_node(
+            label,
+            merge_key,
+            merge_value,
+            on_create={**props, "created_at": props["updated_at"]},
+            on_match=props,
+        )
+        return NodeResult(
+            id=UUID(props["id"]),
+            entity_type=entity_type,
+            created=False,
+            updated=False,
+        )
+
+    async def _buffer_relationship(
+        self,
+        rel_type: str,
+        source_label: str | None,
+        source_id: UUID,
+        target_label: str | None,
+        target_id: UUID,
+        props: dict[str, Any],
+        directed: bool = True,
+    ) -> RelationshipResult:
+        """Queue a relationship upsert on the bulk writer.
+
+        The relationship id is only assigned on create; as with
+        `_buffer_node`, created/updated are unknown until the flush.
+        """
+        rel_props = dict(props)
+        rel_id = rel_props.pop("id")
+        await self.writer.merge_relationship(
+            rel_type,
+            source_label, "id", str(source_id),
+            target_label, "id", str(target_id),
+            properties=rel_props,
+            on_create={"id": rel_id, "created_at": props["updated_at"]},
+            directed=directed,
+        )
+        return RelationshipResult(
+            id=UUID(rel_id),
+            rel_type=rel_type,
+            source_id=source_id,
+            target_id=target_id,
+            created=False,
+            updated=False,
+        )
+
     async def create_organization(
         self,
         name: str,
@@ -89,50 +162,55 @@ class GraphBuilder:
         if entity_id is None:
             entity_id = uuid4()
 
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-
-            # Build properties
-            props = {
-                "id": str(entity_id),
-                "name": name,
-                "entity_type": EntityType.ORGANIZATION.value,
-                "org_type": org_type.value,
-                "status": status.value,
-                "jurisdiction": jurisdiction,
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if ein:
-                props["ein"] = ein
-            if bn:
-                props["bn"] = bn
-            if opencorp_id:
-                props["opencorp_id"] = opencorp_id
-            if address:
-                if address.get("street"):
-                    props["address_street"] = address["street"]
-                if address.get("city"):
-                    props["address_city"] = address["city"]
-                if address.get("state"):
-                    props["address_state"] = address["state"]
-                if address.get("postal_code"):
-                    props["address_postal"] = address["postal_code"]
-                if address.get("country"):
-                    props["address_country"] = address["country"]
-
-            # Determine merge key
-            if ein:
-                merge_key = "ein"
-                merge_value = ein
-            elif bn:
-                merge_key = "bn"
-                merge_value = bn
-            else:
-                merge_key = "id"
-                merge_value = str(entity_id)
+        now = datetime.utcnow().isoformat()
+
+        # Build properties
+        props = {
+            "id": str(entity_id),
+            "name": name,
+            "entity_type": EntityType.ORGANIZATION.value,
+            "org_type": org_type.value,
+            "status": status.value,
+            "jurisdiction": jurisdiction,
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if ein:
+            props["ein"] = ein
+        if bn:
+            props["bn"] = bn
+        if opencorp_id:
+            props["opencorp_id"] = opencorp_id
+        if address:
+            if address.get("street"):
+                props["address_street"] = address["street"]
+            if address.get("city"):
+                props["address_city"] = address["city"]
+            if address.get("state"):
+                props["address_state"] = address["state"]
+            if address.get("postal_code"):
+                props["address_postal"] = address["postal_code"]
+            if address.get("country"):
+                props["address_country"] = address["country"]
+
+        # Determine merge key
+        if ein:
+            merge_key = "ein"
+            merge_value = ein
+        elif bn:
+            merge_key = "bn"
+            merge_value = bn
+        else:
+            merge_key = "id"
+            merge_value = str(entity_id)
+
+        if self.writer is not None:
+            return await self._buffer_node(
+                "Organization", merge_key, merge_value, props, EntityType.ORGANIZATION.value
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists
             check_query = f"""
             MATCH (o:Organization {{{merge_key}: $merge_value}})
@@ -156,6 +234,7 @@ class GraphBuilder:
                 query, merge_value=merge_value, props=props
             )
             record = await result.single()
+            await invalidate_entities([record["id"]])
 
             return NodeResult(
                 id=UUID(record["id"]),
@@ -191,37 +270,42 @@ class GraphBuilder:
         if entity_id is None:
             entity_id = uuid4()
 
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-
-            props = {
-                "id": str(entity_id),
-                "name": name,
-                "entity_type": EntityType.PERSON.value,
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if aliases:
-                props["aliases"] = aliases
-            if irs_990_name:
-                props["irs_990_name"] = irs_990_name
-            if opencorp_officer_id:
-                props["opencorp_officer_id"] = opencorp_officer_id
-            if location:
-                props["location"] = location
-
-            # Determine merge key
-            if irs_990_name:
-                merge_key = "irs_990_name"
-                merge_value = irs_990_name
-            elif opencorp_officer_id:
-                merge_key = "opencorp_officer_id"
-                merge_value = opencorp_officer_id
-            else:
-                merge_key = "name"
-                merge_value = name
+        now = datetime.utcnow().isoformat()
+
+        props = {
+            "id": str(entity_id),
+            "name": name,
+            "entity_type": EntityType.PERSON.value,
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if aliases:
+            props["aliases"] = aliases
+        if irs_990_name:
+            props["irs_990_name"] = irs_990_name
+        if opencorp_officer_id:
+            props["opencorp_officer_id"] = opencorp_officer_id
+        if location:
+            props["location"] = location
+
+        # Determine merge key
+        if irs_990_name:
+            merge_key = "irs_990_name"
+            merge_value = irs_990_name
+        elif opencorp_officer_id:
+            merge_key = "opencorp_officer_id"
+            merge_value = opencorp_officer_id
+        else:
+            merge_key = "name"
+            merge_value = name
+
+        if self.writer is not None:
+            return await self._buffer_node(
+                "Person", merge_key, merge_value, props, EntityType.PERSON.value
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists
             check_query = f"""
             MATCH (p:Person {{{merge_key}: $merge_value}})
@@ -245,6 +329,7 @@ class GraphBuilder:
                 query, merge_value=merge_value, props=props
             )
             record = await result.single()
+            await invalidate_entities([record["id"]])
 
             return NodeResult(
                 id=UUID(record["id"]),
@@ -282,27 +367,32 @@ class GraphBuilder:
         if entity_id is None:
             entity_id = uuid4()
 
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-
-            props = {
-                "id": str(entity_id),
-                "name": name,
-                "entity_type": EntityType.OUTLET.value,
-                "media_type": media_type.value,
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if aliases:
-                props["aliases"] = aliases
-            if domains:
-                props["domains"] = domains
-            if editorial_focus:
-                props["editorial_focus"] = editorial_focus
-            if owner_org_id:
-                props["owner_org_id"] = str(owner_org_id)
+        now = datetime.utcnow().isoformat()
+
+        props = {
+            "id": str(entity_id),
+            "name": name,
+            "entity_type": EntityType.OUTLET.value,
+            "media_type": media_type.value,
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if aliases:
+            props["aliases"] = aliases
+        if domains:
+            props["domains"] = domains
+        if editorial_focus:
+            props["editorial_focus"] = editorial_focus
+        if owner_org_id:
+            props["owner_org_id"] = str(owner_org_id)
+
+        if self.writer is not None:
+            return await self._buffer_node(
+                "Outlet", "name", name, props, EntityType.OUTLET.value
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists
             check_query = """
             MATCH (o:Outlet {name: $name})
@@ -324,6 +414,7 @@ class GraphBuilder:
             """
             result = await session.run(query, name=name, props=props)
             record = await result.single()
+            await invalidate_entities([record["id"]])
 
             return NodeResult(
                 id=UUID(record["id"]),
@@ -357,24 +448,29 @@ class GraphBuilder:
         if entity_id is None:
             entity_id = uuid4()
 
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-
-            props = {
-                "id": str(entity_id),
-                "name": name,
-                "entity_type": EntityType.SPONSOR.value,
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if resolved_org_id:
-                props["resolved_org_id"] = str(resolved_org_id)
-            if meta_page_id:
-                props["meta_page_id"] = meta_page_id
-            if meta_disclaimer_text:
-                props["meta_disclaimer_text"] = meta_disclaimer_text
+        now = datetime.utcnow().isoformat()
+
+        props = {
+            "id": str(entity_id),
+            "name": name,
+            "entity_type": EntityType.SPONSOR.value,
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if resolved_org_id:
+            props["resolved_org_id"] = str(resolved_org_id)
+        if meta_page_id:
+            props["meta_page_id"] = meta_page_id
+        if meta_disclaimer_text:
+            props["meta_disclaimer_text"] = meta_disclaimer_text
+
+        if self.writer is not None:
+            return await self._buffer_node(
+                "Sponsor", "name", name, props, EntityType.SPONSOR.value
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists
             check_query = """
             MATCH (s:Sponsor {name: $name})
@@ -396,6 +492,7 @@ class GraphBuilder:
             """
             result = await session.run(query, name=name, props=props)
             record = await result.single()
+            await invalidate_entities([record["id"]])
 
             return NodeResult(
                 id=UUID(record["id"]),
@@ -432,29 +529,34 @@ class GraphBuilder:
         Returns:
             RelationshipResult with operation status
         """
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-            rel_id = uuid4()
-
-            props = {
-                "id": str(rel_id),
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if amount is not None:
-                props["amount"] = amount
-            if amount_currency:
-                props["amount_currency"] = amount_currency
-            if fiscal_year:
-                props["fiscal_year"] = fiscal_year
-            if grant_purpose:
-                props["grant_purpose"] = grant_purpose
-            if valid_from:
-                props["valid_from"] = valid_from.isoformat()
-            if valid_to:
-                props["valid_to"] = valid_to.isoformat()
+        now = datetime.utcnow().isoformat()
+        rel_id = uuid4()
+
+        props = {
+            "id": str(rel_id),
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if amount is not None:
+            props["amount"] = amount
+        if amount_currency:
+            props["amount_currency"] = amount_currency
+        if fiscal_year:
+            props["fiscal_year"] = fiscal_year
+        if grant_purpose:
+            props["grant_purpose"] = grant_purpose
+        if valid_from:
+            props["valid_from"] = valid_from.isoformat()
+        if valid_to:
+            props["valid_to"] = valid_to.isoformat()
+
+        if self.writer is not None:
+            return await self._buffer_relationship(
+                RelationType.FUNDED_BY.value, None, recipient_id, None, funder_id, props
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists
             check_query = """
             MATCH (recipient {id: $recipient_id})-[r:FUNDED_BY]->(funder {id: $funder_id})
@@ -491,6 +593,7 @@ class GraphBuilder:
                 props=props,
             )
             await result.single()
+            await invalidate_entities([recipient_id, funder_id])
 
             return RelationshipResult(
                 id=rel_id,
@@ -601,25 +704,30 @@ class GraphBuilder:
         Returns:
             RelationshipResult with operation status
         """
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-            rel_id = uuid4()
-
-            props = {
-                "id": str(rel_id),
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if ownership_percentage is not None:
-                props["ownership_percentage"] = ownership_percentage
-            if share_class:
-                props["share_class"] = share_class
-            if valid_from:
-                props["valid_from"] = valid_from.isoformat()
-            if valid_to:
-                props["valid_to"] = valid_to.isoformat()
+        now = datetime.utcnow().isoformat()
+        rel_id = uuid4()
+
+        props = {
+            "id": str(rel_id),
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if ownership_percentage is not None:
+            props["ownership_percentage"] = ownership_percentage
+        if share_class:
+            props["share_class"] = share_class
+        if valid_from:
+            props["valid_from"] = valid_from.isoformat()
+        if valid_to:
+            props["valid_to"] = valid_to.isoformat()
+
+        if self.writer is not None:
+            return await self._buffer_relationship(
+                "OWNS", None, owner_id, None, owned_id, props
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists
             check_query = """
             MATCH (owner {id: $owner_id})-[r:OWNS]->(owned {id: $owned_id})
@@ -654,6 +762,7 @@ class GraphBuilder:
                 props=props,
             )
             await result.single()
+            await invalidate_entities([owner_id, owned_id])
 
             return RelationshipResult(
                 id=rel_id,
@@ -677,27 +786,32 @@ class GraphBuilder:
         confidence: float = 1.0,
     ) -> RelationshipResult:
         """Create or update a role relationship (DIRECTOR_OF or EMPLOYED_BY)."""
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-            rel_id = uuid4()
-
-            props = {
-                "id": str(rel_id),
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if title:
-                props["title"] = title
-            if compensation is not None:
-                props["compensation"] = compensation
-            if hours_per_week is not None:
-                props["hours_per_week"] = hours_per_week
-            if valid_from:
-                props["valid_from"] = valid_from.isoformat()
-            if valid_to:
-                props["valid_to"] = valid_to.isoformat()
+        now = datetime.utcnow().isoformat()
+        rel_id = uuid4()
+
+        props = {
+            "id": str(rel_id),
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if title:
+            props["title"] = title
+        if compensation is not None:
+            props["compensation"] = compensation
+        if hours_per_week is not None:
+            props["hours_per_week"] = hours_per_week
+        if valid_from:
+            props["valid_from"] = valid_from.isoformat()
+        if valid_to:
+            props["valid_to"] = valid_to.isoformat()
+
+        if self.writer is not None:
+            return await self._buffer_relationship(
+                rel_type, "Person", person_id, "Organization", organization_id, props
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists
             check_query = f"""
             MATCH (p:Person {{id: $person_id}})-[r:{rel_type}]->(o:Organization {{id: $org_id}})
@@ -732,6 +846,7 @@ class GraphBuilder:
                 props=props,
             )
             await result.single()
+            await invalidate_entities([person_id, organization_id])
 
             return RelationshipResult(
                 id=rel_id,
@@ -760,25 +875,30 @@ class GraphBuilder:
         Returns:
             RelationshipResult with operation status
         """
-        async with get_neo4j_session() as session:
-            now = datetime.utcnow().isoformat()
-            rel_id = uuid4()
-
-            props = {
-                "id": str(rel_id),
-                "confidence": confidence,
-                "updated_at": now,
-            }
-
-            if properties:
-                # Serialize complex types to JSON strings if needed
-                import json
-                for key, value in properties.items():
-                    if isinstance(value, (list, dict)):
-                        props[key] = json.dumps(value)
-                    else:
-                        props[key] = value
+        now = datetime.utcnow().isoformat()
+        rel_id = uuid4()
+
+        props = {
+            "id": str(rel_id),
+            "confidence": confidence,
+            "updated_at": now,
+        }
+
+        if properties:
+            # Serialize complex types to JSON strings if needed
+            import json
+            for key, value in properties.items():
+                if isinstance(value, (list, dict)):
+                    props[key] = json.dumps(value)
+                else:
+                    props[key] = value
+
+        if self.writer is not None:
+            return await self._buffer_relationship(
+                "SHARED_INFRA", None, source_id, None, target_id, props, directed=False
+            )
 
+        async with get_neo4j_session() as session:
             # Check if exists (bidirectional check)
             check_query = """
             MATCH (a {id: $source_id})-[r:SHARED_INFRA]-(b {id: $target_id})
@@ -813,6 +933,7 @@ class GraphBuilder:
                 props=props,
             )
             await result.single()
+            await invalidate_entities([source_id, target_id])
 
             return RelationshipResult(
                 id=rel_id,
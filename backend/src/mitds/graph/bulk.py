@@ -0,0 +1,385 @@
+"""Buffered bulk writer for Neo4j.
+
+Collects node and relationship upserts, grouped by label and merge key,
+and flushes them as parameterised ``UNWIND $rows AS row MERGE ...``
+statements. Each chunk runs in its own explicit write transaction, so a
+bulk load costs one round trip per chunk instead of one per entity.
+
+Usage:
+    async with BulkGraphWriter(chunk_size=1000) as writer:
+        await writer.merge_node(
+            "Organization", "ein", "123456789",
+            on_create={"id": "...", "name": "Example Org"},
+        )
+        await writer.merge_relationship(
+            "FUNDED_BY",
+            "Organization", "id", recipient_id,
+            "Organization", "id", funder_id,
+            properties={"amount": 50000},
+        )
+    # Remaining rows are flushed when the context exits
+
+Ingesters using `Neo4jHelper` can opt in without changing their Cypher by
+activating a writer for the current task (see `BulkGraphWriter.activate`);
+`BaseIngester.run` does this when `IngestionConfig.bulk_graph_writes` is set.
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from ..cache import invalidate_entities
+from ..db import get_neo4j_session
+from ..logging import get_context_logger
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_active_writer: ContextVar["BulkGraphWriter | None"] = ContextVar(
+    "mitds_bulk_graph_writer", default=None
+)
+
+
+def get_active_writer() -> "BulkGraphWriter | None":
+    """Get the bulk writer activated for the current task, if any."""
+    return _active_writer.get()
+
+
+def _check_identifier(value: str) -> str:
+    """Validate a label, relationship type or property name for Cypher."""
+    if not _IDENTIFIER.match(value):
+        raise ValueError(f"Invalid Cypher identifier: {value!r}")
+    return value
+
+
+def _node_pattern(var: str, label: str | None, key: str, param: str) -> str:
+    label_part = f":{label}" if label else ""
+    return f"({var}{label_part} {{{key}: row.{param}}})"
+
+
+@lru_cache(maxsize=256)
+def _node_query(label: str, merge_key: str, coalesce_keys: tuple[str, ...]) -> str:
+    """Build the UNWIND MERGE statement for a node bucket."""
+    on_match = ["n += row.on_match"]
+    on_match.extend(f"n.{k} = COALESCE(n.{k}, row.coalesce.{k})" for k in coalesce_keys)
+    return (
+        "UNWIND $rows AS row\n"
+        f"MERGE {_node_pattern('n', label, merge_key, 'merge_value')}\n"
+        "ON CREATE SET n += row.on_create\n"
+        f"ON MATCH SET {', '.join(on_match)}\n"
+        "RETURN n.id AS id"
+    )
+
+
+@lru_cache(maxsize=256)
+def _relationship_query(
+    rel_type: str,
+    source_label: str | None,
+    source_key: str,
+    target_label: str | None,
+    target_key: str,
+    merge_keys: tuple[str, ...],
+    directed: bool,
+) -> str:
+    """Build the UNWIND MERGE statement for a relationship bucket."""
+    merge_props = ""
+    if merge_keys:
+        merge_props = " {" + ", ".join(f"{k}: row.merge_on.{k}" for k in merge_keys) + "}"
+    arrow = "->" if directed else "-"
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH {_node_pattern('s', source_label, source_key, 'source_value')}\n"
+        f"MATCH {_node_pattern('t', target_label, target_key, 'target_value')}\n"
+        f"MERGE (s)-[r:{rel_type}{merge_props}]{arrow}(t)\n"
+        "ON CREATE SET r += row.on_create\n"
+        "SET r += row.props\n"
+        "RETURN s.id AS source_id, t.id AS target_id"
+    )
+
+
+async def _run_unwind(tx, query: str, rows: list[dict[str, Any]]) -> list[list[Any]]:
+    result = await tx.run(query, rows=rows)
+    return await result.values()
+
+
+class BulkWriteStats(BaseModel):
+    """Counters for a bulk writer."""
+
+    nodes_written: int = 0
+    relationships_written: int = 0
+    rows_failed: int = 0
+    transactions: int = 0
+    flushes: int = 0
+
+
+class BulkGraphWriter:
+    """Buffered UNWIND-based writer for Neo4j node and edge upserts.
+
+    Rows are buffered per statement shape (label + merge key for nodes,
+    type + endpoint keys for relationships). The buffer is flushed:
+    - on size, when a bucket reaches `chunk_size` rows or the total
+      buffered rows reach `max_buffered`
+    - on time, when `flush_interval` seconds have passed since the last
+      flush (checked on every write and by a background ticker while the
+      writer is used as an async context manager)
+    - on close
+
+    Every flush writes all node buckets before any relationship bucket,
+    so relationships always see nodes that were buffered before them.
+    Failed chunks are logged and counted rather than raised, mirroring
+    the graceful degradation of `Neo4jHelper`. After each flush the ids of
+    every written node and relationship endpoint are passed to
+    `invalidate` (by default the read-through cache invalidation).
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        flush_interval: float | None = 5.0,
+        max_buffered: int | None = None,
+        session_factory: Callable[[], Any] = get_neo4j_session,
+        logger=None,
+        invalidate: Callable[[Iterable[str]], Awaitable[Any]] | None = invalidate_entities,
+    ):
+        """Initialize the writer.
+
+        Args:
+            chunk_size: Rows per UNWIND statement / write transaction
+            flush_interval: Seconds between time-based flushes (None disables)
+            max_buffered: Total buffered rows that force a flush
+                (default: 10 x chunk_size)
+            session_factory: Async context manager factory yielding a Neo4j session
+            logger: Optional logger
+            invalidate: Coroutine called with the entity ids touched by a
+                flush (None disables)
+        """
+        self.chunk_size = max(1, chunk_size)
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered or self.chunk_size * 10
+        self.stats = BulkWriteStats()
+        self._session_factory = session_factory
+        self._invalidate = invalidate
+        self.logger = logger or get_context_logger(__name__)
+        self._nodes: dict[tuple, list[dict[str, Any]]] = {}
+        self._relationships: dict[tuple, list[dict[str, Any]]] = {}
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._ticker: asyncio.Task | None = None
+
+    @property
+    def buffered(self) -> int:
+        """Number of rows waiting to be flushed."""
+        return self._buffered
+
+    async def __aenter__(self) -> "BulkGraphWriter":
+        if self.flush_interval and self._ticker is None:
+            self._ticker = asyncio.create_task(self._tick())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @contextmanager
+    def activate(self) -> Iterator["BulkGraphWriter"]:
+        """Route `Neo4jHelper` writes in the current context through this writer.
+
+        Tasks created inside the block inherit the activation.
+        """
+        token = _active_writer.set(self)
+        try:
+            yield self
+        finally:
+            _active_writer.reset(token)
+
+    async def merge_node(
+        self,
+        label: str,
+        merge_key: str,
+        merge_value: Any,
+        *,
+        on_create: dict[str, Any],
+        on_match: dict[str, Any] | None = None,
+        coalesce: dict[str, Any] | None = None,
+    ) -> None:
+        """Buffer a node upsert.
+
+        Args:
+            label: Node label (e.g. "Organization")
+            merge_key: Property used as the MERGE key
+            merge_value: Value of the merge key
+            on_create: Properties set when the node is created
+            on_match: Properties set when the node already exists
+            coalesce: Properties set on match only where currently null
+        """
+        coalesce = coalesce or {}
+        key = (
+            _check_identifier(label),
+            _check_identifier(merge_key),
+            tuple(sorted(_check_identifier(k) for k in coalesce)),
+        )
+        row = {
+            "merge_value": merge_value,
+            "on_create": on_create,
+            "on_match": on_match or {},
+            "coalesce": coalesce,
+        }
+        await self._add(self._nodes, key, row)
+
+    async def merge_relationship(
+        self,
+        rel_type: str,
+        source_label: str | None,
+        source_key: str,
+        source_value: Any,
+        target_label: str | None,
+        target_key: str,
+        target_value: Any,
+        *,
+        properties: dict[str, Any] | None = None,
+        on_create: dict[str, Any] | None = None,
+        merge_on: dict[str, Any] | None = None,
+        directed: bool = True,
+    ) -> None:
+        """Buffer a relationship upsert between two existing nodes.
+
+        Args:
+            rel_type: Relationship type (e.g. "OWNS")
+            source_label: Source node label, or None to match any label
+            source_key: Source node match property
+            source_value: Source node match value
+            target_label: Target node label, or None to match any label
+            target_key: Target node match property
+            target_value: Target node match value
+            properties: Properties set on every write
+            on_create: Properties set only when the relationship is created
+            merge_on: Properties included in the relationship MERGE key
+            directed: Whether to MERGE a directed relationship
+        """
+        merge_on = merge_on or {}
+        key = (
+            _check_identifier(rel_type),
+            _check_identifier(source_label) if source_label else None,
+            _check_identifier(source_key),
+            _check_identifier(target_label) if target_label else None,
+            _check_identifier(target_key),
+            tuple(sorted(_check_identifier(k) for k in merge_on)),
+            directed,
+        )
+        row = {
+            "source_value": source_value,
+            "target_value": target_value,
+            "props": properties or {},
+            "on_create": on_create or {},
+            "merge_on": merge_on,
+        }
+        await self._add(self._relationships, key, row)
+
+    async def _add(
+        self,
+        buckets: dict[tuple, list[dict[str, Any]]],
+        key: tuple,
+        row: dict[str, Any],
+    ) -> None:
+        bucket = buckets.setdefault(key, [])
+        bucket.append(row)
+        self._buffered += 1
+
+        if (
+            len(bucket) >= self.chunk_size
+            or self._buffered >= self.max_buffered
+            or self._interval_elapsed()
+        ):
+            await self.flush()
+
+    def _interval_elapsed(self) -> bool:
+        return bool(
+            self.flush_interval
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    async def _tick(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._buffered and self._interval_elapsed():
+                try:
+                    await self.flush()
+                except Exception as e:
+                    self.logger.warning(f"Timed bulk graph flush failed: {e}")
+
+    async def flush(self) -> None:
+        """Write all buffered rows to Neo4j."""
+        async with self._lock:
+            nodes, self._nodes = self._nodes, {}
+            relationships, self._relationships = self._relationships, {}
+            self._buffered = 0
+            self._last_flush = time.monotonic()
+
+            if not nodes and not relationships:
+                return
+
+            touched: set[str] = set()
+            try:
+                async with self._session_factory() as session:
+                    for key in list(nodes):
+                        rows = nodes.pop(key)
+                        self.stats.nodes_written += await self._write(
+                            session, _node_query(*key), rows, "node", touched
+                        )
+                    for key in list(relationships):
+                        rows = relationships.pop(key)
+                        self.stats.relationships_written += await self._write(
+                            session, _relationship_query(*key), rows, "relationship", touched
+                        )
+            except Exception as e:
+                # Session-level failure: count whatever was not attempted
+                unwritten = sum(len(rows) for rows in nodes.values())
+                unwritten += sum(len(rows) for rows in relationships.values())
+                self.stats.rows_failed += unwritten
+                self.logger.warning(f"Bulk graph flush failed: {e}")
+            self.stats.flushes += 1
+
+            touched.discard(None)
+            if touched and self._invalidate is not None:
+                await self._invalidate(touched)
+
+    async def _write(
+        self,
+        session,
+        query: str,
+        rows: list[dict[str, Any]],
+        kind: str,
+        touched: set[str],
+    ) -> int:
+        written = 0
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            try:
+                returned = await session.execute_write(_run_unwind, query, chunk)
+            except Exception as e:
+                self.stats.rows_failed += len(chunk)
+                self.logger.warning(
+                    f"Bulk {kind} write failed for {len(chunk)} rows: {e}"
+                )
+                continue
+            self.stats.transactions += 1
+            written += len(chunk)
+            touched.update(entity_id for row in returned for entity_id in row)
+        return written
+
+    async def close(self) -> None:
+        """Stop the background ticker and flush remaining rows."""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+            self._ticker = None
+        await self.flush()
@@ -0,0 +1,319 @@
+"""In-memory graph projections for MITDS.
+
+Loads a filtered subgraph (relationship types, time window, jurisdiction)
+from Neo4j into a compact CSR adjacency matrix with integer node ids, so
+topology algorithms run in process instead of as variable-length Cypher.
+
+Projections are cached per filter with a version stamp built from the
+Neo4j count store. A projection is rebuilt when the stamp changes (nodes
+or relationships were added or removed) or when it is older than the
+`graph_projection_ttl` setting, which covers property-only edits.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+from ..cache import SingleFlight
+from ..config import get_settings
+from ..db import get_neo4j_session
+from ..logging import get_context_logger
+from ..models.relationships import RelationType
+
+logger = get_context_logger(__name__)
+
+# Node labels of entities (see EntityType); other nodes, such as elections
+# or evidence, are left out of projections
+ENTITY_LABELS = (
+    "Organization",
+    "Person",
+    "Outlet",
+    "Sponsor",
+    "Vendor",
+    "Domain",
+    "PlatformAccount",
+)
+
+
+@dataclass(frozen=True)
+class ProjectionFilter:
+    """Which relationships a projection includes.
+
+    Only relationships between entity nodes (`ENTITY_LABELS`) are
+    projected. They are kept when their validity overlaps the time window
+    (missing bounds are open-ended) and neither endpoint has a
+    jurisdiction outside `jurisdictions` (endpoints without one, such as
+    people, always pass).
+    """
+
+    rel_types: tuple[str, ...] | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    jurisdictions: tuple[str, ...] | None = None
+
+    @classmethod
+    def create(
+        cls,
+        rel_types: Iterable[RelationType | str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        jurisdictions: Iterable[str] | None = None,
+    ) -> "ProjectionFilter":
+        """Build a filter with normalized, order-independent fields."""
+        types = sorted({RelationType(t).value for t in rel_types}) if rel_types else None
+        places = sorted({j.upper() for j in jurisdictions}) if jurisdictions else None
+        return cls(
+            rel_types=tuple(types) if types else None,
+            start=start,
+            end=end,
+            jurisdictions=tuple(places) if places else None,
+        )
+
+    @property
+    def key(self) -> str:
+        """Stable identifier for caching."""
+        parts = [
+            ",".join(self.rel_types or ()),
+            self.start.isoformat() if self.start else "",
+            self.end.isoformat() if self.end else "",
+            ",".join(self.jurisdictions or ()),
+        ]
+        return "|".join(parts)
+
+
+@dataclass
+class GraphProjection:
+    """An undirected, weighted subgraph held as CSR adjacency.
+
+    Node `i` is the entity `node_ids[i]`; `adjacency[i, j]` counts the
+    relationships between nodes `i` and `j` in either direction.
+    """
+
+    node_ids: list[str]
+    names: list[str | None]
+    entity_types: list[str | None]
+    adjacency: sparse.csr_matrix
+    version: str = ""
+    built_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self):
+        self.node_index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[tuple[str, str]],
+        nodes: dict[str, tuple[str | None, str | None]] | None = None,
+        version: str = "",
+    ) -> "GraphProjection":
+        """Build a projection from (source id, target id) pairs.
+
+        Args:
+            edges: Relationship endpoints; self-loops are dropped
+            nodes: Optional (name, entity type) by node ID
+            version: Version stamp of the data the edges came from
+        """
+        index: dict[str, int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
+        for source, target in edges:
+            if source == target:
+                continue
+            i = index.setdefault(source, len(index))
+            j = index.setdefault(target, len(index))
+            rows.extend((i, j))
+            cols.extend((j, i))
+
+        n = len(index)
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)), shape=(n, n)
+        )
+        node_ids = list(index)
+        nodes = nodes or {}
+        return cls(
+            node_ids=node_ids,
+            names=[nodes.get(i, (None, None))[0] for i in node_ids],
+            entity_types=[nodes.get(i, (None, None))[1] for i in node_ids],
+            adjacency=adjacency,
+            version=version,
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of connected node pairs."""
+        return self.adjacency.nnz // 2
+
+    def neighborhood(self, entity_ids: Iterable[str], hops: int = 1) -> "GraphProjection":
+        """The subgraph induced by entities and their neighbours within `hops`."""
+        frontier = np.array(
+            sorted({self.node_index[i] for i in entity_ids if i in self.node_index}),
+            dtype=np.int64,
+        )
+        selected = np.zeros(self.node_count, dtype=bool)
+        selected[frontier] = True
+        for _ in range(hops):
+            if not len(frontier):
+                break
+            reached = np.unique(self.adjacency[frontier].indices)
+            frontier = reached[~selected[reached]]
+            selected[frontier] = True
+
+        keep = np.flatnonzero(selected)
+        return GraphProjection(
+            node_ids=[self.node_ids[i] for i in keep],
+            names=[self.names[i] for i in keep],
+            entity_types=[self.entity_types[i] for i in keep],
+            adjacency=self.adjacency[keep][:, keep].tocsr(),
+            version=self.version,
+            built_at=self.built_at,
+        )
+
+    def to_networkx(self):
+        """Convert to a networkx Graph over the integer node ids."""
+        import networkx as nx
+
+        return nx.from_scipy_sparse_array(self.adjacency)
+
+
+# =========================
+# Loading
+# =========================
+
+
+def _type_pattern(projection_filter: ProjectionFilter) -> str:
+    # Types are validated against RelationType by ProjectionFilter.create
+    if projection_filter.rel_types:
+        return ":" + "|".join(projection_filter.rel_types)
+    return ""
+
+
+def _entity_label_predicate(var: str) -> str:
+    return "(" + " OR ".join(f"{var}:{label}" for label in ENTITY_LABELS) + ")"
+
+
+async def get_projection_version(session: Any, projection_filter: ProjectionFilter) -> str:
+    """Version stamp for the data behind a projection.
+
+    Uses node and per-type relationship totals, which Neo4j answers from
+    its count store without scanning the graph.
+    """
+    result = await session.run("MATCH (n) RETURN count(n) AS count")
+    counts = [(await result.single())["count"]]
+    for rel_type in projection_filter.rel_types or ("",):
+        pattern = f":{rel_type}" if rel_type else ""
+        result = await session.run(f"MATCH ()-[r{pattern}]->() RETURN count(r) AS count")
+        counts.append((await result.single())["count"])
+
+    stamp = f"{projection_filter.key}#{'-'.join(str(c) for c in counts)}"
+    return hashlib.md5(stamp.encode()).hexdigest()[:12]
+
+
+async def load_projection(
+    session: Any,
+    projection_filter: ProjectionFilter,
+    version: str = "",
+) -> GraphProjection:
+    """Load a projection from Neo4j with one pass over the relationships."""
+    conditions = [_entity_label_predicate("a"), _entity_label_predicate("b")]
+    params: dict[str, Any] = {}
+    if projection_filter.end:
+        conditions.append("(r.valid_from IS NULL OR r.valid_from <= $end)")
+        params["end"] = projection_filter.end.isoformat()
+    if projection_filter.start:
+        conditions.append("(r.valid_to IS NULL OR r.valid_to >= $start)")
+        params["start"] = projection_filter.start.isoformat()
+    if projection_filter.jurisdictions:
+        conditions.append(
+            "(a.jurisdiction IS NULL OR toUpper(a.jurisdiction) IN $jurisdictions)"
+            " AND (b.jurisdiction IS NULL OR toUpper(b.jurisdiction) IN $jurisdictions)"
+        )
+        params["jurisdictions"] = list(projection_filter.jurisdictions)
+    where = f"WHERE {' AND '.join(conditions)}"
+
+    result = await session.run(
+        f"""
+        MATCH (a)-[r{_type_pattern(projection_filter)}]->(b)
+        {where}
+        RETURN a.id AS source, b.id AS target,
+               a.name AS source_name, b.name AS target_name,
+               coalesce(a.entity_type, labels(a)[0]) AS source_type,
+               coalesce(b.entity_type, labels(b)[0]) AS target_type
+        """,
+        params,
+    )
+
+    edges: list[tuple[str, str]] = []
+    nodes: dict[str, tuple[str | None, str | None]] = {}
+    async for record in result:
+        source, target = record["source"], record["target"]
+        if not source or not target:
+            continue
+        edges.append((source, target))
+        nodes.setdefault(source, (record["source_name"], record["source_type"]))
+        nodes.setdefault(target, (record["target_name"], record["target_type"]))
+
+    projection = GraphProjection.from_edges(edges, nodes, version=version)
+    logger.info(
+        f"Projected {projection.node_count} nodes and {projection.edge_count} "
+        f"edges for filter '{projection_filter.key}'"
+    )
+    return projection
+
+
+# =========================
+# Caching
+# =========================
+
+
+_projections: "OrderedDict[str, GraphProjection]" = OrderedDict()
+_single_flight = SingleFlight()
+
+
+async def get_projection(projection_filter: ProjectionFilter) -> GraphProjection:
+    """Get a cached projection, rebuilding it when stale.
+
+    Concurrent requests for the same filter share one build. The least
+    recently used projections are dropped beyond the
+    `graph_projection_cache_size` setting.
+    """
+    settings = get_settings()
+    key = projection_filter.key
+
+    async with get_neo4j_session() as session:
+        version = await get_projection_version(session, projection_filter)
+
+    cached = _projections.get(key)
+    if (
+        cached is not None
+        and cached.version == version
+        and time.monotonic() - cached.built_at < settings.graph_projection_ttl
+    ):
+        _projections.move_to_end(key)
+        return cached
+
+    async def build() -> GraphProjection:
+        async with get_neo4j_session() as session:
+            projection = await load_projection(session, projection_filter, version)
+        _projections[key] = projection
+        _projections.move_to_end(key)
+        while len(_projections) > max(1, settings.graph_projection_cache_size):
+            _projections.popitem(last=False)
+        return projection
+
+    return await _single_flight.run(f"{key}@{version}", build)
+
+
+def clear_projections() -> None:
+    """Drop all cached projections."""
+    _projections.clear()
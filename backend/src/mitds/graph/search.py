@@ -0,0 +1,433 @@
+"""Full-text entity search for Neo4j.
+
+Entity search and autocomplete read from Neo4j full-text indexes over
+name, page_name and aliases rather than scanning every node of the
+searchable labels. This module owns the index definitions (mirrored in
+infrastructure/scripts/init-neo4j.cypher), creates or rebuilds them on
+startup, rewrites user input into Lucene prefix/fuzzy queries, and serves
+bounded, cached result totals.
+
+Performance Notes:
+- Candidate pools are bounded (MAX_CANDIDATES for search, a small multiple
+  of the page size for autocomplete), so cost does not grow with the graph
+- Totals count at most MAX_CANDIDATES hits and are cached per query
+- EIN, BN and Meta ad ID lookups use range index seeks alongside the index
+- If an index is missing, queries fall back to the original substring scan
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from ..cache import CACHE_TTL, get_cache, search_count_key
+from ..logging import get_context_logger
+
+logger = get_context_logger(__name__)
+
+
+@dataclass(frozen=True)
+class FulltextIndex:
+    """Definition of a managed Neo4j full-text index."""
+
+    name: str
+    labels: tuple[str, ...]
+    properties: tuple[str, ...]
+    analyzer: str = "standard-folding"
+
+    def create_statement(self) -> str:
+        """Build the CREATE FULLTEXT INDEX statement for this definition."""
+        labels = "|".join(self.labels)
+        properties = ", ".join(f"n.{p}" for p in self.properties)
+        return (
+            f"CREATE FULLTEXT INDEX {self.name} IF NOT EXISTS\n"
+            f"FOR (n:{labels})\n"
+            f"ON EACH [{properties}]\n"
+            f"OPTIONS {{indexConfig: {{"
+            f"`fulltext.analyzer`: '{self.analyzer}', "
+            f"`fulltext.eventually_consistent`: true}}}}"
+        )
+
+    def matches(self, labels: list[str], properties: list[str], options: dict) -> bool:
+        """Check whether an existing index has this definition."""
+        analyzer = (options or {}).get("indexConfig", {}).get("fulltext.analyzer")
+        return (
+            sorted(labels or []) == sorted(self.labels)
+            and sorted(properties or []) == sorted(self.properties)
+            and analyzer == self.analyzer
+        )
+
+
+# Index behind GET /entities?q=
+ENTITY_SEARCH_INDEX = FulltextIndex(
+    name="entity_text_search",
+    labels=("Organization", "Person", "Outlet", "Sponsor", "Ad"),
+    properties=("name", "page_name", "aliases"),
+)
+
+# Index behind GET /ingestion/autocomplete (no Ad nodes to crowd out entities)
+ENTITY_AUTOCOMPLETE_INDEX = FulltextIndex(
+    name="entity_autocomplete",
+    labels=("Organization", "Person", "Sponsor", "Outlet"),
+    properties=("name", "aliases"),
+)
+
+SEARCH_INDEXES = (ENTITY_SEARCH_INDEX, ENTITY_AUTOCOMPLETE_INDEX)
+
+# Range indexes backing exact identifier lookups in search
+IDENTIFIER_INDEXES = (
+    "CREATE INDEX ad_meta_ad_id IF NOT EXISTS FOR (a:Ad) ON (a.meta_ad_id)",
+)
+
+# Upper bound on index hits considered by a search (and on reported totals)
+MAX_CANDIDATES = 10_000
+
+# Autocomplete reranks this many index hits per requested suggestion
+AUTOCOMPLETE_CANDIDATE_FACTOR = 5
+
+# Tokens at least this long tolerate a one-character typo
+FUZZY_MIN_LENGTH = 5
+
+# Tokens beyond this are ignored when building a query
+MAX_QUERY_TOKENS = 8
+
+# Indexes found missing at query time; cleared when they are (re)created
+_missing_indexes: set[str] = set()
+
+
+# =========================
+# Index Management
+# =========================
+
+
+async def ensure_search_indexes(session: Any) -> list[str]:
+    """Create the managed search indexes, rebuilding any whose definition changed.
+
+    Args:
+        session: Neo4j async session
+
+    Returns:
+        Names of the full-text indexes created or rebuilt
+    """
+    result = await session.run(
+        "SHOW FULLTEXT INDEXES YIELD name, labelsOrTypes, properties, options "
+        "RETURN name, labelsOrTypes, properties, options"
+    )
+    existing = {row["name"]: row for row in await result.data()}
+
+    changed = []
+    for index in SEARCH_INDEXES:
+        row = existing.get(index.name)
+        if row is not None:
+            if index.matches(row["labelsOrTypes"], row["properties"], row["options"]):
+                continue
+            logger.info(f"Rebuilding full-text index {index.name} with new definition")
+            await session.run(f"DROP INDEX {index.name} IF EXISTS")
+        else:
+            logger.info(f"Creating full-text index {index.name}")
+        await session.run(index.create_statement())
+        _missing_indexes.discard(index.name)
+        changed.append(index.name)
+
+    for statement in IDENTIFIER_INDEXES:
+        await session.run(statement)
+
+    return changed
+
+
+# =========================
+# Query Rewriting
+# =========================
+
+
+def build_fulltext_query(term: str, prefix: bool = True) -> str | None:
+    """Rewrite user input as a Lucene query for the search indexes.
+
+    Every token is required. The last token also matches as a prefix so
+    partially typed words hit, and longer tokens tolerate one typo. The
+    exact term is kept alongside the prefix/fuzzy forms so exact matches
+    score highest. Tokens are lowercased word characters only, so need no
+    escaping and never read as Lucene operators.
+
+    Args:
+        term: Raw search input
+        prefix: Whether the last token may match as a prefix
+
+    Returns:
+        Lucene query string, or None if the input has no word characters
+    """
+    tokens = re.findall(r"\w+", term.lower())[:MAX_QUERY_TOKENS]
+    if not tokens:
+        return None
+
+    clauses = []
+    for i, token in enumerate(tokens):
+        options = [token]
+        if prefix and i == len(tokens) - 1:
+            options.append(f"{token}*")
+        if len(token) >= FUZZY_MIN_LENGTH:
+            options.append(f"{token}~1")
+        if len(options) == 1:
+            clauses.append(f"+{token}")
+        else:
+            clauses.append(f"+({' OR '.join(options)})")
+    return " ".join(clauses)
+
+
+def _is_missing_index(error: Exception) -> bool:
+    return "no such" in str(error).lower()
+
+
+# =========================
+# Entity Search
+# =========================
+
+
+_SEARCH_CANDIDATES = """
+CALL {
+    CALL db.index.fulltext.queryNodes($index, $search, {limit: $candidates})
+    YIELD node, score
+    RETURN node AS e, score
+    UNION
+    MATCH (e:Organization {ein: $term}) RETURN e, 1000.0 AS score
+    UNION
+    MATCH (e:Organization {bn: $term}) RETURN e, 1000.0 AS score
+    UNION
+    MATCH (e:Ad {meta_ad_id: $term}) RETURN e, 1000.0 AS score
+}
+WITH e, max(score) AS score
+WHERE ($entity_type IS NULL OR e.entity_type = $entity_type)
+AND ($jurisdiction IS NULL OR e.jurisdiction = $jurisdiction)
+"""
+
+# Original label scan, used only while the search index is missing
+_SCAN_CANDIDATES = """
+MATCH (e)
+WHERE (e:Organization OR e:Person OR e:Outlet OR e:Sponsor OR e:Ad)
+AND (
+    toLower(e.name) CONTAINS toLower($term)
+    OR toLower(e.page_name) CONTAINS toLower($term)
+    OR any(alias IN coalesce(e.aliases, []) WHERE toLower(alias) CONTAINS toLower($term))
+    OR e.ein = $term
+    OR e.bn = $term
+    OR e.meta_ad_id = $term
+)
+AND ($entity_type IS NULL OR e.entity_type = $entity_type)
+AND ($jurisdiction IS NULL OR e.jurisdiction = $jurisdiction)
+WITH e, 0.0 AS score
+"""
+
+
+async def _run_search(
+    session: Any, tail: str, params: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Run a search over index candidates, falling back to a label scan."""
+    search = build_fulltext_query(params["term"])
+    if search is None:
+        return []
+
+    if ENTITY_SEARCH_INDEX.name not in _missing_indexes:
+        try:
+            result = await session.run(_SEARCH_CANDIDATES + tail, {
+                **params,
+                "index": ENTITY_SEARCH_INDEX.name,
+                "search": search,
+                "candidates": MAX_CANDIDATES,
+            })
+            return await result.data()
+        except Exception as e:
+            logger.warning(
+                f"Full-text index {ENTITY_SEARCH_INDEX.name} query failed, "
+                f"falling back to label scan: {e}"
+            )
+            if _is_missing_index(e):
+                _missing_indexes.add(ENTITY_SEARCH_INDEX.name)
+
+    result = await session.run(_SCAN_CANDIDATES + tail, params)
+    return await result.data()
+
+
+async def search_entity_nodes(
+    session: Any,
+    term: str,
+    entity_type: str | None = None,
+    jurisdiction: str | None = None,
+    offset: int = 0,
+    limit: int = 20,
+) -> list[dict[str, Any]]:
+    """Search entities by name, page name, alias, or identifier.
+
+    Results are ordered by relevance, then confidence and name. Only the
+    top MAX_CANDIDATES index hits are considered.
+
+    Args:
+        session: Neo4j async session
+        term: Search input
+        entity_type: Optional entity_type filter
+        jurisdiction: Optional jurisdiction filter
+        offset: Results to skip
+        limit: Maximum results
+
+    Returns:
+        Node property maps of matching entities
+    """
+    rows = await _run_search(
+        session,
+        """
+        RETURN e
+        ORDER BY score DESC, e.confidence DESC, e.name
+        SKIP $offset
+        LIMIT $limit
+        """,
+        {
+            "term": term,
+            "entity_type": entity_type,
+            "jurisdiction": jurisdiction,
+            "offset": offset,
+            "limit": limit,
+        },
+    )
+    return [dict(row["e"]) for row in rows]
+
+
+async def count_entity_matches(
+    session: Any,
+    term: str,
+    entity_type: str | None = None,
+    jurisdiction: str | None = None,
+) -> int:
+    """Count search matches, capped at MAX_CANDIDATES and cached.
+
+    Args:
+        session: Neo4j async session
+        term: Search input
+        entity_type: Optional entity_type filter
+        jurisdiction: Optional jurisdiction filter
+
+    Returns:
+        Number of matches, at most MAX_CANDIDATES
+    """
+    cache = await get_cache()
+    key = search_count_key(
+        term, {"entity_type": entity_type, "jurisdiction": jurisdiction}
+    )
+    cached = await cache.get(key)
+    if cached is not None:
+        return cached
+
+    rows = await _run_search(
+        session,
+        """
+        WITH e LIMIT $candidates
+        RETURN count(e) AS total
+        """,
+        {
+            "term": term,
+            "entity_type": entity_type,
+            "jurisdiction": jurisdiction,
+            "candidates": MAX_CANDIDATES,
+        },
+    )
+    total = rows[0]["total"] if rows else 0
+    await cache.set(key, total, CACHE_TTL["search_count"])
+    return total
+
+
+# =========================
+# Autocomplete
+# =========================
+
+
+async def suggest_entities(
+    session: Any,
+    prefix: str,
+    labels: list[str] | None = None,
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Fetch autocomplete suggestions for partially typed input.
+
+    Takes a bounded number of top index hits of the requested labels and
+    reranks them so names starting with the input come first, then by
+    relevance and confidence.
+
+    Args:
+        session: Neo4j async session
+        prefix: Typed input
+        labels: Node labels to include (defaults to all indexed labels)
+        limit: Maximum suggestions
+
+    Returns:
+        Rows with id, name, entity_type, jurisdiction, confidence, match_rank
+    """
+    indexed = ENTITY_AUTOCOMPLETE_INDEX.labels
+    labels = [label for label in indexed if label in (labels or indexed)]
+    if not labels:
+        return []
+    returns = """
+    WITH e, score,
+         CASE WHEN toLower(e.name) STARTS WITH toLower($prefix) THEN 0 ELSE 1 END as match_rank
+    RETURN DISTINCT
+        e.id as id,
+        e.name as name,
+        e.entity_type as entity_type,
+        e.jurisdiction as jurisdiction,
+        coalesce(e.confidence, 0.5) as confidence,
+        match_rank,
+        score
+    ORDER BY match_rank, score DESC, confidence DESC, name
+    LIMIT $limit
+    """
+    params = {"prefix": prefix, "labels": labels, "limit": limit}
+
+    search = build_fulltext_query(prefix)
+    if search is None:
+        return []
+
+    if ENTITY_AUTOCOMPLETE_INDEX.name not in _missing_indexes:
+        if len(labels) == len(indexed):
+            # Every hit qualifies, so let the index return only the top ones
+            query = """
+            CALL db.index.fulltext.queryNodes($index, $search, {limit: $candidates})
+            YIELD node AS e, score
+            """ + returns
+        else:
+            # Filter by label before bounding the pool, so common labels
+            # cannot crowd the requested ones out of the candidates
+            query = """
+            CALL db.index.fulltext.queryNodes($index, $search)
+            YIELD node AS e, score
+            WHERE any(label IN labels(e) WHERE label IN $labels)
+            WITH e, score
+            LIMIT $candidates
+            """ + returns
+        try:
+            result = await session.run(query, {
+                **params,
+                "index": ENTITY_AUTOCOMPLETE_INDEX.name,
+                "search": search,
+                "candidates": limit * AUTOCOMPLETE_CANDIDATE_FACTOR,
+            })
+            return await result.data()
+        except Exception as e:
+            logger.warning(
+                f"Full-text index {ENTITY_AUTOCOMPLETE_INDEX.name} query failed, "
+                f"falling back to label scan: {e}"
+            )
+            if _is_missing_index(e):
+                _missing_indexes.add(ENTITY_AUTOCOMPLETE_INDEX.name)
+
+    # Scan only the requested labels (names come from the index definition)
+    scans = "\n        UNION\n".join(
+        f"""        MATCH (e:{label})
+        WHERE toLower(e.name) CONTAINS toLower($prefix)
+        OR any(alias IN coalesce(e.aliases, []) WHERE toLower(alias) STARTS WITH toLower($prefix))
+        RETURN e"""
+        for label in labels
+    )
+    query = f"""
+    CALL {{
+{scans}
+    }}
+    WITH e, 0.0 AS score
+    """ + returns
+    result = await session.run(query, params)
+    return await result.data()
@@ -52,7 +52,14 @@ from .littlesis import LittleSisIngester, run_littlesis_ingestion, get_littlesis
 from .meta_ads import MetaAdIngester, run_meta_ads_ingestion
 from .sedar import SEDARIngester, run_sedar_ingestion
 from .linkedin import LinkedInIngester, run_linkedin_ingestion
-from .search import search_all_sources, warmup_search_cache, CompanySearchResult, CompanySearchResponse
+from .search import (
+    search_all_sources,
+    warmup_search_cache,
+    federated_search,
+    CompanySearchResult,
+    CompanySearchResponse,
+    FederatedSearchResult,
+)
 
 __all__ = [
     # Base classes and utilities
@@ -90,6 +97,8 @@ __all__ = [
     "LinkedInIngester",
     "run_linkedin_ingestion",
     "search_all_sources",
+    "federated_search",
+    "FederatedSearchResult",
     "warmup_search_cache",
     "CompanySearchResult",
     "CompanySearchResponse",
@@ -17,6 +17,8 @@ The ingestion system uses a dual-database architecture:
    - `process_record()`: Process a single record (store in PostgreSQL + Neo4j)
    - `get_last_sync_time()`: Get last sync timestamp from PostgreSQL
    - `save_sync_time()`: Save sync timestamp (usually no-op, handled by base)
+   - Optionally `process_batch()`: Process a micro-batch of records at once
+     (used when `IngestionConfig.batch_size` / `max_workers` are raised)
 
 3. Follow database patterns:
    - Use `get_db_session()` context manager for PostgreSQL
@@ -57,6 +59,7 @@ Example:
     ```
 """
 
+import asyncio
 import json
 import logging
 import sys
@@ -241,6 +244,18 @@ class IngestionConfig(BaseModel):
     target_entities: list[str] | None = None
     extra_params: dict[str, Any] = {}
 
+    # Pipeline tuning: records are grouped into micro-batches of
+    # ``batch_size`` and handed to ``max_workers`` concurrent workers.
+    # The defaults preserve strictly sequential processing.
+    batch_size: int = 1
+    max_workers: int = 1
+
+    # Buffer Neo4jHelper writes into UNWIND batches (see graph.bulk).
+    # Only safe for ingesters whose own Cypher does not read back nodes
+    # written through the helper within the same run.
+    bulk_graph_writes: bool = False
+    graph_chunk_size: int = 500
+
 
 class IngestionResult(BaseModel):
     """Result of an ingestion run."""
@@ -338,6 +353,31 @@ class BaseIngester(ABC, Generic[T]):
         """
         ...
 
+    async def process_batch(
+        self, records: list[T]
+    ) -> list[dict[str, Any] | Exception]:
+        """Process a micro-batch of records.
+
+        The default implementation calls `process_record()` for each record
+        in turn. Subclasses can override this to amortise database round
+        trips across the batch (e.g. one session or one UNWIND per batch).
+
+        Args:
+            records: Records to process, in fetch order
+
+        Returns:
+            One outcome per record, in the same order: either the
+            `process_record()`-style result dict or the exception raised
+            while processing that record
+        """
+        outcomes: list[dict[str, Any] | Exception] = []
+        for record in records:
+            try:
+                outcomes.append(await self.process_record(record))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
     @abstractmethod
     async def get_last_sync_time(self) -> datetime | None:
         """Get the timestamp of the last successful sync.
@@ -443,55 +483,22 @@ class BaseIngester(ABC, Generic[T]):
                     )
 
                     try:
-                        async for record in self.fetch_records(config):
-                            record_name = getattr(record, "name", None) or getattr(record, "corporation_name", None) or getattr(record, "id", "unknown")
-                            try:
-                                process_result = await self.process_record(record)
-                                result.records_processed += 1
-
-                                if process_result.get("created"):
-                                    result.records_created += 1
-                                elif process_result.get("updated"):
-                                    result.records_updated += 1
-                                elif process_result.get("duplicate"):
-                                    result.duplicates_found += 1
-
-                                # Update progress bar with current stats
-                                pbar.set_postfix(
-                                    created=result.records_created,
-                                    updated=result.records_updated,
-                                    dup=result.duplicates_found,
-                                    err=len(result.errors),
-                                    refresh=False,
-                                )
-                                pbar.update(1)
-
-                                # Check limit
-                                if config.limit and result.records_processed >= config.limit:
-                                    pbar.set_description(f"{desc} (limit reached)")
-                                    break
-
-                            except Exception as e:
-                                result.records_processed += 1
-                                error_info = {
-                                    "record_id": getattr(record, "id", None),
-                                    "error": str(e),
-                                    "error_type": type(e).__name__,
-                                }
-                                result.errors.append(error_info)
-
-                                # Update progress bar even on error
-                                pbar.set_postfix(
-                                    created=result.records_created,
-                                    updated=result.records_updated,
-                                    dup=result.duplicates_found,
-                                    err=len(result.errors),
-                                    refresh=False,
-                                )
-                                pbar.update(1)
-
-                                # Continue processing other records
-                                continue
+                        if config.bulk_graph_writes:
+                            from ..graph.bulk import BulkGraphWriter
+
+                            async with BulkGraphWriter(
+                                chunk_size=config.graph_chunk_size,
+                                logger=self.logger,
+                            ) as writer:
+                                with writer.activate():
+                                    await self._run_pipeline(config, result, pbar, desc)
+                            self.logger.info(
+                                f"Bulk graph writes: {writer.stats.nodes_written} nodes, "
+                                f"{writer.stats.relationships_written} relationships, "
+                                f"{writer.stats.rows_failed} failed rows"
+                            )
+                        else:
+                            await self._run_pipeline(config, result, pbar, desc)
                     finally:
                         pbar.close()
 
@@ -546,6 +553,108 @@ class BaseIngester(ABC, Generic[T]):
 
         return result
 
+    async def _run_pipeline(
+        self,
+        config: IngestionConfig,
+        result: IngestionResult,
+        pbar: tqdm,
+        desc: str,
+    ) -> None:
+        """Pull records into micro-batches and process them concurrently.
+
+        A single producer reads `fetch_records()` into a bounded queue, so a
+        fast source cannot run ahead of slow workers (backpressure). Each of
+        the `config.max_workers` workers hands whole batches to
+        `process_batch()` and tallies the outcomes into `result`.
+
+        Args:
+            config: Ingestion configuration
+            result: Result to accumulate counters and errors into
+            pbar: Progress bar to update per record
+            desc: Progress bar description
+        """
+        batch_size = max(1, config.batch_size)
+        workers = max(1, config.max_workers)
+        queue: asyncio.Queue[list[T] | None] = asyncio.Queue(maxsize=workers * 2)
+
+        async def produce() -> None:
+            batch: list[T] = []
+            pulled = 0
+            async for record in self.fetch_records(config):
+                batch.append(record)
+                pulled += 1
+                if len(batch) >= batch_size:
+                    await queue.put(batch)
+                    batch = []
+                if config.limit and pulled >= config.limit:
+                    pbar.set_description(f"{desc} (limit reached)")
+                    break
+            if batch:
+                await queue.put(batch)
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+
+                try:
+                    outcomes = await self.process_batch(batch)
+                    if len(outcomes) != len(batch):
+                        raise ValueError(
+                            f"process_batch returned {len(outcomes)} outcomes "
+                            f"for {len(batch)} records"
+                        )
+                except Exception as e:
+                    outcomes = [e] * len(batch)
+
+                for record, outcome in zip(batch, outcomes, strict=True):
+                    result.records_processed += 1
+                    try:
+                        if not isinstance(outcome, (dict, Exception)):
+                            raise TypeError(
+                                f"process_record returned {type(outcome).__name__}, "
+                                "expected a dict"
+                            )
+                        if isinstance(outcome, Exception):
+                            raise outcome
+                        if outcome.get("created"):
+                            result.records_created += 1
+                        elif outcome.get("updated"):
+                            result.records_updated += 1
+                        elif outcome.get("duplicate"):
+                            result.duplicates_found += 1
+                    except Exception as e:
+                        result.errors.append({
+                            "record_id": getattr(record, "id", None),
+                            "error": str(e),
+                            "error_type": type(e).__name__,
+                        })
+
+                    pbar.set_postfix(
+                        created=result.records_created,
+                        updated=result.records_updated,
+                        dup=result.duplicates_found,
+                        err=len(result.errors),
+                        refresh=False,
+                    )
+                    pbar.update(1)
+
+        # If any task dies, cancel the rest: a dead worker would otherwise
+        # leave the producer blocked on a full queue
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(consume()) for _ in range(workers)]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
 
 class RetryConfig(BaseModel):
     """Configuration for retry behavior."""
@@ -626,10 +735,32 @@ class Neo4jHelper:
             await neo4j.merge_organization(session, org_data)
             await neo4j.merge_person(session, person_data)
             await neo4j.create_relationship(session, "OWNS", source_id, target_id, props)
+
+    Bulk mode:
+        When a `BulkGraphWriter` is passed in (or activated for the current
+        task, see `IngestionConfig.bulk_graph_writes`), the same calls are
+        buffered and flushed as UNWIND batches instead of one statement per
+        entity. The `session` argument is then unused and failures surface
+        in the writer's stats rather than in the return value.
     """
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, writer=None):
         self.logger = logger or logging.getLogger(__name__)
+        self.writer = writer
+
+    def _bulk_writer(self):
+        """Get the explicit or task-activated bulk writer, if any."""
+        if self.writer is not None:
+            return self.writer
+        from ..graph.bulk import get_active_writer
+        return get_active_writer()
+
+    async def _invalidate(self, result) -> None:
+        """Invalidate cached views of the nodes a write statement returned."""
+        from ..cache import invalidate_entities
+
+        rows = await result.values()
+        await invalidate_entities(entity_id for row in rows for entity_id in row)
 
     async def merge_organization(
         self,
@@ -676,19 +807,32 @@ class Neo4jHelper:
         if properties:
             props.update(properties)
 
+        writer = self._bulk_writer()
+
         try:
             if merge_key == "name":
-                await session.run(
+                if writer is not None:
+                    await writer.merge_node(
+                        "Organization", "name", name,
+                        on_create=props,
+                        on_match={"updated_at": now},
+                        coalesce={"id": props["id"]},
+                    )
+                    return True
+
+                result = await session.run(
                     """
                     MERGE (o:Organization {name: $name})
                     ON CREATE SET o += $props
                     ON MATCH SET o.updated_at = $now,
                                  o.id = COALESCE(o.id, $props.id)
+                    RETURN o.id AS id
                     """,
                     name=name,
                     props=props,
                     now=now,
                 )
+                await self._invalidate(result)
             else:
                 # Use a specific external ID as merge key
                 merge_value = external_ids.get(merge_key) if external_ids else None
@@ -699,18 +843,29 @@ class Neo4jHelper:
                         external_ids=external_ids, properties=properties, merge_key="name"
                     )
 
-                await session.run(
+                if writer is not None:
+                    await writer.merge_node(
+                        "Organization", merge_key, merge_value,
+                        on_create=props,
+                        on_match={"updated_at": now},
+                        coalesce={"name": props["name"], "id": props["id"]},
+                    )
+                    return True
+
+                result = await session.run(
                     f"""
                     MERGE (o:Organization {{{merge_key}: $merge_value}})
                     ON CREATE SET o += $props
                     ON MATCH SET o.name = COALESCE(o.name, $props.name),
                                  o.updated_at = $now,
                                  o.id = COALESCE(o.id, $props.id)
+                    RETURN o.id AS id
                     """,
                     merge_value=merge_value,
                     props=props,
                     now=now,
                 )
+                await self._invalidate(result)
 
             return True
         except Exception as e:
@@ -757,19 +912,32 @@ class Neo4jHelper:
         if properties:
             props.update(properties)
 
+        writer = self._bulk_writer()
+
         try:
             if merge_key == "name":
-                await session.run(
+                if writer is not None:
+                    await writer.merge_node(
+                        "Person", "name", name,
+                        on_create=props,
+                        on_match={"updated_at": now},
+                        coalesce={"id": props["id"]},
+                    )
+                    return True
+
+                result = await session.run(
                     """
                     MERGE (p:Person {name: $name})
                     ON CREATE SET p += $props
                     ON MATCH SET p.updated_at = $now,
                                  p.id = COALESCE(p.id, $props.id)
+                    RETURN p.id AS id
                     """,
                     name=name,
                     props=props,
                     now=now,
                 )
+                await self._invalidate(result)
             else:
                 merge_value = external_ids.get(merge_key) if external_ids else None
                 if not merge_value:
@@ -778,17 +946,28 @@ class Neo4jHelper:
                         properties=properties, merge_key="name"
                     )
 
-                await session.run(
+                if writer is not None:
+                    await writer.merge_node(
+                        "Person", merge_key, merge_value,
+                        on_create=props,
+                        on_match={"updated_at": now},
+                        coalesce={"name": props["name"]},
+                    )
+                    return True
+
+                result = await session.run(
                     f"""
                     MERGE (p:Person {{{merge_key}: $merge_value}})
                     ON CREATE SET p += $props
                     ON MATCH SET p.name = COALESCE(p.name, $props.name),
                                  p.updated_at = $now
+                    RETURN p.id AS id
                     """,
                     merge_value=merge_value,
                     props=props,
                     now=now,
                 )
+                await self._invalidate(result)
 
             return True
         except Exception as e:
@@ -833,6 +1012,26 @@ class Neo4jHelper:
         if properties:
             props.update(properties)
 
+        writer = self._bulk_writer()
+        if writer is not None:
+            try:
+                await writer.merge_relationship(
+                    rel_type,
+                    source_label, source_key, source_value,
+                    target_label, target_key, target_value,
+                    properties=props,
+                    merge_on={
+                        k: properties.get(k) if properties else None
+                        for k in merge_on or []
+                    },
+                )
+                return True
+            except Exception as e:
+                self.logger.warning(
+                    f"Neo4j relationship {source_value} -[{rel_type}]-> {target_value} failed: {e}"
+                )
+                return False
+
         try:
             # Build MERGE clause for relationship
             if merge_on:
@@ -842,6 +1041,7 @@ class Neo4jHelper:
                     MATCH (t:{target_label} {{{target_key}: $target_value}})
                     MERGE (s)-[r:{rel_type} {{{merge_props}}}]->(t)
                     SET r += $props
+                    RETURN s.id AS source_id, t.id AS target_id
                 """
                 params = {
                     "source_value": source_value,
@@ -856,6 +1056,7 @@ class Neo4jHelper:
                     MATCH (t:{target_label} {{{target_key}: $target_value}})
                     MERGE (s)-[r:{rel_type}]->(t)
                     SET r += $props
+                    RETURN s.id AS source_id, t.id AS target_id
                 """
                 params = {
                     "source_value": source_value,
@@ -863,7 +1064,8 @@ class Neo4jHelper:
                     "props": props,
                 }
 
-            await session.run(query, **params)
+            result = await session.run(query, **params)
+            await self._invalidate(result)
             return True
         except Exception as e:
             self.logger.warning(
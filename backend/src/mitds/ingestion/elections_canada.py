@@ -34,6 +34,7 @@ from ..db import get_db_session, get_neo4j_session
 from ..logging import get_context_logger
 from ..storage import StorageClient, generate_storage_key, get_storage
 from .base import BaseIngester, IngestionConfig, with_retry, Neo4jHelper
+from .pdf import PDFPLUMBER_AVAILABLE, PdfExtraction, get_pdf_service
 from .search import search_all_sources
 from ..resolution.matcher import normalize_organization_name, FuzzyMatcher, MatchCandidate
 from rapidfuzz import fuzz
@@ -484,17 +485,10 @@ class ElectionsCanadaIngester(BaseIngester[ElectionThirdParty]):
         self, pdf_url: str
     ) -> tuple[list[ExpenseLineItem], list[Contributor]]:
         """Download and parse a financial return PDF to extract expenses and contributors."""
-        import io
-
-        try:
-            import pdfplumber
-        except ImportError:
+        if not PDFPLUMBER_AVAILABLE:
             self.logger.warning("pdfplumber not installed - skipping PDF parsing")
             return [], []
 
-        expenses = []
-        contributors = []
-
         try:
             # Download PDF
             response = await self.http_client.get(pdf_url)
@@ -505,131 +499,143 @@ class ElectionsCanadaIngester(BaseIngester[ElectionThirdParty]):
             pdf_content = response.content
             self.logger.info(f"Downloaded PDF: {len(pdf_content)} bytes")
 
-            # Parse PDF
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    tables = page.extract_tables()
+            # Parse in the shared worker pool; unchanged returns come from cache
+            extraction = await get_pdf_service().extract(pdf_content, tables=True)
+            expenses, contributors = self._parse_financial_return(extraction)
 
-                    # Check if this is an expense page (Part 3a or 3b)
-                    if "statementofexpenses" in text.lower().replace(" ", "") or "part3" in text.lower().replace(" ", ""):
-                        for table in tables:
-                            if not table or len(table) < 2:
-                                continue
+            self.logger.info(
+                f"Parsed PDF: {len(expenses)} expenses, {len(contributors)} contributors"
+            )
+
+        except Exception as e:
+            self.logger.warning(f"Failed to parse PDF {pdf_url}: {e}")
+            return [], []
+
+        return expenses, contributors
 
-                            # Check if this looks like an expense table (has Supplier column)
-                            header = table[0] if table else []
-                            header_str = str(header).lower()
+    def _parse_financial_return(
+        self, extraction: PdfExtraction
+    ) -> tuple[list[ExpenseLineItem], list[Contributor]]:
+        """Extract expenses and contributors from a financial return's pages."""
+        expenses = []
+        contributors = []
 
-                            if "supplier" in header_str:
-                                # Parse expense rows
-                                for row in table[1:]:
-                                    if not row or len(row) < 4:
-                                        continue
+        for page in extraction.pages:
+            text = page.text
+            tables = page.tables
 
-                                    # Skip empty rows
-                                    supplier = row[3] if len(row) > 3 else ""
-                                    if not supplier or supplier.strip() == "":
-                                        continue
+            # Check if this is an expense page (Part 3a or 3b)
+            if "statementofexpenses" in text.lower().replace(" ", "") or "part3" in text.lower().replace(" ", ""):
+                for table in tables:
+                    if not table or len(table) < 2:
+                        continue
 
-                                    # Parse amount (last column)
-                                    amount_str = row[-1] if row else "0"
+                    # Check if this looks like an expense table (has Supplier column)
+                    header = table[0] if table else []
+                    header_str = str(header).lower()
+
+                    if "supplier" in header_str:
+                        # Parse expense rows
+                        for row in table[1:]:
+                            if not row or len(row) < 4:
+                                continue
+
+                            # Skip empty rows
+                            supplier = row[3] if len(row) > 3 else ""
+                            if not supplier or supplier.strip() == "":
+                                continue
+
+                            # Parse amount (last column)
+                            amount_str = row[-1] if row else "0"
+                            try:
+                                amount = Decimal(
+                                    amount_str.replace(",", "").replace("$", "").strip() or "0"
+                                )
+                            except:
+                                amount = Decimal("0")
+
+                            if amount > 0:
+                                expense = ExpenseLineItem(
+                                    supplier=supplier.strip(),
+                                    expense_type=row[4] if len(row) > 4 else None,
+                                    expense_category=row[5] if len(row) > 5 else None,
+                                    expense_subcategory=row[6] if len(row) > 6 else None,
+                                    amount=amount,
+                                    place=row[9] if len(row) > 9 else None,
+                                )
+
+                                # Parse dates if present
+                                if len(row) > 1 and row[1]:
                                     try:
-                                        amount = Decimal(
-                                            amount_str.replace(",", "").replace("$", "").strip() or "0"
-                                        )
+                                        expense.date_incurred = datetime.strptime(
+                                            row[1].strip(), "%Y/%m/%d"
+                                        ).date()
                                     except:
-                                        amount = Decimal("0")
-
-                                    if amount > 0:
-                                        expense = ExpenseLineItem(
-                                            supplier=supplier.strip(),
-                                            expense_type=row[4] if len(row) > 4 else None,
-                                            expense_category=row[5] if len(row) > 5 else None,
-                                            expense_subcategory=row[6] if len(row) > 6 else None,
-                                            amount=amount,
-                                            place=row[9] if len(row) > 9 else None,
-                                        )
-
-                                        # Parse dates if present
-                                        if len(row) > 1 and row[1]:
-                                            try:
-                                                expense.date_incurred = datetime.strptime(
-                                                    row[1].strip(), "%Y/%m/%d"
-                                                ).date()
-                                            except:
-                                                pass
-
-                                        expenses.append(expense)
-                                        self.logger.debug(
-                                            f"  Expense: {expense.supplier} - ${expense.amount}"
-                                        )
-
-                    # Check if this is a contributions page (Part 2a)
-                    elif "statementofmonetarycontributions" in text.lower().replace(" ", ""):
-                        for table in tables:
-                            if not table or len(table) < 2:
-                                continue
+                                        pass
 
-                            header = table[0] if table else []
-                            header_str = str(header).lower()
-
-                            if "fullname" in header_str and "individual" in header_str:
-                                # Parse contributor rows
-                                for row in table[1:]:
-                                    if not row or len(row) < 10:
-                                        continue
-
-                                    # First column is row number, second is name
-                                    name = row[1] if len(row) > 1 else ""
-                                    if not name or name.strip() == "":
-                                        continue
-
-                                    # Find amount from contribution columns (indices 9-14)
-                                    # Columns: Individual, Business/Commercial, Government,
-                                    #          Trade union, Corporation without share capital,
-                                    #          Unincorporated organization
-                                    amount = Decimal("0")
-                                    contributor_type = "individual"
-                                    contrib_types = [
-                                        (9, "individual"),
-                                        (10, "business"),
-                                        (11, "government"),
-                                        (12, "union"),
-                                        (13, "corporation"),
-                                        (14, "association"),
-                                    ]
-                                    for col_idx, ctype in contrib_types:
-                                        if col_idx < len(row) and row[col_idx]:
-                                            cell = row[col_idx].strip()
-                                            if cell:
-                                                try:
-                                                    val = Decimal(
-                                                        cell.replace(",", "").replace("$", "").strip()
-                                                    )
-                                                    if val > 0:
-                                                        amount = val
-                                                        contributor_type = ctype
-                                                        break
-                                                except:
-                                                    pass
-
-                                    if amount > 0:
-                                        contributor = Contributor(
-                                            name=name.strip(),
-                                            city=row[5] if len(row) > 5 else None,
-                                            postal_code=row[7] if len(row) > 7 else None,
-                                            amount=amount,
-                                            contributor_type=contributor_type,
-                                        )
-                                        contributors.append(contributor)
+                                expenses.append(expense)
+                                self.logger.debug(
+                                    f"  Expense: {expense.supplier} - ${expense.amount}"
+                                )
 
-            self.logger.info(
-                f"Parsed PDF: {len(expenses)} expenses, {len(contributors)} contributors"
-            )
+            # Check if this is a contributions page (Part 2a)
+            elif "statementofmonetarycontributions" in text.lower().replace(" ", ""):
+                for table in tables:
+                    if not table or len(table) < 2:
+                        continue
 
-        except Exception as e:
-            self.logger.warning(f"Failed to parse PDF {pdf_url}: {e}")
+                    header = table[0] if table else []
+                    header_str = str(header).lower()
+
+                    if "fullname" in header_str and "individual" in header_str:
+                        # Parse contributor rows
+                        for row in table[1:]:
+                            if not row or len(row) < 10:
+                                continue
+
+                            # First column is row number, second is name
+                            name = row[1] if len(row) > 1 else ""
+                            if not name or name.strip() == "":
+                                continue
+
+                            # Find amount from contribution columns (indices 9-14)
+                            # Columns: Individual, Business/Commercial, Government,
+                            #          Trade union, Corporation without share capital,
+                            #          Unincorporated organization
+                            amount = Decimal("0")
+                            contributor_type = "individual"
+                            contrib_types = [
+                                (9, "individual"),
+                                (10, "business"),
+                                (11, "government"),
+                                (12, "union"),
+                                (13, "corporation"),
+                                (14, "association"),
+                            ]
+                            for col_idx, ctype in contrib_types:
+                                if col_idx < len(row) and row[col_idx]:
+                                    cell = row[col_idx].strip()
+                                    if cell:
+                                        try:
+                                            val = Decimal(
+                                                cell.replace(",", "").replace("$", "").strip()
+                                            )
+                                            if val > 0:
+                                                amount = val
+                                                contributor_type = ctype
+                                                break
+                                        except:
+                                            pass
+
+                            if amount > 0:
+                                contributor = Contributor(
+                                    name=name.strip(),
+                                    city=row[5] if len(row) > 5 else None,
+                                    postal_code=row[7] if len(row) > 7 else None,
+                                    amount=amount,
+                                    contributor_type=contributor_type,
+                                )
+                                contributors.append(contributor)
 
         return expenses, contributors
 
@@ -1135,6 +1135,8 @@ def get_irs990_celery_task():
         start_year: int | None = None,
         end_year: int | None = None,
         incremental: bool = True,
+        batch_size: int | None = None,
+        max_workers: int | None = None,
     ):
         """Celery task for IRS 990 ingestion.
 
@@ -1142,14 +1144,20 @@ def get_irs990_celery_task():
             start_year: Start year (default: previous year)
             end_year: End year (default: current year)
             incremental: Whether to do incremental sync
+            batch_size: Records per micro-batch (default: settings)
+            max_workers: Concurrent record workers (default: settings)
         """
         import asyncio
 
+        settings = get_settings()
+
         async def run_ingestion():
             ingester = IRS990Ingester()
             try:
                 config = IngestionConfig(
                     incremental=incremental,
+                    batch_size=batch_size or settings.ingestion_batch_size,
+                    max_workers=max_workers or settings.ingestion_max_workers,
                     extra_params={
                         "start_year": start_year,
                         "end_year": end_year,
@@ -1172,6 +1180,8 @@ async def run_irs990_ingestion(
     limit: int | None = None,
     target_entities: list[str] | None = None,
     run_id: UUID | None = None,
+    batch_size: int = 1,
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     """Run IRS 990 ingestion directly (not via Celery).
 
@@ -1182,6 +1192,8 @@ async def run_irs990_ingestion(
         limit: Maximum number of records to process
         target_entities: Optional list of EINs to ingest specifically
         run_id: Optional run ID from API layer
+        batch_size: Records per micro-batch handed to each worker
+        max_workers: Number of concurrent record-processing workers
 
     Returns:
         Ingestion result dictionary
@@ -1194,6 +1206,8 @@ async def run_irs990_ingestion(
             incremental=incremental,
             limit=limit,
             target_entities=target_entities,
+            batch_size=batch_size,
+            max_workers=max_workers,
             extra_params={
                 "start_year": start_year or current_year - 1,
                 "end_year": end_year or current_year,
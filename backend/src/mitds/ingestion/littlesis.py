@@ -15,12 +15,15 @@ License: CC BY-SA 4.0
 """
 
 import asyncio
+import codecs
+from collections.abc import AsyncIterator, Callable, Iterator
 import gzip
 import json
+import re
 import sys
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, BinaryIO
 from uuid import uuid4, UUID
 
 from tqdm import tqdm
@@ -470,89 +473,228 @@ class LittleSisCacheManager:
 # =========================
 
 
+# Decompressed bytes read per chunk from the gzip stream
+READ_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class BulkJsonReader:
+    """Incremental reader for gzipped LittleSis bulk exports.
+
+    The exports are either a single JSON array or JSON Lines. Array elements
+    are tokenised one at a time with `json.JSONDecoder.raw_decode` over a
+    sliding text buffer fed from the gzip stream, so memory is bounded by
+    the largest single record rather than the file size.
+
+    Progress is reported in compressed bytes consumed from disk, whose
+    total is known before decompression starts.
+
+    Usage:
+        with BulkJsonReader(path, on_progress=pbar.update) as reader:
+            for item in reader:
+                ...
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        chunk_size: int = READ_CHUNK_SIZE,
+        on_progress: Callable[[int], None] | None = None,
+    ):
+        """Initialize the reader.
+
+        Args:
+            file_path: Path to a gzipped JSON array or JSONL file
+            chunk_size: Decompressed bytes read per chunk
+            on_progress: Called with the number of newly consumed bytes
+        """
+        self.file_path = Path(file_path)
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.total_bytes = self.file_path.stat().st_size
+        self.bytes_read = 0
+        self.is_array = False
+
+        self._raw: BinaryIO | None = None
+        self._gzip: gzip.GzipFile | None = None
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __enter__(self) -> "BulkJsonReader":
+        self._raw = open(self.file_path, "rb")
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="rb")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying gzip and file handles."""
+        if self._gzip is not None:
+            self._gzip.close()
+            self._gzip = None
+        if self._raw is not None:
+            self._raw.close()
+            self._raw = None
+
+    def __iter__(self) -> Iterator[Any]:
+        first = self._peek()
+        if first == "[":
+            self.is_array = True
+            self._pos += 1
+            yield from self._iter_array()
+        elif first:
+            yield from self._iter_lines()
+
+    # =========================
+    # Buffering
+    # =========================
+
+    def _fill(self) -> bool:
+        """Append the next decompressed chunk to the buffer.
+
+        Returns:
+            False once the stream is exhausted
+        """
+        if self._eof:
+            return False
+
+        data = self._gzip.read(self.chunk_size)
+        self._eof = not data
+
+        # Drop consumed text so the buffer only holds the unparsed tail
+        self._buffer = self._buffer[self._pos:] + self._text.decode(data, final=self._eof)
+        self._pos = 0
+
+        position = self._raw.tell()
+        if position > self.bytes_read:
+            if self.on_progress:
+                self.on_progress(position - self.bytes_read)
+            self.bytes_read = position
+
+        return not self._eof
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ("" at EOF)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    # =========================
+    # Formats
+    # =========================
+
+    def _iter_array(self) -> Iterator[Any]:
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._decode_value()
+
+            delimiter = self._peek()
+            self._pos += 1
+            if delimiter == ",":
+                continue
+            if delimiter == "]":
+                return
+            raise json.JSONDecodeError(
+                "Expecting ',' delimiter", self._buffer, self._pos - 1
+            )
+
+    def _decode_value(self) -> Any:
+        """Decode one array element, reading more input until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A scalar ending exactly at the buffer edge may continue in
+            # the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _iter_lines(self) -> Iterator[Any]:
+        while True:
+            newline = self._buffer.find("\n", self._pos)
+            if newline < 0:
+                if self._fill():
+                    continue
+                line = self._buffer[self._pos:]
+                self._pos = len(self._buffer)
+            else:
+                line = self._buffer[self._pos:newline]
+                self._pos = newline + 1
+
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Skipping malformed line in {self.file_path.name}: {e}")
+
+            if newline < 0:
+                return
+
+
 class LittleSisParser:
     """Parser for LittleSis bulk data."""
     
     def __init__(self):
         self.entity_id_map: dict[int, UUID] = {}  # LittleSis ID -> MITDS UUID
     
-    def iter_entities(self, file_path: Path) -> AsyncIterator[LittleSisEntity]:
+    def iter_entities(
+        self,
+        file_path: Path,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> Iterator[LittleSisEntity]:
         """Iterate over entities in the bulk file.
         
         Args:
             file_path: Path to entities.json.gz
+            on_progress: Called with compressed bytes consumed so far
             
         Yields:
             Parsed entity records
         """
-        # #region agent log
-        import json as _json
-        _log_path = r"c:\Users\mail\dev\personal\media_transparency\.cursor\debug.log"
-        with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H1","location":"littlesis.py:iter_entities","message":"Starting entity iteration","data":{"file_path":str(file_path)},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-        # #endregion
-        
-        with gzip.open(file_path, "rt", encoding="utf-8") as f:
-            # #region agent log
-            first_char = f.read(1)
-            with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H1","location":"littlesis.py:iter_entities","message":"First character of file","data":{"first_char":first_char,"is_array":first_char=="["},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-            f.seek(0)  # Reset to beginning
-            # #endregion
-            
-            # Check if file is JSON array (starts with '[') or JSONL
-            content_start = f.read(1)
-            f.seek(0)
-            
-            if content_start == '[':
-                # #region agent log
-                with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H1","location":"littlesis.py:iter_entities","message":"Detected JSON array format, parsing full file","timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-                # #endregion
-                
-                # JSON array format - parse entire file
-                try:
-                    data = json.load(f)
-                    # #region agent log
-                    with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H1","location":"littlesis.py:iter_entities","message":"Parsed JSON array","data":{"num_items":len(data),"first_item_keys":list(data[0].keys()) if data else []},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-                    # #endregion
-                    
-                    for i, item in enumerate(data):
-                        try:
-                            # JSON:API format: data is under 'attributes'
-                            if 'attributes' in item:
-                                # #region agent log
-                                if i == 0:
-                                    with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H2","location":"littlesis.py:iter_entities","message":"JSON:API format detected","data":{"attr_keys":list(item['attributes'].keys())[:10]},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-                                # #endregion
-                                entity_data = item['attributes']
-                                entity_data['link'] = item.get('links', {}).get('self')
-                            else:
-                                entity_data = item
-                            
-                            # Map field names from LittleSis format to our model
-                            mapped_data = self._map_entity_fields(entity_data)
-                            
-                            yield LittleSisEntity(**mapped_data)
-                        except Exception as e:
-                            # #region agent log
-                            if i < 5:
-                                with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H3","location":"littlesis.py:iter_entities","message":"Entity parse error","data":{"index":i,"error":str(e),"item_keys":list(item.keys()) if isinstance(item,dict) else None},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-                            # #endregion
-                            logger.warning(f"Failed to parse entity {i}: {e}")
-                            continue
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse JSON array: {e}")
-                    return
-            else:
-                # JSONL format - parse line by line
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+        with BulkJsonReader(file_path, on_progress=on_progress) as reader:
+            try:
+                for i, item in enumerate(reader):
                     try:
-                        data = json.loads(line)
-                        yield LittleSisEntity(**data)
-                    except (json.JSONDecodeError, Exception) as e:
-                        logger.warning(f"Failed to parse entity: {e}")
+                        if not reader.is_array:
+                            # JSONL records already match our model
+                            yield LittleSisEntity(**item)
+                            continue
+
+                        # JSON:API format: data is under 'attributes'
+                        if 'attributes' in item:
+                            entity_data = item['attributes']
+                            entity_data['link'] = item.get('links', {}).get('self')
+                        else:
+                            entity_data = item
+
+                        # Map field names from LittleSis format to our model
+                        mapped_data = self._map_entity_fields(entity_data)
+
+                        yield LittleSisEntity(**mapped_data)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse entity {i}: {e}")
                         continue
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON array: {e}")
+                return
     
     def _map_entity_fields(self, data: dict) -> dict:
         """Map LittleSis field names to our model fields.
@@ -582,67 +724,43 @@ class LittleSisParser:
             'link': data.get('link'),
         }
     
-    def iter_relationships(self, file_path: Path) -> AsyncIterator[LittleSisRelationship]:
+    def iter_relationships(
+        self,
+        file_path: Path,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> Iterator[LittleSisRelationship]:
         """Iterate over relationships in the bulk file.
         
         Args:
             file_path: Path to relationships.json.gz
+            on_progress: Called with compressed bytes consumed so far
             
         Yields:
             Parsed relationship records
         """
-        # #region agent log
-        import json as _json
-        _log_path = r"c:\Users\mail\dev\personal\media_transparency\.cursor\debug.log"
-        with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H1","location":"littlesis.py:iter_relationships","message":"Starting relationship iteration","data":{"file_path":str(file_path)},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-        # #endregion
-        
-        with gzip.open(file_path, "rt", encoding="utf-8") as f:
-            # Check if file is JSON array or JSONL
-            content_start = f.read(1)
-            f.seek(0)
-            
-            if content_start == '[':
-                # #region agent log
-                with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H1","location":"littlesis.py:iter_relationships","message":"Detected JSON array format","timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-                # #endregion
-                
-                # JSON array format
-                try:
-                    data = json.load(f)
-                    # #region agent log
-                    with open(_log_path, "a") as _lf: _lf.write(_json.dumps({"hypothesisId":"H1","location":"littlesis.py:iter_relationships","message":"Parsed relationships JSON array","data":{"num_items":len(data)},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session"})+"\n")
-                    # #endregion
-                    
-                    for i, item in enumerate(data):
-                        try:
-                            # JSON:API format
-                            if 'attributes' in item:
-                                rel_data = item['attributes']
-                            else:
-                                rel_data = item
-                            
-                            mapped_data = self._map_relationship_fields(rel_data)
-                            yield LittleSisRelationship(**mapped_data)
-                        except Exception as e:
-                            if i < 5:
-                                logger.warning(f"Failed to parse relationship {i}: {e}")
-                            continue
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse relationships JSON: {e}")
-                    return
-            else:
-                # JSONL format
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+        with BulkJsonReader(file_path, on_progress=on_progress) as reader:
+            try:
+                for i, item in enumerate(reader):
                     try:
-                        data = json.loads(line)
-                        yield LittleSisRelationship(**data)
-                    except (json.JSONDecodeError, Exception) as e:
-                        logger.warning(f"Failed to parse relationship: {e}")
+                        if not reader.is_array:
+                            yield LittleSisRelationship(**item)
+                            continue
+
+                        # JSON:API format
+                        if 'attributes' in item:
+                            rel_data = item['attributes']
+                        else:
+                            rel_data = item
+
+                        mapped_data = self._map_relationship_fields(rel_data)
+                        yield LittleSisRelationship(**mapped_data)
+                    except Exception as e:
+                        if i < 5:
+                            logger.warning(f"Failed to parse relationship {i}: {e}")
                         continue
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse relationships JSON: {e}")
+                return
     
     def _map_relationship_fields(self, data: dict) -> dict:
         """Map LittleSis relationship field names to our model.
@@ -834,9 +952,35 @@ class LittleSisIngester(BaseIngester[LittleSisEntity]):
             force_refresh=force_refresh
         )
         
-        # Iterate over entities
-        for entity in self.parser.iter_entities(entities_path):
+        # Stream entities, logging progress through the compressed file
+        on_progress = self._progress_logger(
+            "entities", entities_path.stat().st_size
+        )
+        for entity in self.parser.iter_entities(entities_path, on_progress):
             yield entity
+
+    def _progress_logger(
+        self,
+        label: str,
+        total_bytes: int,
+        step_percent: int = 10,
+    ) -> Callable[[int], None]:
+        """Build a byte-progress callback that logs every `step_percent`."""
+        consumed = 0
+        next_report = step_percent
+
+        def update(delta: int) -> None:
+            nonlocal consumed, next_report
+            consumed += delta
+            percent = consumed * 100 // max(total_bytes, 1)
+            if percent >= next_report:
+                self.logger.info(
+                    f"Parsed {consumed / 1e6:.1f} / {total_bytes / 1e6:.1f} MB "
+                    f"of LittleSis {label} ({percent}%)"
+                )
+                next_report = (percent // step_percent + 1) * step_percent
+
+        return update
     
     async def process_record(self, record: LittleSisEntity) -> dict[str, Any]:
         """Process a single entity record.
@@ -1142,21 +1286,25 @@ class LittleSisIngester(BaseIngester[LittleSisEntity]):
             if not self.parser.entity_id_map:
                 await self._load_entity_id_map()
 
-            total = config.limit if config.limit else None
             desc = "Ingesting relationships"
 
             with suppress_db_logging():
+                # Progress is tracked in compressed bytes consumed, since the
+                # record count is unknown until the whole file is parsed
                 pbar = tqdm(
-                    total=total,
+                    total=relationships_path.stat().st_size,
                     desc=desc,
-                    unit="rel",
+                    unit="B",
+                    unit_scale=True,
                     dynamic_ncols=True,
                     file=sys.stderr,
                 )
 
                 try:
                     async with get_db_session() as db:
-                        for rel in self.parser.iter_relationships(relationships_path):
+                        for rel in self.parser.iter_relationships(
+                            relationships_path, on_progress=pbar.update
+                        ):
                             result.records_processed += 1
 
                             try:
@@ -1166,7 +1314,6 @@ class LittleSisIngester(BaseIngester[LittleSisEntity]):
 
                                 if not source_uuid or not target_uuid:
                                     # Entities not yet imported
-                                    pbar.update(1)
                                     continue
 
                                 # Convert relationship
@@ -1176,7 +1323,6 @@ class LittleSisIngester(BaseIngester[LittleSisEntity]):
 
                                 if not rel_data:
                                     # Relationship type not mappable
-                                    pbar.update(1)
                                     continue
 
                                 # Check for existing relationship
@@ -1197,7 +1343,6 @@ class LittleSisIngester(BaseIngester[LittleSisEntity]):
                                         err=len(result.errors),
                                         refresh=False,
                                     )
-                                    pbar.update(1)
                                     continue
 
                                 # Insert relationship
@@ -1246,7 +1391,6 @@ class LittleSisIngester(BaseIngester[LittleSisEntity]):
                                     err=len(result.errors),
                                     refresh=False,
                                 )
-                                pbar.update(1)
 
                                 # Check limit
                                 if config.limit and result.records_created >= config.limit:
@@ -1264,7 +1408,6 @@ class LittleSisIngester(BaseIngester[LittleSisEntity]):
                                     err=len(result.errors),
                                     refresh=False,
                                 )
-                                pbar.update(1)
                                 continue
 
                         # Note: db.commit() is handled automatically by get_db_session() context manager
@@ -27,6 +27,9 @@ API Docs:
 import asyncio
 import json
 import re
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, AsyncIterator
 from uuid import UUID, uuid4
@@ -221,6 +224,211 @@ PAGE_TRANSPARENCY_FIELDS = [
 ]
 
 
+# search_page_ids accepts at most 10 page IDs per query
+PAGE_ID_CHUNK_SIZE = 10
+
+# Concurrent Ad Library queries per harvest (see MetaAdIngester.fetch_records)
+DEFAULT_HARVEST_CONCURRENCY = 4
+
+# Graph API error codes that signal throttling rather than a bad request
+RATE_LIMIT_ERROR_CODES = {4, 17, 32, 613}
+
+
+@dataclass(frozen=True)
+class AdLibraryQuery:
+    """One Ad Library search: a country plus a search term and/or page IDs."""
+
+    country: str
+    search_terms: str | None = None
+    page_ids: tuple[str, ...] = ()
+
+    def params(self) -> dict[str, str]:
+        """Query-specific ads_archive parameters."""
+        # Meta API expects JSON array format: ["US"]
+        params = {"ad_reached_countries": json.dumps([self.country])}
+        if self.search_terms:
+            params["search_terms"] = self.search_terms
+        if self.page_ids:
+            params["search_page_ids"] = ",".join(self.page_ids)
+        return params
+
+    def describe(self) -> str:
+        parts = [self.country]
+        if self.search_terms:
+            parts.append(f"terms='{self.search_terms}'")
+        if self.page_ids:
+            parts.append(f"{len(self.page_ids)} page ids")
+        return " ".join(parts)
+
+
+def plan_ad_library_queries(
+    countries: list[str],
+    search_terms: list[str] | None = None,
+    page_ids: list[str] | None = None,
+    page_id_chunk_size: int = PAGE_ID_CHUNK_SIZE,
+) -> list[AdLibraryQuery]:
+    """Expand a harvest into the (country x term x page-id chunk) queries.
+
+    The Ad Library API takes a single search string and at most ten page
+    IDs per request, so every watch-list term and page-ID chunk needs its
+    own query per country. When both terms and page IDs are given, each
+    term is searched within each chunk of pages.
+
+    Raises:
+        ValueError: If neither search terms nor page IDs are given
+    """
+    terms = list(dict.fromkeys(t.strip() for t in search_terms or [] if t and t.strip()))
+    ids = list(dict.fromkeys(p.strip() for p in page_ids or [] if p and p.strip()))
+
+    # Meta Ad Library API requires EITHER search_terms OR search_page_ids
+    # Cannot query all ads without search criteria
+    if not terms and not ids:
+        raise ValueError(
+            "Meta Ad Library API requires either --search-terms or --page-ids. "
+            "Example: mitds ingest meta-ads --search-terms 'election'"
+        )
+
+    chunks = [
+        tuple(ids[i:i + page_id_chunk_size])
+        for i in range(0, len(ids), page_id_chunk_size)
+    ] or [()]
+
+    return [
+        AdLibraryQuery(country=country, search_terms=term, page_ids=chunk)
+        for country in countries
+        for term in (terms or [None])
+        for chunk in chunks
+    ]
+
+
+def _usage_header(headers: httpx.Headers, name: str) -> Any:
+    raw = headers.get(name)
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+class GraphUsageThrottle:
+    """Paces Graph API calls from the usage headers Meta returns.
+
+    Every response carries the app's rolling usage (``x-app-usage``) and,
+    for business-owned apps, ``x-business-use-case-usage`` with an
+    ``estimated_time_to_regain_access`` once a limit is hit. Calls are not
+    delayed while usage stays under `soft_limit` percent; above it, starts
+    are spaced out linearly up to `max_interval` seconds at `hard_limit`.
+    A throttled response pauses all callers for the regain time (or
+    ``Retry-After``), falling back to exponential backoff.
+
+    The throttle is shared by every concurrent query of an ingester, so
+    spacing applies to the whole harvest rather than per query.
+    """
+
+    def __init__(
+        self,
+        soft_limit: float = 50.0,
+        hard_limit: float = 90.0,
+        max_interval: float = 10.0,
+        base_backoff: float = 30.0,
+        max_backoff: float = 600.0,
+        clock=time.monotonic,
+        sleep=asyncio.sleep,
+    ):
+        self.soft_limit = soft_limit
+        self.hard_limit = hard_limit
+        self.max_interval = max_interval
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self.usage = 0.0
+        self.throttle_count = 0
+        self._consecutive_throttles = 0
+        self._pause_until = 0.0
+        self._next_start = 0.0
+
+    @property
+    def interval(self) -> float:
+        """Current spacing between call starts, from the last reported usage."""
+        if self.usage <= self.soft_limit:
+            return 0.0
+        if self.usage >= self.hard_limit:
+            return self.max_interval
+        fraction = (self.usage - self.soft_limit) / (self.hard_limit - self.soft_limit)
+        return self.max_interval * fraction
+
+    def _pause(self, seconds: float) -> None:
+        self._pause_until = max(self._pause_until, self._clock() + seconds)
+
+    def observe(self, headers: httpx.Headers) -> float:
+        """Update usage from a response's headers.
+
+        Returns:
+            Seconds until access is regained (0 if not blocked)
+        """
+        usage = 0.0
+        regain_seconds = 0.0
+
+        app = _usage_header(headers, "x-app-usage")
+        if isinstance(app, dict):
+            usage = max([usage, *(float(v or 0) for v in app.values())])
+
+        buc = _usage_header(headers, "x-business-use-case-usage")
+        if isinstance(buc, dict):
+            for entries in buc.values():
+                for entry in entries if isinstance(entries, list) else []:
+                    usage = max(
+                        usage,
+                        float(entry.get("call_count") or 0),
+                        float(entry.get("total_cputime") or 0),
+                        float(entry.get("total_time") or 0),
+                    )
+                    regain_minutes = float(entry.get("estimated_time_to_regain_access") or 0)
+                    regain_seconds = max(regain_seconds, regain_minutes * 60)
+
+        self.usage = usage
+        if regain_seconds:
+            self._pause(regain_seconds)
+        return regain_seconds
+
+    def succeeded(self, headers: httpx.Headers) -> None:
+        """Record a successful response."""
+        self._consecutive_throttles = 0
+        self.observe(headers)
+
+    def throttled(self, headers: httpx.Headers) -> float:
+        """Record a throttled response and pause all callers.
+
+        Returns:
+            Seconds callers will wait before the next attempt
+        """
+        self.throttle_count += 1
+        self._consecutive_throttles += 1
+        pause = self.observe(headers)
+
+        retry_after = headers.get("retry-after")
+        if retry_after and retry_after.isdigit():
+            pause = max(pause, float(retry_after))
+        if not pause:
+            pause = min(
+                self.base_backoff * 2 ** (self._consecutive_throttles - 1),
+                self.max_backoff,
+            )
+
+        self._pause(pause)
+        return self._pause_until - self._clock()
+
+    async def wait(self) -> None:
+        """Wait for this caller's start slot."""
+        now = self._clock()
+        start = max(now, self._pause_until, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await self._sleep(start - now)
+
+
 class FacebookPageContact(BaseModel):
     """Contact information from a Facebook Page."""
     
@@ -370,6 +578,7 @@ class MetaAdIngester(BaseIngester[MetaAdRecord]):
         self._enrich_page_details: bool = False  # Set by run() from config
         self._failed_page_ids: set[str] = set()  # Cache of page IDs that failed enrichment
         self._enriched_page_ids: set[str] = set()  # Cache of already enriched page IDs
+        self.throttle = GraphUsageThrottle()  # Shared by all Ad Library queries
 
     @property
     def http_client(self) -> httpx.AsyncClient:
@@ -561,172 +770,230 @@ class MetaAdIngester(BaseIngester[MetaAdRecord]):
             end_date = yesterday
 
         # Build search parameters
+        settings = get_settings()
         countries = config.extra_params.get("countries", SUPPORTED_COUNTRIES)
         search_terms = config.extra_params.get("search_terms")
         page_ids = config.extra_params.get("page_ids")
         minimal_fields = config.extra_params.get("minimal_fields", False)
-
-        self.logger.info(
-            f"Fetching ads from {start_date.date()} to {end_date.date()} "
-            f"for countries: {countries}"
+        concurrency = config.extra_params.get(
+            "max_concurrency", settings.meta_ads_concurrency
         )
 
-        for country in countries:
-            async for ad in self._fetch_country_ads(
-                access_token,
-                country,
-                start_date,
-                end_date,
-                search_terms=search_terms,
-                page_ids=page_ids,
-                config=config,
-                minimal_fields=minimal_fields,
-            ):
-                yield ad
-
-    async def _fetch_country_ads(
-        self,
-        access_token: str,
-        country: str,
-        start_date: datetime,
-        end_date: datetime,
-        search_terms: list[str] | None = None,
-        page_ids: list[str] | None = None,
-        config: IngestionConfig | None = None,
-        minimal_fields: bool = False,
-    ) -> AsyncIterator[MetaAdRecord]:
-        """Fetch ads for a specific country."""
+        # Scheduled runs name no terms or pages: harvest the watch list
+        if not search_terms and not page_ids:
+            search_terms = settings.meta_ads_search_terms_list
 
-        # Rate limiting: 200 calls/hour = ~3 calls/minute
-        # We'll use a conservative delay between pagination calls
-        rate_limit_delay = 0.5  # seconds
+        queries = plan_ad_library_queries(countries, search_terms, page_ids)
 
         # Use minimal fields if requested (for debugging permission issues)
         fields = MINIMAL_AD_FIELDS if minimal_fields else DEFAULT_AD_FIELDS
         if minimal_fields:
             self.logger.info("Using minimal fields for debugging")
 
-        params = {
+        base_params = {
             "access_token": access_token,
-            # Meta API expects JSON array format: ["US"]
-            "ad_reached_countries": json.dumps([country]),
             "ad_type": "POLITICAL_AND_ISSUE_ADS",
             "ad_active_status": "ALL",
             "fields": ",".join(fields),
             "limit": 100,  # Max per page
+            # Date filter using ad_delivery_date_min/max
+            "ad_delivery_date_min": start_date.strftime("%Y-%m-%d"),
+            "ad_delivery_date_max": end_date.strftime("%Y-%m-%d"),
         }
 
-        # Meta Ad Library API requires EITHER search_terms OR search_page_ids
-        # Cannot query all ads without search criteria
-        if search_terms:
-            params["search_terms"] = search_terms[0]  # No quotes needed
-        elif page_ids:
-            # search_page_ids expects comma-separated list of IDs
-            params["search_page_ids"] = ",".join(page_ids)
-        else:
-            # No search criteria provided - this will fail
-            # Meta requires either search_terms or search_page_ids
-            raise ValueError(
-                "Meta Ad Library API requires either --search-terms or --page-ids. "
-                "Example: mitds ingest meta-ads --search-terms 'election'"
+        self.logger.info(
+            f"Fetching ads from {start_date.date()} to {end_date.date()} "
+            f"for countries: {countries} ({len(queries)} queries, "
+            f"concurrency {concurrency})"
+        )
+
+        async for ad in self._harvest_ads(queries, base_params, concurrency, config.limit):
+            yield ad
+
+    async def _harvest_ads(
+        self,
+        queries: list[AdLibraryQuery],
+        base_params: dict[str, Any],
+        concurrency: int = DEFAULT_HARVEST_CONCURRENCY,
+        limit: int | None = None,
+    ) -> AsyncIterator[MetaAdRecord]:
+        """Run Ad Library queries concurrently and yield unique ads.
+
+        Up to `concurrency` workers take queries from a shared queue and
+        put parsed pages on a bounded output queue, which keeps workers
+        from running ahead of the consumer. The same ad often matches
+        several terms or countries; only its first occurrence is yielded.
+        """
+        pending = deque(queries)
+        pages: asyncio.Queue = asyncio.Queue(maxsize=max(1, concurrency) * 2)
+        workers = [
+            asyncio.create_task(self._harvest_worker(pending, pages, base_params))
+            for _ in range(min(max(1, concurrency), len(queries)))
+        ]
+
+        seen: set[str] = set()
+        duplicates = 0
+        finished = 0
+        try:
+            while finished < len(workers):
+                item = await pages.get()
+                if item is None:
+                    finished += 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+
+                for ad in item:
+                    if ad.ad_id in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(ad.ad_id)
+                    yield ad
+
+                    if limit and len(seen) >= limit:
+                        self.logger.info(f"Reached limit of {limit} records")
+                        return
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.logger.info(
+                f"Harvested {len(seen)} unique ads from {len(queries)} queries "
+                f"({duplicates} duplicates skipped, "
+                f"{self.throttle.throttle_count} rate-limit pauses)"
             )
 
-        # Date filter using ad_delivery_date_min/max
-        params["ad_delivery_date_min"] = start_date.strftime("%Y-%m-%d")
-        params["ad_delivery_date_max"] = end_date.strftime("%Y-%m-%d")
+    async def _harvest_worker(
+        self,
+        pending: deque,
+        pages: asyncio.Queue,
+        base_params: dict[str, Any],
+    ) -> None:
+        """Run queries until none are left; None marks this worker done."""
+        try:
+            while pending:
+                await self._harvest_query(pending.popleft(), pages, base_params)
+        except Exception as e:
+            await pages.put(e)
+        else:
+            await pages.put(None)
 
-        next_url = META_ADS_ARCHIVE_ENDPOINT
+    async def _harvest_query(
+        self,
+        query: AdLibraryQuery,
+        pages: asyncio.Queue,
+        base_params: dict[str, Any],
+    ) -> None:
+        """Page through one query, fetching the next page while parsing."""
+        params = {**base_params, **query.params()}
+        fetch = asyncio.create_task(
+            self._fetch_ads_page(META_ADS_ARCHIVE_ENDPOINT, params, query)
+        )
         page_count = 0
         records_count = 0
 
-        while next_url:
-            try:
-                async def _do_fetch():
-                    if next_url == META_ADS_ARCHIVE_ENDPOINT:
-                        response = await self.http_client.get(next_url, params=params)
-                    else:
-                        # Pagination URL already includes params
-                        response = await self.http_client.get(next_url)
-                    
-                    # Check for errors and log Meta's response before raising
-                    if response.status_code >= 400:
-                        try:
-                            error_data = response.json()
-                            error_info = error_data.get("error", {})
-                            self.logger.error(
-                                f"Meta API returned {response.status_code}: "
-                                f"code={error_info.get('code')}, "
-                                f"type={error_info.get('type')}, "
-                                f"message={error_info.get('message')}"
-                            )
-                        except Exception:
-                            self.logger.error(f"Meta API returned {response.status_code}: {response.text[:500]}")
-                    
-                    response.raise_for_status()
-                    return response.json()
+        try:
+            while fetch is not None:
+                data = await fetch
+                fetch = None
+                if data is None:
+                    break
 
-                data = await with_retry(
-                    _do_fetch,
-                    config=RetryConfig(max_retries=3, base_delay=2.0),
-                    logger=self.logger,
-                )
+                # Get next page URL (pagination URL already includes params)
+                next_url = data.get("paging", {}).get("next")
+                if next_url:
+                    fetch = asyncio.create_task(self._fetch_ads_page(next_url, None, query))
 
                 page_count += 1
-                ads = data.get("data", [])
+                ads = []
+                for ad_data in data.get("data", []):
+                    try:
+                        ads.append(self._parse_ad(ad_data, query.country))
+                    except Exception as e:
+                        self.logger.warning(f"Failed to parse ad: {e}")
 
                 self.logger.debug(
-                    f"Page {page_count}: received {len(ads)} ads for {country}"
+                    f"Page {page_count}: received {len(ads)} ads for {query.describe()}"
                 )
+                records_count += len(ads)
+                if ads:
+                    await pages.put(ads)
+        finally:
+            if fetch is not None:
+                fetch.cancel()
+                await asyncio.gather(fetch, return_exceptions=True)
 
-                for ad_data in ads:
-                    try:
-                        ad = self._parse_ad(ad_data, country)
-                        records_count += 1
-                        yield ad
+        self.logger.info(
+            f"Completed fetching {records_count} ads for {query.describe()} "
+            f"across {page_count} pages"
+        )
 
-                        # Check limit
-                        if config and config.limit and records_count >= config.limit:
-                            self.logger.info(f"Reached limit of {config.limit} records")
-                            return
+    async def _fetch_ads_page(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        query: AdLibraryQuery,
+        max_throttle_retries: int = 5,
+    ) -> dict[str, Any] | None:
+        """Fetch one ads_archive page, pausing on rate limits.
 
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse ad: {e}")
-                        continue
+        Returns:
+            Page JSON, or None if Meta rejected the query
+        """
+        for _ in range(max_throttle_retries + 1):
+            await self.throttle.wait()
 
-                # Get next page URL
-                paging = data.get("paging", {})
-                next_url = paging.get("next")
+            async def _do_fetch():
+                response = await self.http_client.get(url, params=params)
+                if self._is_rate_limited(response):
+                    return response
 
-                # Rate limiting delay
-                if next_url:
-                    await asyncio.sleep(rate_limit_delay)
+                # Check for errors and log Meta's response before raising
+                if response.status_code >= 400:
+                    self._log_api_error(response, query.describe())
+                response.raise_for_status()
+                return response
 
+            try:
+                response = await with_retry(
+                    _do_fetch,
+                    config=RetryConfig(max_retries=3, base_delay=2.0),
+                    logger=self.logger,
+                )
             except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    # Rate limited - wait longer
-                    self.logger.warning("Rate limited by Meta API, waiting 60s...")
-                    await asyncio.sleep(60)
-                    continue
-                elif e.response.status_code == 400:
-                    # Bad request - log full error details from Meta
-                    try:
-                        error_data = e.response.json() if e.response.content else {}
-                        error_msg = error_data.get("error", {}).get("message", str(e))
-                        error_code = error_data.get("error", {}).get("code", "unknown")
-                        error_subcode = error_data.get("error", {}).get("error_subcode", "")
-                        self.logger.error(
-                            f"Meta API error (code={error_code}, subcode={error_subcode}): {error_msg}"
-                        )
-                    except Exception:
-                        self.logger.error(f"Meta API error: {e}")
-                    break
-                else:
-                    raise
+                if e.response.status_code == 400:
+                    # Bad request for this query only - skip it
+                    return None
+                raise
 
-        self.logger.info(
-            f"Completed fetching {records_count} ads for {country} "
-            f"across {page_count} pages"
+            if self._is_rate_limited(response):
+                pause = self.throttle.throttled(response.headers)
+                self.logger.warning(
+                    f"Rate limited by Meta API for {query.describe()}, "
+                    f"pausing {pause:.0f}s"
+                )
+                continue
+
+            self.throttle.succeeded(response.headers)
+            return response.json()
+
+        self.logger.error(
+            f"Giving up on {query.describe()} after {max_throttle_retries} rate-limit pauses"
         )
+        return None
+
+    @staticmethod
+    def _is_rate_limited(response: httpx.Response) -> bool:
+        """Check for HTTP 429 or a Graph API throttling error code."""
+        if response.status_code == 429:
+            return True
+        if response.status_code < 400:
+            return False
+        try:
+            code = response.json().get("error", {}).get("code")
+        except Exception:
+            return False
+        return code in RATE_LIMIT_ERROR_CODES
 
     def _parse_ad(self, ad_data: dict[str, Any], country: str) -> MetaAdRecord:
         """Parse raw API response into MetaAdRecord."""
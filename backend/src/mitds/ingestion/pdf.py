@@ -0,0 +1,328 @@
+"""PDF text and table extraction off the event loop.
+
+pdfplumber parsing is CPU-bound and takes seconds for a long filing, so
+ingesters hand PDF bytes to the shared `PdfExtractionService` rather than
+parsing inline:
+
+1. Workers: `extract_pdf` runs in a process pool (or a thread when
+   processes are unavailable) with a page limit and a deadline checked
+   between pages. A task that overruns its timeout anyway has its pool
+   retired: new documents go to a fresh pool, and the stuck worker is
+   killed once the retired pool's other documents have finished.
+2. Cache: results are stored in the shared cache under the content hash
+   from `storage.compute_content_hash`, so re-ingesting an unchanged
+   filing never re-parses it.
+3. Coalescing: concurrent requests for the same document share one parse.
+"""
+
+import asyncio
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from io import BytesIO
+from typing import Any
+
+from ..cache import CACHE_TTL, SingleFlight, get_cache, pdf_extraction_key
+from ..config import get_settings
+from ..logging import get_context_logger
+from ..storage import compute_content_hash
+
+try:
+    import pdfplumber
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+logger = get_context_logger(__name__)
+
+# Extra seconds allowed past the worker's own deadline before the pool is
+# recycled (covers process start-up and pickling the result)
+HARD_TIMEOUT_GRACE = 10.0
+
+
+class PdfExtractionError(Exception):
+    """A PDF could not be extracted."""
+
+
+class PdfExtractionTimeout(PdfExtractionError):
+    """A PDF extraction overran its hard timeout."""
+
+
+@dataclass
+class PdfPage:
+    """Text (and optionally tables) of one PDF page."""
+
+    number: int
+    text: str = ""
+    tables: list[list[list[str | None]]] = field(default_factory=list)
+
+
+@dataclass
+class PdfExtraction:
+    """Extracted content of a PDF document."""
+
+    pages: list[PdfPage]
+    page_count: int
+    truncated: bool = False  # Stopped at the page limit or deadline
+    timed_out: bool = False  # Stopped at the deadline (never cached)
+
+    @property
+    def text(self) -> str:
+        """Text of all extracted pages, one page per line block."""
+        return "\n".join(page.text for page in self.pages if page.text)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PdfExtraction":
+        return cls(
+            pages=[PdfPage(**page) for page in data["pages"]],
+            page_count=data["page_count"],
+            truncated=data.get("truncated", False),
+        )
+
+
+def extract_pdf(
+    content: bytes,
+    max_pages: int | None = None,
+    tables: bool = False,
+    deadline: float | None = None,
+) -> PdfExtraction:
+    """Extract page text (and tables) from PDF bytes.
+
+    Runs in a worker process, so it only takes and returns picklable
+    values and reports failures as PdfExtractionError.
+
+    Args:
+        content: PDF document bytes
+        max_pages: Stop after this many pages (None = all)
+        tables: Also extract tables with pdfplumber's table finder
+        deadline: Wall-clock time (time.time()) after which no further
+            pages are started
+
+    Returns:
+        Extracted pages
+    """
+    if not PDFPLUMBER_AVAILABLE:
+        raise PdfExtractionError("pdfplumber not installed")
+
+    pages: list[PdfPage] = []
+    try:
+        with pdfplumber.open(BytesIO(content)) as pdf:
+            page_count = len(pdf.pages)
+            for number, page in enumerate(pdf.pages[:max_pages], start=1):
+                if deadline is not None and time.time() > deadline:
+                    return PdfExtraction(pages, page_count, truncated=True, timed_out=True)
+                pages.append(PdfPage(
+                    number=number,
+                    text=page.extract_text() or "",
+                    tables=page.extract_tables() if tables else [],
+                ))
+                # Release the page's parsed layout; long filings otherwise
+                # hold every page in memory until the document closes
+                page.close()
+    except Exception as e:
+        raise PdfExtractionError(f"{type(e).__name__}: {e}") from None
+
+    return PdfExtraction(pages, page_count, truncated=len(pages) < page_count)
+
+
+class PdfExtractionService:
+    """Shared PDF extraction with worker processes and a content-hash cache.
+
+    Args:
+        max_workers: Worker processes (0 = extract in a thread)
+        timeout: Seconds a document may take before extraction stops
+        max_pages: Default page limit per document (None = all)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        timeout: float = 60.0,
+        max_pages: int | None = 200,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self._executor: Executor | None = None
+        # asyncio primitives are bound to a loop, so slots are kept per loop
+        self._loop_slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        # Documents in flight per pool, and pools retired after a timeout
+        self._active: dict[Executor, int] = {}
+        self._retired: set[Executor] = set()
+        self._flight = SingleFlight()
+        self.parsed = 0
+        self.cache_hits = 0
+        self.timeouts = 0
+        self.failures = 0
+
+    async def extract(
+        self,
+        content: bytes,
+        tables: bool = False,
+        max_pages: int | None = None,
+        timeout: float | None = None,
+    ) -> PdfExtraction:
+        """Extract a PDF, serving unchanged documents from the cache.
+
+        Args:
+            content: PDF document bytes
+            tables: Also extract tables
+            max_pages: Page limit (defaults to the service limit)
+            timeout: Seconds allowed (defaults to the service timeout)
+
+        Returns:
+            Extracted pages
+
+        Raises:
+            PdfExtractionError: If the document cannot be parsed
+        """
+        max_pages = self.max_pages if max_pages is None else max_pages
+        variant = f"{'tables' if tables else 'text'}:{max_pages or 'all'}"
+        key = pdf_extraction_key(compute_content_hash(content), variant)
+
+        cache = await get_cache()
+        cached = await cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return PdfExtraction.from_dict(cached)
+
+        async def parse() -> PdfExtraction:
+            extraction = await self._run(content, max_pages, tables, timeout or self.timeout)
+            if extraction.timed_out:
+                logger.warning(
+                    f"PDF extraction stopped at its deadline after "
+                    f"{len(extraction.pages)}/{extraction.page_count} pages"
+                )
+            else:
+                await cache.set(key, extraction.to_dict(), CACHE_TTL["pdf_extraction"])
+            return extraction
+
+        return await self._flight.run(key, parse)
+
+    async def _run(
+        self, content: bytes, max_pages: int | None, tables: bool, timeout: float
+    ) -> PdfExtraction:
+        # Only running tasks hold a slot, so time spent queued behind other
+        # documents does not count against the timeout
+        async with self._get_slots():
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            self._active[executor] = self._active.get(executor, 0) + 1
+            future = loop.run_in_executor(
+                executor, extract_pdf, content, max_pages, tables, time.time() + timeout
+            )
+            try:
+                extraction = await asyncio.wait_for(future, timeout + HARD_TIMEOUT_GRACE)
+            except TimeoutError:
+                self.timeouts += 1
+                self._retire(executor)
+                raise PdfExtractionTimeout(f"PDF extraction exceeded {timeout:.0f}s") from None
+            except BrokenProcessPool as e:
+                self.failures += 1
+                self._retire(executor)
+                raise PdfExtractionError(f"PDF worker died: {e}") from None
+            except PdfExtractionError:
+                self.failures += 1
+                raise
+            finally:
+                self._release(executor)
+
+        self.parsed += 1
+        return extraction
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # Daemonic processes (e.g. Celery prefork workers) may not
+            # start children, so they extract in threads instead
+            if self.max_workers > 0 and not multiprocessing.current_process().daemon:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(self.max_workers, 1), thread_name_prefix="pdf"
+                )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._loop_slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(max(self.max_workers, 1))
+            self._loop_slots[loop] = slots
+        return slots
+
+    def _retire(self, executor: Executor) -> None:
+        """Stop using a pool whose worker is stuck or dead.
+
+        New documents go to a fresh pool; the retired one is torn down
+        once the documents still running in it have finished.
+        """
+        if self._executor is executor:
+            self._executor = None
+        self._retired.add(executor)
+
+    def _release(self, executor: Executor) -> None:
+        self._active[executor] -= 1
+        if self._active[executor]:
+            return
+        del self._active[executor]
+        if executor in self._retired:
+            self._retired.discard(executor)
+            self._recycle(executor)
+
+    def _recycle(self, executor: Executor) -> None:
+        """Tear down a retired pool, killing its stuck workers."""
+        if isinstance(executor, ProcessPoolExecutor):
+            # A running task cannot be cancelled; kill its process instead
+            for process in list((executor._processes or {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "parsed": self.parsed,
+            "cache_hits": self.cache_hits,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "coalesced": self._flight.coalesced,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        for executor in self._retired:
+            self._recycle(executor)
+        self._retired.clear()
+
+
+# Global service instance
+_service: PdfExtractionService | None = None
+
+
+def get_pdf_service() -> PdfExtractionService:
+    """Get or create the shared PDF extraction service."""
+    global _service
+    if _service is None:
+        settings = get_settings()
+        _service = PdfExtractionService(
+            max_workers=settings.pdf_workers,
+            timeout=settings.pdf_timeout,
+            max_pages=settings.pdf_max_pages or None,
+        )
+    return _service
+
+
+def shutdown_pdf_service() -> None:
+    """Stop the shared service's workers."""
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
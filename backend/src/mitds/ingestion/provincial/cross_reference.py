@@ -6,22 +6,26 @@ records with federal registry data using multiple matching strategies:
 2. Exact name matching - high confidence
 3. Fuzzy name matching - configurable thresholds
 
+Fuzzy matching is blocked and vectorised (see `resolution.blocking`):
+provincial names are only scored against federal names sharing a token,
+sorted-prefix or character n-gram key, in bounded-size cdist chunks.
+
 Match results are classified by confidence level:
 - Auto-link (>=95%): Automatically create SAME_AS relationship
 - Flag for review (85-95%): Requires manual verification
 - No match (<85%): No relationship created
 """
 
-import json
+import asyncio
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from rapidfuzz import fuzz
 from sqlalchemy import text
 
+from ...resolution.blocking import BlockedNameMatcher
 from .models import CrossReferenceResult
 
 
@@ -32,7 +36,7 @@ class CrossReferenceConfig:
     provinces: list[str] | None = None  # None = all provinces
     auto_link_threshold: float = 0.95
     review_threshold: float = 0.85
-    batch_size: int = 1000
+    batch_size: int = 1000  # Provincial records scored per matcher call
 
 
 class CrossReferenceService:
@@ -50,6 +54,8 @@ class CrossReferenceService:
         """Initialize the cross-reference service."""
         self._federal_names: dict[str, tuple[UUID, str]] = {}  # normalized_name -> (id, original_name)
         self._federal_bns: dict[str, tuple[UUID, str]] = {}    # bn -> (id, name)
+        self._federal_keys: list[str] = []  # matcher choice index -> normalized_name
+        self._matcher: BlockedNameMatcher | None = None
 
     async def run(
         self,
@@ -142,6 +148,10 @@ class CrossReferenceService:
                 if bn:
                     self._federal_bns[bn] = (entity_id, name)
 
+        # Build the fuzzy-matching block index over normalized federal names
+        self._federal_keys = list(self._federal_names)
+        self._matcher = BlockedNameMatcher(self._federal_keys)
+
     def _normalize_name(self, name: str) -> str:
         """Normalize corporation name for matching."""
         import re
@@ -192,16 +202,71 @@ class CrossReferenceService:
                     params[f"p{i}"] = pattern
 
             result = await db.execute(text(query), params)
+            rows = result.fetchall()
 
-            for row in result.fetchall():
-                match_result = await self._match_entity(
-                    provincial_id=row.id,
-                    provincial_name=row.name,
-                    business_number=row.bn,
-                    config=config,
-                )
+        batch_size = max(1, config.batch_size)
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            for match_result in await self._match_batch(batch, config):
                 yield match_result
 
+    async def _match_batch(
+        self,
+        rows: list[Any],
+        config: CrossReferenceConfig,
+    ) -> list[CrossReferenceResult]:
+        """Match a batch of provincial rows against federal data.
+
+        Identifier and exact-name matches are resolved by dictionary lookup;
+        the remaining names are fuzzy-scored together in one matcher call,
+        off the event loop.
+        """
+        results: list[CrossReferenceResult | None] = []
+        fuzzy_rows: list[tuple[int, Any, str]] = []
+
+        for row in rows:
+            match_result = self._match_exact(row.id, row.name, row.bn)
+            if match_result is None:
+                fuzzy_rows.append((len(results), row, self._normalize_name(row.name)))
+            results.append(match_result)
+
+        if fuzzy_rows:
+            best = await asyncio.to_thread(
+                self._best_fuzzy_matches,
+                [normalized for _, _, normalized in fuzzy_rows],
+                config,
+            )
+            for (pos, row, _), (match, score) in zip(fuzzy_rows, best, strict=True):
+                results[pos] = self._fuzzy_result(row.id, row.name, match, score, config)
+
+        return results
+
+    def _best_fuzzy_matches(
+        self,
+        normalized_names: list[str],
+        config: CrossReferenceConfig,
+    ) -> list[tuple[tuple[UUID, str] | None, float]]:
+        """Score normalized names against the federal block index.
+
+        Returns:
+            One ((federal_id, federal_name) or None, score 0-1) per name
+        """
+        if self._matcher is None:
+            self._federal_keys = list(self._federal_names)
+            self._matcher = BlockedNameMatcher(self._federal_keys)
+
+        matches = self._matcher.best_matches(
+            normalized_names,
+            score_cutoff=config.review_threshold * 100,
+        )
+        return [
+            (
+                self._federal_names[self._federal_keys[idx]] if idx is not None else None,
+                score / 100.0,
+            )
+            for idx, score in matches
+        ]
+
     async def _match_entity(
         self,
         provincial_id: UUID,
@@ -210,6 +275,24 @@ class CrossReferenceService:
         config: CrossReferenceConfig,
     ) -> CrossReferenceResult:
         """Match a provincial entity against federal data."""
+        match_result = self._match_exact(provincial_id, provincial_name, business_number)
+        if match_result is not None:
+            return match_result
+
+        [(best_match, best_score)] = self._best_fuzzy_matches(
+            [self._normalize_name(provincial_name)], config
+        )
+        return self._fuzzy_result(
+            provincial_id, provincial_name, best_match, best_score, config
+        )
+
+    def _match_exact(
+        self,
+        provincial_id: UUID,
+        provincial_name: str,
+        business_number: str | None,
+    ) -> CrossReferenceResult | None:
+        """Match by business number or exact normalized name."""
 
         # 1. Try business number match (highest confidence)
         if business_number and business_number in self._federal_bns:
@@ -242,18 +325,17 @@ class CrossReferenceService:
                 requires_review=False,
             )
 
-        # 3. Try fuzzy name match
-        best_score = 0.0
-        best_match = None
-
-        for fed_normalized, (federal_id, federal_name) in self._federal_names.items():
-            # Use token_sort_ratio for better handling of word order
-            score = fuzz.token_sort_ratio(normalized_name, fed_normalized) / 100.0
-
-            if score > best_score:
-                best_score = score
-                best_match = (federal_id, federal_name)
+        return None
 
+    def _fuzzy_result(
+        self,
+        provincial_id: UUID,
+        provincial_name: str,
+        best_match: tuple[UUID, str] | None,
+        best_score: float,
+        config: CrossReferenceConfig,
+    ) -> CrossReferenceResult:
+        """Build the result for a fuzzy (token_sort_ratio) best match."""
         if best_match and best_score >= config.review_threshold:
             federal_id, federal_name = best_match
             return CrossReferenceResult(
@@ -7,11 +7,14 @@ with source-specific identifiers that can be used for targeted ingestion.
 
 import asyncio
 import csv
+import functools
 import io
 import json
 import os
 import re
 import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -20,8 +23,10 @@ from zipfile import ZipFile
 import httpx
 from pydantic import BaseModel, Field
 
+from ..config import get_settings
 from ..logging import get_context_logger
 from .base import RetryConfig, with_retry
+from .search_index import NameSearchIndex
 
 logger = get_context_logger(__name__)
 
@@ -37,6 +42,39 @@ _DISK_CACHE_DIR = Path(
 )
 _DISK_CACHE_TTL_HOURS = 24
 
+# In-flight dataset loads, by loader name
+_loads: dict[str, asyncio.Task] = {}
+
+
+def _shared_load(loader: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """Run a cold dataset load once, as a task that outlives its callers.
+
+    Concurrent callers wait on the same load, and a caller that is
+    cancelled (e.g. by a search timeout) only abandons its wait: the
+    download carries on and fills `_cache` for the next search.
+    """
+
+    @functools.wraps(loader)
+    async def load() -> Any:
+        loop = asyncio.get_running_loop()
+        task = _loads.get(loader.__name__)
+        # A task from another (e.g. closed) event loop cannot be awaited here
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(loader())
+            _loads[loader.__name__] = task
+            task.add_done_callback(_finish_load)
+        return await asyncio.shield(task)
+
+    def _finish_load(task: asyncio.Task) -> None:
+        if _loads.get(loader.__name__) is task:
+            del _loads[loader.__name__]
+        # Mark a failure as retrieved when every caller has given up waiting
+        if not task.cancelled():
+            task.exception()
+
+    return load
+
+
 
 def _load_disk_cache(key: str) -> Any | None:
     """Load data from disk cache if it exists and is fresh."""
@@ -71,6 +109,61 @@ def _save_disk_cache(key: str, payload: Any) -> None:
         logger.warning(f"Failed to save disk cache for {key}: {e}")
 
 
+def _disk_cache_mtime(key: str) -> int:
+    """Modification time of a disk cache file (0 if absent)."""
+    try:
+        return (_DISK_CACHE_DIR / f"{key}.json").stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_or_build_index(
+    key: str,
+    entries: list[dict[str, Any]],
+    names: Callable[[dict[str, Any]], tuple[str, ...]],
+    sources: list[str],
+) -> NameSearchIndex:
+    """Load the persisted search index for `entries`, or build and save it.
+
+    The index is stamped with the disk cache files it was built from, so
+    it is rebuilt exactly once per cache refresh.
+
+    Args:
+        key: Index name (stored as `<key>.index/` beside the JSON cache)
+        entries: Records to index, in result order
+        names: Extracts a record's searchable names, display name first
+        sources: Disk cache keys the entries were loaded from
+    """
+    path = _DISK_CACHE_DIR / f"{key}.index"
+    stamp = {source: _disk_cache_mtime(source) for source in sources}
+
+    index = NameSearchIndex.load(path)
+    if (
+        index is not None
+        and index.meta.get("sources") == stamp
+        and len(index) == len(entries)
+    ):
+        logger.info(f"Loaded {key} search index from disk")
+        return index
+
+    started = time.monotonic()
+    index = NameSearchIndex.build(
+        [names(entry) for entry in entries], meta={"sources": stamp}
+    )
+    logger.info(
+        f"Built {key} search index over {len(entries)} records "
+        f"in {time.monotonic() - started:.1f}s"
+    )
+
+    # Only persist when it can be tied to the cache files it came from
+    if any(stamp.values()):
+        try:
+            index.save(path)
+        except Exception as e:
+            logger.warning(f"Failed to save {key} search index: {e}")
+    return index
+
+
 class CompanySearchResult(BaseModel):
     """A single company search result from any data source."""
 
@@ -101,6 +194,7 @@ EDGAR_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
 USER_AGENT = "MITDS Research contact@mitds.org"
 
 
+@_shared_load
 async def _get_edgar_tickers() -> dict[str, dict[str, Any]]:
     """Get cached SEC EDGAR company tickers mapping."""
     if "edgar_tickers" in _cache:
@@ -252,73 +346,85 @@ async def _get_irs990_index(year: int) -> list[dict[str, str]]:
     return entries
 
 
-async def search_irs990(query: str, limit: int = 10) -> list[CompanySearchResult]:
-    """Search IRS 990 index for organizations by name.
+@_shared_load
+async def _get_irs990_search() -> tuple[list[dict[str, str]], NameSearchIndex]:
+    """Get IRS 990 filers deduplicated by EIN, with their search index.
 
-    Downloads available year indexes from S3 and searches TAXPAYER_NAME.
     Tries previous two years since current year index may not exist yet.
     """
+    if "irs990_search" in _cache:
+        return _cache["irs990_search"]
+
     current_year = datetime.now().year
+    years = [current_year - 1, current_year - 2, current_year]
 
-    # Try previous two years (current year index often doesn't exist early in the year)
     all_entries: list[dict[str, str]] = []
-    for year in [current_year - 1, current_year - 2, current_year]:
+    complete = True
+    for year in years:
         try:
             entries = await _get_irs990_index(year)
             all_entries.extend(entries)
         except Exception as e:
             logger.warning(f"Failed to fetch IRS 990 index for {year}: {e}")
+            complete = False
 
-    if not all_entries:
-        return []
-
-    query_lower = query.lower()
-    query_parts = query_lower.split()
-
-    # Deduplicate by EIN (keep latest entry)
-    seen_eins: dict[str, dict] = {}
+    # Deduplicate by EIN once per load (keep the first entry seen)
+    seen_eins: dict[str, dict[str, str]] = {}
     for entry in all_entries:
         ein = entry.get("EIN", "")
         if ein and ein not in seen_eins:
             seen_eins[ein] = entry
+    filers = list(seen_eins.values())
+
+    index = await asyncio.to_thread(
+        _load_or_build_index,
+        "irs990",
+        filers,
+        lambda entry: (entry.get("TAXPAYER_NAME", ""),),
+        [f"irs990_index_{year}" for year in years],
+    )
 
-    scored: list[tuple[int, CompanySearchResult]] = []
-
-    for ein, entry in seen_eins.items():
-        name = entry.get("TAXPAYER_NAME", "")
-        name_lower = name.lower()
+    # Retry failed years on the next search rather than caching a partial index
+    if complete:
+        _cache["irs990_search"] = (filers, index)
+    return filers, index
 
-        # Name starts with query
-        if name_lower.startswith(query_lower):
-            score = 90
-        # All query parts found in name
-        elif all(part in name_lower for part in query_parts):
-            score = 70
-        # Partial match
-        elif query_lower in name_lower:
-            score = 60
-        else:
-            continue
 
-        # Format EIN
-        formatted_ein = ein
-        if len(ein) == 9:
-            formatted_ein = f"{ein[:2]}-{ein[2:]}"
+async def search_irs990(query: str, limit: int = 10) -> list[CompanySearchResult]:
+    """Search IRS 990 index for organizations by name.
 
-        scored.append((score, CompanySearchResult(
-            source="irs990",
-            identifier=ein,
-            identifier_type="EIN",
-            name=name,
-            details={
-                "ein_formatted": formatted_ein,
-                "form_type": entry.get("RETURN_TYPE", ""),
-                "tax_period": entry.get("TAX_PERIOD", ""),
-            },
-        )))
+    Downloads available year indexes from S3 and searches TAXPAYER_NAME
+    through the prebuilt name index.
+    """
+    filers, index = await _get_irs990_search()
+    if not filers:
+        return []
 
-    scored.sort(key=lambda x: (-x[0], x[1].name))
-    return [r for _, r in scored[:limit]]
+    return [
+        _irs990_result(filers[record])
+        for _, record in index.search(query, limit, [(90, 70)])
+    ]
+
+
+def _irs990_result(entry: dict[str, str]) -> CompanySearchResult:
+    ein = entry.get("EIN", "")
+
+    # Format EIN
+    formatted_ein = ein
+    if len(ein) == 9:
+        formatted_ein = f"{ein[:2]}-{ein[2:]}"
+
+    return CompanySearchResult(
+        source="irs990",
+        identifier=ein,
+        identifier_type="EIN",
+        name=entry.get("TAXPAYER_NAME", ""),
+        details={
+            "ein_formatted": formatted_ein,
+            "form_type": entry.get("RETURN_TYPE", ""),
+            "tax_period": entry.get("TAX_PERIOD", ""),
+        },
+    )
 
 
 # =========================
@@ -389,79 +495,80 @@ async def _get_cra_charities() -> list[dict[str, str]]:
     return rows
 
 
+def _cra_names(row: dict[str, str]) -> tuple[str, str, str]:
+    """Extract (BN, legal name, operating name) from a CRA row."""
+    bn = row.get("BN", row.get("bn", "")).strip()
+    legal_name = (
+        row.get("Legal Name", row.get("legal_name", ""))
+        or row.get("LegalNameEng", "")
+        or row.get("LEGAL_NAME", "")
+    ).strip()
+    operating_name = (
+        row.get("Operating Name", row.get("operating_name", ""))
+        or row.get("Account Name", "")
+        or row.get("OperatingNameEng", "")
+    )
+    return bn, legal_name, (operating_name or "").strip()
+
+
+@_shared_load
+async def _get_cra_search() -> tuple[list[dict[str, str]], NameSearchIndex]:
+    """Get searchable CRA charities (with BN and legal name) and their index."""
+    if "cra_search" in _cache:
+        return _cache["cra_search"]
+
+    charities = [
+        row for row in await _get_cra_charities()
+        if all(_cra_names(row)[:2])
+    ]
+    index = await asyncio.to_thread(
+        _load_or_build_index,
+        "cra",
+        charities,
+        lambda row: _cra_names(row)[1:],
+        ["cra_charities"],
+    )
+    _cache["cra_search"] = (charities, index)
+    return charities, index
+
+
 async def search_cra(query: str, limit: int = 10) -> list[CompanySearchResult]:
     """Search CRA registered charities by name.
 
-    Downloads the identification CSV (~few MB) and searches by legal/operating name.
+    Downloads the identification CSV (~few MB) and searches by legal name,
+    then operating name, through the prebuilt name index.
     """
-    charities = await _get_cra_charities()
+    charities, index = await _get_cra_search()
     if not charities:
         return []
 
-    query_lower = query.lower()
-    query_parts = query_lower.split()
-
-    scored: list[tuple[int, CompanySearchResult]] = []
-
-    for row in charities:
-        bn = row.get("BN", row.get("bn", "")).strip()
-        legal_name = (
-            row.get("Legal Name", row.get("legal_name", ""))
-            or row.get("LegalNameEng", "")
-            or row.get("LEGAL_NAME", "")
-        ).strip()
-        operating_name = (
-            row.get("Operating Name", row.get("operating_name", ""))
-            or row.get("Account Name", "")
-            or row.get("OperatingNameEng", "")
-        )
-        if operating_name:
-            operating_name = operating_name.strip()
-
-        if not bn or not legal_name:
-            continue
-
-        legal_lower = legal_name.lower()
-        operating_lower = (operating_name or "").lower()
-
-        # Score based on match quality
-        score = 0
-        if legal_lower.startswith(query_lower):
-            score = 90
-        elif operating_lower and operating_lower.startswith(query_lower):
-            score = 85
-        elif all(part in legal_lower for part in query_parts):
-            score = 70
-        elif operating_lower and all(part in operating_lower for part in query_parts):
-            score = 65
-        elif query_lower in legal_lower:
-            score = 60
-        elif operating_lower and query_lower in operating_lower:
-            score = 55
-        else:
-            continue
-
-        province = row.get("Province", row.get("province", ""))
-        city = row.get("City", row.get("city", ""))
-        designation = row.get("Designation", row.get("designation", ""))
-        category = row.get("Category", row.get("category", ""))
-
-        scored.append((score, CompanySearchResult(
-            source="cra",
-            identifier=bn,
-            identifier_type="BN",
-            name=legal_name,
-            details={
-                "operating_name": operating_name or None,
-                "province": province,
-                "city": city,
-                "designation": designation,
-                "category": category,
-            },
-        )))
-
-    scored.sort(key=lambda x: (-x[0], x[1].name))
-    return [r for _, r in scored[:limit]]
+    return [
+        _cra_result(charities[record])
+        for _, record in index.search(query, limit, [(90, 70), (85, 65)])
+    ]
+
+
+def _cra_result(row: dict[str, str]) -> CompanySearchResult:
+    bn, legal_name, operating_name = _cra_names(row)
+
+    province = row.get("Province", row.get("province", ""))
+    city = row.get("City", row.get("city", ""))
+    designation = row.get("Designation", row.get("designation", ""))
+    category = row.get("Category", row.get("category", ""))
+
+    return CompanySearchResult(
+        source="cra",
+        identifier=bn,
+        identifier_type="BN",
+        name=legal_name,
+        details={
+            "operating_name": operating_name or None,
+            "province": province,
+            "city": city,
+            "designation": designation,
+            "category": category,
+        },
+    )
 
 
 # =========================
@@ -582,46 +689,51 @@ def _extract_corp_for_search(corp_elem: Any) -> dict[str, Any] | None:
     }
 
 
+@_shared_load
+async def _get_canada_corps_search() -> tuple[list[dict[str, Any]], NameSearchIndex]:
+    """Get Canada corporations with their search index."""
+    if "canada_corps_search" in _cache:
+        return _cache["canada_corps_search"]
+
+    corps = await _get_canada_corps()
+    index = await asyncio.to_thread(
+        _load_or_build_index,
+        "canada_corps",
+        corps,
+        lambda corp: (corp["name"],),
+        ["canada_corps"],
+    )
+    _cache["canada_corps_search"] = (corps, index)
+    return corps, index
+
+
 async def search_canada_corps(query: str, limit: int = 10) -> list[CompanySearchResult]:
     """Search Canadian federal corporations by name.
 
-    Downloads bulk data XML from ISED and searches corporation names.
+    Downloads bulk data XML from ISED and searches corporation names
+    through the prebuilt name index.
     """
-    corps = await _get_canada_corps()
+    corps, index = await _get_canada_corps_search()
     if not corps:
         return []
 
-    query_lower = query.lower()
-    query_parts = query_lower.split()
-
-    scored: list[tuple[int, CompanySearchResult]] = []
-
-    for corp in corps:
-        name = corp["name"]
-        name_lower = name.lower()
-
-        if name_lower.startswith(query_lower):
-            score = 90
-        elif all(part in name_lower for part in query_parts):
-            score = 70
-        elif query_lower in name_lower:
-            score = 60
-        else:
-            continue
-
-        scored.append((score, CompanySearchResult(
-            source="canada_corps",
-            identifier=corp["corporation_number"],
-            identifier_type="Corporation Number",
-            name=name,
-            details={
-                "status": corp.get("status"),
-                "corporation_type": corp.get("corporation_type"),
-            },
-        )))
-
-    scored.sort(key=lambda x: (-x[0], x[1].name))
-    return [r for _, r in scored[:limit]]
+    return [
+        _canada_corp_result(corps[record])
+        for _, record in index.search(query, limit, [(90, 70)])
+    ]
+
+
+def _canada_corp_result(corp: dict[str, Any]) -> CompanySearchResult:
+    return CompanySearchResult(
+        source="canada_corps",
+        identifier=corp["corporation_number"],
+        identifier_type="Corporation Number",
+        name=corp["name"],
+        details={
+            "status": corp.get("status"),
+            "corporation_type": corp.get("corporation_type"),
+        },
+    )
 
 
 # =========================
@@ -633,14 +745,15 @@ async def warmup_search_cache() -> None:
     """Pre-load all search indexes into memory.
 
     Call this on server startup to avoid slow first searches.
-    Loads from disk cache if available, otherwise downloads.
+    Loads from disk cache if available, otherwise downloads, and loads or
+    builds the name search indexes.
     """
     logger.info("Warming up search cache...")
     sources = {
         "sec_edgar": _get_edgar_tickers,
-        "irs990": lambda: _warmup_irs990(),
-        "cra": _get_cra_charities,
-        "canada_corps": _get_canada_corps,
+        "irs990": _get_irs990_search,
+        "cra": _get_cra_search,
+        "canada_corps": _get_canada_corps_search,
     }
     results = await asyncio.gather(
         *[fn() for fn in sources.values()],
@@ -653,14 +766,30 @@ async def warmup_search_cache() -> None:
             logger.info(f"Warmup complete for {name}")
 
 
-async def _warmup_irs990() -> None:
-    """Warmup IRS 990 indexes for relevant years."""
-    current_year = datetime.now().year
-    for year in [current_year - 1, current_year - 2, current_year]:
-        try:
-            await _get_irs990_index(year)
-        except Exception as e:
-            logger.warning(f"Warmup failed for IRS 990 {year}: {e}")
+def suggest_registry_names(query: str, limit: int = 10) -> list[CompanySearchResult]:
+    """Suggest names from registry indexes that are already loaded.
+
+    Never triggers a download, so it is safe to call per keystroke.
+    Results are merged across sources by score, then name.
+    """
+    loaded = {
+        "irs990_search": (_irs990_result, [(90, 70)]),
+        "cra_search": (_cra_result, [(90, 70), (85, 65)]),
+        "canada_corps_search": (_canada_corp_result, [(90, 70)]),
+    }
+
+    scored: list[tuple[int, CompanySearchResult]] = []
+    for cache_key, (to_result, scores) in loaded.items():
+        if cache_key not in _cache:
+            continue
+        entries, index = _cache[cache_key]
+        scored.extend(
+            (score, to_result(entries[record]))
+            for score, record in index.search(query, limit, scores)
+        )
+
+    scored.sort(key=lambda x: (-x[0], x[1].name))
+    return [r for _, r in scored[:limit]]
 
 
 # =========================
@@ -668,55 +797,149 @@ async def _warmup_irs990() -> None:
 # =========================
 
 
+SourceSearch = Callable[[str], Awaitable[list[Any]]]
+
+
+@dataclass
+class FederatedSearchResult:
+    """Per-source outcome of a federated search.
+
+    Sources that failed or timed out appear in `errors` and not in
+    `results`; the remaining sources' results are still returned.
+    """
+
+    results: dict[str, list[Any]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+async def federated_search(
+    query: str,
+    searches: Mapping[str, SourceSearch],
+    timeout: float | None = None,
+    use_cache: bool = False,
+) -> FederatedSearchResult:
+    """Run one query against several sources concurrently.
+
+    Each source gets its own timeout, so one slow registry cannot hold
+    up the rest. With `use_cache`, results are read from and written to
+    the shared cache per source and normalized query; only successful
+    searches are cached, so a failed source is retried next time.
+
+    Args:
+        query: Search query
+        searches: Search coroutine functions by source name
+        timeout: Seconds per source (default from `registry_search_timeout`)
+        use_cache: Cache results (they must be JSON-serializable)
+
+    Returns:
+        Results and errors by source name
+    """
+    from ..cache import CACHE_TTL, get_cache, registry_search_key
+
+    if timeout is None:
+        timeout = get_settings().registry_search_timeout
+
+    outcome = FederatedSearchResult()
+    pending = dict(searches)
+
+    cache = None
+    if use_cache and pending:
+        keys = {name: registry_search_key(name, query) for name in pending}
+        try:
+            cache = await get_cache()
+            cached = await cache.mget(list(keys.values()))
+        except Exception as e:
+            logger.warning(f"Registry search cache unavailable: {e}")
+            cache, cached = None, [None] * len(keys)
+        for name, value in zip(keys, cached, strict=True):
+            if value is not None:
+                outcome.results[name] = value
+                del pending[name]
+
+    async def run(search: SourceSearch) -> list[Any]:
+        try:
+            return await asyncio.wait_for(search(query), timeout)
+        except TimeoutError:
+            raise TimeoutError(f"timed out after {timeout:g}s") from None
+
+    task_results = await asyncio.gather(
+        *(run(search) for search in pending.values()),
+        return_exceptions=True,
+    )
+
+    fresh: dict[str, list[Any]] = {}
+    for name, result in zip(pending, task_results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Search failed for {name}: {result}")
+            outcome.errors[name] = str(result) or type(result).__name__
+        else:
+            fresh[name] = result
+    outcome.results.update(fresh)
+
+    if cache is not None and fresh:
+        try:
+            await cache.mset(
+                {registry_search_key(name, query): value for name, value in fresh.items()},
+                CACHE_TTL["registry_search"],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache registry search results: {e}")
+
+    # Keep the caller's source order
+    outcome.results = {n: outcome.results[n] for n in searches if n in outcome.results}
+    return outcome
+
+
+SEARCH_SOURCES: dict[str, Callable[[str, int], Awaitable[list[CompanySearchResult]]]] = {
+    "sec_edgar": search_sec_edgar,
+    "irs990": search_irs990,
+    "cra": search_cra,
+    "canada_corps": search_canada_corps,
+}
+
+
 async def search_all_sources(
     query: str,
     sources: list[str] | None = None,
     limit: int = 10,
+    timeout: float | None = None,
 ) -> CompanySearchResponse:
     """Search for companies across all data sources.
 
+    Sources are searched concurrently; a source that fails or times out
+    is reported in `sources_failed` and the others still return.
+
     Args:
         query: Search query (company name, ticker, etc.)
-        sources: Optional list of sources to search (default: all)
+        sources: Optional list of sources to search (default: the
+            `registry_search_sources` setting, or all sources)
         limit: Maximum results per source
+        timeout: Seconds per source (default from `registry_search_timeout`)
 
     Returns:
         Aggregated search results from all sources
     """
-    active_sources = sources or ["sec_edgar", "irs990", "cra", "canada_corps"]
-
-    search_fns = {
-        "sec_edgar": search_sec_edgar,
-        "irs990": search_irs990,
-        "cra": search_cra,
-        "canada_corps": search_canada_corps,
-    }
+    active_sources = (
+        sources
+        or get_settings().registry_search_sources_list
+        or list(SEARCH_SOURCES)
+    )
 
-    tasks = {}
+    searches: dict[str, SourceSearch] = {}
     for source_name in active_sources:
-        if source_name in search_fns:
-            tasks[source_name] = search_fns[source_name](query, limit)
+        search_fn = SEARCH_SOURCES.get(source_name)
+        if search_fn is not None:
+            searches[source_name] = lambda q, fn=search_fn: fn(q, limit)
 
-    # Run all searches in parallel
-    task_results = await asyncio.gather(
-        *tasks.values(), return_exceptions=True
-    )
+    outcome = await federated_search(query, searches, timeout=timeout)
 
     all_results: list[CompanySearchResult] = []
-    sources_searched: list[str] = []
-    sources_failed: list[str] = []
-
-    for source_name, result in zip(tasks.keys(), task_results):
-        if isinstance(result, Exception):
-            logger.warning(f"Search failed for {source_name}: {result}")
-            sources_failed.append(source_name)
-        else:
-            sources_searched.append(source_name)
-            all_results.extend(result)
+    for result in outcome.results.values():
+        all_results.extend(result)
 
     return CompanySearchResponse(
         query=query,
         results=all_results,
-        sources_searched=sources_searched,
-        sources_failed=sources_failed,
+        sources_searched=list(outcome.results),
+        sources_failed=list(outcome.errors),
     )
@@ -0,0 +1,388 @@
+"""In-process name search index for bulk registry listings.
+
+The IRS 990, CRA and ISED company listings hold hundreds of thousands to
+millions of names. Rather than scanning every row per query, each listing
+is indexed once per cache refresh:
+
+1. Keys: lowercased names (one or more fields per record) stored as a
+   single UTF-8 blob with offsets
+2. Prefix: a permutation of keys in sorted order, bisected for
+   `startswith` queries
+3. Trigrams: an inverted index from character trigrams to the keys that
+   contain them, intersected for substring queries. Query parts shorter
+   than a trigram are matched by a vectorised scan of the blob.
+
+Scores follow the tiers the search functions have always used: a prefix
+match on a field scores that field's prefix score, otherwise a key
+containing every query word scores its contains score. Ties are broken
+by display name, as the linear scans did.
+
+Indexes persist as plain `.npy` files beside the JSON disk cache and are
+memory-mapped on load.
+"""
+
+import bisect
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from ..logging import get_context_logger
+
+logger = get_context_logger(__name__)
+
+INDEX_VERSION = 1
+
+# Bits per code point when packing a trigram into one int64
+_CODE_BITS = 21
+
+_ARRAYS = (
+    "blob",
+    "offsets",
+    "key_record",
+    "key_field",
+    "sorted_keys",
+    "record_rank",
+    "gram_codes",
+    "gram_offsets",
+    "gram_postings",
+)
+
+
+def _pack_trigrams(codepoints: np.ndarray) -> np.ndarray:
+    """Pack consecutive code point triples into int64 trigram codes."""
+    c = codepoints.astype(np.int64)
+    return (c[:-2] << (2 * _CODE_BITS)) | (c[1:-1] << _CODE_BITS) | c[2:]
+
+
+def _text_trigrams(text: str) -> np.ndarray:
+    """Unique trigram codes of a string."""
+    if len(text) < 3:
+        return np.empty(0, dtype=np.int64)
+    codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return np.unique(_pack_trigrams(codepoints))
+
+
+class _SortedKeys(Sequence):
+    """Keys in sorted order, decoded on access for bisection."""
+
+    def __init__(self, index: "NameSearchIndex"):
+        self.index = index
+
+    def __len__(self) -> int:
+        return len(self.index.sorted_keys)
+
+    def __getitem__(self, position: int) -> str:
+        return self.index.key(int(self.index.sorted_keys[position]))
+
+
+class NameSearchIndex:
+    """Prefix and trigram index over the names of a record listing.
+
+    Records are identified by their position in the listing the index was
+    built from; callers keep the listing alongside the index.
+
+    Usage:
+        index = NameSearchIndex.build([(row["name"],) for row in rows])
+        for score, record in index.search("maple leaf", 10, [(90, 70)]):
+            ...
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray], meta: dict | None = None):
+        """Wrap prebuilt index arrays (see `build` and `load`)."""
+        self.blob = arrays["blob"]
+        self.offsets = arrays["offsets"]
+        self.key_record = arrays["key_record"]
+        self.key_field = arrays["key_field"]
+        self.sorted_keys = arrays["sorted_keys"]
+        self.record_rank = arrays["record_rank"]
+        self.gram_codes = arrays["gram_codes"]
+        self.gram_offsets = arrays["gram_offsets"]
+        self.gram_postings = arrays["gram_postings"]
+        self.meta = meta or {}
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return len(self.record_rank)
+
+    @property
+    def n_keys(self) -> int:
+        return len(self.key_record)
+
+    def key(self, key_id: int) -> str:
+        """Decode one normalised key."""
+        start, end = self.offsets[key_id], self.offsets[key_id + 1]
+        return bytes(self.blob[start:end]).decode("utf-8")
+
+    # =========================
+    # Building
+    # =========================
+
+    @classmethod
+    def build(
+        cls,
+        names: Sequence[Sequence[str | None]],
+        meta: dict | None = None,
+    ) -> "NameSearchIndex":
+        """Build an index from per-record name fields.
+
+        Args:
+            names: For each record, its searchable names by field. The
+                first field is the display name used to break score ties.
+                Empty fields are not indexed.
+            meta: Extra metadata persisted with the index
+
+        Returns:
+            The built index
+        """
+        keys: list[str] = []
+        key_record: list[int] = []
+        key_field: list[int] = []
+        for record, fields in enumerate(names):
+            for field, name in enumerate(fields):
+                if name:
+                    keys.append(name.lower())
+                    key_record.append(record)
+                    key_field.append(field)
+
+        encoded = [key.encode("utf-8") for key in keys]
+        lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8).copy()
+
+        # Python sorts by code point, which matches UTF-8 byte order
+        sorted_keys = np.array(
+            sorted(range(len(keys)), key=keys.__getitem__), dtype=np.int32
+        )
+
+        # Stable by record position, like sorting the scored results by name
+        display = [fields[0] if fields else "" for fields in names]
+        record_rank = np.empty(len(names), dtype=np.int32)
+        record_rank[sorted(range(len(names)), key=display.__getitem__)] = np.arange(
+            len(names), dtype=np.int32
+        )
+
+        gram_codes, gram_offsets, gram_postings = cls._build_trigrams(keys)
+
+        arrays = {
+            "blob": blob,
+            "offsets": offsets,
+            "key_record": np.array(key_record, dtype=np.int32),
+            "key_field": np.array(key_field, dtype=np.int8),
+            "sorted_keys": sorted_keys,
+            "record_rank": record_rank,
+            "gram_codes": gram_codes,
+            "gram_offsets": gram_offsets,
+            "gram_postings": gram_postings,
+        }
+        return cls(arrays, {**(meta or {}), "version": INDEX_VERSION})
+
+    @staticmethod
+    def _build_trigrams(keys: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Build the trigram -> sorted key ids inverted index."""
+        if not keys:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32)
+
+        codepoints = np.frombuffer("".join(keys).encode("utf-32-le"), dtype=np.uint32)
+        lengths = np.fromiter((len(k) for k in keys), dtype=np.int64, count=len(keys))
+        owner = np.repeat(np.arange(len(keys), dtype=np.int32), lengths)
+
+        codes = _pack_trigrams(codepoints)
+        # Keep trigrams that start and end within the same key
+        same_key = owner[:-2] == owner[2:]
+        codes, owner = codes[same_key], owner[:-2][same_key]
+
+        order = np.lexsort((owner, codes))
+        codes, owner = codes[order], owner[order]
+        unique = np.ones(len(codes), dtype=bool)
+        unique[1:] = (codes[1:] != codes[:-1]) | (owner[1:] != owner[:-1])
+        codes, owner = codes[unique], owner[unique]
+
+        gram_codes, starts = np.unique(codes, return_index=True)
+        gram_offsets = np.append(starts, len(codes)).astype(np.int64)
+        return gram_codes, gram_offsets, owner
+
+    # =========================
+    # Persistence
+    # =========================
+
+    def save(self, path: Path) -> None:
+        """Persist the index as `.npy` arrays plus `meta.json` in `path`."""
+        path.mkdir(parents=True, exist_ok=True)
+        # Replace files atomically so processes that have the previous
+        # index memory-mapped keep reading a consistent copy
+        for name in _ARRAYS:
+            tmp = path / f"{name}.npy.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, np.asarray(getattr(self, name)))
+            os.replace(tmp, path / f"{name}.npy")
+        tmp = path / "meta.json.tmp"
+        tmp.write_text(json.dumps(self.meta), encoding="utf-8")
+        os.replace(tmp, path / "meta.json")
+
+    @classmethod
+    def load(cls, path: Path) -> "NameSearchIndex | None":
+        """Memory-map a persisted index, or None if missing or stale format."""
+        meta_file = path / "meta.json"
+        if not meta_file.exists():
+            return None
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            if meta.get("version") != INDEX_VERSION:
+                return None
+            arrays = {
+                name: np.load(path / f"{name}.npy", mmap_mode="r")
+                for name in _ARRAYS
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load search index from {path}: {e}")
+            return None
+        return cls(arrays, meta)
+
+    # =========================
+    # Querying
+    # =========================
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        scores: Sequence[tuple[int, int]],
+    ) -> list[tuple[int, int]]:
+        """Find the best-scoring records for a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum records returned
+            scores: Per field, the (prefix, contains) scores
+
+        Returns:
+            (score, record) pairs, best first, ties by display name
+        """
+        if limit <= 0 or not self.n_keys:
+            return []
+
+        query_lower = query.lower()
+        parts = query_lower.split()
+        prefix_scores = np.array([s[0] for s in scores], dtype=np.int32)
+        contains_scores = np.array([s[1] for s in scores], dtype=np.int32)
+
+        prefix_keys = self._prefix_keys(query_lower)
+        key_ids = [prefix_keys]
+        key_scores = [prefix_scores[self.key_field[prefix_keys]]]
+        verify = [np.zeros(len(prefix_keys), dtype=bool)]
+
+        # Every prefix tier outranks every contains tier, so contains
+        # matches are only needed when prefix matches don't fill the page
+        prefix_records = np.unique(self.key_record[prefix_keys])
+        if len(prefix_records) < limit or prefix_scores.min() <= contains_scores.max():
+            contains_keys, exact = self._contains_candidates(parts)
+            key_ids.append(contains_keys)
+            key_scores.append(contains_scores[self.key_field[contains_keys]])
+            verify.append(np.full(len(contains_keys), not exact))
+
+        key_ids = np.concatenate(key_ids)
+        key_scores = np.concatenate(key_scores)
+        verify = np.concatenate(verify)
+        records = self.key_record[key_ids]
+        ranking = (
+            -key_scores.astype(np.int64) * (len(self) + 1)
+            + self.record_rank[records]
+        )
+
+        # With no keys left to verify, the best `limit` records are among
+        # the best `limit` keys per field, so only those need sorting
+        keep = limit * len(scores)
+        if not verify.any() and len(ranking) > keep:
+            best = np.argpartition(ranking, keep)[:keep]
+            order = best[np.argsort(ranking[best], kind="stable")]
+        else:
+            order = np.argsort(ranking, kind="stable")
+
+        results: list[tuple[int, int]] = []
+        taken: set[int] = set()
+        for i in order:
+            record = int(records[i])
+            if record in taken:
+                continue
+            if verify[i]:
+                key = self.key(int(key_ids[i]))
+                if not all(part in key for part in parts):
+                    continue
+            taken.add(record)
+            results.append((int(key_scores[i]), record))
+            if len(results) >= limit:
+                break
+        return results
+
+    def _prefix_keys(self, prefix: str) -> np.ndarray:
+        """Key ids whose key starts with `prefix`."""
+        keys = _SortedKeys(self)
+        lo = bisect.bisect_left(keys, prefix)
+        # Keys sharing the prefix form a contiguous run starting at `lo`
+        hi = bisect.bisect_left(
+            keys, True, lo=lo, key=lambda k: not k.startswith(prefix)
+        )
+        return np.asarray(self.sorted_keys[lo:hi], dtype=np.int64)
+
+    def _contains_candidates(self, parts: list[str]) -> tuple[np.ndarray, bool]:
+        """Key ids that may contain every query part.
+
+        Returns:
+            Candidate key ids and whether they are exact (need no
+            verification against the decoded key)
+        """
+        if not parts:
+            return np.arange(self.n_keys, dtype=np.int64), True
+
+        long_parts = [p for p in parts if len(p) >= 3]
+        if not long_parts:
+            candidates = None
+            for part in parts:
+                hits = self._scan_keys(part)
+                candidates = hits if candidates is None else np.intersect1d(
+                    candidates, hits, assume_unique=True
+                )
+            return candidates.astype(np.int64), True
+
+        postings = []
+        for code in np.unique(np.concatenate([_text_trigrams(p) for p in long_parts])):
+            i = np.searchsorted(self.gram_codes, code)
+            if i == len(self.gram_codes) or self.gram_codes[i] != code:
+                return np.empty(0, dtype=np.int64), True
+            postings.append(self.gram_postings[self.gram_offsets[i]:self.gram_offsets[i + 1]])
+
+        postings.sort(key=len)
+        candidates = np.asarray(postings[0])
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if not len(candidates):
+                break
+
+        # A part of exactly three characters is its own trigram
+        exact = all(len(p) == 3 for p in parts)
+        return candidates.astype(np.int64), exact
+
+    def _scan_keys(self, part: str) -> np.ndarray:
+        """Key ids containing a short part, by scanning the key blob."""
+        needle = np.frombuffer(part.encode("utf-8"), dtype=np.uint8)
+        n = len(self.blob) - len(needle) + 1
+        if n <= 0:
+            return np.empty(0, dtype=np.int32)
+
+        mask = np.zeros(len(self.blob), dtype=bool)
+        mask[:n] = self.blob[:n] == needle[0]
+        for i in range(1, len(needle)):
+            mask[:n] &= self.blob[i:n + i] == needle[i]
+
+        # Drop matches that run past the end of their key
+        starts, ends = self.offsets[:-1], self.offsets[1:]
+        for j in range(1, len(needle)):
+            tail = ends - j
+            mask[tail[tail >= starts]] = False
+
+        return np.flatnonzero(np.logical_or.reduceat(mask, starts)).astype(np.int32)
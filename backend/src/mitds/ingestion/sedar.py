@@ -34,6 +34,7 @@ from ..logging import get_context_logger
 from ..models.evidence import EvidenceType
 from ..storage import compute_content_hash
 from .base import BaseIngester, IngestionConfig, IngestionResult, SingleIngestionResult, with_retry
+from .pdf import PdfExtraction, PdfExtractionError, extract_pdf, get_pdf_service
 
 logger = get_context_logger(__name__)
 
@@ -368,6 +369,22 @@ class EarlyWarningReportParser:
             self.logger.warning(f"HTML parsing failed: {e}")
             return None
 
+    async def parse_async(self, content: bytes, content_type: str) -> SEDAROwnership | None:
+        """Parse an Early Warning Report without blocking the event loop.
+
+        PDFs are extracted by the shared PDF service (worker processes,
+        cached by content hash); HTML is cheap enough to parse inline.
+        """
+        if content_type != "application/pdf":
+            return self.parse(content, content_type)
+
+        try:
+            extraction = await get_pdf_service().extract(content)
+        except PdfExtractionError as e:
+            self.logger.warning(f"PDF parsing failed: {e}")
+            return None
+        return self._ownership_from_pdf(extraction)
+
     def _parse_pdf(self, content: bytes) -> SEDAROwnership | None:
         """Parse PDF Early Warning Report (T030).
 
@@ -375,32 +392,23 @@ class EarlyWarningReportParser:
         Falls back to OCR (pytesseract) if text extraction fails.
         """
         try:
-            import pdfplumber
-            from io import BytesIO
-
-            text_content = ""
-            with pdfplumber.open(BytesIO(content)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += page_text + "\n"
-
-            if not text_content.strip():
-                # PDF might be image-based, would need OCR
-                self.logger.warning("PDF text extraction returned empty, may need OCR")
-                return None
-
-            return self._extract_ownership_from_text(
-                text_content,
-                extraction_confidence=0.7,
-            )
-
-        except ImportError:
-            self.logger.error("pdfplumber not installed, cannot parse PDF")
-            return None
-        except Exception as e:
+            extraction = extract_pdf(content)
+        except PdfExtractionError as e:
             self.logger.warning(f"PDF parsing failed: {e}")
             return None
+        return self._ownership_from_pdf(extraction)
+
+    def _ownership_from_pdf(self, extraction: PdfExtraction) -> SEDAROwnership | None:
+        text_content = extraction.text
+        if not text_content.strip():
+            # PDF might be image-based, would need OCR
+            self.logger.warning("PDF text extraction returned empty, may need OCR")
+            return None
+
+        return self._extract_ownership_from_text(
+            text_content,
+            extraction_confidence=0.7,
+        )
 
     def _extract_ownership_from_text(
         self,
@@ -839,7 +847,7 @@ class SEDARIngester(BaseIngester[SEDARFiling]):
             response = await with_retry(_fetch, logger=self.logger)
             content_type = response.headers.get("content-type", "text/html").split(";")[0]
 
-            ownership = self._parser.parse(response.content, content_type)
+            ownership = await self._parser.parse_async(response.content, content_type)
             if not ownership:
                 return None
 
@@ -516,7 +516,8 @@ class TopologySummaryReport(ReportBase):
         self.methodology = """
 This summary presents the network topology of relationships between analyzed entities.
 Network metrics include centrality measures, clustering coefficients, and path lengths.
-The visualization highlights key nodes and dense connection clusters.
+Communities are detected by modularity optimization and central entities ranked by
+PageRank. The visualization highlights key nodes and dense connection clusters.
 """.strip()
 
         # Network metrics
@@ -562,7 +563,9 @@ The visualization highlights key nodes and dense connection clusters.
         entity: EntityReference,
         degree_centrality: float,
         betweenness_centrality: float,
-        eigenvector_centrality: float,
+        eigenvector_centrality: float | None = None,
+        pagerank: float | None = None,
+        core_number: int | None = None,
     ) -> None:
         """Add a central entity to the summary."""
         self.central_entities.append({
@@ -571,6 +574,8 @@ The visualization highlights key nodes and dense connection clusters.
                 "degree": degree_centrality,
                 "betweenness": betweenness_centrality,
                 "eigenvector": eigenvector_centrality,
+                "pagerank": pagerank,
+                "core_number": core_number,
             },
         })
 
@@ -52,10 +52,13 @@ from .models import (
 from .session import ResearchSessionManager, get_session_manager
 from .queue import LeadQueueManager, get_queue_manager
 from .processor import LeadProcessor, get_processor
+from .concurrency import SessionLimitTracker, get_worker_slots, ingester_slot
+from .resolver import LeadEntityResolver
 from .registry import (
     INGESTER_CAPABILITIES,
     IngesterCapability,
     get_capability,
+    get_ingester_concurrency,
     get_ingesters_for_identifier,
     get_ingesters_for_jurisdiction,
     get_ingesters_for_lead_type,
@@ -87,10 +90,16 @@ __all__ = [
     "get_queue_manager",
     "LeadProcessor",
     "get_processor",
+    "LeadEntityResolver",
+    # Concurrency
+    "SessionLimitTracker",
+    "get_worker_slots",
+    "ingester_slot",
     # Registry
     "INGESTER_CAPABILITIES",
     "IngesterCapability",
     "get_capability",
+    "get_ingester_concurrency",
     "get_ingesters_for_identifier",
     "get_ingesters_for_jurisdiction",
     "get_ingesters_for_lead_type",
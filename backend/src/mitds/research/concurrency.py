@@ -0,0 +1,151 @@
+"""Concurrency controls for MITDS research sessions.
+
+Provides:
+- Worker slots capping how many leads one process works on at once
+- Per-ingester slots so concurrent leads respect each source's limits
+- In-memory session limit tracking, reconciled with the database
+"""
+
+import asyncio
+import time
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from uuid import UUID
+
+from ..config import get_settings
+from ..logging import get_context_logger
+from .registry import get_ingester_concurrency
+
+logger = get_context_logger(__name__)
+
+
+class _LoopSlots:
+    """Semaphores shared by every session running on one event loop."""
+
+    def __init__(self, max_workers: int):
+        self.workers = asyncio.Semaphore(max(1, max_workers))
+        self.ingesters: dict[str, asyncio.Semaphore] = {}
+
+    def ingester(self, name: str) -> asyncio.Semaphore:
+        if name not in self.ingesters:
+            self.ingesters[name] = asyncio.Semaphore(
+                max(1, get_ingester_concurrency(name))
+            )
+        return self.ingesters[name]
+
+
+# asyncio primitives are bound to a loop, so slots are kept per loop
+_loop_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSlots]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_loop_slots() -> _LoopSlots:
+    loop = asyncio.get_running_loop()
+    slots = _loop_slots.get(loop)
+    if slots is None:
+        slots = _LoopSlots(get_settings().research_max_workers)
+        _loop_slots[loop] = slots
+    return slots
+
+
+def get_worker_slots() -> asyncio.Semaphore:
+    """Get the process-wide cap on leads processed concurrently.
+
+    Sized by the `research_max_workers` setting and shared by all
+    sessions running in this process.
+    """
+    return _get_loop_slots().workers
+
+
+@asynccontextmanager
+async def ingester_slot(ingester_name: str) -> AsyncIterator[None]:
+    """Hold one of an ingester's concurrency slots.
+
+    Limits come from the ingester's capability in the registry, and are
+    shared by all sessions running in this process.
+
+    Args:
+        ingester_name: Registry name of the ingester (e.g. "sec_edgar")
+    """
+    async with _get_loop_slots().ingester(ingester_name):
+        yield
+
+
+class SessionLimitTracker:
+    """Tracks a session's entity and relationship counts against its limits.
+
+    Counts are kept in memory and the entity count is bumped as this
+    process adds entities. `reconcile` replaces both with the database
+    counts, which include rows added by other worker processes. Limits
+    can overshoot by the work already in flight when they are reached.
+    """
+
+    def __init__(
+        self,
+        session_id: UUID,
+        session_manager,
+        max_entities: int,
+        max_relationships: int,
+        reconcile_interval: float | None = None,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            session_id: Session UUID
+            session_manager: Session manager used to read counts
+            max_entities: Entity limit for the session
+            max_relationships: Relationship limit for the session
+            reconcile_interval: Seconds between reconciliations (default
+                from the `research_reconcile_interval` setting)
+        """
+        self.session_id = session_id
+        self.session_manager = session_manager
+        self.max_entities = max_entities
+        self.max_relationships = max_relationships
+        if reconcile_interval is None:
+            reconcile_interval = get_settings().research_reconcile_interval
+        self.reconcile_interval = reconcile_interval
+
+        self.entity_count = 0
+        self.relationship_count = 0
+        self._reconciled_at: float | None = None
+
+    @property
+    def entity_limit_reached(self) -> bool:
+        return self.entity_count >= self.max_entities
+
+    @property
+    def relationship_limit_reached(self) -> bool:
+        return self.relationship_count >= self.max_relationships
+
+    @property
+    def limit_reached(self) -> bool:
+        return self.entity_limit_reached or self.relationship_limit_reached
+
+    @property
+    def reconcile_due(self) -> bool:
+        return (
+            self._reconciled_at is None
+            or time.monotonic() - self._reconciled_at >= self.reconcile_interval
+        )
+
+    def record_entity(self, added: bool = True) -> None:
+        """Count an entity added to the session by this process."""
+        if added:
+            self.entity_count += 1
+
+    async def reconcile(self) -> None:
+        """Replace the in-memory counts with the database counts."""
+        self.entity_count = await self.session_manager.get_session_entity_count(
+            self.session_id
+        )
+        self.relationship_count = (
+            await self.session_manager.get_session_relationship_count(self.session_id)
+        )
+        self._reconciled_at = time.monotonic()
+        logger.debug(
+            f"Session {self.session_id}: reconciled counts "
+            f"({self.entity_count} entities, {self.relationship_count} relationships)"
+        )
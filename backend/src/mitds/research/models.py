@@ -106,6 +106,10 @@ class ResearchSessionConfig(BaseModel):
 
     # Rate limiting
     max_api_calls_per_minute: int = Field(default=30, ge=1)
+    max_concurrent_leads: int | None = Field(
+        default=None, ge=1, le=32,
+        description="Leads processed concurrently (None = server default)",
+    )
 
     # Auto-pause conditions
     pause_on_high_value_entity: bool = Field(default=False)
@@ -10,9 +10,11 @@ from uuid import UUID
 
 from sqlalchemy import text
 
+from ..config import get_settings
 from ..db import get_db_session
 from ..logging import get_context_logger
-from ..resolution.matcher import HybridMatcher
+from ..resolution.matcher import HybridMatcher, MatchCandidate
+from .concurrency import SessionLimitTracker, get_worker_slots, ingester_slot
 from .extractors.base import BaseLeadExtractor
 from .extractors.funding import CrossBorderFundingExtractor, FundingLeadExtractor
 from .extractors.ownership import OwnershipLeadExtractor
@@ -29,10 +31,14 @@ from .models import (
     SingleIngestionResult,
 )
 from .queue import LeadQueueManager, get_queue_manager
+from .resolver import LeadEntityResolver
 from .session import ResearchSessionManager, get_session_manager
 
 logger = get_context_logger(__name__)
 
+# Leads per processing iteration (the unit of max_iterations)
+LEAD_BATCH_SIZE = 5
+
 
 class LeadProcessor:
     """Processes leads from the queue.
@@ -49,6 +55,7 @@ class LeadProcessor:
         session_manager: ResearchSessionManager | None = None,
         queue_manager: LeadQueueManager | None = None,
         extractors: list[BaseLeadExtractor] | None = None,
+        resolver: LeadEntityResolver | None = None,
     ):
         """Initialize the processor.
 
@@ -56,9 +63,11 @@ class LeadProcessor:
             session_manager: Session manager (uses singleton if None)
             queue_manager: Queue manager (uses singleton if None)
             extractors: Lead extractors (uses defaults if None)
+            resolver: Batch lead-to-entity resolver (uses default if None)
         """
         self.session_manager = session_manager or get_session_manager()
         self.queue_manager = queue_manager or get_queue_manager()
+        self.resolver = resolver or LeadEntityResolver()
 
         # Initialize extractors
         if extractors is None:
@@ -70,8 +79,19 @@ class LeadProcessor:
         else:
             self.extractors = extractors
 
-        # Matcher for entity resolution
-        self.matcher = HybridMatcher()
+        # Matcher for entity resolution; ingested entities are added to its
+        # embedding index when a persistent store is configured
+        store_path = get_settings().embedding_store_path or None
+        self.matcher = HybridMatcher(
+            use_embedding=bool(store_path),
+            embedding_store_path=store_path,
+        )
+
+        # Limit trackers of the sessions being processed, by session ID
+        self._trackers: dict[UUID, SessionLimitTracker] = {}
+
+        # Entities resolved ahead of processing for claimed leads, by lead ID
+        self._resolved: dict[UUID, dict[str, Any] | None] = {}
 
     async def process_session(
         self,
@@ -80,9 +100,19 @@ class LeadProcessor:
     ) -> SessionStats:
         """Process a research session until completion or pause.
 
+        Leads are claimed (FOR UPDATE SKIP LOCKED) in batches sized to the
+        idle workers, resolved to existing entities per batch, and run on a
+        pool of workers, so several worker processes can share a session.
+        Pool size comes from the session config or `research_session_workers`,
+        under the process-wide `research_max_workers` cap. Entity and
+        relationship limits are tracked in memory and reconciled with the
+        database, along with the session status, every
+        `research_reconcile_interval` seconds.
+
         Args:
             session_id: Session UUID
-            max_iterations: Maximum processing iterations (None = until done)
+            max_iterations: Maximum processing iterations of LEAD_BATCH_SIZE
+                leads each (None = until done)
 
         Returns:
             Final session statistics
@@ -100,73 +130,165 @@ class LeadProcessor:
             await self._create_entry_point_lead(session)
             session = await self.session_manager.start_session(session_id)
 
-        iteration = 0
-        while True:
-            # Check if we should stop
+        tracker = SessionLimitTracker(
+            session_id,
+            self.session_manager,
+            max_entities=session.config.max_entities,
+            max_relationships=session.config.max_relationships,
+        )
+        session_slots = asyncio.Semaphore(self._session_workers(session.config))
+        worker_slots = get_worker_slots()
+        in_flight: set[asyncio.Task] = set()
+        max_leads = max_iterations * LEAD_BATCH_SIZE if max_iterations else None
+        claimed = 0
+
+        self._trackers[session_id] = tracker
+        try:
+            while True:
+                # Wait for a free worker before deciding whether to claim more
+                await session_slots.acquire()
+                await worker_slots.acquire()
+                held = 1
+                try:
+                    if max_leads is not None and claimed >= max_leads:
+                        break
+
+                    if not await self._may_claim(session_id, tracker):
+                        break
+
+                    # Claim a lead for every idle worker, up to a batch
+                    room = LEAD_BATCH_SIZE
+                    if max_leads is not None:
+                        room = min(room, max_leads - claimed)
+                    while held < room and not (session_slots.locked() or worker_slots.locked()):
+                        await session_slots.acquire()
+                        await worker_slots.acquire()
+                        held += 1
+
+                    leads = await self.queue_manager.dequeue(session_id, batch_size=held)
+                    if not leads:
+                        if in_flight:
+                            # Leads still running may enqueue more
+                            await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                            continue
+
+                        queue_stats = await self.queue_manager.get_queue_stats(session_id)
+                        if queue_stats.in_progress:
+                            logger.info(
+                                f"Session {session_id}: Queue drained here, "
+                                f"{queue_stats.in_progress} leads still in progress elsewhere"
+                            )
+                            break
+
+                        # No more leads - session complete
+                        await self.session_manager.complete_session(session_id)
+                        break
+
+                    await self._resolve_batch(leads)
+
+                    claimed += len(leads)
+                    for lead in leads:
+                        task = asyncio.create_task(
+                            self._run_claimed_lead(lead, session, session_slots, worker_slots)
+                        )
+                        in_flight.add(task)
+                        task.add_done_callback(in_flight.discard)
+                        held -= 1
+                finally:
+                    # Slots of a claimed lead are released when it finishes
+                    for _ in range(held):
+                        worker_slots.release()
+                        session_slots.release()
+
+            # Let claimed leads finish so none is left in progress
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            self._trackers.pop(session_id, None)
+
+        await self._update_session_stats(session_id)
+
+        # Get final stats
+        session = await self.session_manager.get_session(session_id)
+        return session.stats if session else SessionStats()
+
+    def _session_workers(self, config: ResearchSessionConfig) -> int:
+        """Get how many leads of a session this process works on at once."""
+        return max(1, config.max_concurrent_leads or get_settings().research_session_workers)
+
+    async def _may_claim(self, session_id: UUID, tracker: SessionLimitTracker) -> bool:
+        """Check whether another lead may be claimed for a session.
+
+        Status, counts and session stats are refreshed from the database
+        only when a reconciliation is due; limits are checked against the
+        in-memory counts every time. Pauses the session at a limit.
+
+        Returns:
+            True if the session is running and below its limits
+        """
+        if tracker.reconcile_due:
             session = await self.session_manager.get_session(session_id)
             if not session or session.status != SessionStatus.RUNNING:
-                break
+                return False
 
-            if max_iterations and iteration >= max_iterations:
-                break
+            await tracker.reconcile()
+            await self._update_session_stats(session_id, tracker)
 
-            # Check limits
-            entity_count = await self.session_manager.get_session_entity_count(session_id)
-            relationship_count = await self.session_manager.get_session_relationship_count(session_id)
+        if tracker.entity_limit_reached:
+            logger.info(f"Session {session_id}: Entity limit reached ({tracker.entity_count})")
+            await self.session_manager.pause_session(session_id)
+            return False
 
-            if entity_count >= session.config.max_entities:
-                logger.info(f"Session {session_id}: Entity limit reached ({entity_count})")
-                await self.session_manager.pause_session(session_id)
-                break
-
-            if relationship_count >= session.config.max_relationships:
-                logger.info(f"Session {session_id}: Relationship limit reached ({relationship_count})")
-                await self.session_manager.pause_session(session_id)
-                break
-
-            # Get next batch of leads
-            leads = await self.queue_manager.dequeue(session_id, batch_size=5)
-            if not leads:
-                # No more leads - session complete
-                await self.session_manager.complete_session(session_id)
-                break
-
-            # Process leads
-            for lead in leads:
-                try:
-                    result = await self.process_lead(lead, session)
-
-                    if result.success:
-                        await self.queue_manager.complete_lead(
-                            lead.id,
-                            result={
-                                "entity_id": str(result.entity_id) if result.entity_id else None,
-                                "is_new": result.is_new_entity,
-                                "relationships_created": result.relationships_created,
-                                "new_leads_generated": result.new_leads_generated,
-                            },
-                        )
-                    else:
-                        await self.queue_manager.fail_lead(
-                            lead.id,
-                            error_message=result.error_message or "Unknown error",
-                        )
+        if tracker.relationship_limit_reached:
+            logger.info(f"Session {session_id}: Relationship limit reached ({tracker.relationship_count})")
+            await self.session_manager.pause_session(session_id)
+            return False
 
-                except Exception as e:
-                    logger.error(f"Failed to process lead {lead.id}: {e}")
-                    await self.queue_manager.fail_lead(lead.id, str(e))
+        return True
 
-            # Update session stats
-            await self._update_session_stats(session_id)
+    async def _resolve_batch(self, leads: list[QueuedLead]) -> None:
+        """Resolve claimed leads to existing entities in one round of queries."""
+        try:
+            self._resolved.update(await self.resolver.resolve(leads))
+        except Exception as e:
+            logger.warning(f"Batch entity resolution failed, resolving leads individually: {e}")
 
-            iteration += 1
+    async def _run_claimed_lead(
+        self,
+        lead: QueuedLead,
+        session: ResearchSession,
+        *slots: asyncio.Semaphore,
+    ) -> None:
+        """Process a claimed lead, record its outcome, and free its slots."""
+        try:
+            result = await self.process_lead(lead, session)
+
+            if result.success:
+                await self.queue_manager.complete_lead(
+                    lead.id,
+                    result={
+                        "entity_id": str(result.entity_id) if result.entity_id else None,
+                        "is_new": result.is_new_entity,
+                        "relationships_created": result.relationships_created,
+                        "new_leads_generated": result.new_leads_generated,
+                    },
+                )
+            else:
+                await self.queue_manager.fail_lead(
+                    lead.id,
+                    error_message=result.error_message or "Unknown error",
+                )
 
-            # Small delay to prevent overwhelming APIs
-            await asyncio.sleep(0.1)
+        except Exception as e:
+            logger.error(f"Failed to process lead {lead.id}: {e}")
+            await self.queue_manager.fail_lead(lead.id, str(e))
 
-        # Get final stats
-        session = await self.session_manager.get_session(session_id)
-        return session.stats if session else SessionStats()
+        finally:
+            self._resolved.pop(lead.id, None)
+            for slot in slots:
+                slot.release()
 
     async def process_lead(
         self,
@@ -212,7 +334,7 @@ class LeadProcessor:
             )
 
         # Step 2: Add entity to session
-        await self.session_manager.add_session_entity(
+        await self._add_session_entity(
             session.id,
             entity_id,
             depth=lead.depth,
@@ -329,6 +451,20 @@ class LeadProcessor:
                     "external_ids": entity.get("external_ids", {}),
                     "jurisdiction": entity.get("jurisdiction", ""),
                 }
+                # Make the new entity a candidate for embedding matching
+                self.matcher.index_entities([
+                    MatchCandidate(
+                        entity_id=entity["id"],
+                        entity_type=entity["entity_type"],
+                        name=entity["name"],
+                        identifiers={
+                            key: str(value)
+                            for key, value in (entity.get("external_ids") or {}).items()
+                            if value
+                        },
+                        attributes=entity.get("metadata") or {},
+                    )
+                ])
                 return (
                     entity["id"],
                     entity["entity_type"],
@@ -343,98 +479,16 @@ class LeadProcessor:
         self,
         lead: QueuedLead,
     ) -> dict[str, Any] | None:
-        """Try to find an existing entity matching the lead."""
-        async with get_db_session() as db:
-            id_type = lead.target_identifier_type
-            identifier = lead.target_identifier
-
-            if id_type == IdentifierType.ENTITY_ID:
-                # Direct entity ID lookup
-                query = text("""
-                    SELECT id, name, entity_type, external_ids, metadata
-                    FROM entities
-                    WHERE id = :identifier
-                """)
-                params = {"identifier": identifier}
-
-            elif id_type == IdentifierType.EIN:
-                query = text("""
-                    SELECT id, name, entity_type, external_ids, metadata
-                    FROM entities
-                    WHERE external_ids->>'ein' = :identifier
-                """)
-                params = {"identifier": identifier}
+        """Try to find an existing entity matching the lead.
 
-            elif id_type == IdentifierType.BN:
-                query = text("""
-                    SELECT id, name, entity_type, external_ids, metadata
-                    FROM entities
-                    WHERE external_ids->>'bn' = :identifier
-                """)
-                params = {"identifier": identifier}
-
-            elif id_type == IdentifierType.CIK:
-                query = text("""
-                    SELECT id, name, entity_type, external_ids, metadata
-                    FROM entities
-                    WHERE external_ids->>'sec_cik' = :identifier
-                    OR external_ids->>'cik' = :identifier
-                """)
-                params = {"identifier": identifier}
-
-            elif id_type == IdentifierType.SEDAR_PROFILE:
-                query = text("""
-                    SELECT id, name, entity_type, external_ids, metadata
-                    FROM entities
-                    WHERE external_ids->>'sedar_profile' = :identifier
-                """)
-                params = {"identifier": identifier}
-
-            elif id_type == IdentifierType.META_PAGE_ID:
-                query = text("""
-                    SELECT id, name, entity_type, external_ids, metadata
-                    FROM entities
-                    WHERE external_ids->>'meta_page_id' = :identifier
-                """)
-                params = {"identifier": identifier}
-
-            else:
-                # Name-based lookup with fuzzy matching
-                # Normalize the search term (remove trailing punctuation)
-                normalized = identifier.strip().rstrip('.,;:')
-
-                # Try exact match first, then fuzzy match
-                query = text("""
-                    SELECT id, name, entity_type, external_ids, metadata
-                    FROM entities
-                    WHERE LOWER(name) = LOWER(:identifier)
-                       OR LOWER(TRIM(TRAILING '.' FROM TRIM(name))) = LOWER(:normalized)
-                       OR LOWER(name) LIKE LOWER(:like_pattern)
-                    ORDER BY
-                        CASE WHEN LOWER(name) = LOWER(:identifier) THEN 0 ELSE 1 END,
-                        LENGTH(name)
-                    LIMIT 1
-                """)
-                params = {
-                    "identifier": identifier,
-                    "normalized": normalized,
-                    "like_pattern": normalized + "%",
-                }
-
-            result = await db.execute(query, params)
-            row = result.fetchone()
-
-            if row:
-                import json
-                return {
-                    "id": row.id if not isinstance(row.id, str) else UUID(row.id),
-                    "name": row.name,
-                    "entity_type": row.entity_type,
-                    "external_ids": json.loads(row.external_ids) if isinstance(row.external_ids, str) else (row.external_ids or {}),
-                    "metadata": json.loads(row.metadata) if isinstance(row.metadata, str) else (row.metadata or {}),
-                }
+        Uses the entity resolved with the lead's claimed batch if there is
+        one, otherwise resolves the lead on its own.
+        """
+        if lead.id in self._resolved:
+            return self._resolved.pop(lead.id)
 
-        return None
+        resolved = await self.resolver.resolve([lead])
+        return resolved.get(lead.id)
 
     async def _get_entity(self, entity_id: UUID) -> dict[str, Any] | None:
         """Get entity by ID."""
@@ -461,6 +515,39 @@ class LeadProcessor:
 
         return None
 
+    async def _ingest_single(
+        self,
+        ingester_name: str,
+        identifier: str,
+        identifier_type: str,
+    ) -> Any:
+        """Run one ingester lookup within that ingester's concurrency limit.
+
+        Args:
+            ingester_name: Registry name ("sec_edgar", "sedar" or "meta_ads")
+            identifier: Identifier value to look up
+            identifier_type: Identifier type understood by the ingester
+
+        Returns:
+            The ingester's single-entity ingestion result
+        """
+        from ..ingestion.edgar import SECEDGARIngester
+        from ..ingestion.meta_ads import MetaAdIngester
+        from ..ingestion.sedar import SEDARIngester
+
+        ingesters = {
+            "sec_edgar": SECEDGARIngester,
+            "sedar": SEDARIngester,
+            "meta_ads": MetaAdIngester,
+        }
+
+        async with ingester_slot(ingester_name):
+            ingester = ingesters[ingester_name]()
+            try:
+                return await ingester.ingest_single(identifier, identifier_type)
+            finally:
+                await ingester.close()
+
     async def _ingest_entity(
         self,
         lead: QueuedLead,
@@ -471,10 +558,6 @@ class LeadProcessor:
         Calls the appropriate ingester's ingest_single() method based on
         the lead type and identifier type.
         """
-        from ..ingestion.edgar import SECEDGARIngester
-        from ..ingestion.meta_ads import MetaAdIngester
-        from ..ingestion.sedar import SEDARIngester
-
         id_type = lead.target_identifier_type
         identifier = lead.target_identifier
         lead_type = lead.lead_type
@@ -493,12 +576,10 @@ class LeadProcessor:
         if lead_type == LeadType.SPONSORSHIP:
             # Meta Ads for sponsorship leads
             try:
-                ingester = MetaAdIngester()
                 meta_id_type = "name"
                 if id_type == IdentifierType.META_PAGE_ID:
                     meta_id_type = "meta_page_id"
-                result = await ingester.ingest_single(identifier, meta_id_type)
-                await ingester.close()
+                result = await self._ingest_single("meta_ads", identifier, meta_id_type)
             except Exception as e:
                 logger.warning(f"Meta Ads ingestion failed: {e}")
 
@@ -506,50 +587,38 @@ class LeadProcessor:
             # Try SEC EDGAR first (for US companies), then SEDAR (for Canadian)
             if id_type == IdentifierType.CIK:
                 try:
-                    ingester = SECEDGARIngester()
-                    result = await ingester.ingest_single(identifier, "cik")
-                    await ingester.close()
+                    result = await self._ingest_single("sec_edgar", identifier, "cik")
                 except Exception as e:
                     logger.warning(f"SEC EDGAR ingestion failed: {e}")
 
             elif id_type == IdentifierType.SEDAR_PROFILE:
                 try:
-                    ingester = SEDARIngester()
-                    result = await ingester.ingest_single(identifier, "sedar_profile")
-                    await ingester.close()
+                    result = await self._ingest_single("sedar", identifier, "sedar_profile")
                 except Exception as e:
                     logger.warning(f"SEDAR ingestion failed: {e}")
 
             elif id_type == IdentifierType.BN:
                 try:
-                    ingester = SEDARIngester()
-                    result = await ingester.ingest_single(identifier, "bn")
-                    await ingester.close()
+                    result = await self._ingest_single("sedar", identifier, "bn")
                 except Exception as e:
                     logger.warning(f"SEDAR ingestion failed: {e}")
 
             elif id_type == IdentifierType.EIN:
                 try:
-                    ingester = SECEDGARIngester()
-                    result = await ingester.ingest_single(identifier, "ein")
-                    await ingester.close()
+                    result = await self._ingest_single("sec_edgar", identifier, "ein")
                 except Exception as e:
                     logger.warning(f"SEC EDGAR ingestion failed: {e}")
 
             elif id_type == IdentifierType.NAME:
                 # Try EDGAR first, then SEDAR
                 try:
-                    ingester = SECEDGARIngester()
-                    result = await ingester.ingest_single(identifier, "name")
-                    await ingester.close()
+                    result = await self._ingest_single("sec_edgar", identifier, "name")
                 except Exception as e:
                     logger.debug(f"SEC EDGAR by name failed: {e}")
 
                 if not result or not result.entity_id:
                     try:
-                        ingester = SEDARIngester()
-                        result = await ingester.ingest_single(identifier, "name")
-                        await ingester.close()
+                        result = await self._ingest_single("sedar", identifier, "name")
                     except Exception as e:
                         logger.debug(f"SEDAR by name failed: {e}")
 
@@ -557,34 +626,26 @@ class LeadProcessor:
             # For funding leads, try based on identifier type
             if id_type == IdentifierType.EIN:
                 try:
-                    ingester = SECEDGARIngester()
-                    result = await ingester.ingest_single(identifier, "ein")
-                    await ingester.close()
+                    result = await self._ingest_single("sec_edgar", identifier, "ein")
                 except Exception as e:
                     logger.warning(f"SEC EDGAR by EIN failed: {e}")
 
             elif id_type == IdentifierType.BN:
                 try:
-                    ingester = SEDARIngester()
-                    result = await ingester.ingest_single(identifier, "bn")
-                    await ingester.close()
+                    result = await self._ingest_single("sedar", identifier, "bn")
                 except Exception as e:
                     logger.warning(f"SEDAR by BN failed: {e}")
 
             elif id_type == IdentifierType.NAME:
                 # Try both ingesters for cross-border
                 try:
-                    ingester = SECEDGARIngester()
-                    result = await ingester.ingest_single(identifier, "name")
-                    await ingester.close()
+                    result = await self._ingest_single("sec_edgar", identifier, "name")
                 except Exception as e:
                     logger.debug(f"SEC EDGAR by name failed: {e}")
 
                 if not result or not result.entity_id:
                     try:
-                        ingester = SEDARIngester()
-                        result = await ingester.ingest_single(identifier, "name")
-                        await ingester.close()
+                        result = await self._ingest_single("sedar", identifier, "name")
                     except Exception as e:
                         logger.debug(f"SEDAR by name failed: {e}")
 
@@ -626,10 +687,6 @@ class LeadProcessor:
         Returns:
             Number of relationships created
         """
-        from ..ingestion.edgar import SECEDGARIngester
-        from ..ingestion.meta_ads import MetaAdIngester
-        from ..ingestion.sedar import SEDARIngester
-
         logger.debug(f"Ingesting for relationships: {entity_name} (id={entity_id})")
         relationships_created = 0
         jurisdiction = entity_data.get("jurisdiction", "").upper()
@@ -655,89 +712,53 @@ class LeadProcessor:
             "CA" in config.jurisdictions
         )
 
+        async def ingest(ingester_name: str, identifier: str, identifier_type: str) -> int:
+            result = await self._ingest_single(ingester_name, identifier, identifier_type)
+            if not result or not result.relationships_created:
+                return 0
+            # Add the discovered entity to the session
+            if session_id and result.entity_id:
+                await self._add_session_entity(
+                    session_id,
+                    result.entity_id,
+                    depth=depth,
+                    relevance_score=0.9,  # High relevance for direct match
+                )
+            return result.relationships_created
+
         # Query SEC EDGAR for US entities
         if query_us:
             try:
-                ingester = SECEDGARIngester()
-
                 if cik:
                     # Query by CIK for ownership filings
                     logger.info(f"Fetching SEC EDGAR data for CIK {cik}")
-                    result = await ingester.ingest_single(cik, "cik")
-                    if result and result.relationships_created:
-                        relationships_created += result.relationships_created
-                        if session_id and result.entity_id:
-                            await self.session_manager.add_session_entity(
-                                session_id, result.entity_id, depth=depth, relevance_score=0.9
-                            )
+                    relationships_created += await ingest("sec_edgar", cik, "cik")
                 else:
                     # Query by name
                     logger.info(f"Fetching SEC EDGAR data for {entity_name}")
-                    result = await ingester.ingest_single(entity_name, "name")
-                    if result and result.relationships_created:
-                        relationships_created += result.relationships_created
-                        if session_id and result.entity_id:
-                            await self.session_manager.add_session_entity(
-                                session_id, result.entity_id, depth=depth, relevance_score=0.9
-                            )
-
-                await ingester.close()
+                    relationships_created += await ingest("sec_edgar", entity_name, "name")
             except Exception as e:
                 logger.debug(f"SEC EDGAR ingestion for relationships failed: {e}")
 
         # Query SEDAR for Canadian entities
         if query_ca:
             try:
-                ingester = SEDARIngester()
-
                 if sedar_profile:
                     logger.info(f"Fetching SEDAR data for profile {sedar_profile}")
-                    result = await ingester.ingest_single(sedar_profile, "sedar_profile")
-                    if result and result.relationships_created:
-                        relationships_created += result.relationships_created
-                        if session_id and result.entity_id:
-                            await self.session_manager.add_session_entity(
-                                session_id, result.entity_id, depth=depth, relevance_score=0.9
-                            )
+                    relationships_created += await ingest("sedar", sedar_profile, "sedar_profile")
                 elif bn:
                     logger.info(f"Fetching SEDAR data for BN {bn}")
-                    result = await ingester.ingest_single(bn, "bn")
-                    if result and result.relationships_created:
-                        relationships_created += result.relationships_created
-                        if session_id and result.entity_id:
-                            await self.session_manager.add_session_entity(
-                                session_id, result.entity_id, depth=depth, relevance_score=0.9
-                            )
+                    relationships_created += await ingest("sedar", bn, "bn")
                 else:
                     logger.info(f"Fetching SEDAR data for {entity_name}")
-                    result = await ingester.ingest_single(entity_name, "name")
-                    if result and result.relationships_created:
-                        relationships_created += result.relationships_created
-                        if session_id and result.entity_id:
-                            await self.session_manager.add_session_entity(
-                                session_id, result.entity_id, depth=depth, relevance_score=0.9
-                            )
-
-                await ingester.close()
+                    relationships_created += await ingest("sedar", entity_name, "name")
             except Exception as e:
                 logger.debug(f"SEDAR ingestion for relationships failed: {e}")
 
         # Query Meta Ads for ad sponsorship data
         try:
-            ingester = MetaAdIngester()
             logger.info(f"Fetching Meta Ads data for {entity_name}")
-            result = await ingester.ingest_single(entity_name, "name")
-            if result and result.relationships_created:
-                relationships_created += result.relationships_created
-                # Add the discovered sponsor entity to the session
-                if session_id and result.entity_id:
-                    await self.session_manager.add_session_entity(
-                        session_id,
-                        result.entity_id,
-                        depth=depth,
-                        relevance_score=0.9,  # High relevance for direct sponsor match
-                    )
-            await ingester.close()
+            relationships_created += await ingest("meta_ads", entity_name, "name")
         except Exception as e:
             logger.debug(f"Meta Ads ingestion for relationships failed: {e}")
 
@@ -794,10 +815,44 @@ class LeadProcessor:
 
         return total_enqueued
 
-    async def _update_session_stats(self, session_id: UUID) -> None:
-        """Update session statistics from current data."""
-        entity_count = await self.session_manager.get_session_entity_count(session_id)
-        relationship_count = await self.session_manager.get_session_relationship_count(session_id)
+    async def _add_session_entity(
+        self,
+        session_id: UUID,
+        entity_id: UUID,
+        depth: int,
+        relevance_score: float = 1.0,
+        lead_id: UUID | None = None,
+    ) -> None:
+        """Add an entity to a session, counting it toward the session's limit."""
+        added = await self.session_manager.add_session_entity(
+            session_id,
+            entity_id,
+            depth=depth,
+            relevance_score=relevance_score,
+            lead_id=lead_id,
+        )
+        tracker = self._trackers.get(session_id)
+        if tracker is not None:
+            tracker.record_entity(bool(added))
+
+    async def _update_session_stats(
+        self,
+        session_id: UUID,
+        tracker: SessionLimitTracker | None = None,
+    ) -> None:
+        """Update session statistics from current data.
+
+        Args:
+            session_id: Session UUID
+            tracker: Freshly reconciled limit tracker to take counts from
+                (counts are queried if None)
+        """
+        if tracker is not None:
+            entity_count = tracker.entity_count
+            relationship_count = tracker.relationship_count
+        else:
+            entity_count = await self.session_manager.get_session_entity_count(session_id)
+            relationship_count = await self.session_manager.get_session_relationship_count(session_id)
         queue_stats = await self.queue_manager.get_queue_stats(session_id)
 
         stats = SessionStats(
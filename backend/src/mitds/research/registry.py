@@ -8,6 +8,9 @@ from typing import Any
 
 from .models import IdentifierType, LeadType
 
+# Concurrent lookups per ingester when its capability sets no limit
+DEFAULT_INGESTER_CONCURRENCY = 4
+
 
 @dataclass
 class IngesterCapability:
@@ -20,6 +23,7 @@ class IngesterCapability:
     requires_api_key: bool = False
     rate_limit_per_minute: int | None = None
     supports_incremental: bool = True
+    max_concurrency: int | None = None  # Concurrent lookups across research workers
 
 
 # Registry of ingester capabilities
@@ -38,6 +42,7 @@ INGESTER_CAPABILITIES: dict[str, IngesterCapability] = {
         jurisdictions=["US"],
         requires_api_key=False,
         rate_limit_per_minute=10,
+        max_concurrency=2,
     ),
     "sedar": IngesterCapability(
         name="sedar",
@@ -45,6 +50,7 @@ INGESTER_CAPABILITIES: dict[str, IngesterCapability] = {
         lead_types_generated=[LeadType.OWNERSHIP],
         jurisdictions=["CA"],
         requires_api_key=False,
+        max_concurrency=2,
     ),
     "cra": IngesterCapability(
         name="cra",
@@ -60,6 +66,7 @@ INGESTER_CAPABILITIES: dict[str, IngesterCapability] = {
         jurisdictions=["US", "CA"],
         requires_api_key=True,
         rate_limit_per_minute=200,  # Meta's limit
+        max_concurrency=4,
     ),
     "opencorporates": IngesterCapability(
         name="opencorporates",
@@ -67,6 +74,7 @@ INGESTER_CAPABILITIES: dict[str, IngesterCapability] = {
         lead_types_generated=[LeadType.OWNERSHIP, LeadType.BOARD_INTERLOCK],
         jurisdictions=["*"],  # Global
         requires_api_key=True,  # For higher rate limits
+        max_concurrency=2,
     ),
     "littlesis": IngesterCapability(
         name="littlesis",
@@ -111,6 +119,21 @@ def get_capability(ingester_name: str) -> IngesterCapability | None:
     return INGESTER_CAPABILITIES.get(ingester_name)
 
 
+def get_ingester_concurrency(ingester_name: str) -> int:
+    """Get how many lookups may run concurrently against an ingester.
+
+    Args:
+        ingester_name: Ingester name
+
+    Returns:
+        Concurrency limit (DEFAULT_INGESTER_CONCURRENCY if unset or unknown)
+    """
+    cap = INGESTER_CAPABILITIES.get(ingester_name)
+    if cap is None or cap.max_concurrency is None:
+        return DEFAULT_INGESTER_CONCURRENCY
+    return cap.max_concurrency
+
+
 def get_ingesters_for_identifier(
     identifier_type: IdentifierType,
     jurisdiction: str | None = None,
@@ -0,0 +1,199 @@
+"""Batch entity resolution for MITDS research leads.
+
+Resolves dequeued leads to existing entities with one query per
+identifier type instead of one query per lead. Identifier lookups use
+the external_ids expression indexes and name lookups the lowercased name
+indexes (migration 010_entity_lookup_indexes).
+"""
+
+import json
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+
+from ..db import get_db_session
+from ..logging import get_context_logger
+from .models import IdentifierType, QueuedLead
+
+logger = get_context_logger(__name__)
+
+
+# external_ids keys matched for each identifier type
+EXTERNAL_ID_KEYS: dict[IdentifierType, tuple[str, ...]] = {
+    IdentifierType.EIN: ("ein",),
+    IdentifierType.BN: ("bn",),
+    IdentifierType.CIK: ("sec_cik", "cik"),
+    IdentifierType.SEDAR_PROFILE: ("sedar_profile",),
+    IdentifierType.META_PAGE_ID: ("meta_page_id",),
+}
+
+# Sorts after any character, closing the range of names with a given prefix
+_PREFIX_END = chr(0x10FFFF)
+
+
+def _row_to_entity(row) -> dict[str, Any]:
+    """Convert an entities row to the dict shape used by the processor."""
+    return {
+        "id": row.id if not isinstance(row.id, str) else UUID(row.id),
+        "name": row.name,
+        "entity_type": row.entity_type,
+        "external_ids": json.loads(row.external_ids) if isinstance(row.external_ids, str) else (row.external_ids or {}),
+        "metadata": json.loads(row.metadata) if isinstance(row.metadata, str) else (row.metadata or {}),
+    }
+
+
+class LeadEntityResolver:
+    """Resolves batches of leads to existing entities.
+
+    Leads are grouped by identifier type and each group is resolved with
+    a single query. Identifier types without an external_ids key (names,
+    OpenCorporates and LittleSis IDs) are resolved by name: an exact
+    match first, then a match ignoring trailing periods, then the
+    shortest name starting with the identifier.
+    """
+
+    async def resolve(
+        self, leads: list[QueuedLead]
+    ) -> dict[UUID, dict[str, Any] | None]:
+        """Resolve leads to existing entities.
+
+        Args:
+            leads: Leads to resolve
+
+        Returns:
+            Entity dict (or None if unmatched) for every lead, by lead ID
+        """
+        groups: dict[IdentifierType, list[QueuedLead]] = defaultdict(list)
+        for lead in leads:
+            id_type = IdentifierType(lead.target_identifier_type)
+            if id_type != IdentifierType.ENTITY_ID and id_type not in EXTERNAL_ID_KEYS:
+                id_type = IdentifierType.NAME
+            groups[id_type].append(lead)
+
+        resolved: dict[UUID, dict[str, Any] | None] = {}
+        if not groups:
+            return resolved
+
+        async with get_db_session() as db:
+            for id_type, group in groups.items():
+                identifiers = list({lead.target_identifier for lead in group})
+
+                if id_type == IdentifierType.ENTITY_ID:
+                    found = await self._resolve_entity_ids(db, identifiers)
+                elif id_type == IdentifierType.NAME:
+                    found = await self._resolve_names(db, identifiers)
+                else:
+                    found = await self._resolve_external_ids(
+                        db, EXTERNAL_ID_KEYS[id_type], identifiers
+                    )
+
+                for lead in group:
+                    resolved[lead.id] = found.get(lead.target_identifier)
+
+        logger.debug(
+            f"Resolved {sum(e is not None for e in resolved.values())} of "
+            f"{len(leads)} leads in {len(groups)} queries"
+        )
+        return resolved
+
+    async def _resolve_entity_ids(
+        self, db: Any, identifiers: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Look entities up by ID, keyed by the identifier as given."""
+        by_id: dict[str, str] = {}
+        for identifier in identifiers:
+            try:
+                by_id[str(UUID(identifier))] = identifier
+            except ValueError:
+                continue
+        if not by_id:
+            return {}
+
+        result = await db.execute(
+            text("""
+                SELECT id, name, entity_type, external_ids, metadata
+                FROM entities
+                WHERE id = ANY(CAST(:ids AS uuid[]))
+            """),
+            {"ids": list(by_id)},
+        )
+
+        found = {}
+        for row in result.fetchall():
+            identifier = by_id.get(str(row.id))
+            if identifier is not None:
+                found[identifier] = _row_to_entity(row)
+        return found
+
+    async def _resolve_external_ids(
+        self, db: Any, keys: tuple[str, ...], identifiers: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Look entities up by external_ids keys, keyed by identifier."""
+        # Keys come from EXTERNAL_ID_KEYS, never from input
+        columns = ", ".join(f"external_ids->>'{key}' AS key_{i}" for i, key in enumerate(keys))
+        predicate = " OR ".join(f"external_ids->>'{key}' = ANY(:ids)" for key in keys)
+
+        result = await db.execute(
+            text(f"""
+                SELECT id, name, entity_type, external_ids, metadata, {columns}
+                FROM entities
+                WHERE {predicate}
+            """),
+            {"ids": identifiers},
+        )
+
+        wanted = set(identifiers)
+        found: dict[str, dict[str, Any]] = {}
+        for row in result.fetchall():
+            entity = None
+            for i in range(len(keys)):
+                value = getattr(row, f"key_{i}")
+                if value in wanted and value not in found:
+                    entity = entity or _row_to_entity(row)
+                    found[value] = entity
+        return found
+
+    async def _resolve_names(
+        self, db: Any, identifiers: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Look entities up by name, keyed by identifier.
+
+        Each name is matched in a LATERAL subquery so every arm of the
+        match can use an index. The prefix arm is a byte-wise range on
+        lower(name), which the text_pattern_ops index serves.
+        """
+        # Normalize the search terms (remove trailing punctuation)
+        normalized = [i.strip().rstrip('.,;:') for i in identifiers]
+
+        result = await db.execute(
+            text("""
+                SELECT q.identifier, e.id, e.name, e.entity_type,
+                       e.external_ids, e.metadata
+                FROM unnest(
+                    CAST(:identifiers AS text[]), CAST(:normalized AS text[])
+                ) AS q(identifier, normalized)
+                CROSS JOIN LATERAL (
+                    SELECT id, name, entity_type, external_ids, metadata
+                    FROM entities
+                    WHERE LOWER(name) = LOWER(q.identifier)
+                       OR LOWER(TRIM(TRAILING '.' FROM TRIM(name))) = LOWER(q.normalized)
+                       OR (
+                           LOWER(name) ~>=~ LOWER(q.normalized)
+                           AND LOWER(name) ~<~ (LOWER(q.normalized) || :prefix_end)
+                       )
+                    ORDER BY
+                        CASE WHEN LOWER(name) = LOWER(q.identifier) THEN 0 ELSE 1 END,
+                        LENGTH(name)
+                    LIMIT 1
+                ) e
+            """),
+            {
+                "identifiers": identifiers,
+                "normalized": normalized,
+                "prefix_end": _PREFIX_END,
+            },
+        )
+
+        return {row.identifier: _row_to_entity(row) for row in result.fetchall()}
@@ -371,7 +371,7 @@ class ResearchSessionManager:
         depth: int,
         relevance_score: float = 1.0,
         lead_id: UUID | None = None,
-    ) -> None:
+    ) -> bool:
         """Add an entity to a session's discovered entities.
 
         Args:
@@ -380,6 +380,9 @@ class ResearchSessionManager:
             depth: Hops from entry point
             relevance_score: Computed relevance (0.0-1.0)
             lead_id: Lead that discovered this entity
+
+        Returns:
+            True if added, False if already in the session
         """
         async with get_db_session() as db:
             query = text("""
@@ -393,7 +396,7 @@ class ResearchSessionManager:
                 ON CONFLICT (session_id, entity_id) DO NOTHING
             """)
 
-            await db.execute(
+            result = await db.execute(
                 query,
                 {
                     "session_id": str(session_id),
@@ -404,6 +407,7 @@ class ResearchSessionManager:
                     "relevance_score": relevance_score,
                 },
             )
+            return result.rowcount > 0
 
     async def add_session_relationship(
         self,
@@ -12,6 +12,8 @@ from .matcher import (
     MatchResult,
     MatchStrategy,
 )
+from .blocking import BlockedNameMatcher
+from .dedup import DedupConfig, DuplicateFinder
 from .resolver import EntityResolver, ResolutionResult
 from .cross_border import (
     CrossBorderResolver,
@@ -22,7 +24,10 @@ from .cross_border import (
 )
 
 __all__ = [
+    "BlockedNameMatcher",
+    "DedupConfig",
     "DeterministicMatcher",
+    "DuplicateFinder",
     "FuzzyMatcher",
     "HybridMatcher",
     "MatchCandidate",
@@ -0,0 +1,248 @@
+"""Candidate blocking and vectorised name scoring for MITDS.
+
+Comparing every source name against every target name is O(S x T)
+interpreted comparisons. `BlockedNameMatcher` instead indexes the target
+names under cheap blocking keys and only scores the candidates that share
+a key with each source name:
+
+1. Token keys: each informative word of the normalised name
+2. Sorted-prefix keys: the first characters of the sorted-token string
+3. Character n-gram keys: candidates sharing a fraction of n-grams
+
+Candidates are scored with rapidfuzz's matrix API (`process.cdist`) in
+chunks whose score matrix is capped at `max_cells`, so memory stays
+bounded regardless of how many names are matched. When the full
+S x T matrix fits in one chunk budget the matcher skips blocking and
+scores exhaustively.
+
+Names are expected to be normalised by the caller.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from ..logging import get_context_logger
+
+logger = get_context_logger(__name__)
+
+# Words too common to discriminate between organisation names
+BLOCKING_STOPWORDS = frozenset({
+    "the", "of", "and", "for", "de", "du", "des", "la", "le", "les", "et",
+    "a", "an", "in", "on", "to", "at", "by",
+})
+
+
+def name_tokens(name: str) -> list[str]:
+    """Split a normalised name into informative tokens."""
+    return [
+        t for t in name.lower().split()
+        if len(t) > 1 and t not in BLOCKING_STOPWORDS
+    ]
+
+
+def sorted_prefix_key(name: str, length: int = 4) -> str | None:
+    """Key on the first characters of the sorted-token form of a name.
+
+    Sorting tokens first makes the key insensitive to word order, which
+    matches the behaviour of `fuzz.token_sort_ratio`.
+    """
+    tokens = sorted(name.lower().split())
+    compact = "".join(tokens)
+    if len(compact) < length:
+        return compact or None
+    return compact[:length]
+
+
+def char_ngrams(name: str, n: int = 3) -> set[str]:
+    """Character n-grams of a name with whitespace removed."""
+    compact = "".join(name.lower().split())
+    if len(compact) <= n:
+        return {compact} if compact else set()
+    return {compact[i:i + n] for i in range(len(compact) - n + 1)}
+
+
+class BlockedNameMatcher:
+    """Best-match lookup of names against a fixed list of choices.
+
+    Usage:
+        matcher = BlockedNameMatcher(federal_names)
+        for idx, score in matcher.best_matches(provincial_names, score_cutoff=85):
+            if idx is not None:
+                print(federal_names[idx], score)
+    """
+
+    def __init__(
+        self,
+        choices: Sequence[str],
+        scorer: Callable[..., float] = fuzz.token_sort_ratio,
+        prefix_length: int = 4,
+        ngram_size: int = 3,
+        ngram_overlap: float = 0.5,
+        max_block_size: int = 5000,
+        max_cells: int = 4_000_000,
+        workers: int = -1,
+    ):
+        """Build the blocking index.
+
+        Args:
+            choices: Normalised target names
+            scorer: rapidfuzz scorer returning 0-100
+            prefix_length: Characters in the sorted-prefix key
+            ngram_size: Character n-gram length
+            ngram_overlap: Fraction of a query's n-grams a candidate must share
+            max_block_size: Token/n-gram blocks larger than this are ignored
+                as uninformative (unless they are all a query has)
+            max_cells: Upper bound on score-matrix cells per cdist call
+            workers: rapidfuzz worker threads (-1 = all cores)
+        """
+        self.choices = list(choices)
+        self.scorer = scorer
+        self.prefix_length = prefix_length
+        self.ngram_size = ngram_size
+        self.ngram_overlap = ngram_overlap
+        self.max_block_size = max_block_size
+        self.max_cells = max_cells
+        self.workers = workers
+
+        token_blocks: dict[str, list[int]] = defaultdict(list)
+        prefix_blocks: dict[str, list[int]] = defaultdict(list)
+        ngram_blocks: dict[str, list[int]] = defaultdict(list)
+
+        for idx, name in enumerate(self.choices):
+            for token in set(name_tokens(name)):
+                token_blocks[token].append(idx)
+            prefix = sorted_prefix_key(name, prefix_length)
+            if prefix:
+                prefix_blocks[prefix].append(idx)
+            for gram in char_ngrams(name, ngram_size):
+                ngram_blocks[gram].append(idx)
+
+        self._token_blocks = self._freeze(token_blocks)
+        self._prefix_blocks = self._freeze(prefix_blocks)
+        self._ngram_blocks = self._freeze(ngram_blocks)
+
+    @staticmethod
+    def _freeze(blocks: dict[str, list[int]]) -> dict[str, np.ndarray]:
+        return {k: np.asarray(v, dtype=np.int64) for k, v in blocks.items()}
+
+    @property
+    def exhaustive(self) -> bool:
+        """Whether blocking is unnecessary because the choice list is small."""
+        return len(self.choices) <= self.max_block_size
+
+    def candidates(self, query: str) -> np.ndarray:
+        """Sorted indices of choices sharing a blocking key with `query`."""
+        if self.exhaustive:
+            return np.arange(len(self.choices), dtype=np.int64)
+
+        parts: list[np.ndarray] = []
+        oversized: list[np.ndarray] = []
+
+        for token in set(name_tokens(query)):
+            block = self._token_blocks.get(token)
+            if block is None:
+                continue
+            (oversized if len(block) > self.max_block_size else parts).append(block)
+
+        prefix = sorted_prefix_key(query, self.prefix_length)
+        if prefix and prefix in self._prefix_blocks:
+            parts.append(self._prefix_blocks[prefix])
+
+        grams = char_ngrams(query, self.ngram_size)
+        gram_blocks = [
+            self._ngram_blocks[g] for g in grams
+            if g in self._ngram_blocks and len(self._ngram_blocks[g]) <= self.max_block_size
+        ]
+        if gram_blocks:
+            needed = max(2, int(np.ceil(len(grams) * self.ngram_overlap)))
+            ids, counts = np.unique(np.concatenate(gram_blocks), return_counts=True)
+            parts.append(ids[counts >= needed])
+
+        if not parts and oversized:
+            # Only generic words in the name: fall back to the smallest block
+            parts.append(min(oversized, key=len))
+
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(parts))
+
+    def best_matches(
+        self,
+        queries: Sequence[str],
+        score_cutoff: float = 0.0,
+    ) -> list[tuple[int | None, float]]:
+        """Find the best-scoring choice for each query.
+
+        Ties resolve to the lowest choice index, as a linear scan with a
+        strict `>` comparison would.
+
+        Args:
+            queries: Normalised source names
+            score_cutoff: Minimum score (0-100) for a match
+
+        Returns:
+            One `(choice_index, score)` per query, in order; the index is
+            None when no candidate reaches `score_cutoff`
+        """
+        results: list[tuple[int | None, float]] = [(None, 0.0)] * len(queries)
+        if not queries or not self.choices:
+            return results
+
+        if self.exhaustive:
+            all_ids = np.arange(len(self.choices), dtype=np.int64)
+            rows = max(1, self.max_cells // len(self.choices))
+            order = list(range(len(queries)))
+            for start in range(0, len(order), rows):
+                chunk = order[start:start + rows]
+                self._score_chunk(queries, chunk, all_ids, score_cutoff, results)
+            return results
+
+        # Sort queries so neighbours in a chunk share most of their candidates
+        keyed = sorted(
+            range(len(queries)),
+            key=lambda i: sorted_prefix_key(queries[i], self.prefix_length) or "",
+        )
+
+        chunk: list[int] = []
+        chunk_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        for qi in keyed:
+            ids = self.candidates(queries[qi])
+            if len(ids) == 0:
+                continue
+            merged = np.union1d(chunk_ids, ids)
+            if chunk and (len(chunk) + 1) * len(merged) > self.max_cells:
+                self._score_chunk(queries, chunk, chunk_ids, score_cutoff, results)
+                chunk, merged = [], ids
+            chunk.append(qi)
+            chunk_ids = merged
+
+        if chunk:
+            self._score_chunk(queries, chunk, chunk_ids, score_cutoff, results)
+        return results
+
+    def _score_chunk(
+        self,
+        queries: Sequence[str],
+        query_idx: list[int],
+        choice_ids: np.ndarray,
+        score_cutoff: float,
+        results: list[tuple[int | None, float]],
+    ) -> None:
+        """Score a chunk of queries against a candidate set with cdist."""
+        scores = process.cdist(
+            [queries[i] for i in query_idx],
+            [self.choices[i] for i in choice_ids],
+            scorer=self.scorer,
+            score_cutoff=score_cutoff,
+            dtype=np.float32,
+            workers=self.workers,
+        )
+        best_cols = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(query_idx)), best_cols]
+
+        for qi, col, score in zip(query_idx, best_cols, best_scores, strict=True):
+            if score > 0 and score >= score_cutoff:
+                results[qi] = (int(choice_ids[col]), float(score))
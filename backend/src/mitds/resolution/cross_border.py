@@ -13,6 +13,7 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+from ..config import get_settings
 from ..db import get_neo4j_session
 from ..logging import get_context_logger
 from .matcher import (
@@ -91,6 +92,7 @@ class CrossBorderResolver:
         auto_merge_threshold: float = 0.9,
         review_threshold: float = 0.7,
         use_postal_boost: bool = True,
+        use_embedding: bool = False,
     ):
         """Initialize the resolver.
 
@@ -98,14 +100,17 @@ class CrossBorderResolver:
             auto_merge_threshold: Confidence above which to auto-merge
             review_threshold: Confidence above which to queue for review
             use_postal_boost: Whether to boost confidence for postal code matches
+            use_embedding: Add semantic matching, backed by the persistent
+                embedding store (settings.embedding_store_path)
         """
         self.auto_merge_threshold = auto_merge_threshold
         self.review_threshold = review_threshold
         self.use_postal_boost = use_postal_boost
 
         self._matcher = HybridMatcher(
-            use_embedding=False,  # Faster without embeddings
+            use_embedding=use_embedding,
             fuzzy_min_score=80,
+            embedding_store_path=get_settings().embedding_store_path or None,
         )
         self._queue = ReconciliationQueue(
             confidence_threshold=auto_merge_threshold,
@@ -302,13 +307,6 @@ class CrossBorderResolver:
         """
         result = CrossBorderResolutionResult(grant=grant)
 
-        # Find candidates
-        candidates = await self.find_candidates(grant)
-
-        if not candidates:
-            result.action = "no_match"
-            return result
-
         # Create source candidate from grant
         source = MatchCandidate(
             entity_id=grant.recipient_id,
@@ -325,6 +323,24 @@ class CrossBorderResolver:
             },
         )
 
+        # Find candidates, plus semantically close entities from the ANN
+        # index that the province filter would miss
+        candidates = await self.find_candidates(grant)
+        known_ids = {c.entity_id for c in candidates}
+        for nearest in self._matcher.nearest_candidates(source):
+            address = nearest.attributes.get("address") or {}
+            if (
+                nearest.entity_id not in known_ids
+                and nearest.identifiers.get("bn")
+                and address.get("country") == grant.recipient_country
+            ):
+                candidates.append(nearest)
+                known_ids.add(nearest.entity_id)
+
+        if not candidates:
+            result.action = "no_match"
+            return result
+
         # Find matches using hybrid matcher
         matches = self._matcher.find_matches(
             source,
@@ -500,6 +516,7 @@ async def run_cross_border_resolution(
     limit: int = 100,
     auto_merge: bool = True,
     auto_merge_threshold: float = 0.9,
+    use_embedding: bool = False,
 ) -> dict[str, Any]:
     """Convenience function to run cross-border resolution.
 
@@ -508,12 +525,14 @@ async def run_cross_border_resolution(
         limit: Maximum grants to process
         auto_merge: Whether to auto-merge
         auto_merge_threshold: Confidence threshold for auto-merge
+        use_embedding: Whether to add semantic (embedding) matching
 
     Returns:
         Dictionary with stats and summary
     """
     resolver = CrossBorderResolver(
         auto_merge_threshold=auto_merge_threshold,
+        use_embedding=use_embedding,
     )
 
     stats, results = await resolver.run(
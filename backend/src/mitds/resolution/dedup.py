@@ -0,0 +1,388 @@
+"""Blocked duplicate detection for EntityResolver.
+
+Resolving every entity against every other entity is O(N^2) matcher calls.
+`DuplicateFinder` instead streams entities out of Neo4j in id-ordered pages
+and indexes them under blocking keys, so each entity is only compared with
+the entities it shares a key with:
+
+1. Identifier keys: normalised EIN, BN and OpenCorporates id (exact)
+2. Name keys: informative tokens and the sorted-prefix key of the
+   normalised name
+3. Postal keys: postal prefix (FSA / ZIP3) combined with each name token,
+   so tokens too common to block on nationally still block locally
+
+Fuzzy scoring of each entity against its block neighbours is independent
+work and can be spread across a process pool. The final greedy pass over
+entities in id order reproduces `EntityResolver.resolve` semantics: a
+deterministic match wins outright, otherwise the best fuzzy match among
+entities not already paired is reported.
+"""
+
+import asyncio
+import multiprocessing
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ..db import get_neo4j_session
+from ..logging import get_context_logger
+from .blocking import name_tokens, sorted_prefix_key
+from .matcher import (
+    DeterministicMatcher,
+    FuzzyMatcher,
+    MatchCandidate,
+    MatchResult,
+    MatchStrategy,
+)
+
+if TYPE_CHECKING:
+    from .resolver import EntityResolver, ResolutionResult
+
+logger = get_context_logger(__name__)
+
+# Matches FuzzyMatcher's own top-N cut before location boosts are applied
+FUZZY_TOP_N = 10
+
+
+@dataclass
+class DedupConfig:
+    """Configuration for a duplicate detection run."""
+
+    page_size: int = 5000  # Entities fetched from Neo4j per page
+    prefix_length: int = 4  # Characters in the sorted-prefix name key
+    postal_prefix_length: int = 3  # FSA (Canada) / sectional centre (US)
+    max_block_size: int = 1000  # Larger name/postal blocks are ignored
+    workers: int = 0  # Scoring processes (0 or 1 = score in-process)
+    chunk_size: int = 2000  # Entities per scoring task
+
+
+# (neighbour index, fuzzy score, confidence, match details)
+ScoredPair = tuple[int, float, float, dict[str, Any]]
+
+
+def _score_chunk(
+    tasks: list[tuple[int, MatchCandidate, list[tuple[int, MatchCandidate]]]],
+    min_score: int,
+    threshold: float,
+) -> list[tuple[int, list[ScoredPair]]]:
+    """Fuzzy-score a chunk of entities against their block neighbours.
+
+    Module-level so it can run in a worker process.
+    """
+    matcher = FuzzyMatcher(min_score=min_score, limit=None)
+    scored: list[tuple[int, list[ScoredPair]]] = []
+
+    for idx, source, neighbours in tasks:
+        position = {c.entity_id: j for j, c in neighbours}
+        matches = matcher.find_matches(
+            source, [c for _, c in neighbours], threshold=threshold
+        )
+        if matches:
+            scored.append((
+                idx,
+                [
+                    (
+                        position[m.target.entity_id],
+                        float(m.match_details.get("fuzzy_score", 0.0)),
+                        m.confidence,
+                        m.match_details,
+                    )
+                    for m in matches
+                ],
+            ))
+
+    return scored
+
+
+class DuplicateFinder:
+    """Find duplicate entities of one type without comparing all pairs.
+
+    Usage:
+        finder = DuplicateFinder(EntityResolver(), DedupConfig(workers=4))
+        duplicates = await finder.find_duplicates("Organization")
+    """
+
+    def __init__(
+        self,
+        resolver: "EntityResolver",
+        config: DedupConfig | None = None,
+    ):
+        """Initialize the finder.
+
+        Args:
+            resolver: Resolver whose matchers and thresholds are used
+            config: Blocking and scoring configuration
+        """
+        self.resolver = resolver
+        self.config = config or DedupConfig()
+
+        # Key normalisation follows the matchers that score the pairs
+        self._keys_deterministic = resolver._deterministic or DeterministicMatcher()
+        self._keys_fuzzy = resolver._fuzzy or FuzzyMatcher()
+
+        self.candidates: list[MatchCandidate] = []
+        self._identifier_blocks: dict[tuple[str, str], list[int]] = defaultdict(list)
+        self._name_blocks: dict[tuple[str, ...], list[int]] = defaultdict(list)
+
+    # =========================
+    # Streaming
+    # =========================
+
+    async def iter_candidate_pages(
+        self,
+        entity_type: str,
+    ) -> AsyncIterator[list[MatchCandidate]]:
+        """Stream entities of a type from Neo4j in id-ordered pages.
+
+        Uses keyset pagination on `e.id`, which the per-label id
+        constraint indexes, so no page requires skipping earlier rows.
+        """
+        from .resolver import CANDIDATE_RETURN_CLAUSE, record_to_candidate
+
+        query = f"""
+        MATCH (e:{entity_type})
+        WHERE e.id > $after
+        {CANDIDATE_RETURN_CLAUSE}
+        ORDER BY e.id
+        LIMIT $limit
+        """
+
+        after = ""
+        async with get_neo4j_session() as session:
+            while True:
+                result = await session.run(
+                    query, after=after, limit=self.config.page_size
+                )
+                records = await result.data()
+                if not records:
+                    break
+
+                yield [
+                    record_to_candidate(record, entity_type)
+                    for record in records
+                ]
+
+                after = records[-1]["id"]
+                if len(records) < self.config.page_size:
+                    break
+
+    async def find_duplicates(
+        self,
+        entity_type: str,
+        threshold: float | None = None,
+    ) -> list["ResolutionResult"]:
+        """Stream, block and score all entities of a type.
+
+        Args:
+            entity_type: Neo4j label (Organization, Person, Outlet)
+            threshold: Minimum fuzzy confidence (default: resolver's)
+
+        Returns:
+            Potential duplicate pairs
+        """
+        async for page in self.iter_candidate_pages(entity_type):
+            self.add_candidates(page)
+
+        logger.info(
+            f"Loaded {len(self.candidates)} {entity_type} entities "
+            f"into {len(self._name_blocks)} name blocks"
+        )
+        return await self.find_pairs(threshold)
+
+    # =========================
+    # Blocking
+    # =========================
+
+    def add_candidates(self, candidates: Sequence[MatchCandidate]) -> None:
+        """Index a page of candidates under their blocking keys."""
+        for candidate in candidates:
+            idx = len(self.candidates)
+            self.candidates.append(candidate)
+
+            for key in self._identifier_keys(candidate):
+                self._identifier_blocks[key].append(idx)
+            for key in self._name_keys(candidate):
+                self._name_blocks[key].append(idx)
+
+    def _identifier_keys(self, candidate: MatchCandidate) -> Iterator[tuple[str, str]]:
+        ids = candidate.identifiers
+        if ids.get("ein"):
+            yield ("ein", self._keys_deterministic._normalize_ein(ids["ein"]))
+        if ids.get("bn"):
+            yield ("bn", self._keys_deterministic._normalize_bn(ids["bn"]))
+        if ids.get("opencorp_id"):
+            yield ("opencorp_id", ids["opencorp_id"])
+
+    def _name_keys(self, candidate: MatchCandidate) -> set[tuple[str, ...]]:
+        normalized = self._keys_fuzzy._normalize_name(candidate.name)
+        if not normalized:
+            return set()
+
+        tokens = set(name_tokens(normalized))
+        keys: set[tuple[str, ...]] = {("t", token) for token in tokens}
+
+        prefix = sorted_prefix_key(normalized, self.config.prefix_length)
+        if prefix:
+            keys.add(("s", prefix))
+
+        postal = self._keys_fuzzy._get_postal(candidate)
+        if postal:
+            area = postal.upper().replace(" ", "").replace("-", "")
+            area = area[: self.config.postal_prefix_length]
+            if len(area) == self.config.postal_prefix_length:
+                keys.update(("p", area, token) for token in tokens)
+
+        return keys
+
+    def _identifier_neighbours(self, idx: int) -> list[int]:
+        """Later candidates sharing an identifier with candidate `idx`."""
+        neighbours: set[int] = set()
+        for key in self._identifier_keys(self.candidates[idx]):
+            neighbours.update(j for j in self._identifier_blocks[key] if j > idx)
+        return sorted(neighbours)
+
+    def _name_neighbours(self, idx: int) -> list[int]:
+        """Later candidates sharing a usable name/postal key with `idx`."""
+        neighbours: set[int] = set()
+        for key in self._name_keys(self.candidates[idx]):
+            block = self._name_blocks.get(key)
+            if block is None or len(block) > self.config.max_block_size:
+                continue
+            neighbours.update(j for j in block if j > idx)
+        return sorted(neighbours)
+
+    # =========================
+    # Scoring
+    # =========================
+
+    async def find_pairs(
+        self,
+        threshold: float | None = None,
+    ) -> list["ResolutionResult"]:
+        """Score block neighbours and greedily select duplicate pairs."""
+        from .resolver import ResolutionState
+
+        if threshold is None:
+            threshold = self.resolver.fuzzy_threshold
+
+        fuzzy_scores: dict[int, list[ScoredPair]] = {}
+        if self.resolver._fuzzy:
+            fuzzy_scores = await self._score_all(threshold)
+
+        duplicates = []
+        checked: set[int] = set()
+
+        for idx, source in enumerate(self.candidates):
+            if idx in checked:
+                continue
+            checked.add(idx)
+
+            result = None
+            if self.resolver._deterministic:
+                for j in self._identifier_neighbours(idx):
+                    if j in checked:
+                        continue
+                    matches = self.resolver._deterministic.find_matches(
+                        source, [self.candidates[j]]
+                    )
+                    if matches:
+                        result = self.resolver._create_result(
+                            source, matches[0], ResolutionState.RESOLVED
+                        )
+                        checked.add(j)
+                        break
+
+            if result is None and idx in fuzzy_scores:
+                best = self._best_unchecked(fuzzy_scores[idx], checked)
+                if best is not None:
+                    j, _, confidence, details = best
+                    result = self.resolver._create_result(
+                        source,
+                        self._fuzzy_match(source, self.candidates[j], confidence, details),
+                        ResolutionState.CANDIDATE,
+                    )
+                    checked.add(j)
+
+            if result is not None:
+                duplicates.append(result)
+
+        return duplicates
+
+    async def _score_all(self, threshold: float) -> dict[int, list[ScoredPair]]:
+        """Fuzzy-score every candidate against its block neighbours."""
+        min_score = self.resolver._fuzzy.min_score
+        chunks = list(self._scoring_chunks())
+        scores: dict[int, list[ScoredPair]] = {}
+
+        # Daemonic processes (e.g. Celery prefork workers) may not start
+        # children, so they score in-process instead
+        use_processes = (
+            self.config.workers > 1
+            and len(chunks) > 1
+            and not multiprocessing.current_process().daemon
+        )
+        if use_processes:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=self.config.workers) as pool:
+                futures = [
+                    loop.run_in_executor(pool, _score_chunk, chunk, min_score, threshold)
+                    for chunk in chunks
+                ]
+                for scored in await asyncio.gather(*futures):
+                    scores.update(scored)
+        else:
+            for chunk in chunks:
+                scored = await asyncio.to_thread(_score_chunk, chunk, min_score, threshold)
+                scores.update(scored)
+
+        return scores
+
+    def _scoring_chunks(
+        self,
+    ) -> Iterator[list[tuple[int, MatchCandidate, list[tuple[int, MatchCandidate]]]]]:
+        chunk = []
+        for idx, source in enumerate(self.candidates):
+            neighbours = self._name_neighbours(idx)
+            if not neighbours:
+                continue
+            chunk.append((idx, source, [(j, self.candidates[j]) for j in neighbours]))
+            if len(chunk) >= self.config.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _best_unchecked(
+        scored: list[ScoredPair],
+        checked: set[int],
+    ) -> ScoredPair | None:
+        """Best fuzzy match whose target is not yet paired.
+
+        Mirrors `FuzzyMatcher.find_matches` over the unchecked candidates:
+        take the top-N by fuzzy score (ties to the earlier entity), then the
+        highest confidence after location boosts.
+        """
+        open_pairs = [pair for pair in scored if pair[0] not in checked]
+        if not open_pairs:
+            return None
+        open_pairs.sort(key=lambda pair: (-pair[1], pair[0]))
+        top = open_pairs[:FUZZY_TOP_N]
+        return max(top, key=lambda pair: pair[2])
+
+    def _fuzzy_match(
+        self,
+        source: MatchCandidate,
+        target: MatchCandidate,
+        confidence: float,
+        details: dict[str, Any],
+    ) -> MatchResult:
+        return MatchResult(
+            source=source,
+            target=target,
+            strategy=MatchStrategy.FUZZY,
+            confidence=confidence,
+            match_details=details,
+        )
@@ -0,0 +1,622 @@
+"""Persistent embedding storage and approximate nearest-neighbour search.
+
+`EmbeddingStore` keeps sentence embeddings keyed by a hash of the text
+that was encoded, so an entity is only ever encoded once across runs:
+
+- `keys.bin`: 16-byte BLAKE2b digests, one per row
+- `vectors.f32`: row-major float32 matrix, memory-mapped for reads
+- `meta.json`: embedding dimension and model name
+
+Rows are only ever appended, and vectors are stored L2-normalised so a
+dot product is the cosine similarity. Appends take an exclusive `fcntl`
+lock on `store.lock` and re-read the row count from the files, so
+processes sharing a store directory never number rows from a stale count.
+
+`IVFIndex` is an inverted-file index in pure NumPy: vectors are assigned
+to the nearest of ~sqrt(N) k-means centroids and a query only scans the
+`n_probe` closest lists. Below `min_train_size` vectors it searches
+exhaustively. New vectors are added to their nearest list without
+retraining until the index has grown by `retrain_factor`.
+
+`EmbeddingIndex` ties the two to entities: it maps index slots to
+`MatchCandidate`s and their store rows, and supports incremental adds
+as new entities are ingested. With a persistent store, indexed entities
+are appended to `entities.jsonl` beside it, so entities indexed by one
+process (e.g. at ingestion) are picked up by the others.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+from ..logging import get_context_logger
+from .matcher import MatchCandidate
+
+logger = get_context_logger(__name__)
+
+KEY_BYTES = 16
+
+
+def text_key(text: str) -> bytes:
+    """Stable digest identifying an embedded text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=KEY_BYTES).digest()
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalise each row (zero rows are left as zeros)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[np.newaxis, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class EmbeddingStore:
+    """Append-only embedding matrix keyed by text hash.
+
+    With `path=None` the store lives in memory only.
+
+    Usage:
+        store = EmbeddingStore(Path("/var/lib/mitds/embeddings"))
+        rows = store.get_or_encode(texts, model.encode)
+        vectors = store.vectors(rows)
+    """
+
+    def __init__(self, path: Path | str | None = None, model_name: str | None = None):
+        """Open (or create) a store.
+
+        Args:
+            path: Directory holding the store files (None = in-memory)
+            model_name: Model the vectors come from; a store written by a
+                different model is rejected
+        """
+        self.path = Path(path) if path else None
+        self.model_name = model_name
+        self.dim: int | None = None
+
+        self._rows: dict[bytes, int] = {}
+        self._count = 0
+        self._mmap: np.ndarray | None = None
+        self._memory: list[np.ndarray] = []  # vector blocks when path is None
+
+        if self.path is not None:
+            self._open()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _open(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        meta_file = self.path / "meta.json"
+        if not meta_file.exists():
+            return
+
+        meta = json.loads(meta_file.read_text())
+        if self.model_name and meta.get("model") not in (None, self.model_name):
+            raise ValueError(
+                f"Embedding store at {self.path} was built with model "
+                f"{meta.get('model')!r}, not {self.model_name!r}"
+            )
+        self.model_name = self.model_name or meta.get("model")
+        self.dim = int(meta["dim"])
+
+        keys_file = self.path / "keys.bin"
+        keys = (
+            np.fromfile(keys_file, dtype=np.uint8).reshape(-1, KEY_BYTES)
+            if keys_file.exists()
+            else np.empty((0, KEY_BYTES), dtype=np.uint8)
+        )
+        vectors_file = self.path / "vectors.f32"
+        stored = vectors_file.stat().st_size // (4 * self.dim) if vectors_file.exists() else 0
+
+        # A crash between the two appends can leave one file a row ahead
+        self._count = min(len(keys), stored)
+        self._rows = {k.tobytes(): i for i, k in enumerate(keys[: self._count])}
+        self._remap()
+
+    def refresh(self) -> None:
+        """Pick up rows appended to the store files by other processes."""
+        if self.path is None:
+            return
+        if self.dim is None:
+            self._open()
+            return
+
+        keys_file = self.path / "keys.bin"
+        vectors_file = self.path / "vectors.f32"
+        if not keys_file.exists() or not vectors_file.exists():
+            return
+        count = min(
+            keys_file.stat().st_size // KEY_BYTES,
+            vectors_file.stat().st_size // (4 * self.dim),
+        )
+        if count <= self._count:
+            return
+
+        with open(keys_file, "rb") as f:
+            f.seek(self._count * KEY_BYTES)
+            tail = f.read((count - self._count) * KEY_BYTES)
+        for i in range(count - self._count):
+            self._rows[tail[i * KEY_BYTES:(i + 1) * KEY_BYTES]] = self._count + i
+        self._count = count
+        self._remap()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the store's exclusive write lock (no-op in memory)."""
+        if self.path is None:
+            yield
+            return
+        with open(self.path / "store.lock", "ab") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _truncate_to_count(self) -> None:
+        """Drop a partial row left in either file by a crashed append."""
+        for name, row_bytes in (("keys.bin", KEY_BYTES), ("vectors.f32", 4 * self.dim)):
+            file = self.path / name
+            if file.exists() and file.stat().st_size > self._count * row_bytes:
+                os.truncate(file, self._count * row_bytes)
+
+    def _remap(self) -> None:
+        if self.path is None or not self._count:
+            self._mmap = None
+            return
+        self._mmap = np.memmap(
+            self.path / "vectors.f32",
+            dtype=np.float32,
+            mode="r",
+            shape=(self._count, self.dim),
+        )
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """All stored vectors as a (rows x dim) array."""
+        if self.dim is None:
+            return np.empty((0, 0), dtype=np.float32)
+        if self.path is None:
+            if not self._memory:
+                return np.empty((0, self.dim), dtype=np.float32)
+            if len(self._memory) > 1:
+                self._memory = [np.concatenate(self._memory)]
+            return self._memory[0]
+        return self._mmap if self._mmap is not None else np.empty((0, self.dim), np.float32)
+
+    def lookup(self, texts: Sequence[str]) -> np.ndarray:
+        """Store rows for `texts` (-1 where a text has no embedding yet)."""
+        return self.lookup_keys([text_key(t) for t in texts])
+
+    def lookup_keys(self, keys: Sequence[bytes]) -> np.ndarray:
+        """Store rows for text digests (-1 where not stored)."""
+        return np.fromiter(
+            (self._rows.get(k, -1) for k in keys),
+            dtype=np.int64,
+            count=len(keys),
+        )
+
+    def vectors(self, rows: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Normalised vectors for the given rows."""
+        return np.asarray(self.matrix[np.asarray(rows, dtype=np.int64)])
+
+    def add(self, texts: Sequence[str], vectors: np.ndarray) -> np.ndarray:
+        """Append embeddings for texts not already stored.
+
+        Returns:
+            Store row of each text
+        """
+        vectors = normalize_rows(vectors)
+        with self._locked():
+            # Rows other processes appended since our last read decide the
+            # next row number (and may already hold some of these texts)
+            self.refresh()
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                self._write_meta()
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-d vectors, got {vectors.shape[1]}")
+            return self._append(texts, vectors)
+
+    def _append(self, texts: Sequence[str], vectors: np.ndarray) -> np.ndarray:
+        """Assign rows and write new vectors; called under the lock."""
+        rows = np.empty(len(texts), dtype=np.int64)
+        new_keys: list[bytes] = []
+        new_vectors: list[np.ndarray] = []
+
+        for i, text in enumerate(texts):
+            key = text_key(text)
+            row = self._rows.get(key)
+            if row is None:
+                row = self._count + len(new_keys)
+                self._rows[key] = row
+                new_keys.append(key)
+                new_vectors.append(vectors[i])
+            rows[i] = row
+
+        if new_keys:
+            block = np.vstack(new_vectors).astype(np.float32, copy=False)
+            if self.path is None:
+                self._memory.append(block)
+            else:
+                self._truncate_to_count()
+                with open(self.path / "vectors.f32", "ab") as f:
+                    f.write(block.tobytes())
+                with open(self.path / "keys.bin", "ab") as f:
+                    f.write(b"".join(new_keys))
+            self._count += len(new_keys)
+            self._remap()
+
+        return rows
+
+    def get_or_encode(
+        self,
+        texts: Sequence[str],
+        encode: Callable[[list[str]], Any],
+    ) -> np.ndarray:
+        """Store rows for `texts`, encoding only the ones not yet stored.
+
+        Args:
+            texts: Texts to embed
+            encode: Batch encoder returning an (n x dim) array
+
+        Returns:
+            Store row of each text
+        """
+        rows = self.lookup(texts)
+        missing = np.flatnonzero(rows < 0)
+        if len(missing):
+            # Encode each distinct missing text once
+            unique = list(dict.fromkeys(texts[i] for i in missing))
+            self.add(unique, np.asarray(encode(unique)))
+            rows = self.lookup(texts)
+        return rows
+
+    def _write_meta(self) -> None:
+        if self.path is None:
+            return
+        (self.path / "meta.json").write_text(
+            json.dumps({"dim": self.dim, "model": self.model_name})
+        )
+
+    def clear(self) -> None:
+        """Drop all stored embeddings (and their files)."""
+        self._rows.clear()
+        self._count = 0
+        self._memory = []
+        self._mmap = None
+        self.dim = None
+        if self.path is not None:
+            with self._locked():
+                for name in ("keys.bin", "vectors.f32", "meta.json"):
+                    (self.path / name).unlink(missing_ok=True)
+
+
+class IVFIndex:
+    """Inverted-file approximate nearest-neighbour index over unit vectors.
+
+    Vector ids are caller-assigned integers; vectors are read through
+    `fetch(ids)` so the index holds no copy of them.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[np.ndarray], np.ndarray],
+        n_probe: int = 8,
+        min_train_size: int = 2048,
+        retrain_factor: float = 4.0,
+        kmeans_iterations: int = 10,
+        seed: int = 0,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            fetch: Returns the (normalised) vectors for an array of ids
+            n_probe: Inverted lists scanned per query
+            min_train_size: Below this size, search exhaustively
+            retrain_factor: Retrain once the index grows by this factor
+            kmeans_iterations: Lloyd iterations when training centroids
+            seed: RNG seed for centroid initialisation
+        """
+        self.fetch = fetch
+        self.n_probe = n_probe
+        self.min_train_size = min_train_size
+        self.retrain_factor = retrain_factor
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+
+        self.ids = np.empty(0, dtype=np.int64)
+        self.centroids: np.ndarray | None = None
+        self.assignments = np.empty(0, dtype=np.int32)
+        self._trained_size = 0
+        self._lists: list[np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def add(self, ids: Sequence[int] | np.ndarray, vectors: np.ndarray) -> None:
+        """Add vectors, assigning them to existing lists where trained."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(ids):
+            return
+        self.ids = np.concatenate([self.ids, ids])
+
+        if self.trained:
+            self.assignments = np.concatenate([
+                self.assignments, self._nearest_centroids(vectors)
+            ])
+            self._lists = None
+
+        size = len(self.ids)
+        if size >= self.min_train_size and (
+            not self.trained or size >= self._trained_size * self.retrain_factor
+        ):
+            self.train()
+
+    def train(self) -> None:
+        """(Re)train centroids with spherical k-means over all vectors."""
+        vectors = self.fetch(self.ids)
+        n_lists = max(1, int(np.sqrt(len(vectors))))
+        rng = np.random.default_rng(self.seed)
+        centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+
+        for _ in range(self.kmeans_iterations):
+            assignments = np.argmax(vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, vectors)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+
+        self.centroids = centroids
+        self.assignments = np.argmax(vectors @ centroids.T, axis=1).astype(np.int32)
+        self._trained_size = len(vectors)
+        self._lists = None
+        logger.debug(f"Trained IVF index: {len(vectors)} vectors, {n_lists} lists")
+
+    def _nearest_centroids(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(normalize_rows(vectors) @ self.centroids.T, axis=1).astype(np.int32)
+
+    def _inverted_lists(self) -> list[np.ndarray]:
+        if self._lists is None:
+            order = np.argsort(self.assignments, kind="stable")
+            bounds = np.searchsorted(
+                self.assignments[order], np.arange(len(self.centroids) + 1)
+            )
+            self._lists = [order[bounds[c]:bounds[c + 1]] for c in range(len(self.centroids))]
+        return self._lists
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        allowed: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Top-k ids by cosine similarity for one query vector.
+
+        Args:
+            query: Query vector
+            k: Number of ids to return
+            allowed: Only consider these ids (None = all)
+
+        Returns:
+            (ids, scores), best first
+        """
+        if not len(self.ids):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = normalize_rows(query)[0]
+        if allowed is not None:
+            # Score exactly the allowed ids: probing a few lists would miss
+            # most of a small allowed set
+            positions = np.flatnonzero(np.isin(self.ids, allowed))
+        elif self.trained:
+            probes = np.argsort(-(self.centroids @ query))[: self.n_probe]
+            lists = self._inverted_lists()
+            positions = np.concatenate([lists[c] for c in probes])
+        else:
+            positions = np.arange(len(self.ids))
+
+        if not len(positions):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        ids = self.ids[positions]
+        scores = self.fetch(ids) @ query
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return ids[top], scores[top]
+
+
+class EmbeddingIndex:
+    """ANN index of entities, backed by an EmbeddingStore.
+
+    Usage:
+        index = EmbeddingIndex(store)
+        index.add(candidates, rows)          # rows from store.get_or_encode
+        for candidate, score in index.search(query_vector, k=10):
+            ...
+    """
+
+    LOG_NAME = "entities.jsonl"
+
+    def __init__(self, store: EmbeddingStore, **ivf_options: Any):
+        """Initialize the index, loading entities logged beside the store.
+
+        Args:
+            store: Store the entity vectors live in
+            **ivf_options: Passed through to IVFIndex
+        """
+        self.store = store
+        self.candidates: list[MatchCandidate] = []
+        self._slots: dict[UUID, int] = {}
+        self._slot_rows = np.empty(0, dtype=np.int64)
+        self.ivf = IVFIndex(self._fetch, **ivf_options)
+        self._log = store.path / self.LOG_NAME if store.path is not None else None
+        self._log_offset = 0
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def __contains__(self, entity_id: UUID) -> bool:
+        return entity_id in self._slots
+
+    def _fetch(self, slots: np.ndarray) -> np.ndarray:
+        return self.store.vectors(self._slot_rows[slots])
+
+    def refresh(self) -> None:
+        """Index entities logged by other processes since the last refresh."""
+        if self._log is None or not self._log.exists():
+            return
+        if self._log.stat().st_size <= self._log_offset:
+            return
+
+        with open(self._log, "rb") as f:
+            f.seek(self._log_offset)
+            lines = f.read().splitlines(keepends=True)
+        # A partially written last line is read again next time
+        if lines and not lines[-1].endswith(b"\n"):
+            lines.pop()
+        self._log_offset += sum(len(line) for line in lines)
+
+        entries = [json.loads(line) for line in lines if line.strip()]
+        if not entries:
+            return
+        self.store.refresh()
+        rows = self.store.lookup_keys([bytes.fromhex(e["key"]) for e in entries])
+        known = rows >= 0
+        self._add(
+            [MatchCandidate(**e["candidate"]) for e, ok in zip(entries, known, strict=True) if ok],
+            rows[known],
+        )
+
+    def add(
+        self,
+        candidates: Sequence[MatchCandidate],
+        rows: np.ndarray,
+        texts: Sequence[str] | None = None,
+    ) -> None:
+        """Index entities with their store rows; re-added entities are updated.
+
+        Args:
+            candidates: Entities to index
+            rows: Store row of each entity's vector
+            texts: Embedded text of each entity; with a persistent store,
+                given entities are logged for other processes
+        """
+        self.refresh()
+        changed = self._add(candidates, rows)
+        if self._log is None or texts is None or not changed:
+            return
+
+        # Only new or changed entities are logged, so re-indexing the same
+        # candidates on every match does not grow the log
+        lines = b"".join(
+            json.dumps({
+                "key": text_key(texts[i]).hex(),
+                "candidate": candidates[i].model_dump(mode="json"),
+            }).encode("utf-8") + b"\n"
+            for i in changed
+        )
+        with open(self._log, "ab") as f:
+            f.write(lines)
+        # Own entries are already indexed; skip them on the next refresh
+        # unless another process appended in between
+        if self._log.stat().st_size == self._log_offset + len(lines):
+            self._log_offset += len(lines)
+
+    def clear(self) -> None:
+        """Delete the entity log (the in-memory index is left as is)."""
+        if self._log is not None:
+            self._log.unlink(missing_ok=True)
+        self._log_offset = 0
+
+    def _add(self, candidates: Sequence[MatchCandidate], rows: np.ndarray) -> list[int]:
+        """Index entities; returns the positions of new or changed ones."""
+        changed: list[int] = []
+        base = len(self._slot_rows)
+        appended: list[int] = []  # store rows of slots base, base + 1, ...
+        pending: dict[int, int] = {}  # slot -> store row, to add to the IVF
+        removed: list[int] = []
+
+        for i, (candidate, row) in enumerate(zip(candidates, rows, strict=True)):
+            row = int(row)
+            slot = self._slots.get(candidate.entity_id)
+            if slot is not None:
+                # Same entity re-indexed: refresh the candidate, and re-add
+                # the slot if its text (and so its vector) changed
+                old_row = appended[slot - base] if slot >= base else int(self._slot_rows[slot])
+                if self.candidates[slot] != candidate or old_row != row:
+                    changed.append(i)
+                self.candidates[slot] = candidate
+                if old_row == row:
+                    continue
+                if slot >= base:
+                    appended[slot - base] = row
+                else:
+                    self._slot_rows[slot] = row
+                    removed.append(slot)
+            else:
+                slot = len(self.candidates)
+                self._slots[candidate.entity_id] = slot
+                self.candidates.append(candidate)
+                appended.append(row)
+                changed.append(i)
+            pending[slot] = row
+
+        # One concatenation per batch, not one copy per entity
+        if appended:
+            self._slot_rows = np.concatenate([
+                self._slot_rows, np.asarray(appended, dtype=np.int64)
+            ])
+        if removed:
+            self._remove_from_ivf(removed)
+        if pending:
+            self.ivf.add(list(pending), self.store.vectors(list(pending.values())))
+        return changed
+
+    def _remove_from_ivf(self, slots: Sequence[int]) -> None:
+        keep = ~np.isin(self.ivf.ids, slots)
+        self.ivf.ids = self.ivf.ids[keep]
+        if self.ivf.trained:
+            self.ivf.assignments = self.ivf.assignments[keep]
+        self.ivf._lists = None
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        entity_ids: Iterable[UUID] | None = None,
+    ) -> list[tuple[MatchCandidate, float]]:
+        """Top-k indexed entities by cosine similarity to `query`.
+
+        Args:
+            query: Query vector
+            k: Number of entities to return
+            entity_ids: Only consider these entities (None = all)
+        """
+        self.refresh()
+        allowed = None
+        if entity_ids is not None:
+            allowed = np.fromiter(
+                (self._slots[e] for e in entity_ids if e in self._slots), dtype=np.int64
+            )
+            if not len(allowed):
+                return []
+        slots, scores = self.ivf.search(query, k, allowed)
+        return [(self.candidates[s], float(score)) for s, score in zip(slots, scores, strict=True)]
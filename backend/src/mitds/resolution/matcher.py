@@ -3,7 +3,8 @@
 Implements multiple matching strategies:
 1. Deterministic: Exact ID matching (EIN, BN)
 2. Fuzzy: Name normalization with edit distance
-3. Embedding: (Future) Semantic similarity matching
+3. Embedding: Semantic similarity matching, with a persistent
+   embedding store and ANN index (see `resolution.embeddings`)
 
 See research.md for matching strategy details.
 """
@@ -206,14 +207,16 @@ class FuzzyMatcher(BaseMatcher):
         r"\bN\.?A\.?$",
     ]
 
-    def __init__(self, min_score: int = 85):
+    def __init__(self, min_score: int = 85, limit: int | None = 10):
         """Initialize fuzzy matcher.
 
         Args:
             min_score: Minimum fuzzy match score (0-100)
+            limit: Maximum name matches considered per source (None = all)
         """
         super().__init__(MatchStrategy.FUZZY)
         self.min_score = min_score
+        self.limit = limit
 
     def find_matches(
         self,
@@ -247,7 +250,7 @@ class FuzzyMatcher(BaseMatcher):
             source_name,
             names,
             scorer=fuzz.WRatio,
-            limit=10,
+            limit=self.limit,
             score_cutoff=self.min_score,
         )
 
@@ -423,18 +426,24 @@ class EmbeddingMatcher(BaseMatcher):
         self,
         model_name: str = "all-MiniLM-L6-v2",
         batch_size: int = 32,
+        store_path: str | None = None,
     ):
         """Initialize embedding matcher.
 
         Args:
             model_name: Sentence transformer model name
             batch_size: Batch size for encoding
+            store_path: Directory of a persistent embedding store
+                (None = keep embeddings in memory for this process)
         """
+        from .embeddings import EmbeddingIndex, EmbeddingStore
+
         super().__init__(MatchStrategy.EMBEDDING)
         self.model_name = model_name
         self.batch_size = batch_size
         self._model = None
-        self._embeddings_cache: dict[str, Any] = {}
+        self.store = EmbeddingStore(store_path, model_name=model_name)
+        self.index = EmbeddingIndex(self.store)
 
     @property
     def model(self):
@@ -541,65 +550,135 @@ class EmbeddingMatcher(BaseMatcher):
 
         return " ".join(parts)
 
-    def _get_embedding(self, text: str) -> Any:
-        """Get embedding for a single text, with caching."""
-        if text in self._embeddings_cache:
-            return self._embeddings_cache[text]
+    def _encode(self, texts: list[str]) -> Any:
+        return self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+        )
 
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        self._embeddings_cache[text] = embedding
-        return embedding
+    def _get_embedding(self, text: str) -> Any:
+        """Get the normalised embedding for a single text."""
+        return self._get_embeddings_batch([text])[0]
 
     def _get_embeddings_batch(self, texts: list[str]) -> Any:
-        """Get embeddings for multiple texts."""
-        import numpy as np
-
-        # Check cache for each text
-        uncached_indices = []
-        uncached_texts = []
-
-        for i, text in enumerate(texts):
-            if text not in self._embeddings_cache:
-                uncached_indices.append(i)
-                uncached_texts.append(text)
-
-        # Encode uncached texts in batch
-        if uncached_texts:
-            new_embeddings = self.model.encode(
-                uncached_texts,
-                batch_size=self.batch_size,
-                convert_to_numpy=True,
-            )
-
-            # Update cache
-            for i, text in enumerate(uncached_texts):
-                self._embeddings_cache[text] = new_embeddings[i]
+        """Get normalised embeddings for multiple texts.
 
-        # Build result array in original order
-        result = np.array([self._embeddings_cache[text] for text in texts])
-        return result
+        Only texts missing from the embedding store are encoded.
+        """
+        rows = self.store.get_or_encode(texts, self._encode)
+        return self.store.vectors(rows)
 
     def _cosine_similarity(
         self,
         source_embedding: Any,
         candidate_embeddings: Any,
     ) -> Any:
-        """Calculate cosine similarity between source and candidates."""
+        """Calculate cosine similarity between source and candidates.
+
+        Stored embeddings are already unit length, so this is a dot product.
+        """
         import numpy as np
 
-        # Normalize embeddings
-        source_norm = source_embedding / np.linalg.norm(source_embedding)
-        candidate_norms = candidate_embeddings / np.linalg.norm(
-            candidate_embeddings, axis=1, keepdims=True
-        )
+        return np.dot(candidate_embeddings, source_embedding)
+
+    def add_candidates(self, candidates: list[MatchCandidate]) -> None:
+        """Add entities to the nearest-neighbour index.
+
+        Incremental: call again as new entities are ingested. Entities
+        already indexed are updated in place.
+        """
+        if not candidates:
+            return
+        texts = [self._build_entity_text(c) for c in candidates]
+        rows = self.store.get_or_encode(texts, self._encode)
+        self.index.add(candidates, rows, texts)
+
+    def find_nearest(
+        self,
+        source: MatchCandidate,
+        k: int = 10,
+        threshold: float = 0.7,
+        candidate_ids: set[UUID] | None = None,
+    ) -> list[MatchResult]:
+        """Find matches among indexed entities via the ANN index.
 
-        # Compute dot product (cosine similarity for normalized vectors)
-        similarities = np.dot(candidate_norms, source_norm)
-        return similarities
+        Unlike `find_matches`, candidates are not passed in: the source is
+        compared with the top-k neighbours of everything added through
+        `add_candidates`, or only of `candidate_ids` if given.
+        """
+        results = []
+        source_text = self._build_entity_text(source)
+
+        try:
+            source_embedding = self._get_embedding(source_text)
+            # One extra neighbour in case the source itself is indexed
+            neighbours = self.index.search(source_embedding, k + 1, candidate_ids)
+        except Exception as e:
+            logger.error(f"Embedding matching failed: {e}")
+            return results
+
+        for candidate, similarity in neighbours:
+            if candidate.entity_id == source.entity_id or similarity < threshold:
+                continue
+            results.append(
+                MatchResult(
+                    source=source,
+                    target=candidate,
+                    strategy=self.strategy,
+                    confidence=float(similarity) * 0.95,
+                    match_details={
+                        "similarity_score": float(similarity),
+                        "source_text": source_text[:100],
+                        "target_text": self._build_entity_text(candidate)[:100],
+                        "model": self.model_name,
+                        "ann": True,
+                    },
+                )
+            )
+
+        return sorted(results, key=lambda r: r.confidence, reverse=True)[:k]
 
     def clear_cache(self):
-        """Clear the embeddings cache."""
-        self._embeddings_cache.clear()
+        """Clear in-memory embeddings and the in-memory index.
+
+        A persistent store is left on disk (see `drop_store`), and its
+        indexed entities are reloaded.
+        """
+        from .embeddings import EmbeddingIndex
+
+        if self.store.path is None:
+            self.store.clear()
+        self.index = EmbeddingIndex(self.store)
+
+    def drop_store(self):
+        """Delete all stored embeddings and indexed entities, on disk too."""
+        from .embeddings import EmbeddingIndex
+
+        self.index.clear()
+        self.store.clear()
+        self.index = EmbeddingIndex(self.store)
+
+
+# Process-wide embedding matchers, by (model name, store path)
+_embedding_matchers: dict[tuple[str, str | None], EmbeddingMatcher] = {}
+
+
+def get_embedding_matcher(
+    model_name: str = "all-MiniLM-L6-v2",
+    store_path: str | None = None,
+) -> EmbeddingMatcher:
+    """Get the process-wide embedding matcher for a model and store.
+
+    Sharing one matcher keeps a single model, store and ANN index per
+    process, so entities indexed at ingestion are seen by every matcher.
+    """
+    key = (model_name, store_path or None)
+    matcher = _embedding_matchers.get(key)
+    if matcher is None:
+        matcher = EmbeddingMatcher(model_name=model_name, store_path=store_path)
+        _embedding_matchers[key] = matcher
+    return matcher
 
 
 class HybridMatcher:
@@ -608,7 +687,8 @@ class HybridMatcher:
     Uses a cascading approach:
     1. First tries deterministic matching (highest confidence)
     2. Falls back to fuzzy matching
-    3. Finally tries embedding matching
+    3. Finally tries embedding matching, as a top-k ANN lookup over the
+       remaining candidates in the shared embedding index
 
     Results are combined and deduplicated.
     """
@@ -618,6 +698,8 @@ class HybridMatcher:
         use_embedding: bool = True,
         fuzzy_min_score: int = 85,
         embedding_model: str = "all-MiniLM-L6-v2",
+        embedding_store_path: str | None = None,
+        embedding_top_k: int = 10,
     ):
         """Initialize hybrid matcher.
 
@@ -625,10 +707,48 @@ class HybridMatcher:
             use_embedding: Whether to use embedding matching
             fuzzy_min_score: Minimum fuzzy match score
             embedding_model: Sentence transformer model name
+            embedding_store_path: Persistent embedding store directory
+            embedding_top_k: Nearest neighbours taken from embedding matching
         """
         self.deterministic = DeterministicMatcher()
         self.fuzzy = FuzzyMatcher(min_score=fuzzy_min_score)
-        self.embedding = EmbeddingMatcher(model_name=embedding_model) if use_embedding else None
+        self.embedding = (
+            get_embedding_matcher(embedding_model, embedding_store_path)
+            if use_embedding
+            else None
+        )
+        self.embedding_top_k = embedding_top_k
+
+    def index_entities(self, candidates: list[MatchCandidate]) -> None:
+        """Add entities (e.g. newly ingested ones) to the embedding index."""
+        if not self.embedding or not candidates:
+            return
+        try:
+            self.embedding.add_candidates(candidates)
+        except Exception as e:
+            logger.warning(f"Embedding indexing failed, skipping: {e}")
+
+    def nearest_candidates(
+        self,
+        source: MatchCandidate,
+        k: int | None = None,
+        threshold: float = 0.7,
+    ) -> list[MatchCandidate]:
+        """Indexed entities semantically closest to `source`.
+
+        Used to generate candidates beyond those found by lexical or
+        attribute queries. Empty when embedding matching is off.
+        """
+        if not self.embedding:
+            return []
+        try:
+            matches = self.embedding.find_nearest(
+                source, k=k or self.embedding_top_k, threshold=threshold
+            )
+        except Exception as e:
+            logger.warning(f"Embedding candidate lookup failed, skipping: {e}")
+            return []
+        return [m.target for m in matches]
 
     def find_matches(
         self,
@@ -676,8 +796,14 @@ class HybridMatcher:
             ]
             if remaining_candidates:
                 try:
-                    embedding_results = self.embedding.find_matches(
-                        source, remaining_candidates, threshold=threshold
+                    # Index the candidates (only new texts are encoded),
+                    # then take their nearest neighbours from the ANN index
+                    self.embedding.add_candidates(remaining_candidates)
+                    embedding_results = self.embedding.find_nearest(
+                        source,
+                        k=self.embedding_top_k,
+                        threshold=threshold,
+                        candidate_ids={c.entity_id for c in remaining_candidates},
                     )
                     for result in embedding_results:
                         if result.target.entity_id not in matched_ids:
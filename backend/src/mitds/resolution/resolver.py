@@ -13,11 +13,12 @@ See research.md for resolution strategy details.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+from ..cache import invalidate_entities
 from ..db import get_db_session, get_neo4j_session
 from ..logging import get_context_logger
 from .matcher import (
@@ -28,8 +29,48 @@ from .matcher import (
     MatchStrategy,
 )
 
+if TYPE_CHECKING:
+    from .dedup import DedupConfig
+
 logger = get_context_logger(__name__)
 
+# Properties loaded for each entity considered as a match candidate
+CANDIDATE_RETURN_CLAUSE = """
+RETURN e.id as id, e.name as name, e.ein as ein, e.bn as bn,
+       e.opencorp_id as opencorp_id,
+       e.address_city as city, e.address_state as state,
+       e.address_country as country, e.address_postal as postal
+"""
+
+
+def record_to_candidate(record: dict[str, Any], entity_type: str) -> MatchCandidate:
+    """Convert a Neo4j candidate record into a MatchCandidate."""
+    identifiers = {}
+    if record.get("ein"):
+        identifiers["ein"] = record["ein"]
+    if record.get("bn"):
+        identifiers["bn"] = record["bn"]
+    if record.get("opencorp_id"):
+        identifiers["opencorp_id"] = record["opencorp_id"]
+
+    # Build address dict for location matching
+    attributes = {
+        "address": {
+            "city": record.get("city"),
+            "state": record.get("state"),
+            "country": record.get("country"),
+            "postal_code": record.get("postal"),
+        }
+    }
+
+    return MatchCandidate(
+        entity_id=UUID(record["id"]),
+        entity_type=entity_type,
+        name=record.get("name") or "",
+        identifiers=identifiers,
+        attributes=attributes,
+    )
+
 
 class ResolutionState(str, Enum):
     """State of entity resolution."""
@@ -173,86 +214,26 @@ class EntityResolver:
         self,
         entity_type: str,
         threshold: float | None = None,
+        config: "DedupConfig | None" = None,
     ) -> list[ResolutionResult]:
         """Find potential duplicate entities of a given type.
 
+        Streams every entity of the type from Neo4j and only compares
+        entities that share an identifier, name or postal blocking key
+        (see `resolution.dedup`).
+
         Args:
             entity_type: Type of entity to check (ORGANIZATION, PERSON, etc.)
             threshold: Minimum confidence threshold (default: fuzzy_threshold)
+            config: Paging, blocking and parallel scoring options
 
         Returns:
             List of potential duplicate pairs
         """
-        if threshold is None:
-            threshold = self.fuzzy_threshold
-
-        duplicates = []
-
-        async with get_neo4j_session() as session:
-            # Load entities from Neo4j
-            query = f"""
-            MATCH (e:{entity_type})
-            RETURN e.id as id, e.name as name, e.ein as ein, e.bn as bn,
-                   e.opencorp_id as opencorp_id,
-                   e.address_city as city, e.address_state as state,
-                   e.address_country as country, e.address_postal as postal
-            LIMIT 10000
-            """
-            result = await session.run(query)
-            records = await result.data()
-
-            # Convert to MatchCandidates
-            candidates = []
-            for record in records:
-                identifiers = {}
-                if record.get("ein"):
-                    identifiers["ein"] = record["ein"]
-                if record.get("bn"):
-                    identifiers["bn"] = record["bn"]
-                if record.get("opencorp_id"):
-                    identifiers["opencorp_id"] = record["opencorp_id"]
-
-                # Build address dict for location matching
-                attributes = {
-                    "address": {
-                        "city": record.get("city"),
-                        "state": record.get("state"),
-                        "country": record.get("country"),
-                        "postal_code": record.get("postal"),
-                    }
-                }
-
-                candidates.append(
-                    MatchCandidate(
-                        entity_id=UUID(record["id"]),
-                        entity_type=entity_type,
-                        name=record["name"] or "",
-                        identifiers=identifiers,
-                        attributes=attributes,
-                    )
-                )
-
-            # Find duplicates
-            checked = set()
-            for source in candidates:
-                if source.entity_id in checked:
-                    continue
-
-                # Find matches excluding already checked
-                filtered = [c for c in candidates if c.entity_id not in checked]
-                result = await self.resolve(source, filtered, auto_merge=False)
+        from .dedup import DuplicateFinder
 
-                if result.state in (
-                    ResolutionState.RESOLVED,
-                    ResolutionState.CANDIDATE,
-                ):
-                    if result.target_id:
-                        duplicates.append(result)
-                        checked.add(result.target_id)
-
-                checked.add(source.entity_id)
-
-        return duplicates
+        finder = DuplicateFinder(self, config)
+        return await finder.find_duplicates(entity_type, threshold)
 
     async def merge_entities(
         self,
@@ -349,6 +330,10 @@ class EntityResolver:
                 extra={"source_id": str(source_id), "target_id": str(target_id)},
             )
 
+        # Both sides changed: the source is retired and the target gained
+        # the source's relationships
+        await invalidate_entities([source_id, target_id])
+
         return True
 
     def _create_result(
@@ -401,45 +386,16 @@ async def resolve_entity(
     async with get_neo4j_session() as session:
         query = f"""
         MATCH (e:{entity_type})
-        RETURN e.id as id, e.name as name, e.ein as ein, e.bn as bn,
-               e.opencorp_id as opencorp_id,
-               e.address_city as city, e.address_state as state,
-               e.address_country as country, e.address_postal as postal
+        WHERE e.id IS NOT NULL
+        {CANDIDATE_RETURN_CLAUSE}
         LIMIT 10000
         """
         result = await session.run(query)
         records = await result.data()
 
-        candidates = []
-        for record in records:
-            if record.get("id"):
-                idents = {}
-                if record.get("ein"):
-                    idents["ein"] = record["ein"]
-                if record.get("bn"):
-                    idents["bn"] = record["bn"]
-                if record.get("opencorp_id"):
-                    idents["opencorp_id"] = record["opencorp_id"]
-
-                # Build address dict for location matching
-                attrs = {
-                    "address": {
-                        "city": record.get("city"),
-                        "state": record.get("state"),
-                        "country": record.get("country"),
-                        "postal_code": record.get("postal"),
-                    }
-                }
-
-                candidates.append(
-                    MatchCandidate(
-                        entity_id=UUID(record["id"]),
-                        entity_type=entity_type,
-                        name=record.get("name") or "",
-                        identifiers=idents,
-                        attributes=attrs,
-                    )
-                )
+        candidates = [
+            record_to_candidate(record, entity_type) for record in records
+        ]
 
     resolver = EntityResolver()
     return await resolver.resolve(source, candidates, auto_merge)
@@ -0,0 +1,75 @@
+"""Celery tasks for entity resolution.
+
+Registered with the worker via autodiscovery; `run_matching` backs the
+nightly `run-entity-resolution` beat schedule.
+"""
+
+from typing import Any
+
+from ..logging import get_context_logger
+from ..worker import app as celery_app
+
+logger = get_context_logger(__name__)
+
+
+@celery_app.task(name="mitds.resolution.tasks.run_matching")
+def run_matching(
+    entity_types: list[str] | None = None,
+    auto_merge_threshold: float = 0.95,
+    workers: int = 4,
+    page_size: int = 5000,
+) -> dict[str, Any]:
+    """Find duplicates across the full graph and merge or queue them.
+
+    Matches at or above `auto_merge_threshold` are merged; the rest are
+    queued for human review.
+
+    Args:
+        entity_types: Labels to resolve (default: Organization, Person, Outlet)
+        auto_merge_threshold: Confidence required for automatic merging
+        workers: Processes used for fuzzy scoring
+        page_size: Entities streamed from Neo4j per page
+
+    Returns:
+        Summary counts
+    """
+    import asyncio
+
+    from .dedup import DedupConfig
+    from .reconcile import ReconciliationQueue
+    from .resolver import EntityResolver
+
+    async def run():
+        resolver = EntityResolver(auto_merge_threshold=auto_merge_threshold)
+        config = DedupConfig(workers=workers, page_size=page_size)
+        queue = ReconciliationQueue()
+
+        summary = {"candidates_found": 0, "auto_merged": 0, "queued": 0}
+
+        for etype in entity_types or ["Organization", "Person", "Outlet"]:
+            duplicates = await resolver.find_duplicates(etype, config=config)
+            summary["candidates_found"] += len(duplicates)
+
+            for dup in duplicates:
+                if dup.confidence >= auto_merge_threshold:
+                    merged = await resolver.merge_entities(
+                        dup.source_id,
+                        dup.target_id,
+                        user_id="system:auto-resolve",
+                    )
+                    if merged:
+                        summary["auto_merged"] += 1
+                else:
+                    await queue.create_task(
+                        source_entity_id=dup.source_id,
+                        candidate_entity_id=dup.target_id,
+                        match_confidence=dup.confidence,
+                        match_strategy=dup.strategy,
+                        match_details=dup.match_details,
+                    )
+                    summary["queued"] += 1
+
+        logger.info(f"Entity resolution complete: {summary}")
+        return summary
+
+    return asyncio.run(run())
@@ -81,6 +81,12 @@ app.conf.beat_schedule = {
         "schedule": crontab(hour=8, minute=0),
         "options": {"queue": "detection"},
     },
+    # Infrastructure profile refresh (hourly, stalest profiles first)
+    "refresh-infrastructure-profiles": {
+        "task": "mitds.detection.tasks.refresh_infrastructure_profiles",
+        "schedule": crontab(minute=30),
+        "options": {"queue": "detection"},
+    },
     # Data quality metrics daily (every day at 10 AM UTC)
     "calculate-quality-metrics": {
         "task": "mitds.quality.tasks.calculate_metrics",
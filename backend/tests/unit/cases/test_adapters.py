@@ -6,9 +6,16 @@ without requiring external services.
 Run with: pytest tests/unit/cases/test_adapters.py -v
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
 from uuid import uuid4
 
+from mitds import cache, db
+from mitds.cache import InMemoryCache
+from mitds.ingestion import search as registry_search
+
 from mitds.cases.adapters.meta_ads import MetaAdAdapter
 from mitds.cases.adapters.corporation import CorporationAdapter
 from mitds.cases.adapters.url import URLAdapter
@@ -115,6 +122,165 @@ class TestCorporationAdapterUnit:
         assert "500" in result.error_message
 
 
+@pytest.fixture
+def memory_cache(monkeypatch) -> InMemoryCache:
+    backend = InMemoryCache()
+    monkeypatch.setattr(cache, "_cache", backend)
+    return backend
+
+
+class TestCorporationRegistrySearch:
+    """Unit tests for CorporationAdapter's concurrent registry search."""
+
+    def stub_searches(self, monkeypatch, adapter, delays, calls):
+        for source, delay in delays.items():
+            async def search(name, source=source, delay=delay):
+                calls.append(source)
+                if delay is None:
+                    raise RuntimeError(f"{source} unavailable")
+                await asyncio.sleep(delay)
+                return [{"name": f"{name} ({source})"}]
+
+            monkeypatch.setattr(adapter, f"_search_{source}", search)
+
+    @pytest.mark.asyncio
+    async def test_registries_are_searched_concurrently(self, monkeypatch, memory_cache):
+        adapter = CorporationAdapter()
+        calls: list[str] = []
+        self.stub_searches(
+            monkeypatch, adapter,
+            {"edgar": 0.2, "sedar": 0.2, "ised": 0.2, "cra": 0.2}, calls,
+        )
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        sources = await adapter._search_registries("Postmedia")
+
+        assert loop.time() - started < 0.6
+        assert list(sources) == ["edgar", "sedar", "ised", "cra"]
+        assert sources["cra"] == {"count": 1, "results": [{"name": "Postmedia (cra)"}]}
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failed_registries_return_partial_results(
+        self, monkeypatch, memory_cache
+    ):
+        adapter = CorporationAdapter()
+        calls: list[str] = []
+        self.stub_searches(
+            monkeypatch, adapter,
+            {"edgar": 0, "sedar": 5, "ised": None, "cra": 0}, calls,
+        )
+
+        outcome = await registry_search.federated_search(
+            "Postmedia",
+            {s: getattr(adapter, f"_search_{s}") for s in ("edgar", "sedar", "ised", "cra")},
+            timeout=0.05,
+        )
+
+        assert set(outcome.results) == {"edgar", "cra"}
+        assert "timed out" in outcome.errors["sedar"]
+        assert outcome.errors["ised"] == "ised unavailable"
+
+    @pytest.mark.asyncio
+    async def test_results_are_cached_per_normalized_name(self, monkeypatch, memory_cache):
+        adapter = CorporationAdapter()
+        calls: list[str] = []
+        self.stub_searches(
+            monkeypatch, adapter,
+            {"edgar": 0, "sedar": 0, "ised": None, "cra": 0}, calls,
+        )
+
+        first = await adapter._search_registries("Postmedia  Network")
+        second = await adapter._search_registries("postmedia network")
+
+        # Only the failed registry is searched again
+        assert sorted(calls) == ["cra", "edgar", "ised", "ised", "sedar"]
+        assert second["edgar"] == first["edgar"]
+        assert "error" in second["ised"]
+
+    @pytest.mark.asyncio
+    async def test_registry_helpers_search_registry_data(
+        self, monkeypatch, memory_cache, tmp_path
+    ):
+        """The real helpers run; only registry downloads and Neo4j are faked."""
+        async def edgar_tickers():
+            return {"0001234567": {
+                "cik": "0001234567", "name": "Postmedia Network Corp", "tickers": ["PNC"],
+            }}
+
+        async def canada_corps():
+            return [{
+                "corporation_number": "1234567", "name": "Postmedia Network Inc.",
+                "status": "Active", "corporation_type": "CBCA",
+            }]
+
+        async def cra_charities():
+            return [{
+                "BN": "123456789RR0001", "Legal Name": "Postmedia Foundation",
+                "City": "Toronto", "Province": "ON",
+            }]
+
+        class FakeResult:
+            async def data(self):
+                return [{"sedar_id": "00012345", "name": "Postmedia Network Canada Corp.",
+                         "jurisdiction": "CA"}]
+
+        class FakeNeo4jSession:
+            async def run(self, query, params):
+                assert params["index"] == "entity_text_search"
+                return FakeResult()
+
+        @asynccontextmanager
+        async def get_neo4j_session():
+            yield FakeNeo4jSession()
+
+        monkeypatch.setattr(registry_search, "_cache", {})
+        monkeypatch.setattr(registry_search, "_DISK_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(registry_search, "_get_edgar_tickers", edgar_tickers)
+        monkeypatch.setattr(registry_search, "_get_canada_corps", canada_corps)
+        monkeypatch.setattr(registry_search, "_get_cra_charities", cra_charities)
+        monkeypatch.setattr(db, "get_neo4j_session", get_neo4j_session)
+
+        sources = await CorporationAdapter()._search_registries("Postmedia")
+
+        assert sources["edgar"]["results"] == [
+            {"cik": "0001234567", "name": "Postmedia Network Corp", "ticker": "PNC"}
+        ]
+        assert sources["sedar"]["results"][0]["sedar_id"] == "00012345"
+        assert sources["ised"]["results"] == [{
+            "corporation_number": "1234567", "name": "Postmedia Network Inc.",
+            "status": "Active", "bn": None,
+        }]
+        assert sources["cra"]["results"] == [{
+            "bn": "123456789RR0001", "name": "Postmedia Foundation",
+            "city": "Toronto", "province": "ON",
+        }]
+
+
+class TestSearchAllSources:
+    """Unit tests for the unified company search."""
+
+    @pytest.mark.asyncio
+    async def test_failed_sources_do_not_drop_results(self, monkeypatch):
+        async def found(query, limit):
+            return [registry_search.CompanySearchResult(
+                source="cra", identifier="1", identifier_type="bn", name=query,
+            )]
+
+        async def broken(query, limit):
+            raise RuntimeError("download failed")
+
+        monkeypatch.setattr(
+            registry_search, "SEARCH_SOURCES", {"cra": found, "irs990": broken}
+        )
+
+        response = await registry_search.search_all_sources("Fund")
+
+        assert [r.name for r in response.results] == ["Fund"]
+        assert response.sources_searched == ["cra"]
+        assert response.sources_failed == ["irs990"]
+
+
 class TestURLAdapterUnit:
     """Unit tests for URLAdapter validation (T041)."""
 
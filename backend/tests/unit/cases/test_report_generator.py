@@ -0,0 +1,156 @@
+"""Unit tests for case report data gathering.
+
+Tests that session entities are fetched once and resolved through
+label-partitioned id lookups, that degree comes from COUNT subqueries,
+and that the report's queries run concurrently.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from mitds.cases.reports.generator import ENTITY_ID_LABELS, ReportGenerator
+
+E1, E2, C1 = (str(uuid4()) for _ in range(3))
+
+
+class FakeResult:
+    def __init__(self, rows=(), scalar=0):
+        self.rows = list(rows)
+        self._scalar = scalar
+
+    def fetchall(self):
+        return self.rows
+
+    def scalar(self):
+        return self._scalar
+
+
+class FakeSession:
+    def __init__(self, db):
+        self.db = db
+
+    async def execute(self, statement, params=None):
+        return self.db.answer(str(statement))
+
+    async def close(self):
+        pass
+
+
+class FakeDatabase:
+    """Answers the generator's PostgreSQL queries."""
+
+    def __init__(self, entity_ids, relationship_ids=()):
+        self.entity_ids = entity_ids
+        self.relationship_ids = list(relationship_ids)
+
+    def answer(self, sql):
+        if "FROM session_entities" in sql:
+            return FakeResult([
+                SimpleNamespace(entity_id=entity_id, depth=i, relevance_score=1.0)
+                for i, entity_id in enumerate(self.entity_ids)
+            ])
+        if "FROM session_relationships" in sql:
+            return FakeResult([SimpleNamespace(relationship_id=r) for r in self.relationship_ids])
+        if "FROM entity_matches" in sql:
+            return FakeResult(scalar=3)
+        return FakeResult()
+
+
+class FakeGraph:
+    """Records Cypher queries and how many were in flight at once."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.queries: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def execute(self, query, params=None):
+        self.queries.append(query)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+        if "COUNT { (e)--() } as rel_count" in query:
+            return [
+                {"id": entity_id, "name": entity_id, "entity_type": "organization",
+                 "jurisdiction": "US", "confidence": 0.9, "rel_count": 2, "source_ids": []}
+                for entity_id in params["entity_ids"]
+            ]
+        if "a.meta_ad_id" in query:
+            return [{"meta_ad_id": "ad-1", "sponsor_name": "e1"}]
+        if "us_id" in query:
+            return [{"us_id": E1, "us_name": "E1", "ca_id": C1, "ca_name": "C1",
+                     "rel_type": "FUNDED_BY", "amount": 100.0, "evidence_ids": []}]
+        if "trace_incomplete" in query:
+            return [{"id": E2, "name": "E2", "reason": "trace_incomplete"}]
+        return [{"source_id": E1, "target_id": E2, "rel_type": "OWNS"}]
+
+
+def make_generator(monkeypatch, db, graph):
+    generator = ReportGenerator()
+    generator._graph = graph
+
+    async def get_session():
+        return FakeSession(db)
+
+    monkeypatch.setattr(generator, "_get_session", get_session)
+    return generator
+
+
+class TestReportDataGathering:
+    """Tests for the concurrent data-gathering stage."""
+
+    async def test_fetches_entities_once_and_runs_queries_concurrently(self, monkeypatch):
+        graph = FakeGraph()
+        generator = make_generator(monkeypatch, FakeDatabase([E1, E2]), graph)
+
+        data = await generator._gather_report_data(uuid4(), uuid4())
+
+        assert [e["id"] for e in data.entities] == [E1, E2]
+        assert [e["depth"] for e in data.entities] == [0, 1]
+        assert data.ads[0]["meta_ad_id"] == "ad-1"
+        assert str(data.cross_border[0].us_entity_id) == E1
+        assert data.unknowns[0].entity_name == "E2"
+        assert data.relationships[0]["rel_type"] == "OWNS"
+        assert data.pending_matches == 3
+
+        entity_queries = [q for q in graph.queries if "as rel_count" in q]
+        assert len(entity_queries) == 1
+        # Ads, cross-border, unknowns and fallback relationships overlap
+        assert len(graph.queries) == 5
+        assert graph.max_active == 4
+
+    async def test_entity_queries_use_labelled_lookups(self, monkeypatch):
+        graph = FakeGraph(delay=0)
+        generator = make_generator(monkeypatch, FakeDatabase([E1], ["r1"]), graph)
+
+        await generator._gather_report_data(uuid4(), uuid4())
+
+        by_id = [q for q in graph.queries if "$entity_ids" in q]
+        assert len(by_id) == 4
+        for query in by_id:
+            assert "MATCH (e)\n" not in query and "OPTIONAL MATCH" not in query
+            for label in ENTITY_ID_LABELS:
+                assert f":{label}) WHERE" in query
+        # Session relationship ids are used, so no fallback query runs
+        assert sum("$relationship_ids" in q for q in graph.queries) == 1
+
+    async def test_empty_session_skips_entity_scoped_queries(self, monkeypatch):
+        graph = FakeGraph(delay=0)
+        generator = make_generator(monkeypatch, FakeDatabase([]), graph)
+
+        async def no_fallback(session_id):
+            return []
+
+        monkeypatch.setattr(generator, "_fetch_entities_fallback", no_fallback)
+
+        data = await generator._gather_report_data(uuid4(), uuid4())
+
+        assert data.entities == [] and data.ads == [] and data.unknowns == []
+        assert data.relationships == []
+        assert graph.queries == []
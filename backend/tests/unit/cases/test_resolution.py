@@ -318,3 +318,68 @@ class TestConfidenceCalculation:
         """Test minimum name similarity threshold."""
         # Names below this threshold shouldn't be considered matches
         assert SponsorResolver.MIN_NAME_SIMILARITY >= 0.8
+
+
+class TestCandidateRetrieval:
+    """Tests for indexed candidate retrieval."""
+
+    def test_lucene_query_matches_any_token(self):
+        """Test that longer tokens allow typos and short ones match exactly."""
+        query = SponsorResolver._lucene_query(["americans", "for", "prosperity"])
+
+        assert query == "americans~ OR for OR prosperity~"
+
+    @pytest.mark.asyncio
+    async def test_name_match_uses_fulltext_index(self):
+        """Test that candidates come from the full-text index, not a scan."""
+        mock_session = AsyncMock()
+        mock_result = AsyncMock()
+        mock_result.data.return_value = [{
+            "id": str(uuid4()),
+            "name": "Americans for Prosperity Inc.",
+            "entity_type": "organization",
+            "jurisdiction": "US",
+        }]
+        mock_session.run.return_value = mock_result
+
+        resolver = SponsorResolver(mock_session)
+        candidates = await resolver._match_by_name("Americans for Prosperity")
+
+        query, params = mock_session.run.call_args[0]
+        assert "db.index.fulltext.queryNodes" in query
+        assert params["index"] == SponsorResolver.NAME_INDEX == "entity_text_search"
+        # Non-organization hits are dropped before the candidate limit
+        assert query.index("o:Organization") < query.index("LIMIT $limit")
+        assert params["limit"] == SponsorResolver.CANDIDATE_LIMIT
+        assert "prosperity~" in params["search"]
+        assert [c.name for c in candidates] == ["Americans for Prosperity Inc."]
+
+    @pytest.mark.asyncio
+    async def test_missing_index_falls_back_to_substring_match(self):
+        """Test the substring fallback when the index does not exist."""
+        mock_result = AsyncMock()
+        mock_result.data.return_value = []
+        mock_session = AsyncMock()
+        mock_session.run.side_effect = [
+            Exception("There is no such fulltext schema index: entity_text_search"),
+            mock_result,
+            mock_result,
+        ]
+
+        resolver = SponsorResolver(mock_session)
+        await resolver._match_by_name("Northern Maple Media")
+        await resolver._match_by_name("Northern Maple Media")
+
+        queries = [call[0][0] for call in mock_session.run.call_args_list]
+        assert "queryNodes" in queries[0]
+        assert "CONTAINS $token" in queries[1] and "CONTAINS $token" in queries[2]
+        assert mock_session.run.call_args[0][1]["token"] == "northern"
+
+    @pytest.mark.asyncio
+    async def test_empty_name_skips_query(self):
+        """Test that a name with no word characters queries nothing."""
+        mock_session = AsyncMock()
+        resolver = SponsorResolver(mock_session)
+
+        assert await resolver._match_by_name("---") == []
+        assert not mock_session.run.called
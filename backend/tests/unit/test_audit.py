@@ -0,0 +1,101 @@
+"""Unit tests for the batched audit log writer.
+
+Tests that AuditWriter batches by size and interval, drops entries when
+its queue is full, flushes on close, and keeps the middleware off the
+database write path.
+"""
+
+import asyncio
+
+import pytest
+
+from mitds.api import audit as audit_module
+from mitds.api.audit import AuditAction, AuditEntry, AuditWriter
+
+
+def entry(i: int = 0) -> AuditEntry:
+    return AuditEntry(action=AuditAction.ENTITY_VIEW, resource_id=str(i))
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Capture batches instead of writing them to Postgres."""
+    written: list[list[str]] = []
+
+    async def fake_write(entries):
+        written.append([e.resource_id for e in entries])
+
+    monkeypatch.setattr(audit_module, "write_audit_entries", fake_write)
+    return written
+
+
+class TestAuditWriter:
+    """Tests for the background audit writer."""
+
+    async def test_batches_by_size(self, batches):
+        writer = AuditWriter(batch_size=3, flush_interval=10.0)
+        for i in range(7):
+            writer.submit(entry(i))
+
+        await asyncio.sleep(0.05)
+        assert batches == [["0", "1", "2"], ["3", "4", "5"]]
+        assert writer.queue_depth == 1
+
+        await writer.close()
+        assert batches[-1] == ["6"]
+        assert writer.stats() == {
+            "queue_depth": 0, "submitted": 7, "written": 7, "dropped": 0, "failed": 0,
+        }
+
+    async def test_flushes_partial_batch_after_interval(self, batches):
+        writer = AuditWriter(batch_size=100, flush_interval=0.05)
+        writer.submit(entry(1))
+        writer.submit(entry(2))
+
+        await asyncio.sleep(0.01)
+        assert batches == []
+        await asyncio.sleep(0.1)
+        assert batches == [["1", "2"]]
+        await writer.close()
+
+    async def test_drops_when_queue_full(self, batches):
+        writer = AuditWriter(max_queue_size=2, batch_size=10, flush_interval=10.0)
+
+        accepted = [writer.submit(entry(i)) for i in range(5)]
+
+        assert accepted == [True, True, False, False, False]
+        assert writer.dropped == 3
+        await writer.close()
+        assert sum(len(b) for b in batches) == 2
+
+    async def test_counts_failed_writes(self, monkeypatch):
+        async def failing_write(entries):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(audit_module, "write_audit_entries", failing_write)
+        writer = AuditWriter(batch_size=2, flush_interval=10.0)
+        for i in range(3):
+            writer.submit(entry(i))
+
+        await writer.close()
+        assert writer.failed == 3
+        assert writer.written == 0
+
+    async def test_log_audit_entry_does_not_wait_for_database(self, monkeypatch):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_write(entries):
+            started.set()
+            await release.wait()
+
+        monkeypatch.setattr(audit_module, "write_audit_entries", slow_write)
+        writer = AuditWriter(batch_size=1)
+        monkeypatch.setattr(audit_module, "_audit_writer", writer)
+
+        await asyncio.wait_for(audit_module.log_audit_entry(entry()), timeout=0.1)
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+
+        release.set()
+        await audit_module.shutdown_audit_writer()
+        assert writer.written == 1
@@ -0,0 +1,135 @@
+"""Unit tests for blocked, vectorised name matching.
+
+Tests blocking keys, BlockedNameMatcher against a brute-force scan, and
+its use by the provincial cross-reference service.
+"""
+
+import random
+from collections import namedtuple
+from uuid import uuid4
+
+from rapidfuzz import fuzz
+
+from mitds.ingestion.provincial.cross_reference import (
+    CrossReferenceConfig,
+    CrossReferenceService,
+)
+from mitds.resolution.blocking import (
+    BlockedNameMatcher,
+    char_ngrams,
+    name_tokens,
+    sorted_prefix_key,
+)
+
+WORDS = [
+    "northern", "media", "group", "maple", "leaf", "press", "digital",
+    "news", "quebec", "prairie", "broadcasting", "atlantic", "coastal",
+    "radio", "foundation", "publishing", "harbour", "capital", "signal",
+]
+
+
+def brute_force(queries, choices, cutoff):
+    """Reference implementation: linear scan with strict > comparison."""
+    results = []
+    for q in queries:
+        best, best_score = None, 0.0
+        for idx, c in enumerate(choices):
+            score = fuzz.token_sort_ratio(q, c)
+            if score > best_score:
+                best, best_score = idx, score
+        results.append((best, best_score) if best_score >= cutoff else (None, 0.0))
+    return results
+
+
+def random_names(rng, count, vocabulary=WORDS):
+    return [" ".join(rng.sample(vocabulary, rng.randint(2, 4))) for _ in range(count)]
+
+
+def random_vocabulary(rng, size):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choices(letters, k=rng.randint(4, 9))) for _ in range(size)]
+
+
+class TestBlockingKeys:
+    """Tests for blocking key functions."""
+
+    def test_tokens_drop_stopwords(self):
+        assert name_tokens("the bank of montreal") == ["bank", "montreal"]
+
+    def test_sorted_prefix_is_order_insensitive(self):
+        assert sorted_prefix_key("media northern") == sorted_prefix_key("northern media")
+
+    def test_char_ngrams(self):
+        assert char_ngrams("ab cd") == {"abc", "bcd"}
+
+
+class TestBlockedNameMatcher:
+    """Tests for BlockedNameMatcher scoring."""
+
+    def test_exhaustive_matches_brute_force(self):
+        """Small choice lists are scored exhaustively with identical results."""
+        rng = random.Random(7)
+        choices = random_names(rng, 200)
+        queries = random_names(rng, 50)
+
+        matcher = BlockedNameMatcher(choices, max_cells=1000)
+        assert matcher.exhaustive
+
+        got = matcher.best_matches(queries, score_cutoff=80)
+        expected = brute_force(queries, choices, 80)
+        assert [i for i, _ in got] == [i for i, _ in expected]
+        for (_, a), (_, b) in zip(got, expected, strict=True):
+            assert abs(a - b) < 1e-3
+
+    def test_blocked_finds_high_scoring_matches(self):
+        """With blocking enabled, every >=85 match is still found."""
+        rng = random.Random(11)
+        vocabulary = random_vocabulary(rng, 300)
+        choices = random_names(rng, 2000, vocabulary)
+        queries = [c[:-1] + "x" for c in rng.sample(choices, 40)]
+        queries += random_names(rng, 40, vocabulary)
+
+        matcher = BlockedNameMatcher(choices, max_block_size=100, max_cells=5000)
+        assert not matcher.exhaustive
+
+        got = matcher.best_matches(queries, score_cutoff=85)
+        expected = brute_force(queries, choices, 85)
+        for (gi, gs), (ei, es) in zip(got, expected, strict=True):
+            if ei is None:
+                assert gi is None
+            else:
+                assert abs(gs - es) < 1e-3
+
+    def test_no_candidates(self):
+        matcher = BlockedNameMatcher(["alpha beta"] * 10, max_block_size=2)
+        assert matcher.best_matches(["zzz"], score_cutoff=50) == [(None, 0.0)]
+
+
+Row = namedtuple("Row", ["id", "name", "bn"])
+
+
+class TestCrossReferenceBatchMatching:
+    """Tests for CrossReferenceService batch matching."""
+
+    async def test_match_batch_methods(self):
+        service = CrossReferenceService()
+        fed_ids = [uuid4(), uuid4(), uuid4()]
+        for fed_id, name in zip(fed_ids, ["Maple Leaf Press Inc.", "Northern Media Group", "Coastal Radio Ltd"], strict=True):
+            service._federal_names[service._normalize_name(name)] = (fed_id, name)
+        service._federal_bns["123456789RC0001"] = (fed_ids[2], "Coastal Radio Ltd")
+
+        rows = [
+            Row(uuid4(), "Anything", "123456789RC0001"),
+            Row(uuid4(), "Maple Leaf Press Limited", None),
+            Row(uuid4(), "Nothern Media Group", None),
+            Row(uuid4(), "Unrelated Holdings", None),
+        ]
+        config = CrossReferenceConfig()
+        results = await service._match_batch(rows, config)
+
+        assert [r.match_method for r in results] == [
+            "business_number", "exact_name", "fuzzy_name", "none",
+        ]
+        assert results[2].matched_entity_id == fed_ids[1]
+        assert results[2].match_score >= config.review_threshold
+        assert [r.provincial_id for r in results] == [r.id for r in rows]
@@ -0,0 +1,415 @@
+"""Unit tests for the cache backends and the read-through entity cache.
+
+Tests the bounded LRU, value codec, Redis tiering against a fake client,
+single-flight loading, and generation-based invalidation.
+"""
+
+import asyncio
+import fnmatch
+from types import SimpleNamespace
+
+import pytest
+
+from mitds import cache
+from mitds.cache import (
+    MSGPACK_AVAILABLE,
+    CacheCodec,
+    InMemoryCache,
+    RedisCache,
+    TieredCache,
+    cached,
+    generation_key,
+    invalidate_entities,
+    read_through,
+    relationship_key,
+)
+
+
+@pytest.fixture
+def memory_cache(monkeypatch) -> InMemoryCache:
+    backend = InMemoryCache()
+    monkeypatch.setattr(cache, "_cache", backend)
+    return backend
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the redis.asyncio client, counting round trips."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key, data):
+        self.round_trips += 1
+        self.data[key] = data
+
+    async def setex(self, key, ttl, data):
+        await self.set(key, data)
+
+    async def incr(self, key):
+        self.round_trips += 1
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    async def expire(self, key, ttl):
+        self.round_trips += 1
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+    async def scan(self, cursor, match=None, count=None):
+        self.round_trips += 1
+        return 0, [k for k in self.data if fnmatch.fnmatchcase(k, match)]
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.ops: list = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.ops.append((name, args))
+
+    async def execute(self):
+        round_trips = self.redis.round_trips
+        results = [await getattr(self.redis, name)(*args) for name, args in self.ops]
+        self.redis.round_trips = round_trips + 1
+        return results
+
+
+def make_tiered(**kwargs) -> tuple[TieredCache, FakeRedis]:
+    redis = FakeRedis()
+    tiered = TieredCache(
+        InMemoryCache(max_entries=100),
+        RedisCache(redis),
+        l2_only_prefixes=("mitds:gen:",),
+        **kwargs,
+    )
+    return tiered, redis
+
+
+class CountingLoader:
+    """Loader returning successive values and counting calls."""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.values.pop(0)
+
+
+class TestReadThrough:
+    """Tests for read_through and invalidate_entities."""
+
+    async def test_hit_after_miss(self, memory_cache):
+        loader = CountingLoader({"name": "Org A"})
+
+        first = await read_through("e1", "k", loader, "entity")
+        second = await read_through("e1", "k", loader, "entity")
+
+        assert first == second == {"name": "Org A"}
+        assert loader.calls == 1
+
+    async def test_invalidation_retires_every_view(self, memory_cache):
+        entity = CountingLoader("v1", "v2")
+        rels = CountingLoader(["r1"], ["r1", "r2"])
+        await read_through("e1", "entity:e1", entity)
+        await read_through("e1", relationship_key("e1", "both"), rels)
+
+        assert await invalidate_entities(["e1", None, "e1"]) == 1
+
+        assert await read_through("e1", "entity:e1", entity) == "v2"
+        assert await read_through("e1", relationship_key("e1", "both"), rels) == ["r1", "r2"]
+
+    async def test_other_entities_stay_cached(self, memory_cache):
+        loader = CountingLoader("v1", "v2")
+        await read_through("e2", "k2", loader)
+
+        await invalidate_entities(["e1"])
+
+        assert await read_through("e2", "k2", loader) == "v1"
+        assert loader.calls == 1
+
+    async def test_write_during_load_is_not_served_stale(self, memory_cache):
+        async def stale_loader():
+            # A write commits and invalidates while the read is in flight
+            await invalidate_entities(["e1"])
+            return "stale"
+
+        assert await read_through("e1", "k", stale_loader) == "stale"
+        assert await read_through("e1", "k", CountingLoader("fresh")) == "fresh"
+
+    async def test_concurrent_misses_share_one_load(self, memory_cache):
+        calls = 0
+
+        async def slow_loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"name": "Org A"}
+
+        results = await asyncio.gather(
+            *(read_through("e1", "k", slow_loader) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert all(r == {"name": "Org A"} for r in results)
+
+    async def test_failed_load_propagates_to_waiters(self, memory_cache):
+        async def failing_loader():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("neo4j down")
+
+        results = await asyncio.gather(
+            *(read_through("e1", "k", failing_loader) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await read_through("e1", "k", CountingLoader("ok")) == "ok"
+
+    async def test_none_is_not_cached(self, memory_cache):
+        loader = CountingLoader(None, "found")
+
+        assert await read_through("e1", "k", loader) is None
+        assert await read_through("e1", "k", loader) == "found"
+
+    async def test_invalidation_swallows_backend_errors(self, monkeypatch):
+        class BrokenCache(InMemoryCache):
+            async def incr(self, key, ttl=None):
+                raise ConnectionError("down")
+
+        monkeypatch.setattr(cache, "_cache", BrokenCache())
+        assert await invalidate_entities(["e1"]) == 0
+
+
+class TestCachedDecorator:
+    """Tests for the cached decorator."""
+
+    async def test_coalesces_concurrent_misses(self, memory_cache):
+        calls = 0
+
+        @cached(lambda name: f"mitds:test:{name}")
+        async def lookup(name):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"name": name}
+
+        await asyncio.gather(*(lookup("a") for _ in range(5)))
+        assert await lookup("a") == {"name": "a"}
+        assert calls == 1
+
+
+class TestInMemoryCache:
+    """Tests for the bounded in-memory LRU."""
+
+    async def test_evicts_least_recently_used(self):
+        backend = InMemoryCache(max_entries=2)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.get("a")
+        await backend.set("c", 3)
+
+        assert await backend.mget(["a", "b", "c"]) == [1, None, 3]
+        assert backend.stats.evictions == 1
+
+    async def test_byte_bound(self):
+        backend = InMemoryCache(max_bytes=30)
+        await backend.set("a", "x" * 10)
+        await backend.set("b", "y" * 10)
+        assert len(backend) == 2
+        await backend.set("c", "z" * 10)
+
+        assert len(backend) == 2
+        assert backend.size_bytes <= 30
+        assert await backend.get("a") is None
+
+    async def test_expired_entries_are_reclaimed(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("time.time", lambda: clock[0])
+        backend = InMemoryCache()
+        await backend.set("short", 1, ttl=5)
+        await backend.set("long", 2, ttl=60)
+
+        clock[0] += 10
+        await backend.set("new", 3)
+
+        assert len(backend) == 2
+        assert backend.stats.expirations == 1
+        assert await backend.get("long") == 2
+
+    async def test_metrics(self):
+        backend = InMemoryCache()
+        await backend.set("a", 1)
+        await backend.get("a")
+        await backend.get("missing")
+
+        metrics = backend.metrics()
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["sets"] == 1
+
+    async def test_incr_restarts_after_expiry(self, monkeypatch):
+        backend = InMemoryCache()
+        clock = [1000.0]
+        monkeypatch.setattr("time.time", lambda: clock[0])
+
+        assert await backend.incr(generation_key("e1"), ttl=10) == 1
+        assert await backend.incr(generation_key("e1"), ttl=10) == 2
+        clock[0] += 11
+        assert await backend.get(generation_key("e1")) is None
+        assert await backend.incr(generation_key("e1"), ttl=10) == 1
+
+
+class TestCacheCodec:
+    """Tests for cache value encoding."""
+
+    def test_plain_json_is_unprefixed(self):
+        codec = CacheCodec()
+        assert codec.encode({"a": 1}) == b'{"a":1}'
+        # Values written before the codec existed still decode
+        assert codec.decode(b'{"a": 1}') == {"a": 1}
+        assert codec.decode(b"3") == 3
+
+    def test_large_values_are_compressed(self):
+        codec = CacheCodec(compress_min_bytes=100)
+        value = {"names": ["Northern Maple Media"] * 100}
+
+        data = codec.encode(value)
+        assert data[:1] == b"\x00"
+        assert len(data) < len(CacheCodec().encode(value))
+        assert CacheCodec().decode(data) == value
+
+    @pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_round_trip(self):
+        codec = CacheCodec(serializer="msgpack", compress_min_bytes=64)
+        value = {"gen": 2, "value": [{"id": "e1", "amount": 1.5}] * 10}
+        assert CacheCodec().decode(codec.encode(value)) == value
+
+    def test_msgpack_falls_back_to_json(self, monkeypatch):
+        monkeypatch.setattr(cache, "MSGPACK_AVAILABLE", False)
+        assert CacheCodec(serializer="msgpack").serializer == "json"
+
+
+class TestTieredCache:
+    """Tests for the local LRU in front of Redis."""
+
+    async def test_l1_serves_repeat_reads(self):
+        tiered, redis = make_tiered()
+        await tiered.set("mitds:entity:e1", {"name": "Org A"}, ttl=300)
+        redis.round_trips = 0
+
+        assert await tiered.get("mitds:entity:e1") == {"name": "Org A"}
+        assert redis.round_trips == 0
+
+    async def test_l2_hits_fill_l1(self):
+        tiered, redis = make_tiered()
+        await RedisCache(redis).set("mitds:entity:e1", {"name": "Org A"})
+
+        assert await tiered.get("mitds:entity:e1") == {"name": "Org A"}
+        redis.round_trips = 0
+        assert await tiered.get("mitds:entity:e1") == {"name": "Org A"}
+        assert redis.round_trips == 0
+
+    async def test_generation_keys_bypass_l1(self):
+        tiered, redis = make_tiered()
+        await tiered.incr(generation_key("e1"))
+        assert await tiered.get(generation_key("e1")) == 1
+
+        # Another process bumps the counter directly in Redis
+        await redis.incr(generation_key("e1"))
+        assert await tiered.get(generation_key("e1")) == 2
+        assert generation_key("e1") not in tiered.l1._cache
+
+    async def test_read_through_uses_one_round_trip(self, monkeypatch):
+        tiered, redis = make_tiered()
+        monkeypatch.setattr(cache, "_cache", tiered)
+        await read_through("e1", "mitds:entity:e1", CountingLoader({"name": "Org A"}))
+
+        redis.round_trips = 0
+        assert await read_through("e1", "mitds:entity:e1", CountingLoader()) == {"name": "Org A"}
+        assert redis.round_trips == 1
+
+        await invalidate_entities(["e1"])
+        loader = CountingLoader({"name": "Org A2"})
+        assert await read_through("e1", "mitds:entity:e1", loader) == {"name": "Org A2"}
+
+    async def test_mset_and_mget(self):
+        tiered, redis = make_tiered()
+        await tiered.mset({"a": 1, "b": 2}, ttl=60)
+
+        assert set(redis.data) == {"a", "b"}
+        tiered.l1._cache.clear()
+        redis.round_trips = 0
+        assert await tiered.mget(["a", "missing", "b"]) == [1, None, 2]
+        assert redis.round_trips == 1
+
+    async def test_metrics(self):
+        tiered, _ = make_tiered()
+        await tiered.set("a", 1)
+        await tiered.get("a")
+        await tiered.get("missing")
+
+        metrics = tiered.metrics()
+        assert metrics["l1"]["hits"] == 1
+        assert metrics["l1"]["entries"] == 1
+        assert metrics["l2"]["misses"] == 1
+
+
+class TestGetCache:
+    """Tests for the process-wide cache instance."""
+
+    def test_redis_client_is_bound_per_event_loop(self, monkeypatch):
+        import redis.asyncio
+
+        clients = []
+
+        class PingingRedis(FakeRedis):
+            async def ping(self):
+                return True
+
+        def from_url(url):
+            clients.append(PingingRedis())
+            return clients[-1]
+
+        monkeypatch.setattr(redis.asyncio, "from_url", from_url)
+        monkeypatch.setattr(cache, "get_settings", lambda: SimpleNamespace(
+            is_production=False,
+            redis_url="redis://localhost",
+            cache_l1_max_entries=0,
+            cache_l1_max_bytes=0,
+            cache_serializer="json",
+            cache_compress_min_bytes=0,
+        ))
+        monkeypatch.setattr(cache, "_cache", None)
+        monkeypatch.setattr(cache, "_cache_loop", None)
+
+        async def task():
+            backend = await cache.get_cache()
+            assert await cache.get_cache() is backend
+            return backend._redis
+
+        # Each Celery task runs its own event loop
+        first = asyncio.run(task())
+        second = asyncio.run(task())
+
+        assert first is not second
+        assert clients == [first, second]
@@ -0,0 +1,166 @@
+"""Unit tests for sparse co-funding detection.
+
+Tests shared-funder pair counting, amount overlap and block boundaries
+of the recipient x funder matrix, and FundingClusterDetector's edge
+list path against a fake Neo4j session.
+"""
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+from mitds.detection import cofunding, funding
+from mitds.detection.cofunding import CoFundingMatrix, FundingEdge
+from mitds.detection.funding import FundingClusterDetector
+
+
+def edges(*triples, year=2023):
+    return [FundingEdge(r, f, amount, year) for r, f, amount in triples]
+
+
+class TestCoFundingMatrix:
+    """Tests for the recipient x funder matrix."""
+
+    def test_counts_shared_funders_per_pair(self):
+        matrix = CoFundingMatrix(edges(
+            ("a", "f1", 100), ("a", "f2", 100), ("a", "f3", 100),
+            ("b", "f1", 50), ("b", "f2", 50),
+            ("c", "f3", 10),
+        ))
+
+        pairs = matrix.shared_funder_pairs(min_shared=1)
+
+        assert [(p.recipient_id, p.other_id, p.shared_count) for p in pairs] == [
+            ("a", "b", 2),
+            ("a", "c", 1),
+        ]
+        assert matrix.shared_funder_pairs(min_shared=2)[0].other_id == "b"
+        assert sorted(matrix.shared_funders("a", "b")) == ["f1", "f2"]
+
+    def test_repeat_grants_count_once_but_sum_amounts(self):
+        matrix = CoFundingMatrix([
+            FundingEdge("a", "f1", 100, 2022),
+            FundingEdge("a", "f1", 150, 2023),
+            FundingEdge("b", "f1", 10, 2023),
+        ])
+
+        (pair,) = matrix.shared_funder_pairs()
+
+        assert pair.shared_count == 1
+        assert matrix.total_funding("a") == 250
+        assert matrix.fiscal_years("a") == {2022, 2023}
+
+    def test_overlap_is_amount_weighted(self):
+        matrix = CoFundingMatrix(edges(
+            ("a", "f1", 100), ("a", "f2", 100),
+            ("b", "f1", 100), ("b", "f2", 100),
+            ("c", "f1", 1), ("c", "f2", 1000),
+        ))
+
+        overlaps = {
+            (p.recipient_id, p.other_id): p.overlap
+            for p in matrix.shared_funder_pairs(min_shared=2)
+        }
+
+        assert overlaps[("a", "b")] == pytest.approx(1.0)
+        assert overlaps[("a", "c")] < 0.75
+        # Equal counts are ordered by overlap
+        assert next(iter(overlaps)) == ("a", "b")
+
+    def test_unknown_amounts_have_zero_overlap(self):
+        matrix = CoFundingMatrix(edges(("a", "f1", 0), ("b", "f1", None)))
+
+        (pair,) = matrix.shared_funder_pairs()
+
+        assert pair.overlap == 0.0
+
+    def test_pairs_span_row_blocks(self, monkeypatch):
+        monkeypatch.setattr(cofunding, "PAIR_BLOCK_ROWS", 2)
+        matrix = CoFundingMatrix(edges(*[(f"r{i}", "f", 1) for i in range(5)]))
+
+        pairs = matrix.shared_funder_pairs()
+
+        assert len(pairs) == 10
+        assert len({(p.recipient_id, p.other_id) for p in pairs}) == 10
+        assert len(matrix.shared_funder_pairs(limit=3)) == 3
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def data(self):
+        return self.rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+class FakeSession:
+    """Answers the edge list query, then node lookups by label."""
+
+    def __init__(self, edge_rows, nodes):
+        self.edge_rows = edge_rows
+        self.nodes = nodes
+        self.calls: list[tuple[str, dict]] = []
+
+    async def run(self, query, **params):
+        self.calls.append((query, params))
+        if "FUNDED_BY" in query:
+            return FakeResult(self.edge_rows)
+        label = query.split("(n:")[1].split(")")[0]
+        return FakeResult([
+            {"n": node} for node in self.nodes
+            if node["label"] == label and node["id"] in params["ids"]
+        ])
+
+
+class TestFundingClusterDetector:
+    """Tests for detect_clusters over the edge list."""
+
+    async def test_clusters_from_edge_list(self, monkeypatch):
+        ids = {name: str(uuid4()) for name in ("a", "b", "c", "f1", "f2")}
+        nodes = [
+            {"id": ids["a"], "name": "Outlet A", "entity_type": "OUTLET", "label": "Outlet"},
+            {"id": ids["b"], "name": "Outlet B", "entity_type": "OUTLET", "label": "Outlet"},
+            {"id": ids["c"], "name": "Outlet C", "entity_type": "OUTLET", "label": "Outlet"},
+            {"id": ids["f1"], "name": "Fund 1", "entity_type": "ORGANIZATION", "label": "Organization"},
+            {"id": ids["f2"], "name": "Fund 2", "entity_type": "ORGANIZATION", "label": "Organization"},
+        ]
+        rows = [
+            {"recipient_id": ids[r], "funder_id": ids[f], "amount": amount, "fiscal_year": 2023}
+            for r, f, amount in [
+                ("a", "f1", 100), ("a", "f2", 200),
+                ("b", "f1", 300), ("b", "f2", 400),
+                ("c", "f1", 500),
+            ]
+        ]
+        session = FakeSession(rows, nodes)
+
+        @asynccontextmanager
+        async def get_neo4j_session():
+            yield session
+
+        monkeypatch.setattr(funding, "get_neo4j_session", get_neo4j_session)
+
+        clusters = await FundingClusterDetector(min_shared_funders=2).detect_clusters(
+            entity_type="Outlet", fiscal_year=2023
+        )
+
+        edge_query, edge_params = session.calls[0]
+        assert "MATCH (recipient:Outlet)-[r:FUNDED_BY]->(funder)" in edge_query
+        assert "r.fiscal_year = $fiscal_year" in edge_query
+        assert edge_params["fiscal_year"] == 2023
+
+        (cluster,) = clusters
+        assert {m.name for m in cluster.members} == {"Outlet A", "Outlet B"}
+        assert cluster.shared_funder.name in {"Fund 1", "Fund 2"}
+        assert cluster.total_funding == 1000
+        assert cluster.funding_by_member == {ids["a"]: 300, ids["b"]: 700}
+        assert cluster.fiscal_years == [2023]
+        assert cluster.score > 0
@@ -0,0 +1,205 @@
+"""Unit tests for blocked duplicate detection.
+
+Tests DuplicateFinder against the original all-pairs greedy resolution,
+keyset paging from Neo4j, and the process-pool scoring path.
+"""
+
+import random
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from mitds.resolution import dedup as dedup_module
+from mitds.resolution.dedup import DedupConfig, DuplicateFinder
+from mitds.resolution.matcher import MatchCandidate
+from mitds.resolution.resolver import EntityResolver, ResolutionState
+
+WORDS = [
+    "northern", "media", "group", "maple", "leaf", "press", "digital",
+    "news", "quebec", "prairie", "broadcasting", "atlantic", "coastal",
+]
+SUFFIXES = ["", " Inc", " Ltd", " Corporation", " Foundation"]
+POSTALS = ["M5V 2T6", "M5V 1A1", "H2X 3Y7", "10001", None]
+
+
+def make_candidates(rng: random.Random, count: int) -> list[MatchCandidate]:
+    """Synthetic organisations with near-duplicate names and shared ids."""
+    bases = [" ".join(rng.sample(WORDS, rng.randint(2, 3))) for _ in range(count // 3)]
+    candidates = []
+    for i in range(count):
+        name = rng.choice(bases).title() + rng.choice(SUFFIXES)
+        identifiers = {}
+        if rng.random() < 0.15:
+            identifiers["ein"] = f"12-345{rng.randint(0, 5):04d}"
+        candidates.append(
+            MatchCandidate(
+                entity_id=UUID(int=i + 1),
+                entity_type="Organization",
+                name=name,
+                identifiers=identifiers,
+                attributes={"address": {"postal_code": rng.choice(POSTALS)}},
+            )
+        )
+    return candidates
+
+
+async def all_pairs_duplicates(resolver, candidates):
+    """Reference implementation: the original quadratic greedy loop."""
+    duplicates = []
+    checked = set()
+    for source in candidates:
+        if source.entity_id in checked:
+            continue
+        filtered = [c for c in candidates if c.entity_id not in checked]
+        result = await resolver.resolve(source, filtered, auto_merge=False)
+        resolved = result.state in (ResolutionState.RESOLVED, ResolutionState.CANDIDATE)
+        if resolved and result.target_id:
+            duplicates.append(result)
+            checked.add(result.target_id)
+        checked.add(source.entity_id)
+    return duplicates
+
+
+def pair_summary(results):
+    return [
+        (r.source_id, r.target_id, r.state, round(r.confidence, 6), r.strategy)
+        for r in results
+    ]
+
+
+class TestDuplicateFinder:
+    """Tests for blocked duplicate detection."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    async def test_matches_all_pairs_resolution(self, seed):
+        """Blocking finds the same pairs as the all-pairs greedy loop."""
+        candidates = make_candidates(random.Random(seed), 150)
+        resolver = EntityResolver()
+
+        finder = DuplicateFinder(resolver)
+        finder.add_candidates(candidates)
+        blocked = await finder.find_pairs()
+
+        expected = await all_pairs_duplicates(resolver, candidates)
+        assert pair_summary(blocked) == pair_summary(expected)
+        assert any(r.state == ResolutionState.RESOLVED for r in blocked)
+        assert any(r.state == ResolutionState.CANDIDATE for r in blocked)
+
+    async def test_identifier_match_wins(self):
+        """Entities sharing an EIN pair deterministically despite names."""
+        candidates = [
+            MatchCandidate(
+                entity_id=UUID(int=1), entity_type="Organization",
+                name="Alpha Media", identifiers={"ein": "12-3456789"},
+            ),
+            MatchCandidate(
+                entity_id=UUID(int=2), entity_type="Organization",
+                name="Completely Different", identifiers={"ein": "123456789"},
+            ),
+        ]
+        finder = DuplicateFinder(EntityResolver())
+        finder.add_candidates(candidates)
+        [result] = await finder.find_pairs()
+
+        assert result.state == ResolutionState.RESOLVED
+        assert result.confidence == 1.0
+        assert result.match_details["matched_identifier"] == "ein"
+
+    async def test_oversized_blocks_are_skipped(self):
+        """Generic name tokens don't produce candidate pairs by themselves."""
+        candidates = [
+            MatchCandidate(
+                entity_id=UUID(int=i + 1), entity_type="Organization",
+                name=f"Media {chr(65 + i % 26)}{i}",
+            )
+            for i in range(30)
+        ]
+        finder = DuplicateFinder(EntityResolver(), DedupConfig(max_block_size=10))
+        finder.add_candidates(candidates)
+
+        assert finder._name_neighbours(0) == []
+
+    async def test_postal_blocks_scope_common_tokens(self):
+        """A common token still blocks within the same postal prefix."""
+        def org(i, name, postal):
+            return MatchCandidate(
+                entity_id=UUID(int=i), entity_type="Organization", name=name,
+                attributes={"address": {"postal_code": postal}},
+            )
+
+        candidates = [org(i, f"Media {i:03d}", "H2X 1Z1") for i in range(1, 20)]
+        candidates.append(org(50, "Media Co-op", "M5V 2T6"))
+        candidates.append(org(51, "Media Coop", "M5V 3L9"))
+
+        finder = DuplicateFinder(EntityResolver(), DedupConfig(max_block_size=10))
+        finder.add_candidates(candidates)
+
+        assert finder._name_neighbours(len(candidates) - 2) == [len(candidates) - 1]
+
+    async def test_process_pool_scoring(self):
+        """Parallel scoring returns the same pairs as in-process scoring."""
+        candidates = make_candidates(random.Random(7), 120)
+
+        serial = DuplicateFinder(EntityResolver())
+        serial.add_candidates(candidates)
+        expected = await serial.find_pairs()
+
+        parallel = DuplicateFinder(EntityResolver(), DedupConfig(workers=2, chunk_size=25))
+        parallel.add_candidates(candidates)
+        assert len(list(parallel._scoring_chunks())) > 1
+        result = await parallel.find_pairs()
+
+        assert pair_summary(result) == pair_summary(expected)
+
+    async def test_daemon_process_scores_in_process(self, monkeypatch):
+        """Celery prefork workers are daemonic and cannot start a pool."""
+
+        class NoPool:
+            def __init__(self, *args, **kwargs):
+                raise AssertionError("daemonic processes have no children")
+
+        monkeypatch.setattr(dedup_module, "ProcessPoolExecutor", NoPool)
+        monkeypatch.setattr(
+            dedup_module.multiprocessing, "current_process",
+            lambda: SimpleNamespace(daemon=True),
+        )
+        candidates = make_candidates(random.Random(7), 120)
+        finder = DuplicateFinder(EntityResolver(), DedupConfig(workers=2, chunk_size=25))
+        finder.add_candidates(candidates)
+
+        serial = DuplicateFinder(EntityResolver())
+        serial.add_candidates(candidates)
+
+        assert pair_summary(await finder.find_pairs()) == pair_summary(await serial.find_pairs())
+
+    async def test_streams_pages_with_keyset_pagination(self, monkeypatch):
+        """Entities are fetched page by page, past the old 10k cap."""
+        ids = [str(UUID(int=i + 1)) for i in range(12_500)]
+        calls = []
+
+        class FakeResult:
+            def __init__(self, rows):
+                self.rows = rows
+
+            async def data(self):
+                return self.rows
+
+        class FakeSession:
+            async def run(self, query, after, limit):
+                calls.append(after)
+                rows = [i for i in ids if i > after][:limit]
+                return FakeResult([{"id": i, "name": f"Org {i[-6:]}"} for i in rows])
+
+        @asynccontextmanager
+        async def fake_neo4j_session():
+            yield FakeSession()
+
+        monkeypatch.setattr(dedup_module, "get_neo4j_session", fake_neo4j_session)
+
+        finder = DuplicateFinder(EntityResolver(), DedupConfig(page_size=5000))
+        pages = [len(page) async for page in finder.iter_candidate_pages("Organization")]
+
+        assert pages == [5000, 5000, 2500]
+        assert calls == ["", ids[4999], ids[9999]]
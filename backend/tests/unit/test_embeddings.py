@@ -0,0 +1,269 @@
+"""Unit tests for the embedding store and ANN index.
+
+Tests persistence of EmbeddingStore, IVFIndex recall against exact
+search, the shared entity log, and EmbeddingMatcher and HybridMatcher
+with a deterministic stand-in model.
+"""
+
+import hashlib
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from mitds.resolution import matcher as matcher_module
+from mitds.resolution.embeddings import EmbeddingIndex, EmbeddingStore, IVFIndex, normalize_rows
+from mitds.resolution.matcher import EmbeddingMatcher, HybridMatcher, MatchCandidate
+
+DIM = 32
+
+
+class HashingModel:
+    """Bag-of-words hashing encoder standing in for a sentence transformer."""
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        if isinstance(texts, str):
+            texts = [texts]
+        self.encoded.extend(texts)
+        vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().split():
+                h = int(hashlib.md5(word.encode()).hexdigest(), 16)
+                vectors[i, h % DIM] += 1.0 if (h >> 8) % 2 else -1.0
+        return vectors
+
+
+def org(i: int, name: str) -> MatchCandidate:
+    return MatchCandidate(entity_id=UUID(int=i), entity_type="ORGANIZATION", name=name)
+
+
+class TestEmbeddingStore:
+    """Tests for the persistent embedding store."""
+
+    def test_persists_across_reopen(self, tmp_path):
+        model = HashingModel()
+        store = EmbeddingStore(tmp_path, model_name="hash")
+        rows = store.get_or_encode(["alpha media", "beta news", "alpha media"], model.encode)
+
+        assert rows.tolist() == [0, 1, 0]
+        assert model.encoded == ["alpha media", "beta news"]
+
+        reopened = EmbeddingStore(tmp_path, model_name="hash")
+        assert len(reopened) == 2
+        assert reopened.lookup(["beta news", "gamma"]).tolist() == [1, -1]
+        np.testing.assert_allclose(reopened.vectors([0, 1]), store.vectors([0, 1]))
+
+        rows = reopened.get_or_encode(["beta news", "gamma"], model.encode)
+        assert rows.tolist() == [1, 2]
+        assert model.encoded[-1] == "gamma"
+
+    def test_rejects_other_model(self, tmp_path):
+        store = EmbeddingStore(tmp_path, model_name="hash")
+        store.add(["x"], np.ones((1, DIM)))
+        with pytest.raises(ValueError):
+            EmbeddingStore(tmp_path, model_name="other")
+
+    def test_writers_sharing_a_directory_keep_rows_aligned(self, tmp_path):
+        model = HashingModel()
+        first = EmbeddingStore(tmp_path, model_name="hash")
+        second = EmbeddingStore(tmp_path, model_name="hash")
+        first.get_or_encode(["alpha media"], model.encode)
+        # `second` still counts zero rows; its append must not reuse row 0
+        second.get_or_encode(["beta news", "alpha media"], model.encode)
+
+        reopened = EmbeddingStore(tmp_path, model_name="hash")
+        rows = reopened.lookup(["alpha media", "beta news"])
+        assert rows.tolist() == [0, 1]
+        np.testing.assert_allclose(
+            reopened.vectors(rows), normalize_rows(model.encode(["alpha media", "beta news"]))
+        )
+
+    def test_vectors_are_unit_length(self):
+        store = EmbeddingStore()
+        store.add(["a", "b"], np.array([[3.0, 4.0], [0.0, 2.0]]))
+        np.testing.assert_allclose(np.linalg.norm(store.matrix, axis=1), [1.0, 1.0])
+
+
+class TestIVFIndex:
+    """Tests for the inverted-file index."""
+
+    def test_recall_against_exact_search(self):
+        rng = np.random.default_rng(0)
+        centers = normalize_rows(rng.normal(size=(40, DIM)))
+        vectors = normalize_rows(
+            centers[rng.integers(0, 40, 4000)] + 0.15 * rng.normal(size=(4000, DIM))
+        )
+
+        index = IVFIndex(lambda ids: vectors[ids], n_probe=8, min_train_size=1000)
+        index.add(np.arange(2000), vectors[:2000])
+        assert index.trained
+        # Incremental add without retraining
+        index.add(np.arange(2000, 4000), vectors[2000:])
+        assert len(index) == 4000
+
+        hits = 0
+        for q in rng.integers(0, 4000, 50):
+            exact = np.argsort(-(vectors @ vectors[q]))[:10]
+            ids, _ = index.search(vectors[q], k=10)
+            hits += len(set(ids.tolist()) & set(exact.tolist()))
+        assert hits / 500 >= 0.9
+
+    def test_exhaustive_before_training(self):
+        vectors = normalize_rows(np.eye(4, dtype=np.float32))
+        index = IVFIndex(lambda ids: vectors[ids], min_train_size=100)
+        index.add([0, 1, 2, 3], vectors)
+
+        ids, scores = index.search(vectors[2], k=2)
+        assert not index.trained
+        assert ids[0] == 2
+        assert scores[0] == 1.0
+
+
+    def test_allowed_ids_are_scored_exhaustively(self):
+        rng = np.random.default_rng(1)
+        vectors = normalize_rows(rng.normal(size=(3000, DIM)))
+        index = IVFIndex(lambda ids: vectors[ids], n_probe=1, min_train_size=1000)
+        index.add(np.arange(3000), vectors)
+        allowed = rng.choice(3000, 20, replace=False)
+
+        ids, _ = index.search(vectors[0], k=10, allowed=allowed)
+
+        exact = allowed[np.argsort(-(vectors[allowed] @ vectors[0]))[:10]]
+        assert index.trained
+        assert ids.tolist() == exact.tolist()
+
+
+class TestEmbeddingMatcher:
+    """Tests for EmbeddingMatcher with a store and ANN index."""
+
+    def make_matcher(self, **kwargs) -> EmbeddingMatcher:
+        matcher = EmbeddingMatcher(model_name="hash", **kwargs)
+        matcher._model = HashingModel()
+        return matcher
+
+    def test_find_nearest_uses_index(self):
+        matcher = self.make_matcher()
+        matcher.add_candidates([
+            org(1, "Northern Maple Media"),
+            org(2, "Atlantic Coastal Radio"),
+            org(3, "Prairie Digital Press"),
+        ])
+        matcher.add_candidates([org(4, "Maple Northern Media Group")])
+
+        matches = matcher.find_nearest(org(10, "Northern Maple Media"), k=2, threshold=0.5)
+
+        assert matches[0].target.entity_id == UUID(int=1)
+        assert matches[0].match_details["similarity_score"] > 0.99
+        assert {m.target.entity_id for m in matches} <= {UUID(int=1), UUID(int=4)}
+
+    def test_reindexing_in_bulk_updates_changed_entities(self):
+        matcher = self.make_matcher()
+        matcher.add_candidates([org(i, f"Outlet {i}") for i in range(50)])
+        matcher.add_candidates([org(3, "Northern Maple Media"), org(3, "Northern Maple Media")])
+
+        assert len(matcher.index.ivf) == 50
+        matches = matcher.find_nearest(org(99, "Northern Maple Media"), k=1, threshold=0.9)
+        assert [m.target.entity_id for m in matches] == [UUID(int=3)]
+
+    def test_find_nearest_skips_self(self):
+        matcher = self.make_matcher()
+        matcher.add_candidates([org(1, "Northern Maple Media"), org(2, "Northern Maple")])
+
+        matches = matcher.find_nearest(org(1, "Northern Maple Media"), k=5, threshold=0.0)
+        assert UUID(int=1) not in {m.target.entity_id for m in matches}
+
+    def test_find_matches_reuses_stored_embeddings(self, tmp_path):
+        matcher = self.make_matcher(store_path=str(tmp_path))
+        candidates = [org(1, "Northern Maple Media"), org(2, "Atlantic Coastal Radio")]
+        first = matcher.find_matches(org(10, "Northern Maple Media"), candidates, threshold=0.9)
+
+        restarted = self.make_matcher(store_path=str(tmp_path))
+        second = restarted.find_matches(org(10, "Northern Maple Media"), candidates, threshold=0.9)
+
+        assert [m.target.entity_id for m in first] == [UUID(int=1)]
+        assert [m.confidence for m in second] == [m.confidence for m in first]
+        assert restarted._model.encoded == []
+
+    def test_find_nearest_restricted_to_candidate_ids(self):
+        matcher = self.make_matcher()
+        matcher.add_candidates([
+            org(1, "Northern Maple Media"),
+            org(2, "Northern Maple Radio"),
+            org(3, "Atlantic Coastal Radio"),
+        ])
+
+        matches = matcher.find_nearest(
+            org(10, "Northern Maple Media"), k=5, threshold=0.0,
+            candidate_ids={UUID(int=2), UUID(int=3), UUID(int=99)},
+        )
+
+        assert matches[0].target.entity_id == UUID(int=2)
+        assert UUID(int=1) not in {m.target.entity_id for m in matches}
+        assert matcher.find_nearest(org(10, "x"), candidate_ids={UUID(int=99)}) == []
+
+    def test_indexed_entities_are_shared_through_the_store(self, tmp_path):
+        matcher = self.make_matcher(store_path=str(tmp_path))
+        other = self.make_matcher(store_path=str(tmp_path))
+        matcher.add_candidates([org(1, "Northern Maple Media")])
+        matcher.add_candidates([org(1, "Northern Maple Media")])
+
+        log = tmp_path / EmbeddingIndex.LOG_NAME
+        assert len(log.read_text().splitlines()) == 1
+
+        matches = other.find_nearest(org(10, "Northern Maple Media"), threshold=0.9)
+        assert [m.target.entity_id for m in matches] == [UUID(int=1)]
+        # Only the query is encoded; the entity comes from the log and store
+        assert len(other._model.encoded) == 1
+
+    def test_clear_cache_keeps_store_and_drop_store_removes_it(self, tmp_path):
+        matcher = self.make_matcher(store_path=str(tmp_path))
+        matcher.add_candidates([org(1, "Northern Maple Media")])
+
+        matcher.clear_cache()
+        assert len(matcher.store) == 1
+        assert UUID(int=1) in matcher.index
+
+        matcher.drop_store()
+        assert len(matcher.store) == 0
+        assert UUID(int=1) not in matcher.index
+        assert not (tmp_path / EmbeddingIndex.LOG_NAME).exists()
+
+
+class TestHybridMatcherEmbedding:
+    """Tests for the embedding stage of HybridMatcher."""
+
+    @pytest.fixture
+    def hybrid(self, monkeypatch):
+        monkeypatch.setattr(matcher_module, "_embedding_matchers", {})
+        hybrid = HybridMatcher(use_embedding=True, fuzzy_min_score=99, embedding_model="hash")
+        hybrid.embedding._model = HashingModel()
+        return hybrid
+
+    def test_embedding_stage_uses_ann_index(self, hybrid, monkeypatch):
+        candidates = [org(1, "Maple Northern Media Group"), org(2, "Atlantic Coastal Radio")]
+        calls = []
+        find_nearest = hybrid.embedding.find_nearest
+
+        def spy(source, **kwargs):
+            calls.append(kwargs)
+            return find_nearest(source, **kwargs)
+
+        monkeypatch.setattr(hybrid.embedding, "find_nearest", spy)
+
+        matches = hybrid.find_matches(org(10, "Northern Maple Media"), candidates, threshold=0.5)
+
+        assert calls[0]["candidate_ids"] == {UUID(int=1), UUID(int=2)}
+        assert calls[0]["k"] == hybrid.embedding_top_k
+        assert [m.target.entity_id for m in matches] == [UUID(int=1)]
+
+    def test_matchers_share_one_embedding_index(self, hybrid):
+        hybrid.index_entities([org(1, "Northern Maple Media")])
+
+        other = HybridMatcher(use_embedding=True, embedding_model="hash")
+        nearest = other.nearest_candidates(org(10, "Northern Maple Media"), threshold=0.9)
+
+        assert other.embedding is hybrid.embedding
+        assert [c.entity_id for c in nearest] == [UUID(int=1)]
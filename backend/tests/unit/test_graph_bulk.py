@@ -0,0 +1,225 @@
+"""Unit tests for the UNWIND-based bulk graph writer.
+
+Tests buffering, flush triggers, statement shapes and Neo4jHelper opt-in
+against a recording fake Neo4j session.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from mitds.graph.bulk import BulkGraphWriter, get_active_writer
+from mitds.ingestion.base import Neo4jHelper
+
+
+class FakeTx:
+    def __init__(self, calls: list):
+        self.calls = calls
+        self.rows: list[dict] = []
+
+    async def run(self, query, **params):
+        self.calls.append((query, params["rows"]))
+        self.rows = params["rows"]
+        return self
+
+    async def values(self):
+        """Return the node ids (or endpoint values) the statement touched."""
+        return [
+            [row["on_create"].get("id")] if "merge_value" in row
+            else [row["source_value"], row["target_value"]]
+            for row in self.rows
+        ]
+
+
+class FakeSession:
+    """Records each execute_write call as (query, rows)."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.calls: list[tuple[str, list]] = []
+        self.invalidated: list[set] = []
+        self.fail_on = fail_on
+
+    async def execute_write(self, fn, *args):
+        if self.fail_on and self.fail_on in args[0]:
+            raise RuntimeError("write failed")
+        return await fn(FakeTx(self.calls), *args)
+
+    async def run(self, *args, **kwargs):
+        raise AssertionError("per-entity session.run should not be used")
+
+
+def make_writer(session: FakeSession, **kwargs) -> BulkGraphWriter:
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    async def invalidate(ids):
+        session.invalidated.append(set(ids))
+
+    kwargs.setdefault("flush_interval", None)
+    return BulkGraphWriter(session_factory=factory, invalidate=invalidate, **kwargs)
+
+
+class TestBulkGraphWriter:
+    """Tests for BulkGraphWriter buffering and flushing."""
+
+    async def test_buffers_until_close(self):
+        """Rows are held until close, then written in chunks."""
+        session = FakeSession()
+        writer = make_writer(session, chunk_size=100)
+
+        for i in range(5):
+            await writer.merge_node("Organization", "ein", f"{i:09d}", on_create={"id": str(i)})
+        assert session.calls == []
+        assert writer.buffered == 5
+
+        await writer.close()
+
+        assert len(session.calls) == 1
+        query, rows = session.calls[0]
+        assert query.startswith("UNWIND $rows AS row")
+        assert "MERGE (n:Organization {ein: row.merge_value})" in query
+        assert len(rows) == 5
+        assert writer.stats.nodes_written == 5
+        assert writer.buffered == 0
+        assert "RETURN n.id AS id" in query
+
+    async def test_flush_invalidates_written_entities(self):
+        """Ids returned by a flush are invalidated once per flush."""
+        session = FakeSession(fail_on="Person")
+        writer = make_writer(session)
+
+        await writer.merge_node("Organization", "name", "Org A", on_create={"id": "org-a"})
+        await writer.merge_node("Person", "name", "Jane", on_create={"id": "jane"})
+        await writer.merge_relationship(
+            "OWNS", "Organization", "id", "org-a", "Organization", "id", "org-b"
+        )
+        await writer.close()
+
+        # The failed Person chunk is not reported as written
+        assert session.invalidated == [{"org-a", "org-b"}]
+
+        await writer.flush()
+        assert len(session.invalidated) == 1
+
+    async def test_flush_on_size_and_chunking(self):
+        """A full bucket triggers a flush; large flushes are chunked."""
+        session = FakeSession()
+        writer = make_writer(session, chunk_size=3, max_buffered=100)
+
+        for i in range(7):
+            await writer.merge_node("Person", "name", f"P{i}", on_create={})
+
+        # Two size-triggered flushes of 3 rows each
+        assert [len(rows) for _, rows in session.calls] == [3, 3]
+        await writer.close()
+        assert [len(rows) for _, rows in session.calls] == [3, 3, 1]
+        assert writer.stats.transactions == 3
+
+    async def test_nodes_flush_before_relationships(self):
+        """Relationship buckets are written after node buckets."""
+        session = FakeSession()
+        writer = make_writer(session)
+
+        await writer.merge_relationship(
+            "OWNS", "Person", "id", "p1", "Organization", "id", "o1",
+            properties={"ownership_percentage": 10.0},
+        )
+        await writer.merge_node("Person", "id", "p1", on_create={"name": "A"})
+        await writer.close()
+
+        assert "MERGE (n:Person" in session.calls[0][0]
+        assert "MERGE (s)-[r:OWNS]->(t)" in session.calls[1][0]
+        assert writer.stats.relationships_written == 1
+
+    async def test_relationship_merge_keys_and_direction(self):
+        """merge_on keys are part of the MERGE pattern; undirected is supported."""
+        session = FakeSession()
+        writer = make_writer(session)
+
+        await writer.merge_relationship(
+            "FUNDED_BY", None, "id", "a", None, "id", "b",
+            merge_on={"fiscal_year": 2023},
+        )
+        await writer.merge_relationship(
+            "SHARED_INFRA", None, "id", "a", None, "id", "b", directed=False,
+        )
+        await writer.close()
+
+        queries = [q for q, _ in session.calls]
+        assert "MERGE (s)-[r:FUNDED_BY {fiscal_year: row.merge_on.fiscal_year}]->(t)" in queries[0]
+        assert "MATCH (s {id: row.source_value})" in queries[0]
+        assert "MERGE (s)-[r:SHARED_INFRA]-(t)" in queries[1]
+
+    async def test_failed_chunk_is_counted(self):
+        """A failing statement is logged and counted, not raised."""
+        session = FakeSession(fail_on=":Person")
+        writer = make_writer(session)
+
+        await writer.merge_node("Person", "name", "A", on_create={})
+        await writer.merge_node("Organization", "name", "B", on_create={})
+        await writer.close()
+
+        assert writer.stats.rows_failed == 1
+        assert writer.stats.nodes_written == 1
+
+    async def test_rejects_unsafe_identifiers(self):
+        """Labels and keys are validated before being interpolated."""
+        writer = make_writer(FakeSession())
+
+        with pytest.raises(ValueError):
+            await writer.merge_node("Org) DETACH DELETE n //", "name", "x", on_create={})
+
+
+class TestNeo4jHelperBulkMode:
+    """Tests for routing Neo4jHelper calls through an active writer."""
+
+    async def test_activated_writer_receives_helper_calls(self):
+        session = FakeSession()
+        writer = make_writer(session)
+        helper = Neo4jHelper()
+
+        with writer.activate():
+            assert get_active_writer() is writer
+            assert await helper.merge_organization(session, id="1", name="Org A")
+            assert await helper.merge_person(session, id="2", name="Jane Doe")
+            assert await helper.create_relationship(
+                session, "DIRECTOR_OF",
+                "Person", "name", "Jane Doe",
+                "Organization", "name", "Org A",
+            )
+        assert get_active_writer() is None
+
+        await writer.close()
+
+        assert writer.stats.nodes_written == 2
+        assert writer.stats.relationships_written == 1
+        org_query, org_rows = session.calls[0]
+        assert "n.id = COALESCE(n.id, row.coalesce.id)" in org_query
+        assert org_rows[0]["on_create"]["entity_type"] == "ORGANIZATION"
+
+
+class TestGraphBuilderBulkMode:
+    """Tests for GraphBuilder with an attached bulk writer."""
+
+    async def test_builder_buffers_nodes_and_relationships(self):
+        from mitds.graph.builder import GraphBuilder
+
+        session = FakeSession()
+        writer = make_writer(session)
+        builder = GraphBuilder(writer=writer)
+
+        org = await builder.create_organization(name="Org A", ein="123456789")
+        person = await builder.create_person(name="Jane Doe")
+        rel = await builder.create_director_of_relationship(person.id, org.id, title="Chair")
+        assert org.created is False and org.updated is False
+        assert writer.buffered == 3
+
+        await writer.close()
+
+        assert writer.stats.nodes_written == 2
+        assert writer.stats.relationships_written == 1
+        rel_query, rel_rows = session.calls[-1]
+        assert "MATCH (s:Person {id: row.source_value})" in rel_query
+        assert rel_rows[0]["on_create"]["id"] == str(rel.id)
+        assert rel_rows[0]["props"]["title"] == "Chair"
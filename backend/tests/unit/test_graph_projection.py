@@ -0,0 +1,220 @@
+"""Unit tests for graph projections and topology analysis.
+
+Tests CSR projection building, neighbourhood extraction, version-stamped
+projection caching against a fake Neo4j session, and the community,
+centrality and k-core analysis that feeds TopologySummaryReport.
+"""
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+from mitds.detection.topology import TopologyAnalyzer, apply_topology_to_report
+from mitds.graph import projection as projection_module
+from mitds.graph.projection import GraphProjection, ProjectionFilter, get_projection
+from mitds.models.relationships import RelationType
+from mitds.reporting.templates import TopologySummaryReport
+
+
+def two_cliques():
+    """Two 4-cliques joined by a single bridge (a3 - b0)."""
+    ids = {name: str(uuid4()) for name in [f"a{i}" for i in range(4)] + [f"b{i}" for i in range(4)]}
+    edges = []
+    for group in ("a", "b"):
+        for i in range(4):
+            for j in range(i + 1, 4):
+                edges.append((ids[f"{group}{i}"], ids[f"{group}{j}"]))
+    edges.append((ids["a3"], ids["b0"]))
+    nodes = {node_id: (name.upper(), "ORGANIZATION") for name, node_id in ids.items()}
+    return ids, edges, nodes
+
+
+class TestGraphProjection:
+    """Tests for CSR projections."""
+
+    def test_builds_symmetric_weighted_adjacency(self):
+        projection = GraphProjection.from_edges(
+            [("a", "b"), ("b", "a"), ("b", "c"), ("c", "c")]
+        )
+
+        assert projection.node_ids == ["a", "b", "c"]
+        assert projection.edge_count == 2
+        adjacency = projection.adjacency.toarray()
+        assert (adjacency == adjacency.T).all()
+        assert adjacency[0, 1] == 2
+        assert adjacency[2, 2] == 0
+
+    def test_neighborhood_follows_hops(self):
+        projection = GraphProjection.from_edges([("a", "b"), ("b", "c"), ("c", "d")])
+
+        one_hop = projection.neighborhood(["a"], hops=1)
+        two_hops = projection.neighborhood(["a"], hops=2)
+
+        assert sorted(one_hop.node_ids) == ["a", "b"]
+        assert sorted(two_hops.node_ids) == ["a", "b", "c"]
+        assert two_hops.edge_count == 2
+        assert projection.neighborhood(["missing"]).node_count == 0
+
+    def test_filter_normalizes_fields(self):
+        first = ProjectionFilter.create(rel_types=["OWNS", RelationType.FUNDED_BY], jurisdictions=["on", "CA"])
+        second = ProjectionFilter.create(rel_types=["FUNDED_BY", "OWNS"], jurisdictions=["CA", "ON"])
+
+        assert first.key == second.key
+        with pytest.raises(ValueError):
+            ProjectionFilter.create(rel_types=["NOT_A_TYPE"])
+
+
+class FakeRecords:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def single(self):
+        return self.rows[0]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+class FakeGraph:
+    """Answers count-store and edge list queries from an edge list."""
+
+    def __init__(self, edges):
+        self.edges = edges
+        self.edge_loads = 0
+        self.edge_queries: list[str] = []
+
+    async def run(self, query, params=None):
+        if "count(" in query:
+            return FakeRecords([{"count": len(self.edges)}])
+        self.edge_loads += 1
+        self.edge_queries.append(query)
+        return FakeRecords([
+            {
+                "source": a, "target": b,
+                "source_name": a, "target_name": b,
+                "source_type": "ORGANIZATION", "target_type": "ORGANIZATION",
+            }
+            for a, b in self.edges
+        ])
+
+
+@pytest.fixture
+def fake_graph(monkeypatch):
+    graph = FakeGraph([("a", "b"), ("b", "c")])
+
+    @asynccontextmanager
+    async def get_neo4j_session():
+        yield graph
+
+    monkeypatch.setattr(projection_module, "get_neo4j_session", get_neo4j_session)
+    projection_module.clear_projections()
+    yield graph
+    projection_module.clear_projections()
+
+
+class TestProjectionCache:
+    """Tests for version-stamped projection caching."""
+
+    async def test_reuses_projection_until_version_changes(self, fake_graph):
+        projection_filter = ProjectionFilter.create()
+
+        first = await get_projection(projection_filter)
+        again = await get_projection(projection_filter)
+        assert again is first
+        assert fake_graph.edge_loads == 1
+
+        fake_graph.edges.append(("c", "d"))
+        rebuilt = await get_projection(projection_filter)
+
+        assert rebuilt.version != first.version
+        assert rebuilt.node_count == 4
+        assert fake_graph.edge_loads == 2
+
+    async def test_only_entity_nodes_are_projected(self, fake_graph):
+        await get_projection(ProjectionFilter.create())
+
+        query = fake_graph.edge_queries[0]
+        for var in ("a", "b"):
+            assert f"{var}:Organization OR {var}:Person" in query
+        assert "Election" not in query
+
+    async def test_expired_projection_is_rebuilt(self, fake_graph, monkeypatch):
+        projection_filter = ProjectionFilter.create()
+        first = await get_projection(projection_filter)
+
+        first.built_at -= 10_000
+        await get_projection(projection_filter)
+
+        assert fake_graph.edge_loads == 2
+
+
+class TestTopologyAnalyzer:
+    """Tests for communities, centrality and cores."""
+
+    def test_finds_communities_and_bridge_nodes(self):
+        ids, edges, nodes = two_cliques()
+        projection = GraphProjection.from_edges(edges, nodes, version="v1")
+
+        result = TopologyAnalyzer(top_n=3, betweenness_samples=0).analyze(projection)
+
+        assert result.node_count == 8 and result.edge_count == 13
+        assert result.connected_components == 1
+        assert result.max_core == 3
+        assert result.diameter == 3
+        assert sorted(c.size for c in result.communities) == [4, 4]
+        assert {frozenset(c.member_ids) for c in result.communities} == {
+            frozenset(ids[f"a{i}"] for i in range(4)),
+            frozenset(ids[f"b{i}"] for i in range(4)),
+        }
+        # The bridge endpoints carry every shortest path between the cliques
+        assert {n.entity_id for n in result.central_nodes[:2]} == {ids["a3"], ids["b0"]}
+        assert max(result.central_nodes, key=lambda n: n.betweenness).entity_id in {ids["a3"], ids["b0"]}
+
+    def test_label_propagation(self):
+        _, edges, nodes = two_cliques()
+        projection = GraphProjection.from_edges(edges, nodes)
+
+        result = TopologyAnalyzer(community_method="label_propagation").analyze(projection)
+
+        assert sum(c.size for c in result.communities) == 8
+
+    def test_empty_projection(self):
+        result = TopologyAnalyzer().analyze(GraphProjection.from_edges([]))
+
+        assert result.node_count == 0 and result.communities == []
+
+    def test_populates_topology_report(self):
+        _, edges, nodes = two_cliques()
+        result = TopologyAnalyzer(top_n=2).analyze(GraphProjection.from_edges(edges, nodes))
+        report = TopologySummaryReport(entity_ids=[])
+
+        apply_topology_to_report(report, result)
+
+        data = report.to_dict()
+        assert data["network_metrics"]["node_count"] == 8
+        assert data["network_metrics"]["connected_components"] == 1
+        assert len(data["central_entities"]) == 2
+        assert data["central_entities"][0]["centrality"]["pagerank"] > 0
+        assert len(data["clusters"]) == 2
+        assert data["clusters"][0]["members"][0]["entity_type"] == "ORGANIZATION"
+
+    def test_report_skips_non_entity_ids(self):
+        ids, edges, nodes = two_cliques()
+        # An election node, with a non-UUID id, tied to every "a" node
+        edges += [(ids[f"a{i}"], "election_45") for i in range(4)]
+        nodes["election_45"] = ("45th General Election", "Election")
+        result = TopologyAnalyzer(top_n=9).analyze(GraphProjection.from_edges(edges, nodes))
+        report = TopologySummaryReport(entity_ids=[])
+
+        apply_topology_to_report(report, result)
+
+        data = report.to_dict()
+        assert "election_45" in {n.entity_id for n in result.central_nodes}
+        assert len(data["central_entities"]) == 8
+        members = [m["entity_id"] for c in data["clusters"] for m in c["members"]]
+        assert "election_45" not in members
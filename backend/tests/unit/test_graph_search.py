@@ -0,0 +1,268 @@
+"""Unit tests for full-text entity search.
+
+Tests Lucene query rewriting, index creation and migration, the index and
+fallback query paths, and cached totals against a recording fake session.
+"""
+
+import pytest
+
+from mitds.cache import InMemoryCache
+from mitds.graph import search as search_module
+from mitds.graph.search import (
+    ENTITY_AUTOCOMPLETE_INDEX,
+    ENTITY_SEARCH_INDEX,
+    MAX_CANDIDATES,
+    build_fulltext_query,
+    count_entity_matches,
+    ensure_search_indexes,
+    search_entity_nodes,
+    suggest_entities,
+)
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    async def data(self):
+        return self.rows
+
+
+class FakeSession:
+    """Records each run call as (query, params) and replays queued results."""
+
+    def __init__(self, *results):
+        self.calls: list[tuple[str, dict]] = []
+        self.results = list(results)
+
+    async def run(self, query, params=None):
+        self.calls.append((query, params or {}))
+        outcome = self.results.pop(0) if self.results else []
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResult(outcome)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    cache = InMemoryCache()
+
+    async def get_cache():
+        return cache
+
+    monkeypatch.setattr(search_module, "get_cache", get_cache)
+    monkeypatch.setattr(search_module, "_missing_indexes", set())
+    return cache
+
+
+class TestBuildFulltextQuery:
+    """Tests for rewriting user input as Lucene queries."""
+
+    def test_last_token_matches_as_prefix(self):
+        assert build_fulltext_query("Maple Le") == "+(maple OR maple~1) +(le OR le*)"
+
+    def test_prefix_can_be_disabled(self):
+        assert build_fulltext_query("maple le", prefix=False) == "+(maple OR maple~1) +le"
+
+    def test_operators_and_syntax_are_stripped(self):
+        query = build_fulltext_query('AND "Foo" (bar)*')
+
+        assert query == "+and +foo +(bar OR bar*)"
+
+    def test_no_word_characters(self):
+        assert build_fulltext_query("!! --") is None
+
+    def test_token_count_is_capped(self):
+        query = build_fulltext_query(" ".join(["ab"] * 20))
+
+        assert query.count("+") == search_module.MAX_QUERY_TOKENS
+
+
+class TestEnsureSearchIndexes:
+    """Tests for creating and migrating the managed indexes."""
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_indexes(self):
+        session = FakeSession([])
+
+        changed = await ensure_search_indexes(session)
+
+        assert changed == [ENTITY_SEARCH_INDEX.name, ENTITY_AUTOCOMPLETE_INDEX.name]
+        queries = [query for query, _ in session.calls]
+        assert queries[1] == ENTITY_SEARCH_INDEX.create_statement()
+        assert "ON EACH [n.name, n.page_name, n.aliases]" in queries[1]
+        assert not any("DROP" in query for query in queries)
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_stale_and_keeps_current(self):
+        analyzer = {"indexConfig": {"fulltext.analyzer": "standard-folding"}}
+        session = FakeSession([
+            {
+                "name": ENTITY_SEARCH_INDEX.name,
+                "labelsOrTypes": ["Organization", "Person"],
+                "properties": ["name"],
+                "options": analyzer,
+            },
+            {
+                "name": ENTITY_AUTOCOMPLETE_INDEX.name,
+                "labelsOrTypes": list(reversed(ENTITY_AUTOCOMPLETE_INDEX.labels)),
+                "properties": list(ENTITY_AUTOCOMPLETE_INDEX.properties),
+                "options": analyzer,
+            },
+        ])
+
+        changed = await ensure_search_indexes(session)
+
+        assert changed == [ENTITY_SEARCH_INDEX.name]
+        queries = [query for query, _ in session.calls]
+        assert queries[1] == f"DROP INDEX {ENTITY_SEARCH_INDEX.name} IF EXISTS"
+        assert queries[2] == ENTITY_SEARCH_INDEX.create_statement()
+
+    @pytest.mark.asyncio
+    async def test_creation_clears_missing_flag(self):
+        search_module._missing_indexes.add(ENTITY_SEARCH_INDEX.name)
+
+        await ensure_search_indexes(FakeSession([]))
+
+        assert not search_module._missing_indexes
+
+
+class TestSearchEntityNodes:
+    """Tests for index-backed entity search."""
+
+    @pytest.mark.asyncio
+    async def test_uses_fulltext_index(self):
+        session = FakeSession([{"e": {"id": "1", "name": "Maple Leaf Media"}}])
+
+        nodes = await search_entity_nodes(
+            session, "maple lea", entity_type="ORGANIZATION", offset=20, limit=10
+        )
+
+        query, params = session.calls[0]
+        assert "db.index.fulltext.queryNodes" in query
+        assert "CONTAINS" not in query
+        assert params["index"] == ENTITY_SEARCH_INDEX.name
+        assert params["search"] == "+(maple OR maple~1) +(lea OR lea*)"
+        assert params["candidates"] == MAX_CANDIDATES
+        assert params["entity_type"] == "ORGANIZATION"
+        assert params["jurisdiction"] is None
+        assert (params["offset"], params["limit"]) == (20, 10)
+        assert nodes == [{"id": "1", "name": "Maple Leaf Media"}]
+
+    @pytest.mark.asyncio
+    async def test_missing_index_falls_back_to_scan(self):
+        session = FakeSession(
+            Exception("There is no such fulltext schema index: entity_text_search"),
+            [],
+            [],
+        )
+
+        await search_entity_nodes(session, "maple")
+        await search_entity_nodes(session, "maple")
+
+        queries = [query for query, _ in session.calls]
+        assert "queryNodes" in queries[0]
+        assert "CONTAINS toLower($term)" in queries[1]
+        assert "CONTAINS toLower($term)" in queries[2]
+
+    @pytest.mark.asyncio
+    async def test_other_errors_fall_back_once(self):
+        session = FakeSession(Exception("index is still populating"), [], [])
+
+        await search_entity_nodes(session, "maple")
+        await search_entity_nodes(session, "maple")
+
+        assert "queryNodes" in session.calls[2][0]
+
+    @pytest.mark.asyncio
+    async def test_input_without_words_skips_query(self):
+        session = FakeSession()
+
+        assert await search_entity_nodes(session, "***") == []
+        assert session.calls == []
+
+
+class TestCountEntityMatches:
+    """Tests for capped, cached search totals."""
+
+    @pytest.mark.asyncio
+    async def test_total_is_capped_and_cached(self):
+        session = FakeSession([{"total": 42}])
+
+        first = await count_entity_matches(session, "maple", jurisdiction="CA")
+        second = await count_entity_matches(session, "maple", jurisdiction="CA")
+
+        assert first == second == 42
+        assert len(session.calls) == 1
+        query, params = session.calls[0]
+        assert "WITH e LIMIT $candidates" in query
+        assert params["candidates"] == MAX_CANDIDATES
+
+    @pytest.mark.asyncio
+    async def test_filters_are_part_of_cache_key(self):
+        session = FakeSession([{"total": 42}], [{"total": 7}])
+
+        assert await count_entity_matches(session, "maple") == 42
+        assert await count_entity_matches(session, "maple", jurisdiction="CA") == 7
+
+
+class TestSuggestEntities:
+    """Tests for autocomplete suggestions."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_candidates_from_autocomplete_index(self):
+        session = FakeSession([{"id": "1", "name": "Maple Leaf", "match_rank": 0}])
+
+        rows = await suggest_entities(session, "map", limit=10)
+
+        query, params = session.calls[0]
+        assert "db.index.fulltext.queryNodes" in query
+        assert params["index"] == ENTITY_AUTOCOMPLETE_INDEX.name
+        assert params["search"] == "+(map OR map*)"
+        assert params["candidates"] == 10 * search_module.AUTOCOMPLETE_CANDIDATE_FACTOR
+        assert params["labels"] == list(ENTITY_AUTOCOMPLETE_INDEX.labels)
+        assert rows[0]["name"] == "Maple Leaf"
+
+    @pytest.mark.asyncio
+    async def test_label_filter_is_passed_through(self):
+        session = FakeSession([])
+
+        await suggest_entities(session, "map", labels=["Person", "Unknown"], limit=5)
+
+        query, params = session.calls[0]
+        assert params["labels"] == ["Person"]
+        # The label filter runs before the candidate pool is cut
+        assert "{limit: $candidates}" not in query
+        assert query.index("label IN $labels") < query.index("LIMIT $candidates")
+
+    @pytest.mark.asyncio
+    async def test_unknown_labels_return_nothing(self):
+        session = FakeSession([])
+
+        assert await suggest_entities(session, "map", labels=["Ad"]) == []
+        assert session.calls == []
+
+    @pytest.mark.asyncio
+    async def test_missing_index_falls_back_to_scan(self):
+        session = FakeSession(
+            Exception("There is no such fulltext schema index: entity_autocomplete"),
+            [],
+        )
+
+        await suggest_entities(session, "map")
+
+        assert "STARTS WITH toLower($prefix)" in session.calls[1][0]
+        assert "queryNodes" not in session.calls[1][0]
+
+    @pytest.mark.asyncio
+    async def test_scan_fallback_matches_requested_labels_only(self):
+        session = FakeSession(
+            Exception("There is no such fulltext schema index: entity_autocomplete"),
+            [],
+        )
+
+        await suggest_entities(session, "map", labels=["Person", "Sponsor"])
+
+        query = session.calls[1][0]
+        assert "MATCH (e:Person)" in query and "MATCH (e:Sponsor)" in query
+        assert "MATCH (e:Organization)" not in query and "MATCH (e)\n" not in query
@@ -0,0 +1,329 @@
+"""Unit tests for bounded infrastructure scanning.
+
+Tests the TTL-honouring DNS cache, DNS lookups against a local stub
+resolver, the shared keep-alive HTTP pool against a local stub web
+server, per-service concurrency limits, and streaming of profiles as
+each domain completes.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from mitds.detection.infra import (
+    AnalyticsDetector,
+    AnalyticsResult,
+    DNSLookupService,
+    DNSResult,
+    HostingDetector,
+    HostingResult,
+    InfrastructureDetector,
+    SSLResult,
+    WHOISResult,
+)
+from mitds.detection.infra_scan import DNSCache, ScanLimits
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDNSCache:
+    """Tests for TTL expiry and bounds."""
+
+    def test_answers_expire_with_their_ttl(self):
+        clock = FakeClock()
+        cache = DNSCache(default_ttl=300, negative_ttl=60, clock=clock)
+
+        cache.set("Example.com.", "A", ["1.2.3.4"], ttl=30)
+        cache.set("missing.com", "A", [], ttl=3600)
+        cache.set("system.com", "A", ["5.6.7.8"])
+
+        assert cache.get("example.com", "A") == ["1.2.3.4"]
+        clock.now += 31
+        assert cache.get("example.com", "A") is None
+        # Empty answers never outlive the negative TTL
+        assert cache.get("missing.com", "A") == []
+        clock.now += 30
+        assert cache.get("missing.com", "A") is None
+        # Answers without a TTL use the default
+        assert cache.get("system.com", "A") == ["5.6.7.8"]
+
+    def test_evicts_least_recently_used(self):
+        cache = DNSCache(max_entries=2)
+
+        cache.set("a.com", "A", ["1.1.1.1"], ttl=60)
+        cache.set("b.com", "A", ["2.2.2.2"], ttl=60)
+        cache.get("a.com", "A")
+        cache.set("c.com", "A", ["3.3.3.3"], ttl=60)
+
+        assert len(cache) == 2
+        assert cache.get("b.com", "A") is None
+        assert cache.get("a.com", "A") == ["1.1.1.1"]
+
+
+class StubResolver(asyncio.DatagramProtocol):
+    """Answers DNS queries over UDP from a record table."""
+
+    def __init__(self, records, ttl=30):
+        self.records = records
+        self.ttl = ttl
+        self.queries: list[tuple[str, str]] = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        import dns.message
+        import dns.rcode
+        import dns.rdatatype
+        import dns.rrset
+
+        query = dns.message.from_wire(data)
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        name = question.name.to_text().rstrip(".")
+        rdtype = dns.rdatatype.to_text(question.rdtype)
+        self.queries.append((name, rdtype))
+
+        values = self.records.get((name, rdtype))
+        if not any(known == name for known, _ in self.records):
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif values:
+            response.answer.append(
+                dns.rrset.from_text_list(question.name, self.ttl, "IN", rdtype, values)
+            )
+        self.transport.sendto(response.to_wire(), addr)
+
+
+@pytest.fixture
+async def stub_resolver():
+    pytest.importorskip("dns.asyncresolver")
+    resolver = StubResolver({
+        ("site.test", "A"): ["10.0.0.1", "10.0.0.2"],
+        ("site.test", "NS"): ["ns1.host.test."],
+        ("site.test", "MX"): ["10 mail.site.test."],
+    })
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: resolver, local_addr=("127.0.0.1", 0)
+    )
+    resolver.port = transport.get_extra_info("sockname")[1]
+    yield resolver
+    transport.close()
+
+
+class TestDNSLookupService:
+    """Tests against a local stub resolver."""
+
+    async def test_caches_answers_for_their_ttl(self, stub_resolver):
+        clock = FakeClock()
+        service = DNSLookupService(
+            timeout=2.0,
+            cache=DNSCache(clock=clock),
+            nameservers=["127.0.0.1"],
+            port=stub_resolver.port,
+        )
+
+        first = await service.lookup("site.test")
+        queries = len(stub_resolver.queries)
+        again = await service.lookup("site.test")
+
+        assert first.a_records == ["10.0.0.1", "10.0.0.2"]
+        assert first.nameservers == ["ns1.host.test."]
+        assert first.mx_records == ["mail.site.test."]
+        assert again == first
+        assert len(stub_resolver.queries) == queries
+
+        clock.now += stub_resolver.ttl + 1
+        await service.lookup("site.test")
+        # The empty AAAA answer is cached for the longer negative TTL
+        assert sorted(stub_resolver.queries[queries:]) == [
+            ("site.test", "A"), ("site.test", "MX"), ("site.test", "NS"),
+        ]
+
+    async def test_missing_names_are_cached_negatively(self, stub_resolver):
+        service = DNSLookupService(
+            timeout=2.0,
+            cache=DNSCache(),
+            nameservers=["127.0.0.1"],
+            port=stub_resolver.port,
+        )
+
+        result = await asyncio.gather(
+            service.lookup("gone.test"), service.lookup("gone.test")
+        )
+
+        assert result[0].a_records == [] and result[0].error is None
+        # Concurrent lookups of the same name share one query per type
+        assert len(stub_resolver.queries) == 4
+
+
+class StubWebServer:
+    """Minimal keep-alive HTTP/1.1 server recording connections and load."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.connections = 0
+        self.active: dict[str, int] = {"page": 0, "ip": 0}
+        self.max_active: dict[str, int] = {"page": 0, "ip": 0}
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ")[1].decode()
+                kind = path.split("/")[1]
+                self.active[kind] += 1
+                self.max_active[kind] = max(self.max_active[kind], self.active[kind])
+                await asyncio.sleep(self.delay)
+                self.active[kind] -= 1
+
+                if kind == "page":
+                    body = "<script>gtag('config', 'G-STUBSITE01');</script>"
+                else:
+                    body = json.dumps({"status": "success", "as": "AS64500 Stub Net", "org": "Stub"})
+                payload = body.encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(payload) + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def stub_web():
+    web = StubWebServer()
+    server = await asyncio.start_server(web.handle, "127.0.0.1", 0)
+    web.url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    yield web
+    server.close()
+    await server.wait_closed()
+
+
+class FakeLookups:
+    """DNS, WHOIS and SSL stand-ins that record their concurrency."""
+
+    def __init__(self, delay=0.0, gates=None):
+        self.delay = delay
+        self.gates = gates or {}
+        self.active = 0
+        self.max_active = 0
+
+    async def _work(self, domain):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if domain in self.gates:
+                await self.gates[domain].wait()
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+    async def lookup(self, domain):
+        await self._work(domain)
+        return DNSResult(domain=domain, a_records=[f"192.0.2.{len(domain)}"])
+
+    async def analyze(self, domain, address=None):
+        return SSLResult(domain=domain, issuer="Stub CA")
+
+
+class FakeWhois(FakeLookups):
+    async def lookup(self, domain):
+        await self._work(domain)
+        return WHOISResult(domain=domain, registrar="Stub Registrar")
+
+
+class FakeAnalytics:
+    async def detect(self, domain):
+        return AnalyticsResult(domain=domain)
+
+    async def close(self):
+        pass
+
+
+class FakeHosting:
+    async def detect(self, ip):
+        return HostingResult(ip_address=ip)
+
+    async def close(self):
+        pass
+
+
+def make_detector(limits, dns=None, whois=None):
+    lookups = dns or FakeLookups()
+    return InfrastructureDetector(
+        dns_service=lookups,
+        whois_service=whois or FakeWhois(),
+        ssl_analyzer=lookups,
+        limits=limits,
+    )
+
+
+class TestBoundedScanning:
+    """Tests for shared pools, limits and streaming."""
+
+    async def test_shares_keepalive_pool_within_limits(self, stub_web):
+        limits = ScanLimits(analytics=3, hosting=2, http_connections=4, http_keepalive=4)
+        detector = make_detector(limits)
+        client = detector.resources.http_client
+        detector.analytics = AnalyticsDetector(client=client, url_template=stub_web.url + "/page/{domain}")
+        detector.hosting = HostingDetector(client=client, api_url=stub_web.url + "/ip/{ip}")
+        domains = [f"site{i}.test" for i in range(30)]
+
+        try:
+            profiles = await detector.get_profiles(domains)
+        finally:
+            await detector.close()
+
+        assert list(profiles) == domains
+        assert all(p.analytics.google_analytics_ids == ["G-STUBSITE01"] for p in profiles.values())
+        assert all(p.hosting[0].asn == "AS64500" for p in profiles.values())
+        # 30 page fetches and 30 IP lookups over a handful of reused connections
+        assert stub_web.connections <= 4
+        assert stub_web.max_active["page"] <= 3
+        assert stub_web.max_active["ip"] <= 2
+        assert client.is_closed
+
+    async def test_per_service_and_domain_limits(self):
+        whois = FakeWhois(delay=0.01)
+        dns = FakeLookups(delay=0.01)
+        detector = make_detector(ScanLimits(max_domains=5, whois=2, dns=8), dns=dns, whois=whois)
+        detector.analytics = FakeAnalytics()
+        detector.hosting = FakeHosting()
+
+        try:
+            profiles = await detector.get_profiles([f"d{i}.test" for i in range(20)])
+        finally:
+            await detector.close()
+
+        assert len(profiles) == 20
+        assert whois.max_active == 2
+        assert dns.max_active <= 5
+
+    async def test_streams_profiles_as_domains_complete(self):
+        gate = asyncio.Event()
+        dns = FakeLookups(gates={"slow.test": gate})
+        detector = make_detector(ScanLimits(), dns=dns)
+        detector.analytics = FakeAnalytics()
+        detector.hosting = FakeHosting()
+        stream = detector.stream_profiles(["slow.test", "a.test", "b.test"])
+
+        try:
+            first = [(await anext(stream)).domain for _ in range(2)]
+            gate.set()
+            rest = [p.domain async for p in stream]
+        finally:
+            await detector.close()
+
+        assert sorted(first) == ["a.test", "b.test"]
+        assert rest == ["slow.test"]
+
@@ -0,0 +1,263 @@
+"""Unit tests for stored infrastructure profiles.
+
+Tests signal-key matching against pairwise comparison, profile
+serialization, per-component staleness, and InfrastructureDetector's
+reuse of stored profiles against a fake store and fake lookup services.
+"""
+
+from datetime import datetime, timedelta
+from itertools import combinations
+
+import pytest
+
+from mitds.detection.infra import (
+    AnalyticsResult,
+    DNSResult,
+    HostingResult,
+    InfraSignalType,
+    InfrastructureDetector,
+    InfrastructureProfile,
+    InfrastructureScorer,
+    SSLResult,
+    WHOISResult,
+)
+from mitds.detection.infra_store import (
+    COMPONENT_TTLS,
+    StoredProfile,
+    profile_from_dict,
+    profile_to_dict,
+)
+
+
+def make_profile(
+    domain,
+    ips=(),
+    nameservers=(),
+    registrar=None,
+    org=None,
+    ga=(),
+    asn=None,
+    sans=(),
+    issuer=None,
+):
+    return InfrastructureProfile(
+        domain=domain,
+        dns=DNSResult(domain=domain, a_records=list(ips)),
+        whois=WHOISResult(
+            domain=domain,
+            registrar=registrar,
+            registrant_org=org,
+            nameservers=list(nameservers),
+            registration_date=datetime(2020, 1, 2),
+        ),
+        hosting=[HostingResult(ip_address=ip, asn=asn) for ip in ips],
+        analytics=AnalyticsResult(domain=domain, google_analytics_ids=list(ga)),
+        ssl=SSLResult(domain=domain, issuer=issuer, subject_alt_names=list(sans)),
+    )
+
+
+@pytest.fixture
+def profiles():
+    return [
+        make_profile("a.com", ips=["1.1.1.1"], ga=["G-SHARED0001"], registrar="Gandi",
+                     asn="AS1", sans=["a.com", "b.com", "cdn.shared.net"], issuer="LE"),
+        make_profile("b.com", ips=["1.1.1.1"], ga=["G-SHARED0001"], registrar="Gandi",
+                     asn="AS1", sans=["b.com", "cdn.shared.net"], issuer="LE"),
+        make_profile("c.com", ips=["2.2.2.2"], nameservers=["ns1.x.net"], asn="AS1",
+                     org="Acme Media Inc", issuer="LE"),
+        make_profile("d.com", ips=["3.3.3.3"], nameservers=["ns1.x.net"], asn="AS2",
+                     org="Acme Media Inc", registrar="Gandi"),
+        make_profile("e.com", ips=["4.4.4.4"], org="Privacy Protect, LLC", registrar="Gandi"),
+        make_profile("f.com", ips=["5.5.5.5"], org="REDACTED FOR PRIVACY", registrar="Gandi"),
+    ]
+
+
+class TestInfrastructureScorer:
+    """Tests for signal keys and index-driven matching."""
+
+    def test_index_matches_equal_pairwise_compare(self, profiles):
+        scorer = InfrastructureScorer()
+
+        for min_score in (0.0, 0.5, 1.0, 3.0):
+            expected = [
+                scorer.compare(a, b) for a, b in combinations(profiles, 2)
+            ]
+            expected = [m for m in expected if m.signals and m.total_score >= min_score]
+            found = scorer.find_matches(profiles, min_score=min_score)
+
+            def summary(matches):
+                return sorted(
+                    (m.domain_a, m.domain_b, round(m.total_score, 6),
+                     tuple((s.signal_type, s.value) for s in m.signals))
+                    for m in matches
+                )
+
+            assert summary(found) == summary(expected)
+            assert [m.total_score for m in found] == sorted(
+                (m.total_score for m in found), reverse=True
+            )
+
+    def test_san_overlap_ignores_own_domains(self, profiles):
+        match = InfrastructureScorer().compare(profiles[0], profiles[1])
+
+        sans = [s.value for s in match.signals if s.signal_type == InfraSignalType.SSL_SAN_OVERLAP]
+        assert sans == ["cdn.shared.net"]
+        assert match.signals[0].description == "Same registrar: Gandi"
+
+    def test_registrant_org_skips_privacy_services(self, profiles):
+        scorer = InfrastructureScorer()
+
+        shared = scorer.compare(profiles[2], profiles[3])
+        hidden = scorer.compare(profiles[4], profiles[5])
+
+        assert (InfraSignalType.SAME_REGISTRANT_ORG, "Acme Media Inc") in {
+            (s.signal_type, s.value) for s in shared.signals
+        }
+        assert all(s.signal_type != InfraSignalType.SAME_REGISTRANT_ORG for s in hidden.signals)
+
+    def test_known_pairs_are_skipped(self, profiles):
+        matches = InfrastructureScorer().find_matches(
+            profiles, min_score=0.0, known={"a.com", "b.com"}
+        )
+
+        assert ("a.com", "b.com") not in {(m.domain_a, m.domain_b) for m in matches}
+        assert any(m.domain_a == "a.com" for m in matches)
+
+
+class TestStoredProfile:
+    """Tests for serialization and per-component staleness."""
+
+    def test_profile_round_trip(self, profiles):
+        profile = profiles[0]
+
+        restored = profile_from_dict(profile_to_dict(profile))
+
+        assert restored == profile
+        assert isinstance(restored.whois.registration_date, datetime)
+
+    def test_stale_components_follow_ttls(self, profiles):
+        now = datetime(2026, 1, 10)
+        entry = StoredProfile(
+            profile=profiles[0],
+            scanned_at={c: now - timedelta(days=2) for c in COMPONENT_TTLS},
+            failed={"ssl"},
+        )
+
+        # DNS and analytics expire after a day, failed components after an hour
+        assert entry.stale_components(now) == {"dns", "analytics", "ssl"}
+        assert entry.next_refresh_at == now - timedelta(days=2) + timedelta(hours=1)
+        assert StoredProfile(profile=profiles[0]).stale_components(now) == set(COMPONENT_TTLS)
+
+
+class FakeStore:
+    def __init__(self, entries=()):
+        self.entries = {e.profile.domain: e for e in entries}
+        self.index: dict[tuple[str, str], set[str]] = {}
+        self.saved = []
+
+    async def load(self, domains):
+        return {d: self.entries[d] for d in domains if d in self.entries}
+
+    async def save(self, entries, signal_keys):
+        self.saved.extend(e.profile.domain for e in entries)
+        for entry in entries:
+            domain = entry.profile.domain
+            self.entries[domain] = entry
+            for key in signal_keys[domain]:
+                self.index.setdefault(key, set()).add(domain)
+
+    async def domains_sharing(self, keys, exclude=()):
+        return {
+            key: self.index[key] - set(exclude)
+            for key in keys if self.index.get(key, set()) - set(exclude)
+        }
+
+
+class FakeService:
+    """Answers one kind of lookup from canned profiles, logging calls."""
+
+    def __init__(self, kind, profiles, calls):
+        self.kind = kind
+        self.profiles = {p.domain: p for p in profiles}
+        self.calls = calls
+
+    async def run(self, key, *args):
+        self.calls.append((self.kind, key))
+        if key == "broken.com":
+            raise RuntimeError("lookup failed")
+        if self.kind == "hosting":
+            return HostingResult(ip_address=key, asn="AS1")
+        return getattr(self.profiles[key], self.kind)
+
+    lookup = detect = analyze = run
+
+    async def close(self):
+        pass
+
+
+def make_detector(profiles, calls, store=None):
+    def service(kind):
+        return FakeService(kind, profiles, calls)
+
+    return InfrastructureDetector(
+        dns_service=service("dns"),
+        whois_service=service("whois"),
+        hosting_detector=service("hosting"),
+        analytics_detector=service("analytics"),
+        ssl_analyzer=service("ssl"),
+        store=store,
+    )
+
+
+class TestInfrastructureDetector:
+    """Tests for reuse of stored profiles."""
+
+    async def test_fresh_profiles_are_not_rescanned(self, profiles):
+        calls = []
+        store = FakeStore()
+        detector = make_detector(profiles, calls, store)
+
+        first = await detector.find_shared_infrastructure(["a.com", "b.com"])
+        scans = len(calls)
+        again = await detector.find_shared_infrastructure(["a.com", "b.com"])
+
+        assert scans == 10
+        assert len(calls) == scans
+        assert sorted(store.saved) == ["a.com", "b.com"]
+        assert [m.total_score for m in again] == [m.total_score for m in first]
+
+    async def test_only_stale_components_are_rescanned(self, profiles):
+        calls = []
+        old = datetime.utcnow() - timedelta(days=3)
+        entry = StoredProfile(profile=profiles[0], scanned_at=dict.fromkeys(COMPONENT_TTLS, old))
+        entry.scanned_at["whois"] = datetime.utcnow()
+        store = FakeStore([entry])
+
+        result = await make_detector(profiles, calls, store).get_profiles(["a.com"])
+
+        # Hosting and SSL are within their TTLs and the A records did not change
+        assert sorted(kind for kind, _ in calls) == ["analytics", "dns"]
+        assert result["a.com"].whois is profiles[0].whois
+        assert store.entries["a.com"].stale_components() == set()
+
+    async def test_failed_components_are_retried_sooner(self, profiles):
+        calls = []
+        store = FakeStore()
+        broken = make_profile("broken.com")
+
+        result = await make_detector(profiles + [broken], calls, store).get_profiles(["broken.com"])
+
+        entry = store.entries["broken.com"]
+        assert result["broken.com"].dns is None
+        assert entry.failed == {"dns", "whois", "analytics", "ssl"}
+        assert entry.next_refresh_at - entry.scanned_at["dns"] == timedelta(hours=1)
+
+    async def test_matches_against_known_domains(self, profiles):
+        calls = []
+        store = FakeStore()
+        detector = make_detector(profiles, calls, store)
+        await detector.get_profiles(["b.com", "c.com"])
+
+        matches = await detector.find_shared_infrastructure(["a.com"], include_known=True)
+
+        assert [(m.domain_a, m.domain_b) for m in matches] == [("a.com", "b.com")]
@@ -0,0 +1,155 @@
+"""Unit tests for the BaseIngester record pipeline.
+
+Tests sequential and batched/concurrent processing, result counters,
+per-record error capture and the process_batch hook.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from mitds.ingestion.base import BaseIngester, IngestionConfig
+
+
+class FakeRecord(BaseModel):
+    id: int
+    name: str
+
+
+class FakeIngester(BaseIngester[FakeRecord]):
+    """In-memory ingester with configurable per-record behaviour."""
+
+    def __init__(self, count: int, delay: float = 0.0):
+        super().__init__("fake")
+        self.count = count
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batches: list[int] = []
+
+    async def fetch_records(self, config):
+        for i in range(self.count):
+            yield FakeRecord(id=i, name=f"Org {i}")
+
+    async def process_record(self, record: FakeRecord) -> dict[str, Any]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if record.id % 10 == 9:
+                raise RuntimeError(f"bad record {record.id}")
+            if record.id % 3 == 0:
+                return {"created": True}
+            if record.id % 3 == 1:
+                return {"updated": True}
+            return {"duplicate": True}
+        finally:
+            self.in_flight -= 1
+
+    async def process_batch(self, records):
+        self.batches.append(len(records))
+        return await super().process_batch(records)
+
+    async def get_last_sync_time(self) -> datetime | None:
+        return None
+
+    async def save_sync_time(self, timestamp: datetime) -> None:
+        pass
+
+
+class TestIngestionPipeline:
+    """Tests for BaseIngester.run record processing."""
+
+    async def test_sequential_counters(self):
+        """Default config processes one record at a time."""
+        ingester = FakeIngester(30)
+        result = await ingester.run(IngestionConfig(incremental=False))
+
+        assert result.status == "partial"
+        assert result.records_processed == 30
+        assert len(result.errors) == 3
+        assert result.records_created + result.records_updated + result.duplicates_found == 27
+        assert ingester.max_in_flight == 1
+        assert set(ingester.batches) == {1}
+
+    async def test_batched_matches_sequential(self):
+        """Batched mode produces the same counters and errors."""
+        sequential = await FakeIngester(30).run(IngestionConfig(incremental=False))
+
+        ingester = FakeIngester(30, delay=0.001)
+        batched = await ingester.run(
+            IngestionConfig(incremental=False, batch_size=4, max_workers=3)
+        )
+
+        assert batched.records_processed == sequential.records_processed
+        assert batched.records_created == sequential.records_created
+        assert batched.records_updated == sequential.records_updated
+        assert batched.duplicates_found == sequential.duplicates_found
+        assert sorted(e["record_id"] for e in batched.errors) == [9, 19, 29]
+        assert all(e["error_type"] == "RuntimeError" for e in batched.errors)
+        assert ingester.max_in_flight > 1
+        assert max(ingester.batches) == 4
+        assert sum(ingester.batches) == 30
+
+    async def test_limit_caps_records_pulled(self):
+        """The limit bounds how many records are fetched in batched mode."""
+        ingester = FakeIngester(100)
+        result = await ingester.run(
+            IngestionConfig(incremental=False, limit=25, batch_size=10, max_workers=2)
+        )
+
+        assert result.records_processed == 25
+        assert sum(ingester.batches) == 25
+
+    async def test_failing_batch_marks_every_record(self):
+        """An exception from process_batch is recorded against each record."""
+
+        class BrokenBatchIngester(FakeIngester):
+            async def process_batch(self, records):
+                raise ConnectionError("neo4j unavailable")
+
+        result = await BrokenBatchIngester(8).run(
+            IngestionConfig(incremental=False, batch_size=4, max_workers=2)
+        )
+
+        assert result.status == "partial"
+        assert result.records_processed == 8
+        assert len(result.errors) == 8
+        assert {e["error_type"] for e in result.errors} == {"ConnectionError"}
+
+    async def test_fetch_failure_is_fatal(self):
+        """A failure in fetch_records fails the run and stops workers."""
+
+        class BrokenFetchIngester(FakeIngester):
+            async def fetch_records(self, config):
+                yield FakeRecord(id=0, name="Org 0")
+                raise OSError("source went away")
+
+        result = await BrokenFetchIngester(1).run(
+            IngestionConfig(incremental=False, max_workers=4)
+        )
+
+        assert result.status == "failed"
+        assert result.errors[-1]["fatal"] is True
+        assert result.errors[-1]["error"] == "source went away"
+
+    async def test_non_dict_outcome_is_an_error(self):
+        """A record processed to None is recorded as an error, not a hang."""
+
+        class NoneIngester(FakeIngester):
+            async def process_record(self, record):
+                return None if record.id == 2 else {"created": True}
+
+        result = await asyncio.wait_for(
+            NoneIngester(20).run(
+                IngestionConfig(incremental=False, batch_size=1, max_workers=2)
+            ),
+            timeout=5,
+        )
+
+        assert result.records_processed == 20
+        assert result.records_created == 19
+        assert [e["record_id"] for e in result.errors] == [2]
+        assert result.errors[0]["error_type"] == "TypeError"
@@ -0,0 +1,120 @@
+"""Unit tests for LittleSis bulk file parsing.
+
+Tests the incremental BulkJsonReader against json.load on array and JSONL
+exports, chunk-boundary handling, and byte progress reporting.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from mitds.ingestion.littlesis import BulkJsonReader, LittleSisParser
+
+
+def write_gz(path, text: str):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def entity_item(i: int) -> dict:
+    return {
+        "type": "entities",
+        "id": i,
+        "attributes": {
+            "id": i,
+            "name": f"Entité {i} — Holdings",
+            "blurb": "x" * (i % 50),
+            "primary_ext": "Org",
+            "types": ["Organization", "Business"],
+            "extensions": {"Org": {"revenue": i * 1000}},
+        },
+        "links": {"self": f"https://littlesis.org/entities/{i}"},
+    }
+
+
+class TestBulkJsonReader:
+    """Tests for the incremental bulk JSON reader."""
+
+    @pytest.mark.parametrize("chunk_size", [7, 64, 1 << 20])
+    def test_array_matches_json_load(self, tmp_path, chunk_size):
+        items = [entity_item(i) for i in range(300)] + [1.5, "tail", None, [1, 2]]
+        path = write_gz(tmp_path / "entities.json.gz", json.dumps(items, ensure_ascii=False))
+
+        with BulkJsonReader(path, chunk_size=chunk_size) as reader:
+            decoded = list(reader)
+            assert reader.is_array
+
+        assert decoded == items
+
+    def test_pretty_printed_and_empty_arrays(self, tmp_path):
+        items = [entity_item(1), entity_item(2)]
+        pretty = write_gz(tmp_path / "pretty.json.gz", json.dumps(items, indent=2))
+        empty = write_gz(tmp_path / "empty.json.gz", "  [ ]\n")
+
+        with BulkJsonReader(pretty, chunk_size=5) as reader:
+            assert list(reader) == items
+        with BulkJsonReader(empty) as reader:
+            assert list(reader) == []
+
+    def test_jsonl_skips_malformed_lines(self, tmp_path):
+        text = '{"id": 1}\n\n{"id": 2\n{"id": 3}'
+        path = write_gz(tmp_path / "rels.jsonl.gz", text)
+
+        with BulkJsonReader(path, chunk_size=4) as reader:
+            assert list(reader) == [{"id": 1}, {"id": 3}]
+            assert not reader.is_array
+
+    def test_truncated_array_raises(self, tmp_path):
+        path = write_gz(tmp_path / "broken.json.gz", '[{"id": 1}, {"id": 2')
+
+        with BulkJsonReader(path, chunk_size=8) as reader:
+            items = iter(reader)
+            assert next(items) == {"id": 1}
+            with pytest.raises(json.JSONDecodeError):
+                next(items)
+
+    def test_reports_compressed_bytes(self, tmp_path):
+        items = [entity_item(i) for i in range(2000)]
+        path = write_gz(tmp_path / "entities.json.gz", json.dumps(items))
+        deltas = []
+
+        with BulkJsonReader(path, chunk_size=4096, on_progress=deltas.append) as reader:
+            records = iter(reader)
+            first = next(records)
+            early = sum(deltas)
+            count = 1 + sum(1 for _ in records)
+
+        assert first == items[0]
+        assert count == len(items)
+        assert 0 < early < reader.total_bytes
+        assert sum(deltas) == reader.total_bytes
+
+
+class TestLittleSisParser:
+    """Tests for streaming entity and relationship parsing."""
+
+    def test_iter_entities_maps_json_api(self, tmp_path):
+        items = [entity_item(i) for i in range(1, 4)]
+        items.insert(1, {"attributes": {"name": "missing id"}})
+        path = write_gz(tmp_path / "entities.json.gz", json.dumps(items))
+
+        entities = list(LittleSisParser().iter_entities(path))
+
+        assert [e.id for e in entities] == [1, 2, 3]
+        assert entities[0].extensions == ["Organization", "Business"]
+        assert entities[0].link == "https://littlesis.org/entities/1"
+
+    def test_iter_relationships(self, tmp_path):
+        items = [
+            {"attributes": {"id": i, "entity1_id": i, "entity2_id": i + 1, "category_id": 1}}
+            for i in range(50)
+        ]
+        path = write_gz(tmp_path / "relationships.json.gz", json.dumps(items))
+        deltas = []
+
+        rels = list(LittleSisParser().iter_relationships(path, on_progress=deltas.append))
+
+        assert [r.entity2_id for r in rels] == list(range(1, 51))
+        assert sum(deltas) == path.stat().st_size
@@ -0,0 +1,265 @@
+"""Unit tests for Meta Ad Library harvesting.
+
+Tests query planning, the usage-header throttle, and concurrent harvesting
+against a stub ads_archive endpoint served through httpx.MockTransport.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+
+from mitds.ingestion.base import IngestionConfig
+from mitds.ingestion.meta_ads import (
+    AdLibraryQuery,
+    GraphUsageThrottle,
+    MetaAdIngester,
+    plan_ad_library_queries,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by the throttle's sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StubAdLibrary:
+    """Stub ads_archive endpoint.
+
+    `ads` maps (country, search term) to ad IDs; results are served in
+    pages of `page_size` with Graph-style `paging.next` cursors.
+    """
+
+    def __init__(self, ads: dict[tuple[str, str], list[str]], page_size: int = 2):
+        self.ads = ads
+        self.page_size = page_size
+        self.requests: list[dict[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.responses: list[httpx.Response] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.005)
+            if self.responses:
+                return self.responses.pop(0)
+
+            country = json.loads(params["ad_reached_countries"])[0]
+            ids = self.ads.get((country, params.get("search_terms")), [])
+            offset = int(params.get("after", 0))
+            page = ids[offset:offset + self.page_size]
+
+            body = {"data": [{"id": ad_id, "page_name": "Page"} for ad_id in page]}
+            if offset + self.page_size < len(ids):
+                next_params = {**params, "after": str(offset + self.page_size)}
+                body["paging"] = {"next": str(request.url.copy_with(params=next_params))}
+            return httpx.Response(
+                200, json=body, headers={"x-app-usage": '{"call_count": 10}'}
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def make_ingester(stub: StubAdLibrary, clock: FakeClock | None = None) -> MetaAdIngester:
+    ingester = MetaAdIngester()
+    ingester._http_client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+    ingester._access_token = "token"
+    ingester._token_expires_at = datetime.max
+    clock = clock or FakeClock()
+    ingester.throttle = GraphUsageThrottle(clock=clock, sleep=clock.sleep)
+    return ingester
+
+
+async def harvest(ingester: MetaAdIngester, **extra) -> list[str]:
+    config = IngestionConfig(extra_params=extra)
+    return [ad.ad_id async for ad in ingester.fetch_records(config)]
+
+
+class TestPlanQueries:
+    """Tests for the query planner."""
+
+    def test_cross_product(self):
+        queries = plan_ad_library_queries(
+            ["US", "CA"], ["pipeline", "carbon tax"], [str(i) for i in range(12)]
+        )
+
+        assert len(queries) == 2 * 2 * 2
+        assert {q.search_terms for q in queries} == {"pipeline", "carbon tax"}
+        assert sorted(len(q.page_ids) for q in queries[:2]) == [2, 10]
+
+    def test_terms_are_deduplicated(self):
+        queries = plan_ad_library_queries(["CA"], ["vote", " vote ", "", "ballot"])
+        assert [q.search_terms for q in queries] == ["vote", "ballot"]
+
+    def test_requires_criteria(self):
+        with pytest.raises(ValueError):
+            plan_ad_library_queries(["US"], [], None)
+
+    def test_query_params(self):
+        query = AdLibraryQuery("CA", "vote", ("1", "2"))
+        assert query.params() == {
+            "ad_reached_countries": '["CA"]',
+            "search_terms": "vote",
+            "search_page_ids": "1,2",
+        }
+
+
+class TestGraphUsageThrottle:
+    """Tests for usage-header pacing."""
+
+    async def test_no_delay_under_soft_limit(self):
+        clock = FakeClock()
+        throttle = GraphUsageThrottle(clock=clock, sleep=clock.sleep)
+        throttle.succeeded(httpx.Headers({"x-app-usage": '{"call_count": 20, "total_time": 5}'}))
+
+        for _ in range(5):
+            await throttle.wait()
+        assert clock.sleeps == []
+
+    async def test_spacing_grows_with_usage(self):
+        clock = FakeClock()
+        throttle = GraphUsageThrottle(max_interval=10.0, clock=clock, sleep=clock.sleep)
+        throttle.succeeded(httpx.Headers({"x-app-usage": '{"call_count": 70}'}))
+
+        assert throttle.interval == pytest.approx(5.0)
+        await throttle.wait()
+        await throttle.wait()
+        assert clock.sleeps == [pytest.approx(5.0)]
+
+    async def test_business_use_case_regain_time(self):
+        clock = FakeClock()
+        throttle = GraphUsageThrottle(clock=clock, sleep=clock.sleep)
+        buc = {"123": [{"type": "ads_archive", "call_count": 100, "estimated_time_to_regain_access": 2}]}
+
+        pause = throttle.throttled(httpx.Headers({"x-business-use-case-usage": json.dumps(buc)}))
+
+        assert pause == pytest.approx(120.0)
+        await throttle.wait()
+        assert clock.sleeps[0] == pytest.approx(120.0)
+
+    def test_backoff_without_headers(self):
+        clock = FakeClock()
+        throttle = GraphUsageThrottle(base_backoff=30.0, clock=clock, sleep=clock.sleep)
+
+        assert throttle.throttled(httpx.Headers()) == pytest.approx(30.0)
+        clock.now += 30
+        assert throttle.throttled(httpx.Headers()) == pytest.approx(60.0)
+        throttle.succeeded(httpx.Headers())
+        clock.now += 60
+        assert throttle.throttled(httpx.Headers({"retry-after": "5"})) == pytest.approx(5.0)
+
+
+class TestHarvest:
+    """Tests for concurrent harvesting against the stub endpoint."""
+
+    async def test_all_terms_and_countries_are_harvested(self):
+        stub = StubAdLibrary({
+            ("US", "pipeline"): ["a1", "a2", "a3"],
+            ("US", "carbon tax"): ["a3", "a4"],
+            ("CA", "pipeline"): ["a1", "c1"],
+            ("CA", "carbon tax"): ["c2"],
+        })
+        ingester = make_ingester(stub)
+
+        ids = await harvest(
+            ingester, countries=["US", "CA"], search_terms=["pipeline", "carbon tax"]
+        )
+
+        assert sorted(ids) == ["a1", "a2", "a3", "a4", "c1", "c2"]
+        searched = {(r["ad_reached_countries"], r["search_terms"]) for r in stub.requests}
+        assert len(searched) == 4
+        # Second pages were followed through the paging cursor
+        assert any(r.get("after") == "2" for r in stub.requests)
+
+    async def test_concurrency_is_bounded(self):
+        stub = StubAdLibrary({("US", f"t{i}"): [f"ad{i}"] for i in range(8)})
+        ingester = make_ingester(stub)
+
+        ids = await harvest(
+            ingester, countries=["US"], search_terms=[f"t{i}" for i in range(8)],
+            max_concurrency=3,
+        )
+
+        assert len(ids) == 8
+        assert 1 < stub.max_in_flight <= 3
+
+    async def test_next_page_is_prefetched(self):
+        stub = StubAdLibrary({("US", "vote"): ["a1", "a2", "a3", "a4"]})
+        ingester = make_ingester(stub)
+        records = ingester.fetch_records(
+            IngestionConfig(extra_params={"countries": ["US"], "search_terms": ["vote"]})
+        )
+
+        first = await records.__anext__()
+        await asyncio.sleep(0.001)
+
+        assert first.ad_id == "a1"
+        assert any(r.get("after") == "2" for r in stub.requests)
+        await records.aclose()
+
+    async def test_limit_stops_harvest(self):
+        stub = StubAdLibrary({("US", "vote"): [f"a{i}" for i in range(10)]})
+        ingester = make_ingester(stub)
+
+        records = ingester.fetch_records(
+            IngestionConfig(limit=3, extra_params={"countries": ["US"], "search_terms": ["vote"]})
+        )
+        assert [ad.ad_id async for ad in records] == ["a0", "a1", "a2"]
+
+    async def test_rate_limit_pauses_and_retries(self):
+        stub = StubAdLibrary({("US", "vote"): ["a1"]})
+        stub.responses.append(httpx.Response(
+            400,
+            json={"error": {"code": 613, "message": "Calls to this api have exceeded the rate limit."}},
+            headers={"retry-after": "45"},
+        ))
+        clock = FakeClock()
+        ingester = make_ingester(stub, clock)
+
+        ids = await harvest(ingester, countries=["US"], search_terms=["vote"])
+
+        assert ids == ["a1"]
+        assert clock.sleeps == [pytest.approx(45.0)]
+        assert ingester.throttle.throttle_count == 1
+
+    async def test_bad_query_is_skipped(self, monkeypatch):
+        stub = StubAdLibrary({("US", "ok"): ["a1"]})
+        # Initial attempt plus three retries
+        stub.responses.extend(
+            httpx.Response(400, json={"error": {"code": 100, "message": "Invalid"}})
+            for _ in range(4)
+        )
+        ingester = make_ingester(stub)
+
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr("asyncio.sleep", no_sleep)
+        ids = await harvest(ingester, countries=["US"], search_terms=["bad", "ok"], max_concurrency=1)
+
+        assert ids == ["a1"]
+
+    async def test_watch_list_is_used_by_default(self, monkeypatch):
+        from mitds.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "meta_ads_search_terms", "vote, ballot")
+        stub = StubAdLibrary({("CA", "vote"): ["a1"], ("CA", "ballot"): ["a2"]})
+        ingester = make_ingester(stub)
+
+        assert sorted(await harvest(ingester, countries=["CA"])) == ["a1", "a2"]
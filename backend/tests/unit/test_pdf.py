@@ -0,0 +1,261 @@
+"""Unit tests for the PDF extraction service.
+
+Tests page-limited extraction in worker processes and threads, the
+content-hash cache, coalescing of concurrent requests, and the SEDAR and
+Elections Canada parsers on extracted pages.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from mitds import cache
+from mitds.cache import InMemoryCache
+from mitds.ingestion import pdf as pdf_module
+from mitds.ingestion.elections_canada import ElectionsCanadaIngester
+from mitds.ingestion.pdf import (
+    PdfExtraction,
+    PdfExtractionError,
+    PdfExtractionService,
+    PdfExtractionTimeout,
+    PdfPage,
+    extract_pdf,
+)
+from mitds.ingestion.sedar import EarlyWarningReportParser
+
+pytestmark = pytest.mark.skipif(
+    not pdf_module.PDFPLUMBER_AVAILABLE, reason="pdfplumber not installed"
+)
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    count = len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(f"{4 + 2 * i} 0 R".encode() for i in range(count))
+        + f"] /Count {count} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return bytes(out)
+
+
+@pytest.fixture
+def memory_cache(monkeypatch) -> InMemoryCache:
+    backend = InMemoryCache()
+    monkeypatch.setattr(cache, "_cache", backend)
+    return backend
+
+
+class TestExtractPdf:
+    """Tests for the worker-side extraction function."""
+
+    def test_extracts_pages_in_order(self):
+        extraction = extract_pdf(make_pdf(["First page", "Second page"]))
+
+        assert [p.number for p in extraction.pages] == [1, 2]
+        assert extraction.text == "First page\nSecond page"
+        assert not extraction.truncated
+
+    def test_page_limit(self):
+        extraction = extract_pdf(make_pdf(["a", "b", "c"]), max_pages=2)
+
+        assert len(extraction.pages) == 2
+        assert extraction.page_count == 3
+        assert extraction.truncated
+
+    def test_deadline_stops_extraction(self):
+        extraction = extract_pdf(make_pdf(["a", "b"]), deadline=0.0)
+
+        assert extraction.pages == []
+        assert extraction.timed_out
+
+    def test_invalid_pdf_raises(self):
+        with pytest.raises(PdfExtractionError):
+            extract_pdf(b"not a real pdf")
+
+    def test_round_trips_through_cache_dict(self):
+        extraction = PdfExtraction([PdfPage(1, "text", [[["a", None]]])], 3, truncated=True)
+        assert PdfExtraction.from_dict(extraction.to_dict()) == extraction
+
+
+class TestPdfExtractionService:
+    """Tests for the shared extraction service."""
+
+    async def test_process_pool_extraction(self, memory_cache):
+        service = PdfExtractionService(max_workers=1)
+        try:
+            extraction = await service.extract(make_pdf(["Early Warning Report"]))
+        finally:
+            service.shutdown()
+
+        assert extraction.text == "Early Warning Report"
+
+    async def test_unchanged_content_is_not_reparsed(self, memory_cache, monkeypatch):
+        calls = []
+        real_extract = pdf_module.extract_pdf
+
+        def counting_extract(*args):
+            calls.append(args)
+            return real_extract(*args)
+
+        monkeypatch.setattr(pdf_module, "extract_pdf", counting_extract)
+        service = PdfExtractionService(max_workers=0)
+        content = make_pdf(["Filing"])
+
+        first = await service.extract(content)
+        second = await service.extract(content)
+        await service.extract(content, tables=True)
+
+        assert first == second
+        assert len(calls) == 2
+        assert service.stats()["cache_hits"] == 1
+
+    async def test_concurrent_requests_share_one_parse(self, memory_cache, monkeypatch):
+        calls = []
+        real_extract = pdf_module.extract_pdf
+
+        def counting_extract(*args):
+            calls.append(args)
+            return real_extract(*args)
+
+        monkeypatch.setattr(pdf_module, "extract_pdf", counting_extract)
+        service = PdfExtractionService(max_workers=0)
+        content = make_pdf(["Filing"])
+
+        results = await asyncio.gather(*(service.extract(content) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(r.text == "Filing" for r in results)
+
+    async def test_deadline_results_are_not_cached(self, memory_cache, monkeypatch):
+        monkeypatch.setattr(
+            pdf_module, "extract_pdf",
+            lambda *_args: PdfExtraction([], 5, truncated=True, timed_out=True),
+        )
+        service = PdfExtractionService(max_workers=0)
+
+        await service.extract(b"%PDF slow")
+        assert len(memory_cache) == 0
+
+    async def test_hard_timeout(self, memory_cache, monkeypatch):
+        monkeypatch.setattr(pdf_module, "HARD_TIMEOUT_GRACE", 0.0)
+        monkeypatch.setattr(pdf_module, "extract_pdf", lambda *_args: time.sleep(0.2))
+        service = PdfExtractionService(max_workers=0, timeout=0.01)
+
+        with pytest.raises(PdfExtractionTimeout):
+            await service.extract(b"%PDF stuck")
+        assert service.stats()["timeouts"] == 1
+        assert service._executor is None
+
+    async def test_timeout_waits_for_other_documents(self, memory_cache, monkeypatch):
+        monkeypatch.setattr(pdf_module, "HARD_TIMEOUT_GRACE", 0.0)
+        finished = []
+
+        def fake_extract(content, *args):
+            time.sleep(0.3 if content == b"%PDF stuck" else 0.1)
+            finished.append(content)
+            return PdfExtraction([PdfPage(1, "ok")], 1)
+
+        monkeypatch.setattr(pdf_module, "extract_pdf", fake_extract)
+        # Threads stand in for worker processes (the fake is not picklable)
+        monkeypatch.setattr(pdf_module, "ProcessPoolExecutor", ThreadPoolExecutor)
+        service = PdfExtractionService(max_workers=2)
+        recycled = []
+        monkeypatch.setattr(service, "_recycle", lambda _executor: recycled.append(list(finished)))
+
+        stuck, healthy = await asyncio.gather(
+            service.extract(b"%PDF stuck", timeout=0.02),
+            service.extract(b"%PDF healthy", timeout=5),
+            return_exceptions=True,
+        )
+
+        assert isinstance(stuck, PdfExtractionTimeout)
+        assert healthy.text == "ok"
+        # The pool is only torn down after the healthy document finished
+        assert recycled == [[b"%PDF healthy"]]
+
+    def test_slots_are_per_event_loop(self, memory_cache, monkeypatch):
+        def fake_extract(*args):
+            time.sleep(0.01)
+            return PdfExtraction([PdfPage(1, "ok")], 1)
+
+        monkeypatch.setattr(pdf_module, "extract_pdf", fake_extract)
+        service = PdfExtractionService(max_workers=0)
+
+        async def contend(tag):
+            return await asyncio.gather(
+                *(service.extract(f"%PDF {tag} {i}".encode()) for i in range(3))
+            )
+
+        # Each asyncio.run is a new loop, as in CLI commands and Celery tasks
+        for tag in ("first", "second"):
+            assert [r.text for r in asyncio.run(contend(tag))] == ["ok"] * 3
+        service.shutdown()
+
+    async def test_invalid_pdf_raises(self, memory_cache):
+        service = PdfExtractionService(max_workers=0)
+
+        with pytest.raises(PdfExtractionError):
+            await service.extract(b"not a real pdf")
+        assert service.stats()["failures"] == 1
+
+
+class TestParsers:
+    """Tests for the ingester parsers on extracted pages."""
+
+    async def test_sedar_parse_async(self, memory_cache, monkeypatch):
+        monkeypatch.setattr(pdf_module, "_service", PdfExtractionService(max_workers=0))
+        parser = EarlyWarningReportParser()
+        content = make_pdf(["The acquirer holds 1,234,567 common shares"])
+
+        result = await parser.parse_async(content, "application/pdf")
+
+        assert result is not None
+        assert result.shares_owned == 1234567
+
+    def test_elections_canada_financial_return(self):
+        header = ["#", "Date", "", "Supplier", "Type", "Category", "Sub", "", "", "Place", "Amount"]
+        expense_row = ["1", "2021/08/20", "", "Acme Media", "Ad", "Digital", "", "", "", "Ottawa", "$1,250.00"]
+        contrib_header = ["#", "Fullname", "", "", "", "City", "", "Postal", "", "Individual"]
+        contrib_row = ["1", "Jane Doe", "", "", "", "Toronto", "", "M5V 1A1", "", "500"]
+        extraction = PdfExtraction(
+            pages=[
+                PdfPage(1, "Part 3 Statement of expenses", [[header, expense_row]]),
+                PdfPage(2, "Statement of monetary contributions", [[contrib_header, contrib_row]]),
+            ],
+            page_count=2,
+        )
+
+        expenses, contributors = ElectionsCanadaIngester()._parse_financial_return(extraction)
+
+        assert [(e.supplier, e.amount) for e in expenses] == [("Acme Media", Decimal("1250.00"))]
+        assert expenses[0].date_incurred.isoformat() == "2021-08-20"
+        assert [(c.name, c.amount) for c in contributors] == [("Jane Doe", Decimal("500"))]
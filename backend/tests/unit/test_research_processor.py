@@ -0,0 +1,330 @@
+"""Unit tests for concurrent research session processing.
+
+Tests the LeadProcessor worker pool, limit tracking and completion rules,
+and per-ingester concurrency slots, against in-memory session and queue
+managers.
+"""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from mitds.config import get_settings
+from mitds.research.concurrency import SessionLimitTracker, ingester_slot
+from mitds.research.models import (
+    IdentifierType,
+    LeadResult,
+    LeadType,
+    QueuedLead,
+    QueueStats,
+    ResearchSession,
+    ResearchSessionConfig,
+    SessionStatus,
+)
+from mitds.research.processor import LEAD_BATCH_SIZE, LeadProcessor
+from mitds.research.registry import get_ingester_concurrency
+
+
+class FakeSessionManager:
+    def __init__(self, session: ResearchSession):
+        self.session = session
+        self.entities: set[UUID] = set()
+        self.count_queries = 0
+
+    async def get_session(self, session_id):
+        return self.session
+
+    async def get_session_entity_count(self, session_id):
+        self.count_queries += 1
+        return len(self.entities)
+
+    async def get_session_relationship_count(self, session_id):
+        self.count_queries += 1
+        return 0
+
+    async def add_session_entity(self, session_id, entity_id, **kwargs):
+        added = entity_id not in self.entities
+        self.entities.add(entity_id)
+        return added
+
+    async def pause_session(self, session_id):
+        self.session.status = SessionStatus.PAUSED
+
+    async def complete_session(self, session_id, *args, **kwargs):
+        self.session.status = SessionStatus.COMPLETED
+
+    async def update_stats(self, session_id, stats):
+        self.session.stats = stats
+
+
+class FakeQueueManager:
+    def __init__(self, session_id: UUID, count: int):
+        self.pending = [make_lead(session_id) for _ in range(count)]
+        self.completed: list[UUID] = []
+        self.failed: list[UUID] = []
+        self.in_progress_elsewhere = 0
+        self.batch_sizes: list[int] = []
+
+    async def dequeue(self, session_id, batch_size=10):
+        self.batch_sizes.append(batch_size)
+        claimed, self.pending = self.pending[:batch_size], self.pending[batch_size:]
+        return claimed
+
+    async def enqueue(self, session_id, leads, source_entity_id=None, depth=0):
+        self.pending.extend(make_lead(session_id) for _ in leads)
+        return len(leads)
+
+    async def complete_lead(self, lead_id, result=None):
+        self.completed.append(lead_id)
+
+    async def fail_lead(self, lead_id, error_message):
+        self.failed.append(lead_id)
+
+    async def get_queue_stats(self, session_id):
+        return QueueStats(
+            pending=len(self.pending),
+            in_progress=self.in_progress_elsewhere,
+            completed=len(self.completed),
+            failed=len(self.failed),
+        )
+
+
+def make_lead(session_id: UUID) -> QueuedLead:
+    return QueuedLead(
+        session_id=session_id,
+        lead_type=LeadType.OWNERSHIP,
+        target_identifier="Maple Leaf Media",
+        target_identifier_type=IdentifierType.NAME,
+    )
+
+
+class FakeResolver:
+    def __init__(self):
+        self.batches: list[list[QueuedLead]] = []
+
+    async def resolve(self, leads):
+        self.batches.append(list(leads))
+        return {lead.id: None for lead in leads}
+
+
+def make_processor(leads: int = 0, **config) -> LeadProcessor:
+    session = ResearchSession(
+        name="test",
+        entry_point_type="company",
+        entry_point_value="Maple Leaf Media",
+        status=SessionStatus.RUNNING,
+        config=ResearchSessionConfig(**config),
+    )
+    return LeadProcessor(
+        session_manager=FakeSessionManager(session),
+        queue_manager=FakeQueueManager(session.id, leads),
+        extractors=[],
+        resolver=FakeResolver(),
+    )
+
+
+class TestProcessSession:
+    """Tests for the concurrent session executor."""
+
+    async def test_leads_run_concurrently_up_to_session_workers(self, monkeypatch):
+        processor = make_processor(leads=12, max_concurrent_leads=3)
+        running = 0
+        peak = 0
+
+        async def process_lead(lead, session):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return LeadResult(lead_id=lead.id, success=True)
+
+        monkeypatch.setattr(processor, "process_lead", process_lead)
+        await processor.process_session(processor.session_manager.session.id)
+
+        assert peak == 3
+        assert len(processor.queue_manager.completed) == 12
+        # The first claim fills every idle worker in one batch
+        assert processor.queue_manager.batch_sizes[0] == 3
+        assert max(processor.queue_manager.batch_sizes) == 3
+        assert sum(len(b) for b in processor.resolver.batches) == 12
+        assert processor.session_manager.session.status == SessionStatus.COMPLETED
+
+    async def test_worker_count_defaults_to_setting(self):
+        processor = make_processor()
+
+        assert processor._session_workers(ResearchSessionConfig()) == (
+            get_settings().research_session_workers
+        )
+
+    async def test_waits_for_running_leads_before_completing(self, monkeypatch):
+        processor = make_processor(leads=1, max_concurrent_leads=4)
+        queue = processor.queue_manager
+        spawned = False
+
+        async def process_lead(lead, session):
+            nonlocal spawned
+            await asyncio.sleep(0.01)
+            if not spawned:
+                # The first lead discovers another one while others sit idle
+                spawned = True
+                await queue.enqueue(session.id, [object()])
+            return LeadResult(lead_id=lead.id, success=True)
+
+        monkeypatch.setattr(processor, "process_lead", process_lead)
+        await processor.process_session(processor.session_manager.session.id)
+
+        assert len(queue.completed) == 2
+        assert processor.session_manager.session.status == SessionStatus.COMPLETED
+
+    async def test_leaves_completion_to_other_workers(self, monkeypatch):
+        processor = make_processor(leads=0)
+        processor.queue_manager.in_progress_elsewhere = 2
+
+        await processor.process_session(processor.session_manager.session.id)
+
+        assert processor.session_manager.session.status == SessionStatus.RUNNING
+
+    async def test_batch_resolution_feeds_lead_processing(self, monkeypatch):
+        processor = make_processor(leads=4, max_concurrent_leads=4)
+        entity = {"id": uuid4(), "name": "Maple Leaf Media"}
+        found = []
+
+        async def resolve(leads):
+            processor.resolver.batches.append(list(leads))
+            return {lead.id: entity for lead in leads}
+
+        async def process_lead(lead, session):
+            found.append(await processor._find_existing_entity(lead))
+            return LeadResult(lead_id=lead.id, success=True)
+
+        monkeypatch.setattr(processor.resolver, "resolve", resolve)
+        monkeypatch.setattr(processor, "process_lead", process_lead)
+        await processor.process_session(processor.session_manager.session.id)
+
+        assert [len(b) for b in processor.resolver.batches] == [4]
+        assert found == [entity] * 4
+        assert processor._resolved == {}
+
+    async def test_failures_are_recorded(self, monkeypatch):
+        processor = make_processor(leads=3)
+
+        async def process_lead(lead, session):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(processor, "process_lead", process_lead)
+        await processor.process_session(processor.session_manager.session.id)
+
+        assert len(processor.queue_manager.failed) == 3
+
+    async def test_max_iterations_bounds_leads(self, monkeypatch):
+        processor = make_processor(leads=20)
+
+        async def process_lead(lead, session):
+            return LeadResult(lead_id=lead.id, success=True)
+
+        monkeypatch.setattr(processor, "process_lead", process_lead)
+        await processor.process_session(
+            processor.session_manager.session.id, max_iterations=2
+        )
+
+        assert len(processor.queue_manager.completed) == 2 * LEAD_BATCH_SIZE
+        assert processor.session_manager.session.status == SessionStatus.RUNNING
+
+    async def test_entity_limit_pauses_from_in_memory_counts(self, monkeypatch):
+        processor = make_processor(leads=10, max_entities=3, max_concurrent_leads=1)
+        session_id = processor.session_manager.session.id
+
+        async def process_lead(lead, session):
+            await processor._add_session_entity(session.id, uuid4(), depth=0)
+            return LeadResult(lead_id=lead.id, success=True)
+
+        monkeypatch.setattr(processor, "process_lead", process_lead)
+        await processor.process_session(session_id)
+
+        manager = processor.session_manager
+        assert manager.session.status == SessionStatus.PAUSED
+        assert len(processor.queue_manager.completed) == 3
+        # Counts were read once at start and once for the final stats
+        assert manager.count_queries == 4
+        assert manager.session.stats.total_entities == 3
+
+    async def test_stops_when_paused_externally(self, monkeypatch):
+        processor = make_processor(leads=10, max_concurrent_leads=1)
+        manager = processor.session_manager
+
+        async def process_lead(lead, session):
+            manager.session.status = SessionStatus.PAUSED
+            return LeadResult(lead_id=lead.id, success=True)
+
+        monkeypatch.setattr(processor, "process_lead", process_lead)
+        monkeypatch.setattr(SessionLimitTracker, "reconcile_due", property(lambda _self: True))
+        await processor.process_session(manager.session.id)
+
+        assert len(processor.queue_manager.completed) == 1
+
+
+class TestSessionLimitTracker:
+    """Tests for in-memory limit tracking."""
+
+    async def test_reconcile_replaces_local_counts(self):
+        session = ResearchSession(
+            name="test", entry_point_type="company", entry_point_value="x"
+        )
+        manager = FakeSessionManager(session)
+        manager.entities = {uuid4() for _ in range(5)}
+        tracker = SessionLimitTracker(
+            session.id, manager, max_entities=6, max_relationships=10,
+            reconcile_interval=60,
+        )
+
+        assert tracker.reconcile_due
+        await tracker.reconcile()
+        assert tracker.entity_count == 5 and not tracker.reconcile_due
+
+        tracker.record_entity()
+        tracker.record_entity(added=False)
+        assert tracker.entity_count == 6
+        assert tracker.entity_limit_reached and tracker.limit_reached
+        assert not tracker.relationship_limit_reached
+
+
+class TestIngesterSlots:
+    """Tests for per-ingester concurrency limits."""
+
+    async def test_slots_follow_registry_limits(self):
+        limit = get_ingester_concurrency("sec_edgar")
+        running = 0
+        peak = 0
+
+        async def lookup():
+            nonlocal running, peak
+            async with ingester_slot("sec_edgar"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(lookup() for _ in range(limit * 3)))
+
+        assert peak == limit
+
+    async def test_ingest_single_closes_ingester(self, monkeypatch):
+        closed = []
+
+        class FakeIngester:
+            async def ingest_single(self, identifier, identifier_type):
+                raise RuntimeError("lookup failed")
+
+            async def close(self):
+                closed.append(True)
+
+        from mitds.ingestion import sedar
+
+        monkeypatch.setattr(sedar, "SEDARIngester", FakeIngester)
+        processor = make_processor()
+
+        with pytest.raises(RuntimeError):
+            await processor._ingest_single("sedar", "123", "bn")
+        assert closed == [True]
@@ -0,0 +1,172 @@
+"""Unit tests for batch lead-to-entity resolution.
+
+Tests grouping by identifier type, one query per group, and mapping rows
+back to leads against a recording fake database session.
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from mitds.research import resolver as resolver_module
+from mitds.research.models import IdentifierType, LeadType, QueuedLead
+from mitds.research.resolver import LeadEntityResolver
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeDB:
+    """Records each execute call and answers with rows from a callback."""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls: list[tuple[str, dict]] = []
+
+    async def execute(self, query, params):
+        sql = str(query)
+        self.calls.append((sql, params))
+        return FakeResult(self.answer(sql, params))
+
+
+def entity_row(name, **extra):
+    return SimpleNamespace(
+        id=uuid4(),
+        name=name,
+        entity_type="organization",
+        external_ids={},
+        metadata={},
+        **extra,
+    )
+
+
+def make_lead(identifier, id_type):
+    return QueuedLead(
+        session_id=uuid4(),
+        lead_type=LeadType.FUNDING,
+        target_identifier=identifier,
+        target_identifier_type=id_type,
+    )
+
+
+@pytest.fixture
+def use_db(monkeypatch):
+    def install(answer):
+        db = FakeDB(answer)
+
+        @asynccontextmanager
+        async def get_db_session():
+            yield db
+
+        monkeypatch.setattr(resolver_module, "get_db_session", get_db_session)
+        return db
+
+    return install
+
+
+class TestLeadEntityResolver:
+    """Tests for LeadEntityResolver."""
+
+    async def test_one_query_per_identifier_type(self, use_db):
+        ein_row = entity_row("Fund A", key_0="11-111")
+        name_row = entity_row("Maple Leaf Media Inc", identifier="Maple Leaf Media")
+
+        def answer(sql, params):
+            if "key_0" in sql:
+                return [ein_row]
+            if "LATERAL" in sql:
+                return [name_row]
+            return []
+
+        db = use_db(answer)
+        leads = [
+            make_lead("11-111", IdentifierType.EIN),
+            make_lead("22-222", IdentifierType.EIN),
+            make_lead("11-111", IdentifierType.EIN),
+            make_lead("Maple Leaf Media", IdentifierType.NAME),
+            make_lead("Unknown Org", IdentifierType.NAME),
+        ]
+
+        resolved = await LeadEntityResolver().resolve(leads)
+
+        assert len(db.calls) == 2
+        ein_sql, ein_params = db.calls[0]
+        assert "external_ids->>'ein' = ANY(:ids)" in ein_sql
+        assert sorted(ein_params["ids"]) == ["11-111", "22-222"]
+        assert resolved[leads[0].id]["id"] == ein_row.id
+        assert resolved[leads[1].id] is None
+        assert resolved[leads[2].id]["name"] == "Fund A"
+        assert resolved[leads[3].id]["id"] == name_row.id
+        assert resolved[leads[4].id] is None
+
+    async def test_cik_matches_either_key(self, use_db):
+        row = entity_row("Issuer", key_0=None, key_1="0000123")
+        db = use_db(lambda _sql, _params: [row])
+
+        lead = make_lead("0000123", IdentifierType.CIK)
+        resolved = await LeadEntityResolver().resolve([lead])
+
+        sql, _ = db.calls[0]
+        assert "external_ids->>'sec_cik' = ANY(:ids)" in sql
+        assert "external_ids->>'cik' = ANY(:ids)" in sql
+        assert resolved[lead.id]["id"] == row.id
+
+    async def test_entity_ids_skip_malformed_values(self, use_db):
+        row = entity_row("Known")
+        db = use_db(lambda _sql, _params: [row])
+
+        good = make_lead(str(row.id).upper(), IdentifierType.ENTITY_ID)
+        bad = make_lead("not-a-uuid", IdentifierType.ENTITY_ID)
+        resolved = await LeadEntityResolver().resolve([good, bad])
+
+        _, params = db.calls[0]
+        assert params["ids"] == [str(row.id)]
+        assert resolved[good.id]["id"] == row.id
+        assert resolved[bad.id] is None
+
+    async def test_names_are_normalized(self, use_db):
+        db = use_db(lambda _sql, _params: [])
+
+        await LeadEntityResolver().resolve([
+            make_lead("  Acme Corp.; ", IdentifierType.NAME),
+        ])
+
+        _, params = db.calls[0]
+        assert params["identifiers"] == ["  Acme Corp.; "]
+        assert params["normalized"] == ["Acme Corp"]
+
+    async def test_prefix_range_bound_is_parenthesized(self, use_db):
+        db = use_db(lambda _sql, _params: [])
+
+        await LeadEntityResolver().resolve([make_lead("Acme", IdentifierType.NAME)])
+
+        sql = " ".join(db.calls[0][0].split())
+        # ~<~ and || share a precedence level and bind left to right, so
+        # without parentheses the AND operand would be text, not boolean
+        assert "LOWER(name) ~<~ (LOWER(q.normalized) || :prefix_end)" in sql
+        assert "~<~ LOWER(q.normalized) ||" not in sql
+
+    async def test_unkeyed_identifier_types_resolve_by_name(self, use_db):
+        db = use_db(lambda _sql, _params: [])
+
+        await LeadEntityResolver().resolve([
+            make_lead("Acme", IdentifierType.OPENCORP_ID),
+            make_lead("Acme Holdings", IdentifierType.NAME),
+        ])
+
+        sql, params = db.calls[0]
+        assert len(db.calls) == 1 and "LATERAL" in sql
+        assert sorted(params["identifiers"]) == ["Acme", "Acme Holdings"]
+
+    async def test_empty_batch_skips_database(self, use_db):
+        db = use_db(lambda _sql, _params: [])
+
+        assert await LeadEntityResolver().resolve([]) == {}
+        assert db.calls == []
@@ -0,0 +1,173 @@
+"""Unit tests for the registry name search index.
+
+Tests NameSearchIndex against the original linear-scan scoring, its
+on-disk persistence, and the indexed CRA search path.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from mitds.ingestion import search as search_module
+from mitds.ingestion.search_index import NameSearchIndex
+
+WORDS = [
+    "maple", "leaf", "media", "foundation", "société", "québec", "news",
+    "canadian", "broadcasting", "the", "inc", "of", "al", "fund", "Ünion",
+]
+
+
+def random_names(rng: random.Random, count: int) -> list[str]:
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))).title()
+        for _ in range(count)
+    ]
+
+
+def linear_search(names, query, limit, scores):
+    """Reference implementation: the original per-row scan and sort."""
+    query_lower = query.lower()
+    query_parts = query_lower.split()
+    scored = []
+    for record, fields in enumerate(names):
+        lowered = [(f or "").lower() for f in fields]
+        score = None
+        for (prefix, _), name in zip(scores, lowered, strict=True):
+            if name and name.startswith(query_lower):
+                score = prefix
+                break
+        if score is None:
+            for (_, contains), name in zip(scores, lowered, strict=True):
+                if name and all(part in name for part in query_parts):
+                    score = contains
+                    break
+        if score is not None:
+            scored.append((score, fields[0], record))
+    scored.sort(key=lambda x: (-x[0], x[1]))
+    return [(score, record) for score, _, record in scored[:limit]]
+
+
+QUERIES = [
+    "maple", "Maple Leaf", "leaf maple", "qué", "société québec", "a", "al",
+    "al fund", "the news", "ünion", "inc", "xyz", "media foundation of", "e",
+    "o f", "casting",
+]
+
+
+class TestNameSearchIndex:
+    """Tests for prefix and trigram search."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    @pytest.mark.parametrize("limit", [3, 10, 500])
+    def test_matches_linear_scan(self, query, limit):
+        names = [(n,) for n in random_names(random.Random(4), 400)]
+        index = NameSearchIndex.build(names)
+
+        assert index.search(query, limit, [(90, 70)]) == linear_search(
+            names, query, limit, [(90, 70)]
+        )
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_two_fields_match_linear_scan(self, query):
+        rng = random.Random(9)
+        legal = random_names(rng, 300)
+        operating = [n if rng.random() < 0.6 else "" for n in random_names(rng, 300)]
+        names = list(zip(legal, operating, strict=True))
+        scores = [(90, 70), (85, 65)]
+
+        index = NameSearchIndex.build(names)
+
+        assert index.search(query, 20, scores) == linear_search(names, query, 20, scores)
+
+    def test_short_parts_do_not_span_keys(self):
+        index = NameSearchIndex.build([("xa",), ("bx",), ("zab",)])
+        assert index.search("ab", 10, [(90, 70)]) == [(70, 2)]
+
+    def test_persists_and_memory_maps(self, tmp_path):
+        names = [(n,) for n in random_names(random.Random(1), 200)]
+        index = NameSearchIndex.build(names, meta={"sources": {"x": 1}})
+        index.save(tmp_path / "x.index")
+
+        loaded = NameSearchIndex.load(tmp_path / "x.index")
+
+        assert loaded.meta["sources"] == {"x": 1}
+        assert len(loaded) == 200
+        for query in QUERIES:
+            assert loaded.search(query, 10, [(90, 70)]) == index.search(query, 10, [(90, 70)])
+
+    def test_missing_index_loads_none(self, tmp_path):
+        assert NameSearchIndex.load(tmp_path / "missing") is None
+
+    def test_empty_listing(self):
+        index = NameSearchIndex.build([])
+        assert index.search("maple", 10, [(90, 70)]) == []
+
+
+class TestIndexedSearch:
+    """Tests for the indexed source search functions."""
+
+    async def test_cra_search_builds_index_once(self, tmp_path, monkeypatch):
+        rows = [
+            {"BN": "1", "Legal Name": "Maple Foundation", "Operating Name": ""},
+            {"BN": "2", "Legal Name": "Zeta Trust", "Operating Name": "Maple Friends"},
+            {"BN": "", "Legal Name": "Maple Orphan", "Operating Name": ""},
+            {"BN": "3", "Legal Name": "Friends of the Maple", "Operating Name": ""},
+        ]
+
+        async def fake_charities():
+            return rows
+
+        monkeypatch.setattr(search_module, "_DISK_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(search_module, "_cache", {})
+        monkeypatch.setattr(search_module, "_get_cra_charities", fake_charities)
+        search_module._save_disk_cache("cra_charities", rows)
+
+        results = await search_module.search_cra("maple", limit=10)
+
+        assert [(r.identifier, r.name) for r in results] == [
+            ("1", "Maple Foundation"),
+            ("2", "Zeta Trust"),
+            ("3", "Friends of the Maple"),
+        ]
+        assert results[1].details["operating_name"] == "Maple Friends"
+        assert (tmp_path / "cra.index" / "meta.json").exists()
+
+        # A fresh process reuses the persisted index
+        monkeypatch.setattr(search_module, "_cache", {})
+        built = []
+        monkeypatch.setattr(
+            search_module.NameSearchIndex, "build",
+            classmethod(lambda _cls, *_args, **_kwargs: built.append(1)),
+        )
+        again = await search_module.search_cra("maple", limit=10)
+        assert again == results
+        assert built == []
+
+        suggestions = search_module.suggest_registry_names("zeta", limit=5)
+        assert [s.identifier for s in suggestions] == ["2"]
+
+    async def test_timed_out_search_keeps_loading(self, tmp_path, monkeypatch):
+        started = []
+        release = asyncio.Event()
+
+        async def slow_charities():
+            started.append(1)
+            await release.wait()
+            return [{"BN": "1", "Legal Name": "Maple Foundation", "Operating Name": ""}]
+
+        monkeypatch.setattr(search_module, "_DISK_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(search_module, "_cache", {})
+        monkeypatch.setattr(search_module, "_get_cra_charities", slow_charities)
+
+        for _ in range(3):
+            response = await search_module.search_all_sources(
+                "maple", sources=["cra"], timeout=0.01
+            )
+            assert response.sources_failed == ["cra"]
+
+        release.set()
+        response = await search_module.search_all_sources("maple", sources=["cra"])
+
+        assert started == [1]
+        assert [r.identifier for r in response.results] == ["1"]
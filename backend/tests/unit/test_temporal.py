@@ -0,0 +1,341 @@
+"""Unit tests for temporal coordination detection.
+
+Tests the vectorised Kleinberg Viterbi pass and FFT lead-lag analysis
+against the reference loop implementations, batched burst detection,
+the all-pairs lead-lag mode, and the shared TimingEventFrame index.
+"""
+
+import math
+import random
+from datetime import UTC, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from mitds.detection.temporal import (
+    BurstDetector,
+    LeadLagAnalyzer,
+    SynchronizationScorer,
+    TimingEvent,
+    TimingEventFrame,
+)
+
+
+def reference_viterbi(gaps, base_rate, k, s, gamma):
+    """Original gaps x states x states loop."""
+    n = len(gaps)
+    cost = [[float("inf")] * k for _ in range(n + 1)]
+    parent = [[0] * k for _ in range(n + 1)]
+    cost[0][0] = 0
+    rates = [base_rate * (s ** j) for j in range(k)]
+
+    for i in range(n):
+        gap = gaps[i]
+        for j in range(k):
+            if cost[i][j] == float("inf"):
+                continue
+            for j_next in range(k):
+                rate = rates[j_next]
+                emit_cost = (
+                    rate * gap - math.log(rate) if rate > 0 and gap > 0 else float("inf")
+                )
+                trans_cost = gamma * max(0, j_next - j) if j_next != j else 0
+                total_cost = cost[i][j] + emit_cost + trans_cost
+                if total_cost < cost[i + 1][j_next]:
+                    cost[i + 1][j_next] = total_cost
+                    parent[i + 1][j_next] = j
+
+    states = [0] * n
+    min_cost = float("inf")
+    last_state = 0
+    for j in range(k):
+        if cost[n][j] < min_cost:
+            min_cost = cost[n][j]
+            last_state = j
+    current_state = last_state
+    for i in range(n - 1, -1, -1):
+        states[i] = current_state
+        current_state = parent[i + 1][current_state]
+    return states
+
+
+def bursty_events(rng, entity_id, start, count):
+    """Events at a slow background rate with a few dense bursts."""
+    events = []
+    t = start
+    for i in range(count):
+        in_burst = (i // 25) % 3 == 1
+        t += timedelta(minutes=rng.expovariate(1 / (5 if in_burst else 300)))
+        events.append(TimingEvent(entity_id=entity_id, timestamp=t))
+    return events
+
+
+class TestBurstDetector:
+    """Tests for BurstDetector."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("s,gamma", [(2.0, 1.0), (1.5, 0.5), (3.0, 2.0)])
+    def test_viterbi_matches_reference(self, seed, s, gamma):
+        rng = random.Random(seed)
+        gaps = [max(rng.expovariate(rng.choice([1 / 5, 1 / 300])), 0.1) for _ in range(300)]
+        base_rate = sum(gaps) / len(gaps)
+        k = max(2, int(math.ceil(1 + math.log(max(gaps) / base_rate, s))) + 1)
+
+        detector = BurstDetector(s=s, gamma=gamma)
+        assert detector._viterbi(gaps, base_rate, k) == reference_viterbi(
+            gaps, base_rate, k, s, gamma
+        )
+
+    def test_viterbi_ties_choose_lowest_state(self):
+        """Equal gaps produce ties that must resolve like the loop did."""
+        gaps = [1.0] * 50
+        detector = BurstDetector()
+        assert detector._viterbi(gaps, 1.0, 4) == reference_viterbi(gaps, 1.0, 4, 2.0, 1.0)
+
+    def test_batch_matches_per_entity_calls(self):
+        rng = random.Random(3)
+        events = []
+        for n, entity_id in enumerate(["a", "b", "c"]):
+            events += bursty_events(rng, entity_id, datetime(2024, 1, 1 + n), 90)
+        rng.shuffle(events)
+
+        detector = BurstDetector()
+        batch = detector.detect_bursts_batch(events, ["a", "b", "c", "missing"])
+
+        for entity_id in ["a", "b", "c", "missing"]:
+            assert batch[entity_id] == detector.detect_bursts(events, entity_id)
+        assert batch["missing"].total_events == 0
+
+    def test_batch_defaults_to_all_entities(self):
+        events = bursty_events(random.Random(4), "x", datetime(2024, 1, 1), 30)
+        events += bursty_events(random.Random(5), "y", datetime(2024, 1, 1), 30)
+
+        assert set(BurstDetector().detect_bursts_batch(events)) == {"x", "y"}
+
+
+def reference_correlation(a, b):
+    if len(a) == 0 or len(b) == 0:
+        return 0.0
+    if np.std(a) == 0 or np.std(b) == 0:
+        return 0.0
+    return float(np.corrcoef(a, b)[0, 1])
+
+
+def reference_lag_scan(series_a, series_b, max_lag_hours):
+    """Original per-lag np.corrcoef loop."""
+    best_corr, best_lag = 0.0, 0
+    for lag in range(-max_lag_hours, max_lag_hours + 1):
+        if lag < 0:
+            corr = reference_correlation(series_a[-lag:], series_b[:lag])
+        elif lag > 0:
+            corr = reference_correlation(series_a[:-lag], series_b[lag:])
+        else:
+            corr = reference_correlation(series_a, series_b)
+        if abs(corr) > abs(best_corr):
+            best_corr, best_lag = corr, lag
+    return best_corr, best_lag
+
+
+def follower_events(rng, leader, follower, lag_hours, start, count):
+    """Leader publishes at random; follower echoes it `lag_hours` later."""
+    events = []
+    for _ in range(count):
+        t = start + timedelta(hours=rng.randint(0, 24 * 30), minutes=rng.randint(0, 59))
+        events.append(TimingEvent(entity_id=leader, timestamp=t))
+        events.append(TimingEvent(entity_id=follower, timestamp=t + timedelta(hours=lag_hours)))
+    return events
+
+
+class TestLeadLagAnalyzer:
+    """Tests for LeadLagAnalyzer."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_lagged_correlations_match_corrcoef(self, seed):
+        rng = np.random.default_rng(seed)
+        a = rng.poisson(0.4, 200).astype(float)
+        b = np.roll(a, 3) + rng.poisson(0.2, 200)
+        lags = np.arange(-24, 25)
+
+        fast = LeadLagAnalyzer()._lagged_correlations(a, b, lags)
+        for lag, corr in zip(lags, fast, strict=True):
+            if lag < 0:
+                expected = reference_correlation(a[-lag:], b[:lag])
+            elif lag > 0:
+                expected = reference_correlation(a[:-lag], b[lag:])
+            else:
+                expected = reference_correlation(a, b)
+            assert corr == pytest.approx(expected, abs=1e-9)
+
+    def test_short_and_constant_series(self):
+        analyzer = LeadLagAnalyzer()
+        lags = np.arange(-5, 6)
+
+        assert not analyzer._lagged_correlations(np.ones(20), np.arange(20.0), lags).any()
+        short = analyzer._lagged_correlations(np.array([0.0, 1.0, 0.0]), np.array([1.0, 0.0, 1.0]), lags)
+        assert short[np.abs(lags) >= 3].tolist() == [0.0] * 6
+
+    def test_analyze_pair_finds_reference_lag(self):
+        rng = random.Random(0)
+        events = follower_events(rng, "lead", "follow", 2, datetime(2024, 1, 1), 60)
+
+        result = LeadLagAnalyzer().analyze_pair(events, "lead", "follow")
+
+        series = {}
+        start = min(e.timestamp for e in events)
+        hours = int((max(e.timestamp for e in events) - start).total_seconds() / 3600) + 1
+        for eid in ("lead", "follow"):
+            series[eid] = np.zeros(hours)
+            for e in events:
+                if e.entity_id == eid:
+                    series[eid][int((e.timestamp - start).total_seconds() / 3600)] += 1
+        best_corr, best_lag = reference_lag_scan(series["lead"], series["follow"], 24)
+
+        assert result.correlation == pytest.approx(best_corr, abs=1e-9)
+        assert result.leader_entity_id == "lead"
+        assert result.lag_minutes == best_lag * 60 == 120
+        assert result.is_significant
+
+    def test_permutation_test_is_seeded(self):
+        rng = np.random.default_rng(1)
+        a = rng.poisson(0.5, 300).astype(float)
+        b = rng.poisson(0.5, 300).astype(float)
+
+        analyzer = LeadLagAnalyzer(random_seed=42, max_permutation_cells=5000)
+        first = analyzer._permutation_test(a, b, 0.05)
+        assert first == analyzer._permutation_test(a, b, 0.05)
+        # Unrelated series: a small observed correlation is not significant
+        assert first > 0.05
+        assert analyzer._permutation_test(a, b, 0.99) == pytest.approx(1 / 1001)
+
+    def test_all_pairs_mode(self):
+        rng = random.Random(2)
+        events = follower_events(rng, "a", "b", 3, datetime(2024, 1, 1), 50)
+        events += [
+            TimingEvent(
+                entity_id="c",
+                timestamp=datetime(2024, 1, 1) + timedelta(hours=rng.randint(0, 720)),
+            )
+            for _ in range(50)
+        ]
+        events += [TimingEvent(entity_id="sparse", timestamp=datetime(2024, 1, 2))]
+
+        results = LeadLagAnalyzer().analyze_all_pairs(events)
+        pairs = {frozenset((r.leader_entity_id, r.follower_entity_id)): r for r in results}
+
+        assert set(pairs) == {frozenset("ab"), frozenset("ac"), frozenset("bc")}
+        ab = pairs[frozenset("ab")]
+        assert ab.leader_entity_id == "a"
+        assert ab.lag_minutes == 180
+        assert ab.is_significant
+        assert not pairs[frozenset("ac")].is_significant
+
+
+def reference_sync(events, entity_ids, window_hours=24, min_events=5):
+    """Original per-entity filtering implementation of score_group."""
+    entity_events = {}
+    for event in events:
+        if event.entity_id in entity_ids:
+            entity_events.setdefault(event.entity_id, []).append(event)
+    valid = [eid for eid, evts in entity_events.items() if len(evts) >= min_events]
+    if len(valid) < 2:
+        return None
+
+    dists = {}
+    for eid in valid:
+        dist = np.zeros(24)
+        for event in entity_events[eid]:
+            dist[event.timestamp.hour] += 1
+        dists[eid] = dist / dist.sum()
+
+    scorer = SynchronizationScorer()
+    js = [
+        scorer._jensen_shannon_divergence(dists[a], dists[b])
+        for i, a in enumerate(valid) for b in valid[i + 1:]
+    ]
+    bins = {}
+    for eid in valid:
+        for event in entity_events[eid]:
+            bins.setdefault(int(event.timestamp.timestamp() // (window_hours * 3600)), set()).add(eid)
+    overlap = sum(1 for v in bins.values() if len(v) > 1) / len(bins)
+    return valid, float(np.mean(js)), overlap
+
+
+def mixed_events(seed, entities=("a", "b", "c", "d"), count=200):
+    rng = random.Random(seed)
+    return [
+        TimingEvent(
+            entity_id=rng.choice(entities),
+            timestamp=datetime(2024, 3, 1) + timedelta(minutes=rng.randint(0, 60 * 24 * 60)),
+            event_type=rng.choice(["publication", "ad"]),
+        )
+        for _ in range(count)
+    ]
+
+
+class TestTimingEventFrame:
+    """Tests for the shared columnar event index."""
+
+    def test_slices_are_sorted_per_entity(self):
+        events = mixed_events(0)
+        frame = TimingEventFrame.from_events(events)
+
+        assert frame.entity_ids == list(dict.fromkeys(e.entity_id for e in events))
+        for eid in frame.entity_ids:
+            expected = sorted(
+                (e for e in events if e.entity_id == eid), key=lambda e: e.timestamp
+            )
+            assert frame.events_for(eid) == expected
+            assert frame.count(eid) == len(expected)
+            stamps = frame.timestamps[frame.entity_slice(eid)]
+            assert stamps.tolist() == [e.timestamp for e in expected]
+        assert frame.count("unknown") == 0
+        assert sorted(set(frame.event_types)) == ["ad", "publication"]
+
+    def test_binned_series_are_cached(self):
+        frame = TimingEventFrame.from_events(mixed_events(1), ["a", "b"])
+        hourly = frame.binned(60)
+
+        assert frame.binned(60) is hourly
+        assert hourly.shape[0] == 2
+        assert hourly.sum() == len(frame)
+        daily = frame.binned(60 * 24)
+        assert daily.sum() == len(frame)
+        assert daily.shape[1] < hourly.shape[1]
+
+    def test_timezone_aware_events(self):
+        events = [
+            TimingEvent(entity_id="a", timestamp=datetime(2024, 1, 1, 12, tzinfo=UTC)),
+            TimingEvent(
+                entity_id="a",
+                timestamp=datetime(2024, 1, 1, 9, tzinfo=timezone(timedelta(hours=-5))),
+            ),
+        ]
+        frame = TimingEventFrame.from_events(events)
+
+        assert frame.offsets_for("a").tolist() == [0, 2 * 3600 * 1_000_000]
+        assert frame.timestamps[0] == np.datetime64("2024-01-01T12:00:00")
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_sync_scorer_matches_reference(self, seed):
+        events = mixed_events(seed)
+        result = SynchronizationScorer().score_group(events, ["a", "b", "c"])
+        valid, js, overlap = reference_sync(events, ["a", "b", "c"])
+
+        assert result.entity_ids == valid
+        assert result.js_divergence == pytest.approx(js, abs=1e-12)
+        assert result.overlap_ratio == pytest.approx(overlap)
+
+    def test_analyzers_share_one_frame(self):
+        events = mixed_events(5)
+        frame = TimingEventFrame.from_events(events)
+
+        bursts = BurstDetector().detect_bursts_frame(frame)
+        for eid in frame.entity_ids:
+            assert bursts[eid] == BurstDetector().detect_bursts(events, eid)
+
+        analyzer = LeadLagAnalyzer()
+        assert analyzer.analyze_frame(frame) == analyzer.analyze_all_pairs(events)
+        assert (
+            SynchronizationScorer().score_frame(frame)
+            == SynchronizationScorer().score_group(events, frame.entity_ids)
+        )
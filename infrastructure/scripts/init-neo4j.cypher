@@ -229,6 +229,23 @@ CREATE FULLTEXT INDEX entity_name_search IF NOT EXISTS
 FOR (n:Person|Organization|Outlet|Sponsor|Election|Vendor)
 ON EACH [n.name];
 
+// Full-text indexes for entity search and autocomplete. Keep in sync with
+// SEARCH_INDEXES in backend/src/mitds/graph/search.py, which rebuilds them
+// on API startup if their definition changes.
+CREATE FULLTEXT INDEX entity_text_search IF NOT EXISTS
+FOR (n:Organization|Person|Outlet|Sponsor|Ad)
+ON EACH [n.name, n.page_name, n.aliases]
+OPTIONS {indexConfig: {`fulltext.analyzer`: 'standard-folding', `fulltext.eventually_consistent`: true}};
+
+CREATE FULLTEXT INDEX entity_autocomplete IF NOT EXISTS
+FOR (n:Organization|Person|Sponsor|Outlet)
+ON EACH [n.name, n.aliases]
+OPTIONS {indexConfig: {`fulltext.analyzer`: 'standard-folding', `fulltext.eventually_consistent`: true}};
+
+// Meta ad ID index (for identifier search)
+CREATE INDEX ad_meta_ad_id IF NOT EXISTS
+FOR (a:Ad) ON (a.meta_ad_id);
+
 // =========================
 // Verification
 // =========================